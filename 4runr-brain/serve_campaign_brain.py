@@ -15,7 +15,7 @@ import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 # Add project paths
 sys.path.insert(0, str(Path(__file__).parent))
@@ -440,48 +440,14 @@ class CampaignBrainService:
             # Query for leads ready for campaign brain processing
             # First try leads with "Ready for Outreach" status
             self.logger.debug("Searching for leads with 'Ready for Outreach' status")
-            leads = self.lead_db.search_leads({
-                'status': 'Ready for Outreach'
-            })
-            self.logger.debug(f"Found {len(leads)} leads with 'Ready for Outreach' status")
+            leads, seen = self._collect_unprocessed_leads({'status': 'Ready for Outreach'}, limit)
+            self.logger.debug(f"Scanned {seen} leads with 'Ready for Outreach' status")
             
             # If no "Ready for Outreach" leads, get enriched leads
-            if not leads:
+            if not seen:
                 self.logger.debug("No 'Ready for Outreach' leads found, searching for enriched leads")
-                leads = self.lead_db.search_leads({
-                    'enriched': True
-                })
-                self.logger.debug(f"Found {len(leads)} enriched leads")
-            
-            # Filter out leads that have already been processed by campaign brain
-            filtered_leads = []
-            for lead in leads:
-                if lead is None:
-                    continue
-                    
-                raw_data = lead.get('raw_data')
-                if raw_data is None:
-                    raw_data = {}
-                elif isinstance(raw_data, str):
-                    try:
-                        import json
-                        raw_data = json.loads(raw_data)
-                    except:
-                        raw_data = {}
-                
-                # Skip if already processed by brain
-                if raw_data.get('brain_status'):
-                    self.logger.debug(f"Skipping lead {lead.get('full_name')} - already processed by brain (status: {raw_data.get('brain_status')})")
-                    continue
-                    
-                filtered_leads.append(lead)
-                self.logger.debug(f"Including lead {lead.get('full_name')} for processing")
-            
-            leads = filtered_leads
-            
-            # Limit results
-            if len(leads) > limit:
-                leads = leads[:limit]
+                leads, seen = self._collect_unprocessed_leads({'enriched': True}, limit)
+                self.logger.debug(f"Scanned {seen} enriched leads")
             
             self.logger.info(f"Found {len(leads)} leads ready for campaign brain processing")
             
@@ -495,6 +461,34 @@ class CampaignBrainService:
             self.logger.error(f"Error getting leads from database: {str(e)}")
             return []
     
+    def _collect_unprocessed_leads(self, filters: Dict[str, Any], limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Stream matching leads and keep the first `limit` not yet processed by the brain
+        
+        Returns:
+            Tuple of (leads to process, number of matching leads scanned)
+        """
+        leads = []
+        seen = 0
+        for lead in self.lead_db.search_leads_iter(filters):
+            seen += 1
+            
+            raw_data = lead.get('raw_data')
+            if not isinstance(raw_data, dict):
+                raw_data = {}
+            
+            # Skip if already processed by brain
+            if raw_data.get('brain_status'):
+                self.logger.debug(f"Skipping lead {lead.get('full_name')} - already processed by brain (status: {raw_data.get('brain_status')})")
+                continue
+            
+            leads.append(lead)
+            self.logger.debug(f"Including lead {lead.get('full_name')} for processing")
+            if len(leads) >= limit:
+                break
+        
+        return leads, seen
+    
     def _get_leads_for_brain_processing(self, limit: int) -> List[Dict[str, Any]]:
         """Get leads ready for Campaign Brain processing from Airtable"""
         
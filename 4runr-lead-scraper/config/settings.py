@@ -56,6 +56,7 @@ class AirtableConfig:
     table_name: str = "Leads"
     sync_interval_minutes: int = 30
     auto_sync_enabled: bool = True
+    endpoint_url: str = "https://api.airtable.com"
     
     def __post_init__(self):
         """Validate Airtable configuration."""
@@ -72,6 +73,13 @@ class SyncConfig:
     batch_size: int = 50
     sync_on_create: bool = True
     sync_on_update: bool = True
+    outbox_workers: int = 2
+    adaptive_scheduling: bool = True
+    min_push_interval_seconds: int = 15
+    max_push_interval_seconds: int = 3600
+    target_sync_lag_seconds: int = 300
+    min_pull_interval_minutes: int = 15
+    api_budget_share: float = 0.5
     
     def __post_init__(self):
         """Validate sync configuration."""
@@ -86,6 +94,18 @@ class SyncConfig:
         
         if self.batch_size <= 0:
             raise ValueError("batch_size must be positive")
+        
+        if self.outbox_workers <= 0:
+            raise ValueError("outbox_workers must be positive")
+        
+        if not 0 < self.min_push_interval_seconds <= self.max_push_interval_seconds:
+            raise ValueError("min_push_interval_seconds must be positive and not above max_push_interval_seconds")
+        
+        if self.target_sync_lag_seconds <= 0 or self.min_pull_interval_minutes <= 0:
+            raise ValueError("target_sync_lag_seconds and min_pull_interval_minutes must be positive")
+        
+        if not 0 < self.api_budget_share <= 1:
+            raise ValueError("api_budget_share must be between 0 and 1")
 
 @dataclass
 class EnrichmentConfig:
@@ -221,7 +241,8 @@ class Settings:
                 base_id=os.getenv('AIRTABLE_BASE_ID', ''),
                 table_name=os.getenv('AIRTABLE_TABLE_NAME', 'Leads'),
                 sync_interval_minutes=int(os.getenv('AIRTABLE_SYNC_INTERVAL_MINUTES', '30')),
-                auto_sync_enabled=os.getenv('AUTO_SYNC_TO_AIRTABLE', 'true').lower() == 'true'
+                auto_sync_enabled=os.getenv('AUTO_SYNC_TO_AIRTABLE', 'true').lower() == 'true',
+                endpoint_url=os.getenv('AIRTABLE_ENDPOINT_URL', 'https://api.airtable.com')
             )
             
             # Sync configuration
@@ -230,7 +251,14 @@ class Settings:
                 daily_sync_time=os.getenv('DAILY_SYNC_TIME', '06:00'),
                 batch_size=int(os.getenv('SYNC_BATCH_SIZE', '50')),
                 sync_on_create=os.getenv('SYNC_ON_CREATE', 'true').lower() == 'true',
-                sync_on_update=os.getenv('SYNC_ON_UPDATE', 'true').lower() == 'true'
+                sync_on_update=os.getenv('SYNC_ON_UPDATE', 'true').lower() == 'true',
+                outbox_workers=int(os.getenv('SYNC_OUTBOX_WORKERS', '2')),
+                adaptive_scheduling=os.getenv('ADAPTIVE_SYNC_SCHEDULING', 'true').lower() == 'true',
+                min_push_interval_seconds=int(os.getenv('SYNC_MIN_PUSH_INTERVAL_SECONDS', '15')),
+                max_push_interval_seconds=int(os.getenv('SYNC_MAX_PUSH_INTERVAL_SECONDS', '3600')),
+                target_sync_lag_seconds=int(os.getenv('SYNC_TARGET_LAG_SECONDS', '300')),
+                min_pull_interval_minutes=int(os.getenv('SYNC_MIN_PULL_INTERVAL_MINUTES', '15')),
+                api_budget_share=float(os.getenv('SYNC_API_BUDGET_SHARE', '0.5'))
             )
             
             # Enrichment configuration
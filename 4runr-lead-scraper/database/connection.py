@@ -207,6 +207,20 @@ class DatabaseConnection:
             FOREIGN KEY (lead_id) REFERENCES leads(id)
         );
         
+        -- High-water marks for incremental syncs
+        CREATE TABLE IF NOT EXISTS sync_watermarks (
+            name TEXT PRIMARY KEY,
+            high_water_mark TEXT NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        
+        -- Digests of the field values last pushed to Airtable, per lead
+        CREATE TABLE IF NOT EXISTS airtable_push_state (
+            lead_id TEXT PRIMARY KEY,
+            field_hashes TEXT NOT NULL,
+            pushed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        
         -- Migration log table for tracking data migrations
         CREATE TABLE IF NOT EXISTS migration_log (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -224,8 +238,10 @@ class DatabaseConnection:
         CREATE INDEX IF NOT EXISTS idx_leads_ready_for_outreach ON leads(ready_for_outreach);
         CREATE INDEX IF NOT EXISTS idx_leads_scraped_at ON leads(scraped_at);
         CREATE INDEX IF NOT EXISTS idx_leads_email ON leads(email);
+        CREATE INDEX IF NOT EXISTS idx_leads_email_lower ON leads(lower(email));
         CREATE INDEX IF NOT EXISTS idx_leads_linkedin_url ON leads(linkedin_url);
         CREATE INDEX IF NOT EXISTS idx_leads_airtable_id ON leads(airtable_id);
+        CREATE INDEX IF NOT EXISTS idx_leads_sync_status_updated_at ON leads(sync_status, updated_at);
         CREATE INDEX IF NOT EXISTS idx_sync_log_lead_id ON sync_log(lead_id);
         CREATE INDEX IF NOT EXISTS idx_sync_log_timestamp ON sync_log(sync_timestamp);
         """
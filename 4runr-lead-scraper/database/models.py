@@ -6,10 +6,12 @@ Data models and ORM-like functionality for the 4runr-lead-scraper database.
 Provides high-level interfaces for lead management operations.
 """
 
+import json
 import uuid
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
+from contextlib import nullcontext
 from dataclasses import dataclass, asdict
 import sys
 import os
@@ -434,12 +436,219 @@ class LeadDatabase:
             logger.error(f"Failed to delete lead {lead_id}: {e}")
             return False
     
-    def bulk_insert_leads(self, leads_data: List[Dict[str, Any]]) -> int:
+    def bulk_update_leads(self, updates: Dict[str, Dict[str, Any]], enqueue_sync: bool = True) -> int:
+        """
+        Update multiple leads in a single transaction.
+        
+        Leads that change the same set of fields are written with one
+        executemany call.
+        
+        Args:
+            updates: Mapping of lead ID to dictionary of fields to update
+            enqueue_sync: Queue the changes for pushing to Airtable; pass
+                False when applying values that came from Airtable
+            
+        Returns:
+            int: Number of leads updated
+        """
+        if not updates:
+            return 0
+        
+        now = datetime.now().isoformat()
+        groups: Dict[tuple, List[tuple]] = {}
+        for lead_id, fields in updates.items():
+            fields = dict(fields, updated_at=now)
+            fields.pop('id', None)
+            columns = tuple(fields)
+            groups.setdefault(columns, []).append(tuple(fields.values()) + (lead_id,))
+        
+        try:
+            rows_affected = 0
+            with self.db.get_connection() as conn, self._sync_outbox_scope(conn, enqueue_sync):
+                for columns, params_list in groups.items():
+                    set_clause = ', '.join(f"{column} = ?" for column in columns)
+                    cursor = conn.executemany(f"UPDATE leads SET {set_clause} WHERE id = ?", params_list)
+                    rows_affected += cursor.rowcount
+            
+            logger.info(f"Bulk updated {rows_affected} leads")
+            return rows_affected
+            
+        except Exception as e:
+            logger.error(f"Failed to bulk update leads: {e}")
+            return 0
+    
+    def _sync_outbox_scope(self, conn, enqueue_sync: bool):
+        """Context for a write: suppresses the sync outbox triggers unless enqueue_sync."""
+        if enqueue_sync:
+            return nullcontext(conn)
+        
+        from sync.sync_outbox import suppress_outbox_triggers
+        return suppress_outbox_triggers(conn)
+    
+    def get_lead_ids_by_airtable_ids(self, airtable_ids: List[str]) -> Dict[str, str]:
+        """
+        Look up lead IDs for a batch of Airtable record IDs.
+        
+        Args:
+            airtable_ids: Airtable record IDs
+            
+        Returns:
+            Mapping of Airtable record ID to lead ID for leads that exist
+        """
+        return self._get_lead_ids_by_column('airtable_id', airtable_ids)
+    
+    def get_lead_ids_by_emails(self, emails: List[str]) -> Dict[str, str]:
+        """
+        Look up lead IDs for a batch of email addresses (case-insensitive).
+        
+        Args:
+            emails: Email addresses
+            
+        Returns:
+            Mapping of lower-cased email to lead ID for leads that exist
+        """
+        return self._get_lead_ids_by_column('lower(email)', [email.lower() for email in emails])
+    
+    def _get_lead_ids_by_column(self, column: str, values: List[str]) -> Dict[str, str]:
+        """Map values of an indexed column expression to lead IDs, 500 values per query."""
+        lead_ids = {}
+        values = list(dict.fromkeys(value for value in values if value))
+        
+        for start in range(0, len(values), 500):
+            chunk = values[start:start + 500]
+            cursor = self.db.execute_query(
+                f"SELECT {column} AS value, id FROM leads WHERE {column} IN ({', '.join('?' * len(chunk))})",
+                tuple(chunk)
+            )
+            for row in cursor.fetchall():
+                lead_ids.setdefault(row['value'], row['id'])
+        
+        return lead_ids
+    
+    def get_sync_watermark(self, name: str) -> Optional[str]:
+        """
+        Get the high-water mark of an incremental sync.
+        
+        Args:
+            name: Watermark name (e.g. 'from_airtable:<base>:<table>')
+            
+        Returns:
+            ISO timestamp of the last complete sync, or None if never synced
+        """
+        cursor = self.db.execute_query(
+            "SELECT high_water_mark FROM sync_watermarks WHERE name = ?", (name,)
+        )
+        row = cursor.fetchone()
+        return row['high_water_mark'] if row else None
+    
+    def set_sync_watermark(self, name: str, high_water_mark: str) -> None:
+        """
+        Store the high-water mark of an incremental sync.
+        
+        Args:
+            name: Watermark name
+            high_water_mark: ISO timestamp up to which changes have been applied
+        """
+        self.db.execute_update("""
+            INSERT INTO sync_watermarks (name, high_water_mark, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                high_water_mark = excluded.high_water_mark,
+                updated_at = excluded.updated_at
+        """, (name, high_water_mark, datetime.now().isoformat()))
+    
+    def get_sync_backlog(self) -> Dict[str, Any]:
+        """
+        Get the size and age of the backlog of leads waiting to be pushed.
+        
+        Returns:
+            Dictionary with pending_count and oldest_pending_age_seconds
+            (0 when nothing is pending)
+        """
+        cursor = self.db.execute_query(
+            "SELECT COUNT(*) AS pending_count, MIN(updated_at) AS oldest_updated_at "
+            "FROM leads WHERE sync_status = 'pending'"
+        )
+        row = cursor.fetchone()
+        
+        oldest_age = 0.0
+        if row['oldest_updated_at']:
+            try:
+                oldest = datetime.fromisoformat(str(row['oldest_updated_at']))
+                oldest_age = max(0.0, (datetime.now() - oldest).total_seconds())
+            except ValueError:
+                pass
+        
+        return {
+            'pending_count': row['pending_count'],
+            'oldest_pending_age_seconds': round(oldest_age, 3)
+        }
+    
+    def get_airtable_push_hashes(self, lead_ids: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Get the field digests of the last successful push to Airtable.
+        
+        Args:
+            lead_ids: Lead IDs
+            
+        Returns:
+            Mapping of lead ID to {Airtable field name: digest} for leads
+            that have been pushed before
+        """
+        hashes = {}
+        lead_ids = list(dict.fromkeys(lead_ids))
+        
+        try:
+            for start in range(0, len(lead_ids), 500):
+                chunk = lead_ids[start:start + 500]
+                cursor = self.db.execute_query(
+                    f"SELECT lead_id, field_hashes FROM airtable_push_state "
+                    f"WHERE lead_id IN ({', '.join('?' * len(chunk))})",
+                    tuple(chunk)
+                )
+                for row in cursor.fetchall():
+                    hashes[row['lead_id']] = json.loads(row['field_hashes'])
+            
+            return hashes
+            
+        except Exception as e:
+            logger.error(f"Failed to get Airtable push hashes: {e}")
+            return {}
+    
+    def set_airtable_push_hashes(self, hashes: Dict[str, Dict[str, str]]) -> int:
+        """
+        Record the field digests of a successful push to Airtable.
+        
+        Args:
+            hashes: Mapping of lead ID to {Airtable field name: digest}
+            
+        Returns:
+            int: Number of leads recorded
+        """
+        if not hashes:
+            return 0
+        
+        try:
+            now = datetime.now().isoformat()
+            return self.db.execute_many("""
+                INSERT INTO airtable_push_state (lead_id, field_hashes, pushed_at) VALUES (?, ?, ?)
+                ON CONFLICT(lead_id) DO UPDATE SET
+                    field_hashes = excluded.field_hashes,
+                    pushed_at = excluded.pushed_at
+            """, [(lead_id, json.dumps(field_hashes, sort_keys=True), now)
+                  for lead_id, field_hashes in hashes.items()])
+            
+        except Exception as e:
+            logger.error(f"Failed to set Airtable push hashes: {e}")
+            return 0
+    
+    def bulk_insert_leads(self, leads_data: List[Dict[str, Any]], enqueue_sync: bool = True) -> int:
         """
         Insert multiple leads efficiently.
         
         Args:
             leads_data: List of lead data dictionaries
+            enqueue_sync: Queue the new leads for pushing to Airtable; pass
+                False when the leads came from Airtable
             
         Returns:
             int: Number of leads inserted
@@ -504,7 +713,8 @@ class LeadDatabase:
                 )
                 params_list.append(params)
             
-            rows_affected = self.db.execute_many(query, params_list)
+            with self.db.get_connection() as conn, self._sync_outbox_scope(conn, enqueue_sync):
+                rows_affected = conn.executemany(query, params_list).rowcount
             
             logger.info(f"Bulk inserted {rows_affected} leads")
             return rows_affected
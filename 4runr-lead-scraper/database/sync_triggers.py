@@ -3,11 +3,11 @@
 Database Sync Triggers
 
 Provides automatic sync triggers that fire when leads are created or updated
-in the database, ensuring immediate synchronization to Airtable.
+in the database. Changes are recorded in the durable sync outbox and pushed
+to Airtable by the sync scheduler's outbox workers.
 """
 
 import sqlite3
-import threading
 from typing import Dict, Any, Optional, Callable
 from datetime import datetime
 
@@ -16,6 +16,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sync.sync_scheduler import get_sync_scheduler
+from sync.sync_outbox import install_outbox_triggers, remove_outbox_triggers
 from utils.logging import get_logger
 
 class DatabaseSyncTriggers:
@@ -34,41 +35,17 @@ class DatabaseSyncTriggers:
         self.logger = get_logger('db-sync-triggers')
         self.sync_scheduler = get_sync_scheduler()
         
-        # Track pending syncs to avoid duplicate triggers
-        self._pending_syncs = set()
-        self._sync_lock = threading.Lock()
-        
         self.logger.info("🔗 Database sync triggers initialized")
     
     def setup_triggers(self):
-        """Set up database triggers for automatic sync."""
+        """Set up database triggers that queue changed leads in the sync outbox."""
         try:
             self.logger.info("⚙️ Setting up database sync triggers")
             
-            # Create trigger for lead insertions
-            self.db.execute("""
-                CREATE TRIGGER IF NOT EXISTS sync_on_lead_insert
-                AFTER INSERT ON leads
-                FOR EACH ROW
-                BEGIN
-                    UPDATE leads 
-                    SET sync_status = 'pending', updated_at = datetime('now')
-                    WHERE id = NEW.id;
-                END;
-            """)
-            
-            # Create trigger for lead updates
-            self.db.execute("""
-                CREATE TRIGGER IF NOT EXISTS sync_on_lead_update
-                AFTER UPDATE ON leads
-                FOR EACH ROW
-                WHEN NEW.sync_status != 'syncing'
-                BEGIN
-                    UPDATE leads 
-                    SET sync_status = 'pending', updated_at = datetime('now')
-                    WHERE id = NEW.id;
-                END;
-            """)
+            # Triggers from older versions rewrote sync_status on every write
+            self.db.execute("DROP TRIGGER IF EXISTS sync_on_lead_insert")
+            self.db.execute("DROP TRIGGER IF EXISTS sync_on_lead_update")
+            install_outbox_triggers(self.db)
             
             self.db.commit()
             self.logger.info("✅ Database sync triggers created successfully")
@@ -78,12 +55,11 @@ class DatabaseSyncTriggers:
             raise
     
     def remove_triggers(self):
-        """Remove database sync triggers."""
+        """Remove database sync triggers (queued leads are kept)."""
         try:
             self.logger.info("🗑️ Removing database sync triggers")
             
-            self.db.execute("DROP TRIGGER IF EXISTS sync_on_lead_insert")
-            self.db.execute("DROP TRIGGER IF EXISTS sync_on_lead_update")
+            remove_outbox_triggers(self.db)
             
             self.db.commit()
             self.logger.info("✅ Database sync triggers removed")
@@ -93,88 +69,22 @@ class DatabaseSyncTriggers:
     
     def trigger_immediate_sync(self, lead_id: str, operation: str = 'update'):
         """
-        Trigger immediate sync for a specific lead.
+        Queue a lead for immediate sync.
         
-        Args:
-            lead_id: ID of the lead to sync
-            operation: Type of operation ('insert', 'update', 'delete')
-        """
-        with self._sync_lock:
-            # Avoid duplicate sync requests
-            if lead_id in self._pending_syncs:
-                self.logger.debug(f"⏭️ Sync already pending for lead {lead_id}")
-                return
-            
-            self._pending_syncs.add(lead_id)
-        
-        try:
-            self.logger.debug(f"🔄 Triggering immediate sync for lead {lead_id} ({operation})")
-            
-            # Mark lead as syncing to prevent trigger loops
-            self.db.execute(
-                "UPDATE leads SET sync_status = 'syncing' WHERE id = ?",
-                (lead_id,)
-            )
-            self.db.commit()
-            
-            # Perform the sync in a separate thread to avoid blocking
-            sync_thread = threading.Thread(
-                target=self._perform_sync,
-                args=(lead_id, operation),
-                daemon=True
-            )
-            sync_thread.start()
-            
-        except Exception as e:
-            self.logger.error(f"❌ Failed to trigger sync for lead {lead_id}: {str(e)}")
-            # Remove from pending syncs on error
-            with self._sync_lock:
-                self._pending_syncs.discard(lead_id)
-    
-    def _perform_sync(self, lead_id: str, operation: str):
-        """
-        Perform the actual sync operation.
+        The outbox triggers already queue leads written through this
+        connection; this also covers leads changed elsewhere and wakes the
+        outbox workers. Repeated calls for the same lead are coalesced.
         
         Args:
             lead_id: ID of the lead to sync
-            operation: Type of operation
+            operation: Type of operation ('insert', 'update')
         """
         try:
-            # Perform the sync
-            result = self.sync_scheduler.sync_lead_to_airtable_immediately(lead_id)
-            
-            # Update sync status based on result
-            if result.get('success'):
-                sync_status = 'synced'
-                self.logger.debug(f"✅ Lead {lead_id} synced successfully")
-            else:
-                sync_status = 'failed'
-                self.logger.warning(f"⚠️ Lead {lead_id} sync failed: {result.get('error', 'Unknown error')}")
-            
-            # Update the database with sync result
-            self.db.execute(
-                "UPDATE leads SET sync_status = ?, airtable_synced = ? WHERE id = ?",
-                (sync_status, datetime.now().isoformat(), lead_id)
-            )
-            self.db.commit()
+            self.logger.debug(f"🔄 Queueing immediate sync for lead {lead_id} ({operation})")
+            self.sync_scheduler.enqueue_lead_sync(lead_id, operation)
             
         except Exception as e:
-            self.logger.error(f"❌ Sync operation failed for lead {lead_id}: {str(e)}")
-            
-            # Mark as failed
-            try:
-                self.db.execute(
-                    "UPDATE leads SET sync_status = 'failed' WHERE id = ?",
-                    (lead_id,)
-                )
-                self.db.commit()
-            except Exception:
-                pass  # Ignore secondary errors
-        
-        finally:
-            # Remove from pending syncs
-            with self._sync_lock:
-                self._pending_syncs.discard(lead_id)
+            self.logger.error(f"❌ Failed to trigger sync for lead {lead_id}: {str(e)}")
 
 
 class SyncAwareConnection:
@@ -20,7 +20,7 @@ try:
     from enricher.enhanced_enricher_integration import EnhancedEnricherIntegration
     from enricher.fallback_message_generator import FallbackMessageGenerator, should_use_fallback_messaging
     from database.models import get_lead_database, Lead
-    from sync.airtable_sync import AirtableSync
+    from sync.sync_scheduler import get_sync_scheduler
     INTEGRATION_AVAILABLE = True
 except ImportError as e:
     INTEGRATION_AVAILABLE = False
@@ -46,7 +46,7 @@ class EnhancedEngagerIntegration:
         
         # Initialize components
         self.db = get_lead_database()
-        self.airtable_sync = AirtableSync()
+        self.sync_scheduler = get_sync_scheduler()
         self.enricher = EnhancedEnricherIntegration(openai_api_key)
         self.fallback_generator = None
         
@@ -373,8 +373,8 @@ class EnhancedEngagerIntegration:
             if not updated_lead:
                 return False
             
-            # Force sync to Airtable
-            sync_result = self.airtable_sync.sync_leads_to_airtable([updated_lead], force=True)
+            # Push now through the sync outbox
+            sync_result = self.sync_scheduler.push_leads_to_airtable([updated_lead.id])
             
             if sync_result.get('success'):
                 logger.info(f"✅ Airtable updated for processed lead {lead_id}")
@@ -20,7 +20,7 @@ try:
     from utils.web_content_scraper import scrape_website_content_sync
     from enricher.business_trait_extractor import extract_business_traits_from_content
     from database.models import get_lead_database, Lead
-    from sync.airtable_sync import AirtableSync
+    from sync.sync_scheduler import get_sync_scheduler
     INTEGRATION_AVAILABLE = True
 except ImportError as e:
     INTEGRATION_AVAILABLE = False
@@ -46,7 +46,7 @@ class EnhancedEnricherIntegration:
         
         # Initialize components
         self.db = get_lead_database()
-        self.airtable_sync = AirtableSync()
+        self.sync_scheduler = get_sync_scheduler()
         self.openai_api_key = openai_api_key or os.getenv('OPENAI_API_KEY')
         
         # Configuration
@@ -684,8 +684,8 @@ class EnhancedEnricherIntegration:
             if not updated_lead:
                 return False
             
-            # Force sync to Airtable
-            sync_result = self.airtable_sync.sync_leads_to_airtable([updated_lead], force=True)
+            # Push now through the sync outbox
+            sync_result = self.sync_scheduler.push_leads_to_airtable([updated_lead.id])
             
             if sync_result.get('success'):
                 logger.info(f"✅ Airtable updated for lead {lead_id}")
@@ -107,7 +107,12 @@ class SyncService:
             print(f"⚡ Immediate Sync: {'✅ Enabled' if scheduler_info.get('immediate_sync_enabled') else '❌ Disabled'}")
             print(f"📅 Daily Sync Time: {scheduler_info.get('daily_sync_time', 'Not set')}")
             print(f"📋 Pending Leads: {scheduler_info.get('pending_leads_count', 0)}")
-            
+
+            outbox = scheduler_info.get('outbox')
+            if outbox:
+                print(f"📬 Sync Outbox: {outbox['depth']} queued, {outbox['retrying']} retrying, "
+                      f"oldest {outbox['oldest_age_seconds']:.0f}s")
+
             # Last sync times
             last_to_airtable = scheduler_info.get('last_sync_to_airtable')
             last_from_airtable = scheduler_info.get('last_sync_from_airtable')
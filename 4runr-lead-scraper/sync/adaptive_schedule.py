@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Adaptive Sync Scheduling
+
+Decides how long the sync loops wait between pushes to and pulls from
+Airtable, instead of using fixed intervals:
+
+- Pushes come sooner as the pending backlog and the age of its oldest lead
+  grow, and back off towards a maximum interval while nothing is pending.
+- Pulls are halved in interval after a pull that found changes and doubled
+  after one that found none, between a minimum and once a day.
+- Neither plans more requests than its share of the shared Airtable budget
+  (the transport's token bucket still enforces the hard limit).
+
+Also tracks sync lag: how long leads waited between their last local change
+(updated_at) and being written to Airtable (airtable_synced).
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+# Airtable accepts 10 records per write request
+RECORDS_PER_REQUEST = 10
+
+# Leads one push cycle sends (AirtableSync.sync_leads_to_airtable reads 100 pending leads)
+DEFAULT_PUSH_BATCH_LEADS = 100
+
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+DEFAULT_BUDGET_SHARE = 0.5
+DEFAULT_TARGET_LAG_SECONDS = 300.0
+DEFAULT_MIN_PULL_INTERVAL = 900.0
+DEFAULT_MAX_PULL_INTERVAL = 86400.0
+
+# Growth factor of the push interval per idle cycle
+IDLE_BACKOFF = 2.0
+
+# Lag samples kept for percentiles
+DEFAULT_LAG_WINDOW = 1000
+
+
+class AdaptiveSyncPolicy:
+    """
+    Push and pull intervals driven by the sync backlog and Airtable's change rate.
+    """
+
+    def __init__(self, base_push_interval: float, min_push_interval: float,
+                 max_push_interval: float, target_lag_seconds: float = DEFAULT_TARGET_LAG_SECONDS,
+                 min_pull_interval: float = DEFAULT_MIN_PULL_INTERVAL,
+                 max_pull_interval: float = DEFAULT_MAX_PULL_INTERVAL,
+                 requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+                 budget_share: float = DEFAULT_BUDGET_SHARE,
+                 push_batch_leads: int = DEFAULT_PUSH_BATCH_LEADS):
+        """
+        Initialize the policy.
+
+        Args:
+            base_push_interval: Seconds between pushes under a small backlog
+            min_push_interval: Shortest push interval, however large the backlog
+            max_push_interval: Longest push interval reached while idle
+            target_lag_seconds: Oldest-pending age at which pushes are twice as frequent
+            min_pull_interval: Shortest pull interval while Airtable keeps changing
+            max_pull_interval: Longest pull interval (and the first one after startup)
+            requests_per_second: Shared Airtable request budget of the base
+            budget_share: Fraction of that budget these syncs may plan for
+            push_batch_leads: Leads sent per push cycle
+        """
+        self.min_push_interval = float(min_push_interval)
+        self.max_push_interval = max(float(max_push_interval), self.min_push_interval)
+        self.base_push_interval = min(max(float(base_push_interval), self.min_push_interval),
+                                      self.max_push_interval)
+        self.target_lag_seconds = float(target_lag_seconds)
+        self.min_pull_interval = float(min_pull_interval)
+        self.max_pull_interval = max(float(max_pull_interval), self.min_pull_interval)
+        self.requests_per_second = float(requests_per_second)
+        self.budget_share = float(budget_share)
+        self.push_batch_leads = push_batch_leads
+
+        self._lock = threading.Lock()
+        self.push_interval = self.base_push_interval
+        self.pull_interval = self.max_pull_interval
+        self.last_pull_at: Optional[float] = None
+        self.last_pull_changes = 0
+
+    @classmethod
+    def from_settings(cls, sync_settings, base_push_interval: float,
+                      requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND) -> 'AdaptiveSyncPolicy':
+        """
+        Build a policy from the sync section of the settings.
+
+        Args:
+            sync_settings: SyncConfig instance
+            base_push_interval: Push interval under a small backlog, in seconds
+            requests_per_second: Shared Airtable request budget of the base
+
+        Returns:
+            AdaptiveSyncPolicy instance
+        """
+        return cls(
+            base_push_interval=base_push_interval,
+            min_push_interval=sync_settings.min_push_interval_seconds,
+            max_push_interval=max(sync_settings.max_push_interval_seconds, base_push_interval),
+            target_lag_seconds=sync_settings.target_sync_lag_seconds,
+            min_pull_interval=sync_settings.min_pull_interval_minutes * 60,
+            requests_per_second=requests_per_second,
+            budget_share=sync_settings.api_budget_share
+        )
+
+    def _budget_floor(self, requests: int) -> float:
+        """Shortest interval at which the given requests per cycle stay within budget."""
+        return requests / (self.requests_per_second * self.budget_share)
+
+    def next_push_interval(self, pending_count: int, oldest_pending_age: float) -> float:
+        """
+        Seconds to wait before the next push.
+
+        Args:
+            pending_count: Leads waiting to be pushed
+            oldest_pending_age: Seconds the oldest of them has been waiting
+
+        Returns:
+            Push interval in seconds
+        """
+        with self._lock:
+            if pending_count <= 0:
+                self.push_interval = min(self.max_push_interval,
+                                         max(self.push_interval * IDLE_BACKOFF, self.min_push_interval))
+                return self.push_interval
+
+            pressure = max(pending_count / self.push_batch_leads,
+                           oldest_pending_age / self.target_lag_seconds)
+            interval = max(self.min_push_interval, self.base_push_interval / (1.0 + pressure))
+
+            requests = math.ceil(min(pending_count, self.push_batch_leads) / RECORDS_PER_REQUEST)
+            self.push_interval = min(self.max_push_interval, max(interval, self._budget_floor(requests)))
+            return self.push_interval
+
+    def record_pull(self, changed_count: int, requests: int = 1, now: Optional[float] = None) -> float:
+        """
+        Adjust the pull interval after a pull.
+
+        Args:
+            changed_count: Records the pull found changed in Airtable
+            requests: Requests the pull made
+            now: Monotonic time of the pull (defaults to now)
+
+        Returns:
+            New pull interval in seconds
+        """
+        with self._lock:
+            self.last_pull_at = time.monotonic() if now is None else now
+            self.last_pull_changes = changed_count
+
+            if changed_count > 0:
+                interval = max(self.min_pull_interval, self.pull_interval / 2)
+            else:
+                interval = min(self.max_pull_interval, self.pull_interval * 2)
+            self.pull_interval = max(interval, self._budget_floor(requests))
+            return self.pull_interval
+
+    def seconds_until_pull(self, now: Optional[float] = None) -> float:
+        """Seconds until the next pull is due (0 if due now or never pulled)."""
+        with self._lock:
+            if self.last_pull_at is None:
+                return 0.0
+            now = time.monotonic() if now is None else now
+            return max(0.0, self.last_pull_at + self.pull_interval - now)
+
+    def pull_due(self, now: Optional[float] = None) -> bool:
+        """Whether a pull from Airtable is due."""
+        return self.seconds_until_pull(now) <= 0
+
+    def get_state(self) -> Dict[str, Any]:
+        """Current intervals for status reporting."""
+        with self._lock:
+            return {
+                'push_interval_seconds': round(self.push_interval, 3),
+                'pull_interval_seconds': round(self.pull_interval, 3),
+                'last_pull_changes': self.last_pull_changes,
+                'budget_requests_per_second': self.requests_per_second * self.budget_share
+            }
+
+
+def estimate_pull_requests(result: Dict[str, Any], page_size: int) -> int:
+    """Requests a pull made: one per page of records it received, and at least one."""
+    records = result.get('synced_count', 0) + result.get('failed_count', 0) + result.get('skipped_count', 0)
+    return max(1, math.ceil(records / page_size))
+
+
+class SyncLagTracker:
+    """
+    Recent sync lags (updated_at to airtable_synced) with percentiles.
+    """
+
+    def __init__(self, window: int = DEFAULT_LAG_WINDOW):
+        """
+        Args:
+            window: Number of most recent samples kept
+        """
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, updated_at: Any, synced_at: datetime) -> None:
+        """
+        Record the lag of one lead written to Airtable.
+
+        Args:
+            updated_at: The lead's updated_at as read before the push (ISO string or datetime)
+            synced_at: When the push was recorded
+        """
+        if not updated_at:
+            return
+        try:
+            changed = updated_at if isinstance(updated_at, datetime) else datetime.fromisoformat(str(updated_at))
+        except ValueError:
+            return
+        if (changed.tzinfo is None) != (synced_at.tzinfo is None):
+            return
+
+        with self._lock:
+            self._samples.append(max(0.0, (synced_at - changed).total_seconds()))
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Nearest-rank percentile of the recorded lags.
+
+        Args:
+            q: Percentile between 0 and 100
+
+        Returns:
+            Lag in seconds, or None if nothing was recorded
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        rank = max(1, math.ceil(q / 100.0 * len(samples)))
+        return samples[rank - 1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Sample count and p50/p95/max lag in seconds."""
+        with self._lock:
+            count = len(self._samples)
+            maximum = max(self._samples) if self._samples else None
+        p50, p95 = self.percentile(50), self.percentile(95)
+        return {
+            'samples': count,
+            'p50_seconds': round(p50, 3) if p50 is not None else None,
+            'p95_seconds': round(p95, 3) if p95 is not None else None,
+            'max_seconds': round(maximum, 3) if maximum is not None else None
+        }
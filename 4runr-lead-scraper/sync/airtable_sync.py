@@ -7,12 +7,11 @@ the local database and Airtable.
 """
 
 import os
-import time
+import json
+import hashlib
 import logging
-import requests
-from typing import List, Dict, Optional, Any
-from datetime import datetime, timedelta
-from urllib.parse import quote
+from typing import Iterator, List, Dict, Optional, Any
+from datetime import datetime, timedelta, timezone
 
 import sys
 from pathlib import Path
@@ -20,6 +19,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from database.models import get_lead_database, Lead
 from config.settings import get_settings
+from sync.adaptive_schedule import SyncLagTracker
+from sync.airtable_transport import get_airtable_transport
 
 logger = logging.getLogger('airtable-sync')
 
@@ -38,19 +39,17 @@ class AirtableSync:
         self.base_id = self.settings.airtable.base_id
         self.table_name = self.settings.airtable.table_name
         
-        # API endpoints
-        encoded_table_name = quote(self.table_name)
-        self.base_url = f"https://api.airtable.com/v0/{self.base_id}/{encoded_table_name}"
+        # Shared rate-limited transport (5 requests/second per base across all processes)
+        self.transport = get_airtable_transport(self.api_key, self.base_id,
+                                                self.settings.airtable.endpoint_url)
+        self.base_url = self.transport.table_url(self.table_name)
         
-        # Headers for API requests
-        self.headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json'
-        }
+        # Incremental pulls: records per page and re-fetch window before the high-water mark
+        self.pull_page_size = 100
+        self.pull_overlap_seconds = 300
         
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 0.2  # 200ms between requests (5 requests/second)
+        # Time leads waited between their last local change and reaching Airtable
+        self.sync_lag = SyncLagTracker()
         
         # Initialize engagement defaults manager if enabled
         self.engagement_defaults_manager = None
@@ -79,7 +78,8 @@ class AirtableSync:
             force: Force sync even if already synced
             
         Returns:
-            Dictionary with sync results
+            Dictionary with sync results; synced_lead_ids lists the leads
+            Airtable now matches (pushed or already unchanged)
         """
         logger.info("📤 Starting database to Airtable sync")
         
@@ -99,46 +99,55 @@ class AirtableSync:
                     'success': True,
                     'synced_count': 0,
                     'failed_count': 0,
+                    'synced_lead_ids': [],
                     'errors': [],
                     'defaults_applied': {'count': 0, 'fields_updated': [], 'errors': []}
                 }
             
             logger.info(f"📋 Syncing {len(leads)} leads to Airtable")
             
-            # Process in batches (Airtable limit is 10 records per request)
+            # Process in batches (Airtable limit is 10 records per request);
+            # the transport sends several at once within the shared rate limit
             batch_size = 10
             synced_count = 0
             failed_count = 0
+            skipped_count = 0
+            fields_saved = 0
+            bytes_saved = 0
             errors = []
             all_synced_records = []
+            synced_lead_ids = []
             
-            for i in range(0, len(leads), batch_size):
-                batch = leads[i:i + batch_size]
-                
+            batches = [leads[i:i + batch_size] for i in range(0, len(leads), batch_size)]
+            
+            def sync_batch(numbered_batch) -> Dict[str, Any]:
+                batch_number, batch = numbered_batch
                 try:
                     batch_result = self._sync_batch_to_airtable(batch)
-                    synced_count += batch_result['synced']
-                    failed_count += batch_result['failed']
-                    errors.extend(batch_result['errors'])
-                    
-                    # Collect synced records for defaults application
-                    if 'synced_records' in batch_result:
-                        all_synced_records.extend(batch_result['synced_records'])
-                    
-                    logger.info(f"✅ Batch {i//batch_size + 1}: {batch_result['synced']} synced, {batch_result['failed']} failed")
-                    
-                    # Rate limiting between batches
-                    time.sleep(1)
-                    
+                    logger.info(f"✅ Batch {batch_number}: {batch_result['synced']} synced, "
+                                f"{batch_result['skipped']} unchanged, {batch_result['failed']} failed")
+                    return batch_result
                 except Exception as e:
-                    logger.error(f"❌ Batch {i//batch_size + 1} failed: {str(e)}")
-                    failed_count += len(batch)
-                    errors.append(f"Batch {i//batch_size + 1}: {str(e)}")
+                    logger.error(f"❌ Batch {batch_number} failed: {str(e)}")
+                    return {'synced': 0, 'failed': len(batch), 'errors': [f"Batch {batch_number}: {str(e)}"]}
+            
+            for batch_result in self.transport.map(sync_batch, enumerate(batches, 1)):
+                synced_count += batch_result['synced']
+                failed_count += batch_result['failed']
+                skipped_count += batch_result.get('skipped', 0)
+                fields_saved += batch_result.get('fields_saved', 0)
+                bytes_saved += batch_result.get('bytes_saved', 0)
+                errors.extend(batch_result['errors'])
+                synced_lead_ids.extend(batch_result.get('synced_lead_ids', []))
+                
+                # Collect synced records for defaults application
+                all_synced_records.extend(batch_result.get('synced_records', []))
             
             # Log sync to database
             self._log_sync_operation('to_airtable', synced_count, failed_count, errors)
             
-            logger.info(f"📊 Airtable sync completed: {synced_count} synced, {failed_count} failed")
+            logger.info(f"📊 Airtable sync completed: {synced_count} synced, {skipped_count} unchanged, "
+                        f"{failed_count} failed ({fields_saved} fields / {bytes_saved} bytes not re-sent)")
             
             # Apply engagement defaults if enabled and we have synced records
             defaults_result = {'count': 0, 'fields_updated': [], 'errors': []}
@@ -153,6 +162,10 @@ class AirtableSync:
                 'success': failed_count == 0,
                 'synced_count': synced_count,
                 'failed_count': failed_count,
+                'skipped_count': skipped_count,
+                'fields_saved': fields_saved,
+                'bytes_saved': bytes_saved,
+                'synced_lead_ids': synced_lead_ids,
                 'errors': errors,
                 'defaults_applied': defaults_result
             }
@@ -163,6 +176,7 @@ class AirtableSync:
                 'success': False,
                 'synced_count': 0,
                 'failed_count': 0,
+                'synced_lead_ids': [],
                 'errors': [str(e)],
                 'defaults_applied': {'count': 0, 'fields_updated': [], 'errors': []}
             }
@@ -172,46 +186,40 @@ class AirtableSync:
         Sync updates from Airtable to database (DAILY ONLY - 6:00 AM).
         This provides updated user interface data from Airtable.
         
+        Only records modified since the last complete pull are requested.
+        Pages are applied as they arrive and the high-water mark advances
+        only once every page has been applied without failures.
+        
         Args:
-            force: Force sync regardless of last sync time
+            force: Pull every record regardless of the high-water mark
             
         Returns:
             Dictionary with sync results
         """
         logger.info("📥 Starting DAILY Airtable to database sync (UI updates)")
         
+        pull_started = datetime.now(timezone.utc)
+        synced_count = 0
+        failed_count = 0
+        skipped_count = 0
+        errors = []
+        
         try:
-            # Get records from Airtable that have been modified recently
+            # Get records from Airtable that have been modified since the last pull
             cutoff_time = self._get_sync_cutoff_time(force)
-            airtable_records = self._get_airtable_records(modified_since=cutoff_time)
-            
-            if not airtable_records:
-                logger.info("✅ No updated records in Airtable")
-                return {
-                    'success': True,
-                    'synced_count': 0,
-                    'failed_count': 0,
-                    'errors': []
-                }
             
-            logger.info(f"📋 Processing {len(airtable_records)} updated records from Airtable")
+            for page in self._get_airtable_records(modified_since=cutoff_time):
+                page_result = self._apply_airtable_page(page)
+                synced_count += page_result['synced_count']
+                failed_count += page_result['failed_count']
+                skipped_count += page_result['skipped_count']
+                errors.extend(page_result['errors'])
             
-            synced_count = 0
-            failed_count = 0
-            errors = []
+            if failed_count == 0:
+                self.db.set_sync_watermark(self._get_sync_watermark_name(), pull_started.isoformat())
             
-            for record in airtable_records:
-                try:
-                    success = self._update_lead_from_airtable(record)
-                    if success:
-                        synced_count += 1
-                    else:
-                        failed_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"❌ Failed to update lead from Airtable record {record.get('id')}: {str(e)}")
-                    failed_count += 1
-                    errors.append(f"Record {record.get('id')}: {str(e)}")
+            if synced_count == 0 and failed_count == 0 and skipped_count == 0:
+                logger.info("✅ No updated records in Airtable")
             
             # Log sync to database
             self._log_sync_operation('from_airtable', synced_count, failed_count, errors)
@@ -222,6 +230,7 @@ class AirtableSync:
                 'success': failed_count == 0,
                 'synced_count': synced_count,
                 'failed_count': failed_count,
+                'skipped_count': skipped_count,
                 'errors': errors
             }
             
@@ -229,91 +238,156 @@ class AirtableSync:
             logger.error(f"❌ Airtable to database sync failed: {str(e)}")
             return {
                 'success': False,
-                'synced_count': 0,
-                'failed_count': 0,
-                'errors': [str(e)]
+                'synced_count': synced_count,
+                'failed_count': failed_count,
+                'skipped_count': skipped_count,
+                'errors': errors + [str(e)]
             }
     
     def _sync_batch_to_airtable(self, batch: List[Lead]) -> Dict[str, Any]:
         """
         Sync a batch of leads to Airtable.
         
+        Leads without an Airtable ID are created. Leads that already have one
+        are patched with only the fields whose value changed since the last
+        successful push, and leads with no such fields are marked synced
+        without a request, so fields edited in Airtable are not overwritten.
+        
         Args:
             batch: List of leads to sync
             
         Returns:
             Dictionary with batch sync results
         """
-        # Apply rate limiting
-        self._apply_rate_limiting()
+        result = {
+            'synced': 0, 'failed': 0, 'skipped': 0, 'fields_saved': 0, 'bytes_saved': 0,
+            'errors': [], 'synced_records': [], 'synced_lead_ids': []
+        }
+        pushed_hashes = self.db.get_airtable_push_hashes([lead.id for lead in batch])
         
         # Format records for Airtable
-        records = []
+        creates = []   # (lead, fields, digests)
+        updates = []   # (lead, changed fields, digests)
         for lead in batch:
             try:
                 airtable_record = self._format_lead_for_airtable(lead)
-                records.append({'fields': airtable_record})
             except Exception as e:
                 logger.warning(f"⚠️ Failed to format lead {lead.name}: {str(e)}")
+                result['failed'] += 1
+                continue
+            
+            hashes = self._hash_airtable_fields(airtable_record)
+            airtable_id = lead.airtable_id if isinstance(lead.airtable_id, str) else None
+            if not airtable_id:
+                creates.append((lead, airtable_record, hashes))
+                continue
+            
+            previous = pushed_hashes.get(lead.id, {})
+            changed = {field: airtable_record[field] for field, digest in hashes.items()
+                       if previous.get(field) != digest}
+            full_size = self._payload_size(airtable_id, airtable_record)
+            
+            if not changed:
+                # Airtable already holds this payload
+                synced_at = datetime.now()
+                if self.db.update_lead(lead.id, {'airtable_synced': synced_at.isoformat(), 'sync_status': 'synced'}):
+                    self.sync_lag.record(lead.updated_at, synced_at)
+                    result['skipped'] += 1
+                    result['synced_lead_ids'].append(lead.id)
+                    result['fields_saved'] += len(hashes)
+                    result['bytes_saved'] += full_size
+                else:
+                    result['failed'] += 1
                 continue
+            
+            result['fields_saved'] += len(hashes) - len(changed)
+            result['bytes_saved'] += full_size - self._payload_size(airtable_id, changed)
+            updates.append((lead, changed, hashes))
         
-        if not records:
-            return {'synced': 0, 'failed': len(batch), 'errors': ['No valid records to sync'], 'synced_records': []}
+        if not creates and not updates and not result['skipped']:
+            result['errors'].append('No valid records to sync')
+            return result
         
         # Send to Airtable
+        if creates:
+            self._send_airtable_records(self.transport.post, [
+                {'fields': fields} for _, fields, _ in creates
+            ], creates, result)
+        
+        if updates:
+            self._send_airtable_records(self.transport.patch, [
+                {'id': lead.airtable_id, 'fields': fields} for lead, fields, _ in updates
+            ], updates, result)
+        
+        return result
+    
+    def _send_airtable_records(self, send, records: List[Dict[str, Any]], entries: List[tuple],
+                               result: Dict[str, Any]) -> None:
+        """
+        Create or update up to 10 records in one request and record the outcome.
+        
+        Args:
+            send: Transport method (post to create, patch to update)
+            records: Request records in the same order as entries
+            entries: (lead, fields, digests) tuples
+            result: Batch result to add counts, errors and synced leads to
+        """
         try:
-            data = {'records': records}
-            response = requests.post(self.base_url, headers=self.headers, json=data, timeout=30)
+            response = send(self.base_url, json={'records': records})
             
-            if response.status_code == 200:
-                result = response.json()
-                created_records = result.get('records', [])
-                
-                # Update database with Airtable IDs
-                synced_count = 0
-                synced_records = []
-                for i, airtable_record in enumerate(created_records):
-                    if i < len(batch):
-                        lead = batch[i]
-                        airtable_id = airtable_record['id']
-                        success = self.db.update_lead(lead.id, {
-                            'airtable_id': airtable_id,
-                            'airtable_synced': datetime.now().isoformat(),
-                            'sync_status': 'synced'
-                        })
-                        
-                        if success:
-                            synced_count += 1
-                            # Update the lead object with the Airtable ID for defaults application
-                            lead.airtable_id = airtable_id
-                            synced_records.append(lead)
-                
-                return {
-                    'synced': synced_count,
-                    'failed': len(batch) - synced_count,
-                    'errors': [],
-                    'synced_records': synced_records
-                }
-            
-            else:
+            if response.status_code != 200:
                 error_msg = f"Airtable API error: {response.status_code} - {response.text}"
                 logger.error(f"❌ {error_msg}")
-                return {
-                    'synced': 0,
-                    'failed': len(batch),
-                    'errors': [error_msg],
-                    'synced_records': []
-                }
-                
+                result['failed'] += len(entries)
+                result['errors'].append(error_msg)
+                return
+            
+            returned_records = response.json().get('records', [])
+            
         except Exception as e:
             error_msg = f"Request failed: {str(e)}"
             logger.error(f"❌ {error_msg}")
-            return {
-                'synced': 0,
-                'failed': len(batch),
-                'errors': [error_msg],
-                'synced_records': []
-            }
+            result['failed'] += len(entries)
+            result['errors'].append(error_msg)
+            return
+        
+        # Update database with Airtable IDs
+        synced_count = 0
+        pushed_hashes = {}
+        for (lead, _, hashes), airtable_record in zip(entries, returned_records):
+            airtable_id = airtable_record['id']
+            synced_at = datetime.now()
+            success = self.db.update_lead(lead.id, {
+                'airtable_id': airtable_id,
+                'airtable_synced': synced_at.isoformat(),
+                'sync_status': 'synced'
+            })
+            
+            if success:
+                self.sync_lag.record(lead.updated_at, synced_at)
+                synced_count += 1
+                pushed_hashes[lead.id] = hashes
+                result['synced_lead_ids'].append(lead.id)
+                # Update the lead object with the Airtable ID for defaults application
+                lead.airtable_id = airtable_id
+                result['synced_records'].append(lead)
+        
+        self.db.set_airtable_push_hashes(pushed_hashes)
+        result['synced'] += synced_count
+        result['failed'] += len(entries) - synced_count
+    
+    @staticmethod
+    def _hash_airtable_fields(airtable_record: Dict[str, Any]) -> Dict[str, str]:
+        """Short digest of each Airtable field value, for change detection."""
+        return {
+            field: hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+            for field, value in airtable_record.items()
+        }
+    
+    @staticmethod
+    def _payload_size(airtable_id: str, fields: Dict[str, Any]) -> int:
+        """Size in bytes of one record in an update request body."""
+        return len(json.dumps({'id': airtable_id, 'fields': fields}, default=str).encode('utf-8'))
     
     def _format_lead_for_airtable(self, lead: Lead) -> Dict[str, Any]:
         """
@@ -358,86 +432,114 @@ class AirtableSync:
         except Exception:
             return None
     
-    def _get_airtable_records(self, modified_since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    def _get_airtable_records(self, modified_since: Optional[datetime] = None) -> Iterator[List[Dict[str, Any]]]:
         """
-        Get records from Airtable.
+        Page through records from Airtable.
+        
+        Filtering happens server-side on LAST_MODIFIED_TIME() and pages are
+        fetched lazily, so the cost of a pull follows the number of changed
+        records rather than the size of the table.
         
         Args:
             modified_since: Only get records modified since this time
             
-        Returns:
-            List of Airtable records
-        """
-        try:
-            # Apply rate limiting
-            self._apply_rate_limiting()
+        Yields:
+            Lists of Airtable records, one list per page
             
-            # Build query parameters
-            params = {}
-            if modified_since:
-                # Airtable uses a different format for filtering by date
-                # This is a simplified implementation
-                pass
-            
-            response = requests.get(self.base_url, headers=self.headers, params=params, timeout=30)
-            
-            if response.status_code == 200:
-                result = response.json()
-                return result.get('records', [])
-            else:
-                logger.error(f"❌ Failed to get Airtable records: {response.status_code} - {response.text}")
-                return []
-                
-        except Exception as e:
-            logger.error(f"❌ Failed to get Airtable records: {str(e)}")
-            return []
+        Raises:
+            Exception: If a page cannot be fetched
+        """
+        params = {'pageSize': self.pull_page_size}
+        if modified_since:
+            if modified_since.tzinfo is not None:
+                modified_since = modified_since.astimezone(timezone.utc).replace(tzinfo=None)
+            params['filterByFormula'] = (
+                "IS_AFTER(LAST_MODIFIED_TIME(), "
+                f"DATETIME_PARSE('{modified_since.strftime('%Y-%m-%dT%H:%M:%S')}Z'))"
+            )
+        
+        while True:
+            response = self.transport.get(self.base_url, params=params)
+            if response.status_code != 200:
+                raise RuntimeError(f"Failed to get Airtable records: {response.status_code} - {response.text}")
+            
+            result = response.json()
+            yield result.get('records', [])
+            
+            if not result.get('offset'):
+                return
+            params['offset'] = result['offset']
     
-    def _update_lead_from_airtable(self, airtable_record: Dict[str, Any]) -> bool:
+    def _apply_airtable_page(self, airtable_records: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        Update a lead in the database from an Airtable record.
+        Apply one page of Airtable records to the database.
+        
+        Existing leads are matched by Airtable ID, then by email, with one
+        lookup query each for the whole page. Updates and inserts are then
+        written with one transaction each, outside the sync outbox, so values
+        that came from Airtable are not pushed back to it.
         
         Args:
-            airtable_record: Airtable record data
+            airtable_records: Airtable records
             
         Returns:
-            True if update successful
+            Dictionary with synced_count, failed_count, skipped_count and errors
         """
+        result = {'synced_count': 0, 'failed_count': 0, 'skipped_count': 0, 'errors': []}
+        if not airtable_records:
+            return result
+        
         try:
-            fields = airtable_record.get('fields', {})
-            airtable_id = airtable_record.get('id')
-            
-            # Find existing lead by Airtable ID or email
-            lead = None
-            
-            # First try to find by Airtable ID
-            if airtable_id:
-                leads = self.db.search_leads({'airtable_id': airtable_id}, limit=1)
-                if leads:
-                    lead = leads[0]
-            
-            # If not found, try by email
-            if not lead and fields.get('Email'):
-                leads = self.db.search_leads({'email': fields['Email']}, limit=1)
-                if leads:
-                    lead = leads[0]
-            
-            if not lead:
-                # Create new lead if not found
-                lead_data = self._format_airtable_for_lead(fields, airtable_id)
-                lead_id = self.db.create_lead(lead_data)
-                logger.info(f"✅ Created new lead from Airtable: {fields.get('Full Name', 'Unknown')}")
-                return True
-            else:
-                # Update existing lead
-                updates = self._format_airtable_for_lead(fields, airtable_id)
-                success = self.db.update_lead(lead.id, updates)
-                if success:
-                    logger.info(f"✅ Updated lead from Airtable: {lead.name}")
-                return success
-                
+            by_airtable_id = self.db.get_lead_ids_by_airtable_ids(
+                [record.get('id') for record in airtable_records]
+            )
+            by_email = self.db.get_lead_ids_by_emails([
+                record.get('fields', {}).get('Email', '')
+                for record in airtable_records
+                if record.get('id') not in by_airtable_id
+            ])
         except Exception as e:
-            logger.error(f"❌ Failed to update lead from Airtable: {str(e)}")
-            return False
+            logger.error(f"❌ Failed to match Airtable records to leads: {str(e)}")
+            result['failed_count'] = len(airtable_records)
+            result['errors'].append(str(e))
+            return result
+        
+        updates = {}
+        new_leads = []
+        for record in airtable_records:
+            fields = record.get('fields', {})
+            airtable_id = record.get('id')
+            lead_data = self._format_airtable_for_lead(fields, airtable_id)
+            
+            lead_id = by_airtable_id.get(airtable_id) or by_email.get((fields.get('Email') or '').lower())
+            if lead_id:
+                updates[lead_id] = lead_data
+            elif not lead_data['name']:
+                # Cannot succeed until the record is edited, which makes it show up again
+                logger.warning(f"⚠️ Skipping Airtable record {airtable_id}: missing Full Name")
+                result['skipped_count'] += 1
+            else:
+                # Empty LinkedIn URLs would collide on the unique index
+                lead_data['linkedin_url'] = lead_data['linkedin_url'] or None
+                new_leads.append(lead_data)
+        
+        if updates:
+            updated = self.db.bulk_update_leads(updates, enqueue_sync=False)
+            result['synced_count'] += updated
+            if updated < len(updates):
+                result['failed_count'] += len(updates) - updated
+                result['errors'].append(f"Failed to update {len(updates) - updated} leads from Airtable")
+        
+        if new_leads:
+            created = self.db.bulk_insert_leads(new_leads, enqueue_sync=False)
+            result['synced_count'] += created
+            if created < len(new_leads):
+                result['failed_count'] += len(new_leads) - created
+                result['errors'].append(f"Failed to create {len(new_leads) - created} leads from Airtable")
+        
+        logger.info(f"✅ Applied {len(airtable_records)} Airtable records: "
+                    f"{len(updates)} updates, {len(new_leads)} new")
+        return result
     
     def _format_airtable_for_lead(self, fields: Dict[str, Any], airtable_id: str) -> Dict[str, Any]:
         """
@@ -471,24 +573,28 @@ class AirtableSync:
         return lead_data
     
     def _get_sync_cutoff_time(self, force: bool) -> Optional[datetime]:
-        """Get cutoff time for incremental sync."""
+        """
+        Get cutoff time for incremental sync.
+        
+        The stored high-water mark is the start time of the last complete
+        pull; it is moved back by pull_overlap_seconds to cover records
+        modified while that pull ran and clock skew with Airtable.
+        """
         if force:
             return None
         
-        # Get last successful sync time from database
-        # For now, use 24 hours ago as default
-        return datetime.now() - timedelta(hours=24)
+        try:
+            high_water_mark = self.db.get_sync_watermark(self._get_sync_watermark_name())
+            if not high_water_mark:
+                return None
+            return datetime.fromisoformat(high_water_mark) - timedelta(seconds=self.pull_overlap_seconds)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to read sync watermark, pulling all records: {str(e)}")
+            return None
     
-    def _apply_rate_limiting(self):
-        """Apply rate limiting for Airtable API requests."""
-        now = time.time()
-        time_since_last = now - self.last_request_time
-        
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+    def _get_sync_watermark_name(self) -> str:
+        """Name of the high-water mark for pulls from this base and table."""
+        return f"from_airtable:{self.base_id}:{self.table_name}"
     
     def _log_sync_operation(self, operation: str, synced_count: int, failed_count: int, errors: List[str]):
         """Log sync operation to database."""
@@ -549,6 +655,7 @@ class AirtableSync:
             return {
                 'sync_statistics': sync_stats,
                 'pending_sync_count': len(pending_leads),
+                'sync_lag': self.sync_lag.snapshot(),
                 'last_checked': datetime.now().isoformat()
             }
             
@@ -9,7 +9,6 @@ leads are scraped, verified, or enriched.
 import os
 import time
 import logging
-import requests
 import json
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -20,6 +19,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import get_settings
+from sync.airtable_transport import get_airtable_transport
 
 logger = logging.getLogger('engagement-defaults')
 
@@ -49,6 +49,10 @@ class EngagementDefaultsManager:
         'Enrichment_Method': 'default_population'
     }
     
+    # Airtable limits: records per list page, records per batch update
+    FETCH_BATCH_SIZE = 100
+    UPDATE_BATCH_SIZE = 10
+    
     def __init__(self):
         """Initialize the Engagement Defaults Manager."""
         self.settings = get_settings()
@@ -58,20 +62,10 @@ class EngagementDefaultsManager:
         self.base_id = self.settings.airtable.base_id
         self.table_name = self.settings.airtable.table_name
         
-        # API endpoints
-        from urllib.parse import quote
-        encoded_table_name = quote(self.table_name)
-        self.base_url = f"https://api.airtable.com/v0/{self.base_id}/{encoded_table_name}"
-        
-        # Headers for API requests
-        self.headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json'
-        }
-        
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 0.2  # 200ms between requests (5 requests/second)
+        # Shared rate-limited transport (5 requests/second per base across all processes)
+        self.transport = get_airtable_transport(self.api_key, self.base_id,
+                                                self.settings.airtable.endpoint_url)
+        self.base_url = self.transport.table_url(self.table_name)
         
         # Use default values from settings
         self.DEFAULT_VALUES = self.settings.engagement_defaults.default_values.copy()
@@ -205,6 +199,10 @@ class EngagementDefaultsManager:
         """
         Apply defaults to multiple leads.
         
+        Current values are read for up to 100 records per request, needed
+        defaults are worked out in memory and written back 10 records per
+        request, so N leads take about N/100 + N/10 requests instead of 2N.
+        
         Args:
             lead_records: List of dicts with 'lead_id' and 'airtable_record_id'
             
@@ -235,15 +233,12 @@ class EngagementDefaultsManager:
             'processing_time': 0.0
         }
         
-        # Track processing times for each lead
-        lead_processing_times = []
-        
+        # Leads that have an Airtable record: (position, lead_id, airtable_record_id)
+        entries = []
         for i, record in enumerate(lead_records):
             lead_id = record.get('lead_id', 'unknown')
             airtable_record_id = record.get('airtable_record_id')
             
-            logger.debug(f"🔄 Processing lead {i+1}/{len(lead_records)}: {lead_id}")
-            
             if not airtable_record_id:
                 error_msg = f"Lead {lead_id}: No Airtable record ID"
                 logger.warning(f"⚠️ {error_msg}")
@@ -258,62 +253,96 @@ class EngagementDefaultsManager:
                 results['errors'].append(error_msg)
                 continue
             
+            entries.append((i + 1, lead_id, airtable_record_id))
+        
+        # Each lead is charged its own in-memory work plus an equal share of the requests
+        lead_processing_times = {position: 0.0 for position, _, _ in entries}
+        
+        # Read current values for all records
+        fetch_start_time = time.time()
+        record_ids = list(dict.fromkeys(record_id for _, _, record_id in entries))
+        current_values = self._get_current_airtable_values_batch(record_ids)
+        fetch_share = (time.time() - fetch_start_time) / max(1, len(entries))
+        
+        # Work out needed defaults in memory: position -> (status, needed defaults or error)
+        outcomes = {}
+        pending_updates = {}
+        for position, lead_id, airtable_record_id in entries:
+            lead_start_time = time.time()
             try:
-                lead_start_time = time.time()
-                result = self.apply_defaults_to_lead(lead_id, airtable_record_id)
-                lead_processing_time = time.time() - lead_start_time
-                lead_processing_times.append(lead_processing_time)
-                
-                results['processed_count'] += 1
-                
-                if result['success']:
-                    if result['fields_updated']:
-                        results['updated_count'] += 1
-                        results['fields_updated'].extend(result['fields_updated'])
-                        
-                        self._log_structured_activity('batch_lead_processing', lead_id, 'success', {
-                            'fields_updated': result['fields_updated'],
-                            'processing_time': lead_processing_time,
-                            'batch_id': batch_id,
-                            'position': i+1
-                        })
-                    else:
-                        results['skipped_count'] += 1
-                        
-                        self._log_structured_activity('batch_lead_processing', lead_id, 'skipped', {
-                            'reason': 'no_defaults_needed',
-                            'processing_time': lead_processing_time,
-                            'batch_id': batch_id,
-                            'position': i+1
-                        })
+                values = current_values.get(airtable_record_id)
+                if values is None:
+                    outcomes[position] = ('error', 'Failed to retrieve current Airtable values')
                 else:
-                    results['failed_count'] += 1
-                    error_msg = f"Lead {lead_id}: {result.get('error', 'Unknown error')}"
-                    results['errors'].append(error_msg)
+                    needed_defaults = self._determine_needed_defaults(values)
+                    self._log_field_analysis(lead_id, values, needed_defaults)
                     
-                    self._log_structured_activity('batch_lead_processing', lead_id, 'error', {
-                        'error': result.get('error', 'Unknown error'),
-                        'processing_time': lead_processing_time,
-                        'batch_id': batch_id,
-                        'position': i+1
-                    })
-                
-                # Rate limiting between requests
-                time.sleep(0.1)
-                
+                    if needed_defaults:
+                        pending_updates[airtable_record_id] = needed_defaults
+                        outcomes[position] = ('update', needed_defaults)
+                    else:
+                        outcomes[position] = ('skipped', {})
             except Exception as e:
-                error_msg = f"Lead {lead_id}: {str(e)}"
                 logger.error(f"❌ Exception processing lead {lead_id}: {str(e)}")
+                outcomes[position] = ('error', str(e))
+            
+            lead_processing_times[position] = fetch_share + time.time() - lead_start_time
+        
+        # Write defaults back
+        update_start_time = time.time()
+        updated_record_ids = self._update_airtable_records_batch(pending_updates)
+        updating_count = sum(1 for status, _ in outcomes.values() if status == 'update')
+        update_share = (time.time() - update_start_time) / max(1, updating_count)
+        
+        for position, lead_id, airtable_record_id in entries:
+            status, detail = outcomes[position]
+            if status == 'update':
+                lead_processing_times[position] += update_share
+                if airtable_record_id not in updated_record_ids:
+                    status, detail = 'error', 'Failed to update Airtable record'
+            
+            lead_processing_time = lead_processing_times[position]
+            self._update_performance_stats(f"apply_defaults_lead_{lead_id}", lead_processing_time)
+            results['processed_count'] += 1
+            
+            if status == 'update':
+                fields_updated = list(detail.keys())
+                logger.info(f"✅ Applied default engagement values to lead {airtable_record_id}: {fields_updated}")
                 
-                self._log_structured_activity('batch_lead_processing', lead_id, 'error', {
-                    'error': str(e),
-                    'exception_type': type(e).__name__,
+                results['updated_count'] += 1
+                results['fields_updated'].extend(fields_updated)
+                self.performance_stats['successful_operations'] += 1
+                
+                self._log_structured_activity('batch_lead_processing', lead_id, 'success', {
+                    'fields_updated': fields_updated,
+                    'values_applied': detail,
+                    'airtable_record_id': airtable_record_id,
+                    'processing_time': lead_processing_time,
                     'batch_id': batch_id,
-                    'position': i+1
+                    'position': position
                 })
+            elif status == 'skipped':
+                results['skipped_count'] += 1
+                self.performance_stats['successful_operations'] += 1
                 
+                self._log_structured_activity('batch_lead_processing', lead_id, 'skipped', {
+                    'reason': 'no_defaults_needed',
+                    'processing_time': lead_processing_time,
+                    'batch_id': batch_id,
+                    'position': position
+                })
+            else:
                 results['failed_count'] += 1
-                results['errors'].append(error_msg)
+                results['errors'].append(f"Lead {lead_id}: {detail}")
+                self.performance_stats['failed_operations'] += 1
+                
+                self._log_structured_activity('batch_lead_processing', lead_id, 'error', {
+                    'error': detail,
+                    'airtable_record_id': airtable_record_id,
+                    'processing_time': lead_processing_time,
+                    'batch_id': batch_id,
+                    'position': position
+                })
         
         # Calculate batch metrics
         batch_processing_time = time.time() - batch_start_time
@@ -326,7 +355,8 @@ class EngagementDefaultsManager:
         results['fields_updated'] = list(set(results['fields_updated']))
         
         # Calculate performance metrics
-        avg_lead_time = sum(lead_processing_times) / len(lead_processing_times) if lead_processing_times else 0
+        avg_lead_time = (sum(lead_processing_times.values()) / len(lead_processing_times)
+                         if lead_processing_times else 0)
         leads_per_second = len(lead_records) / batch_processing_time if batch_processing_time > 0 else 0
         
         # Log batch completion
@@ -360,13 +390,10 @@ class EngagementDefaultsManager:
             Dictionary of current field values or None if failed
         """
         try:
-            # Apply rate limiting
-            self._apply_rate_limiting()
-            
             # Get all fields (don't filter - this was causing the 422 error)
             url = f"{self.base_url}/{record_id}"
             
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self.transport.get(url)
             
             if response.status_code == 200:
                 result = response.json()
@@ -382,6 +409,56 @@ class EngagementDefaultsManager:
             logger.error(f"❌ Exception getting Airtable record {record_id}: {str(e)}")
             return None
     
+    def _get_current_airtable_values_batch(self, record_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get current field values for many Airtable records.
+        
+        Records are matched with a RECORD_ID() formula, up to 100 per
+        request (one full page), and requests run concurrently within the
+        shared rate limit.
+        
+        Args:
+            record_ids: Airtable record IDs
+            
+        Returns:
+            Dictionary of record ID to current field values; records that
+            were not found or could not be fetched are missing
+        """
+        chunks = [record_ids[i:i + self.FETCH_BATCH_SIZE] for i in range(0, len(record_ids), self.FETCH_BATCH_SIZE)]
+        
+        def fetch_chunk(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+            formula = 'OR(' + ','.join(
+                "RECORD_ID()='{}'".format(record_id.replace("'", "\\'")) for record_id in chunk
+            ) + ')'
+            try:
+                response = self.transport.get(self.base_url, params={
+                    'filterByFormula': formula,
+                    'pageSize': self.FETCH_BATCH_SIZE
+                })
+                
+                if response.status_code != 200:
+                    logger.error(f"❌ Failed to get {len(chunk)} Airtable records: {response.status_code} - {response.text}")
+                    return {}
+                
+                return {
+                    record['id']: record.get('fields', {})
+                    for record in response.json().get('records', [])
+                }
+                
+            except Exception as e:
+                logger.error(f"❌ Exception getting {len(chunk)} Airtable records: {str(e)}")
+                return {}
+        
+        current_values = {}
+        for chunk_values in self.transport.map(fetch_chunk, chunks):
+            current_values.update(chunk_values)
+        
+        missing = len(record_ids) - len(current_values)
+        if missing:
+            logger.warning(f"⚠️ {missing} of {len(record_ids)} Airtable records could not be retrieved")
+        
+        return current_values
+    
     def _determine_needed_defaults(self, current_values: Dict[str, Any]) -> Dict[str, Any]:
         """
         Determine which default values need to be applied.
@@ -438,73 +515,73 @@ class EngagementDefaultsManager:
         
         return False
     
-    def _update_airtable_record(self, record_id: str, updates: Dict[str, Any], retry_count: int = 0) -> bool:
+    def _update_airtable_record(self, record_id: str, updates: Dict[str, Any]) -> bool:
         """
         Update Airtable record with new field values.
         
+        Rate limiting (429), server errors and timeouts are retried by the
+        shared transport.
+        
         Args:
             record_id: Airtable record ID
             updates: Dictionary of field updates
-            retry_count: Current retry attempt (for internal use)
             
         Returns:
             True if update successful
         """
-        max_retries = 2
-        
         try:
-            # Apply rate limiting
-            self._apply_rate_limiting()
-            
             # Prepare update data
             data = {
                 'fields': updates
             }
             
             url = f"{self.base_url}/{record_id}"
-            response = requests.patch(url, headers=self.headers, json=data, timeout=30)
+            response = self.transport.patch(url, json=data)
             
             if response.status_code == 200:
                 logger.debug(f"✅ Successfully updated Airtable record {record_id}")
                 return True
-            elif response.status_code == 429 and retry_count < max_retries:
-                # Rate limited - wait and retry
-                wait_time = (retry_count + 1) * 2  # Exponential backoff: 2s, 4s
-                logger.warning(f"⚠️ Rate limited, waiting {wait_time}s before retry {retry_count + 1}/{max_retries}")
-                time.sleep(wait_time)
-                return self._update_airtable_record(record_id, updates, retry_count + 1)
-            elif response.status_code in [500, 502, 503, 504] and retry_count < max_retries:
-                # Server error - retry once
-                wait_time = 1
-                logger.warning(f"⚠️ Server error {response.status_code}, retrying in {wait_time}s")
-                time.sleep(wait_time)
-                return self._update_airtable_record(record_id, updates, retry_count + 1)
             else:
                 logger.error(f"❌ Failed to update Airtable record {record_id}: {response.status_code} - {response.text}")
                 return False
                 
-        except requests.exceptions.Timeout as e:
-            if retry_count < max_retries:
-                logger.warning(f"⚠️ Request timeout, retrying {retry_count + 1}/{max_retries}")
-                time.sleep(1)
-                return self._update_airtable_record(record_id, updates, retry_count + 1)
-            else:
-                logger.error(f"❌ Request timeout updating Airtable record {record_id}: {str(e)}")
-                return False
         except Exception as e:
             logger.error(f"❌ Exception updating Airtable record {record_id}: {str(e)}")
             return False
     
-    def _apply_rate_limiting(self):
-        """Apply rate limiting for Airtable API requests."""
-        now = time.time()
-        time_since_last = now - self.last_request_time
+    def _update_airtable_records_batch(self, updates: Dict[str, Dict[str, Any]]) -> set:
+        """
+        Update many Airtable records, 10 per request (Airtable API limit).
         
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
-            time.sleep(sleep_time)
+        A failed request fails only the records it carried.
+        
+        Args:
+            updates: Dictionary of record ID to field updates
+            
+        Returns:
+            Set of record IDs that were updated
+        """
+        items = list(updates.items())
+        batches = [items[i:i + self.UPDATE_BATCH_SIZE] for i in range(0, len(items), self.UPDATE_BATCH_SIZE)]
+        
+        def update_batch(batch: List[tuple]) -> List[str]:
+            try:
+                response = self.transport.patch(self.base_url, json={
+                    'records': [{'id': record_id, 'fields': fields} for record_id, fields in batch]
+                })
+                
+                if response.status_code == 200:
+                    logger.debug(f"✅ Successfully updated {len(batch)} Airtable records")
+                    return [record_id for record_id, _ in batch]
+                
+                logger.error(f"❌ Failed to update {len(batch)} Airtable records: {response.status_code} - {response.text}")
+                return []
+                
+            except Exception as e:
+                logger.error(f"❌ Exception updating {len(batch)} Airtable records: {str(e)}")
+                return []
         
-        self.last_request_time = time.time()
+        return {record_id for updated in self.transport.map(update_batch, batches) for record_id in updated}
     
     def get_default_values(self) -> Dict[str, str]:
         """
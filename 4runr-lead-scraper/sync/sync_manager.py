@@ -3,7 +3,9 @@
 Sync Manager
 
 Coordinates synchronization operations between the local database and external systems.
-Handles scheduling, conflict resolution, and sync orchestration.
+Handles scheduling, conflict resolution, and sync orchestration. With adaptive
+scheduling the loop pushes sooner as the pending backlog grows, backs off
+while idle, and pulls from Airtable more often while pulls keep finding changes.
 """
 
 import logging
@@ -17,7 +19,9 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from .adaptive_schedule import AdaptiveSyncPolicy, estimate_pull_requests
 from .airtable_sync import AirtableSync
+from .sync_scheduler import get_sync_scheduler
 from database.models import get_lead_database
 from config.settings import get_settings
 
@@ -37,6 +41,10 @@ class SyncManager:
         # Sync scheduling
         self.sync_interval = self.settings.airtable.sync_interval_minutes * 60  # Convert to seconds
         self.auto_sync_enabled = self.settings.airtable.auto_sync_enabled
+        self.adaptive_scheduling = self.settings.sync.adaptive_scheduling
+        self.schedule_policy = AdaptiveSyncPolicy.from_settings(
+            self.settings.sync, self.sync_interval, self.airtable_sync.transport.limiter.rate
+        )
         
         # Threading
         self._sync_thread = None
@@ -54,7 +62,8 @@ class SyncManager:
         
         logger.info("🔄 Sync Manager initialized")
         logger.info(f"⚙️ Auto sync enabled: {self.auto_sync_enabled}")
-        logger.info(f"⚙️ Sync interval: {self.sync_interval // 60} minutes")
+        logger.info(f"⚙️ Sync interval: {self.sync_interval // 60} minutes"
+                    f"{' (adaptive)' if self.adaptive_scheduling else ''}")
     
     def start_automatic_sync(self):
         """Start automatic synchronization in background thread."""
@@ -96,7 +105,7 @@ class SyncManager:
                 self._perform_scheduled_sync()
                 
                 # Wait for next sync interval
-                self._stop_event.wait(self.sync_interval)
+                self._stop_event.wait(self._next_sync_wait())
                 
             except Exception as e:
                 logger.error(f"❌ Error in sync loop: {str(e)}")
@@ -105,6 +114,24 @@ class SyncManager:
         
         logger.info("🔄 Sync loop stopped")
     
+    def _next_sync_wait(self) -> float:
+        """
+        Seconds until the next scheduled sync.
+        
+        Fixed at the configured interval unless adaptive scheduling is
+        enabled, in which case the push interval follows the depth and age
+        of the sync outbox and the loop also wakes up when a pull is due.
+        """
+        if not self.adaptive_scheduling:
+            return self.sync_interval
+        
+        backlog = get_sync_scheduler().get_push_backlog()
+        push_wait = self.schedule_policy.next_push_interval(
+            backlog['pending_count'], backlog['oldest_pending_age_seconds']
+        )
+        pull_wait = max(self.schedule_policy.seconds_until_pull(), self.schedule_policy.min_push_interval)
+        return min(push_wait, pull_wait)
+    
     def _perform_scheduled_sync(self):
         """Perform scheduled sync operations."""
         with self._sync_lock:
@@ -114,7 +141,7 @@ class SyncManager:
                 # Sync to Airtable (frequent)
                 to_airtable_result = self.sync_to_airtable()
                 
-                # Sync from Airtable (less frequent - daily)
+                # Sync from Airtable (less frequent - daily, or as often as changes warrant)
                 should_sync_from_airtable = self._should_sync_from_airtable()
                 from_airtable_result = None
                 
@@ -134,8 +161,12 @@ class SyncManager:
         """
         Sync leads from database to Airtable.
         
+        Leads are pushed through the sync outbox shared with the sync
+        scheduler, so they are never sent while an outbox worker is sending
+        them too.
+        
         Args:
-            force: Force sync even if recently synced
+            force: Also push leads that are already synced (up to 100)
             
         Returns:
             Sync result dictionary
@@ -143,7 +174,12 @@ class SyncManager:
         logger.info("📤 Starting manual sync to Airtable")
         
         try:
-            result = self.airtable_sync.sync_leads_to_airtable(force=force)
+            scheduler = get_sync_scheduler()
+            if force:
+                lead_ids = [lead.id for lead in self.db.search_leads({}, limit=100)]
+                result = scheduler.push_leads_to_airtable(lead_ids)
+            else:
+                result = scheduler.sync_all_pending_to_airtable()
             
             if result['success']:
                 self.sync_stats['last_sync_to_airtable'] = datetime.now().isoformat()
@@ -164,7 +200,8 @@ class SyncManager:
                     else:
                         logger.debug("🎯 No engagement defaults needed (all leads already have values)")
             else:
-                logger.error(f"❌ Sync to Airtable failed: {result['failed_count']} failures")
+                logger.error(f"❌ Sync to Airtable failed: {result.get('failed_count', 0)} failures "
+                             f"{result.get('errors') or result.get('error')}")
             
             return result
             
@@ -198,6 +235,14 @@ class SyncManager:
             else:
                 logger.error(f"❌ Sync from Airtable failed: {result['failed_count']} failures")
             
+            # Forced pulls re-apply every record, so they say nothing about the change rate;
+            # failed pulls count as finding nothing, so the interval backs off
+            if not force:
+                self.schedule_policy.record_pull(
+                    result['synced_count'] if result['success'] else 0,
+                    estimate_pull_requests(result, self.airtable_sync.pull_page_size)
+                )
+            
             return result
             
         except Exception as e:
@@ -257,6 +302,9 @@ class SyncManager:
     
     def _should_sync_from_airtable(self) -> bool:
         """Determine if we should sync from Airtable based on timing."""
+        if self.adaptive_scheduling:
+            return self.schedule_policy.pull_due()
+        
         last_sync = self.sync_stats.get('last_sync_from_airtable')
         
         if not last_sync:
@@ -308,7 +356,10 @@ class SyncManager:
                     'auto_sync_enabled': self.auto_sync_enabled,
                     'sync_interval_minutes': self.sync_interval // 60,
                     'sync_thread_active': self._sync_thread and self._sync_thread.is_alive(),
-                    'statistics': self.sync_stats
+                    'statistics': self.sync_stats,
+                    'adaptive_scheduling': self.adaptive_scheduling,
+                    'schedule': self.schedule_policy.get_state(),
+                    'backlog': get_sync_scheduler().get_push_backlog()
                 },
                 'airtable_sync': airtable_status,
                 'database_stats': db_stats,
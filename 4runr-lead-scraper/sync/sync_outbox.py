@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+"""
+Durable Sync Outbox
+
+Queue of leads waiting to be pushed to Airtable, kept in the lead database
+itself so pending work survives crashes and restarts. SQLite triggers on the
+leads table (or explicit enqueue calls) add a row whenever a lead's data
+changes; repeated changes to the same lead coalesce into that one row. A
+fixed pool of workers drains the queue in batches of 10, one Airtable
+request per batch, and failed leads are retried with exponential backoff.
+
+The outbox is the only path that pushes leads: claimed leads are marked
+sync_status = 'syncing' so scans for pending leads skip them, and writes
+that apply changes pulled from Airtable run with the triggers suppressed
+so they are not pushed straight back.
+"""
+
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.logging import get_logger
+
+# Leads per claim (Airtable accepts 10 records per request)
+OUTBOX_BATCH_SIZE = 10
+
+DEFAULT_WORKERS = 2
+DEFAULT_POLL_INTERVAL = 5.0
+
+# Retry delay is BACKOFF_BASE_SECONDS * 2**(attempts - 1), capped
+BACKOFF_BASE_SECONDS = 5
+MAX_BACKOFF_SECONDS = 3600
+
+# Claims older than this belong to a worker that died and are handed out again
+CLAIM_TIMEOUT_SECONDS = 300
+
+# Bookkeeping columns whose changes do not need pushing to Airtable
+UNTRACKED_COLUMNS = frozenset({'id', 'airtable_id', 'airtable_synced', 'sync_status', 'created_at', 'updated_at'})
+
+# Current time as fractional Unix seconds, usable inside triggers
+_NOW_SQL = "((julianday('now') - 2440587.5) * 86400.0)"
+
+_TRIGGER_NAMES = ('sync_outbox_after_insert', 'sync_outbox_after_update')
+
+# The triggers do nothing while this table has a row (see suppress_outbox_triggers)
+_NOT_SUPPRESSED_SQL = "NOT EXISTS (SELECT 1 FROM sync_outbox_suppressed)"
+
+_ENQUEUE_SQL = f"""
+    INSERT INTO sync_outbox (lead_id, operation, enqueued_at, changed_at, next_attempt_at)
+    VALUES ({{lead_id}}, {{operation}}, {_NOW_SQL}, {_NOW_SQL}, {_NOW_SQL})
+    ON CONFLICT(lead_id) DO UPDATE SET
+        generation = generation + 1,
+        changed_at = excluded.changed_at
+"""
+
+logger = get_logger('sync-outbox')
+
+
+def ensure_sync_outbox(conn: sqlite3.Connection) -> None:
+    """
+    Create the sync_outbox table if it does not exist.
+
+    One row per lead: enqueued_at is when the oldest unsent change arrived,
+    generation counts changes coalesced into the row so a worker can tell
+    whether the lead changed again while it was being sent.
+
+    Args:
+        conn: Connection to the lead database
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS sync_outbox (
+            lead_id TEXT PRIMARY KEY,
+            operation TEXT NOT NULL,
+            enqueued_at REAL NOT NULL,
+            changed_at REAL NOT NULL,
+            generation INTEGER NOT NULL DEFAULT 0,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at REAL NOT NULL,
+            claimed_by TEXT,
+            claimed_at REAL,
+            last_error TEXT
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sync_outbox_next_attempt ON sync_outbox(next_attempt_at)")
+    conn.execute("CREATE TABLE IF NOT EXISTS sync_outbox_suppressed (marker INTEGER)")
+
+
+def install_outbox_triggers(conn: sqlite3.Connection) -> None:
+    """
+    (Re)create the triggers that enqueue leads when their data changes.
+
+    Updates that only touch sync bookkeeping columns (sync_status,
+    airtable_id, ...) are ignored, so recording a sync result never
+    re-enqueues the lead. Writes made inside suppress_outbox_triggers()
+    are ignored as well.
+
+    Args:
+        conn: Connection to the lead database
+    """
+    ensure_sync_outbox(conn)
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(leads)") if row[1] not in UNTRACKED_COLUMNS]
+
+    for trigger in _TRIGGER_NAMES:
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+    conn.execute(f"""
+        CREATE TRIGGER sync_outbox_after_insert AFTER INSERT ON leads
+        WHEN {_NOT_SUPPRESSED_SQL} BEGIN
+            {_ENQUEUE_SQL.format(lead_id='NEW.id', operation="'insert'")};
+        END
+    """)
+
+    if columns:
+        changed = ' OR '.join(f"OLD.{column} IS NOT NEW.{column}" for column in columns)
+        conn.execute(f"""
+            CREATE TRIGGER sync_outbox_after_update AFTER UPDATE OF {', '.join(columns)} ON leads
+            WHEN {_NOT_SUPPRESSED_SQL} AND ({changed}) BEGIN
+                {_ENQUEUE_SQL.format(lead_id='NEW.id', operation="'update'")};
+            END
+        """)
+
+
+def remove_outbox_triggers(conn: sqlite3.Connection) -> None:
+    """Drop the enqueue triggers; queued rows are kept."""
+    for trigger in _TRIGGER_NAMES:
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+
+@contextmanager
+def suppress_outbox_triggers(conn: sqlite3.Connection):
+    """
+    Keep writes made on conn inside the block out of the outbox.
+
+    Used when applying records pulled from Airtable, which already holds
+    those values. The marker row is inserted and deleted inside the
+    caller's transaction, so other connections never see it; SQLite
+    serializes writers, so no other write can run while it exists.
+
+    Args:
+        conn: Connection to the lead database; the caller commits
+    """
+    ensure_sync_outbox(conn)
+    conn.execute("INSERT INTO sync_outbox_suppressed (marker) VALUES (1)")
+    try:
+        yield conn
+    finally:
+        conn.execute("DELETE FROM sync_outbox_suppressed")
+
+
+def enqueue_leads(conn: sqlite3.Connection, lead_ids: Iterable[str], operation: str = 'update') -> None:
+    """
+    Enqueue leads on an open connection (joins the caller's transaction).
+
+    Args:
+        conn: Connection to the lead database
+        lead_ids: Leads to push
+        operation: 'insert' or 'update'
+    """
+    conn.executemany(
+        _ENQUEUE_SQL.format(lead_id='?', operation='?'),
+        [(lead_id, operation) for lead_id in lead_ids]
+    )
+
+
+class SyncOutbox:
+    """
+    Access to the sync_outbox table of one lead database.
+    """
+
+    def __init__(self, db_path: str, claim_timeout: float = CLAIM_TIMEOUT_SECONDS):
+        """
+        Initialize the outbox and create its table if needed.
+
+        Args:
+            db_path: Path to the lead database
+            claim_timeout: Seconds after which an unfinished claim is reclaimed
+        """
+        self.db_path = db_path
+        self.claim_timeout = claim_timeout
+
+        with self._connect() as conn:
+            ensure_sync_outbox(conn)
+            # Workers can drain an outbox without a leads table (e.g. in tests)
+            self._has_leads_table = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'leads'"
+            ).fetchone() is not None
+
+    @contextmanager
+    def _connect(self):
+        """Short-lived autocommit connection; transactions are explicit."""
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def install_triggers(self) -> None:
+        """(Re)create the enqueue triggers on the leads table."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                install_outbox_triggers(conn)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def enqueue_pending(self) -> int:
+        """
+        Enqueue leads marked sync_status = 'pending' that are not queued yet.
+
+        Picks up leads written without the triggers (other databases,
+        imports, older versions). Leads already queued are left as they are,
+        so this does not make in-flight leads look changed.
+
+        Returns:
+            Number of leads enqueued
+        """
+        if not self._has_leads_table:
+            return 0
+
+        with self._connect() as conn:
+            cursor = conn.execute(f"""
+                INSERT INTO sync_outbox (lead_id, operation, enqueued_at, changed_at, next_attempt_at)
+                SELECT id, CASE WHEN ifnull(airtable_id, '') = '' THEN 'insert' ELSE 'update' END,
+                       {_NOW_SQL}, {_NOW_SQL}, {_NOW_SQL}
+                FROM leads
+                WHERE sync_status = 'pending'
+                  AND id NOT IN (SELECT lead_id FROM sync_outbox)
+            """)
+            return cursor.rowcount
+
+    def enqueue(self, lead_ids: Iterable[str], operation: str = 'update') -> None:
+        """
+        Enqueue leads for pushing, coalescing with rows already queued.
+
+        Args:
+            lead_ids: Leads to push
+            operation: 'insert' or 'update'
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                enqueue_leads(conn, lead_ids, operation)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def claim(self, limit: int = OUTBOX_BATCH_SIZE,
+              lead_ids: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Claim up to limit due leads, oldest first.
+
+        Claimed leads are marked sync_status = 'syncing' so that scans for
+        pending leads do not push them a second time.
+
+        Args:
+            limit: Maximum number of leads to claim
+            lead_ids: Only claim these leads (any due lead if None)
+
+        Returns:
+            Claim with 'token' and 'entries' (lead_id, generation, attempts),
+            or None if nothing is due
+        """
+        token = uuid.uuid4().hex
+
+        only = ''
+        params: List[Any] = [self.claim_timeout]
+        if lead_ids is not None:
+            lead_ids = list(lead_ids)
+            if not lead_ids:
+                return None
+            only = f"AND lead_id IN ({', '.join('?' for _ in lead_ids)})"
+            params.extend(lead_ids)
+        params.append(limit)
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute(f"""
+                    SELECT lead_id, generation, attempts FROM sync_outbox
+                    WHERE next_attempt_at <= {_NOW_SQL}
+                      AND (claimed_by IS NULL OR claimed_at < {_NOW_SQL} - ?)
+                      {only}
+                    ORDER BY enqueued_at
+                    LIMIT ?
+                """, params).fetchall()
+
+                if rows:
+                    conn.executemany(
+                        f"UPDATE sync_outbox SET claimed_by = ?, claimed_at = {_NOW_SQL} WHERE lead_id = ?",
+                        [(token, row['lead_id']) for row in rows]
+                    )
+                    if self._has_leads_table:
+                        conn.executemany(
+                            "UPDATE leads SET sync_status = 'syncing' WHERE id = ?",
+                            [(row['lead_id'],) for row in rows]
+                        )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        if not rows:
+            return None
+        return {'token': token, 'entries': [dict(row) for row in rows]}
+
+    def complete(self, claim: Dict[str, Any], lead_ids: Iterable[str]) -> None:
+        """
+        Remove sent leads from the queue.
+
+        A lead that changed again while it was being sent keeps its row and
+        is released for another push.
+
+        Args:
+            claim: Claim returned by claim()
+            lead_ids: Leads of the claim that were pushed successfully
+        """
+        lead_ids = set(lead_ids)
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    "DELETE FROM sync_outbox WHERE lead_id = ? AND claimed_by = ? AND generation = ?",
+                    [(entry['lead_id'], claim['token'], entry['generation'])
+                     for entry in claim['entries'] if entry['lead_id'] in lead_ids]
+                )
+                conn.executemany(
+                    "UPDATE sync_outbox SET claimed_by = NULL, claimed_at = NULL, attempts = 0, "
+                    "last_error = NULL WHERE lead_id = ? AND claimed_by = ?",
+                    [(lead_id, claim['token']) for lead_id in lead_ids]
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def fail(self, claim: Dict[str, Any], lead_ids: Iterable[str], error: str) -> None:
+        """
+        Release leads that could not be pushed and schedule a retry.
+
+        The leads go back to sync_status = 'pending'.
+
+        Args:
+            claim: Claim returned by claim()
+            lead_ids: Leads of the claim that failed
+            error: Error message to record
+        """
+        lead_ids = set(lead_ids)
+        params = []
+        for entry in claim['entries']:
+            if entry['lead_id'] in lead_ids:
+                attempts = entry['attempts'] + 1
+                delay = min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), MAX_BACKOFF_SECONDS)
+                params.append((attempts, delay, error, entry['lead_id'], claim['token']))
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(f"""
+                    UPDATE sync_outbox
+                    SET attempts = ?, next_attempt_at = {_NOW_SQL} + ?, last_error = ?,
+                        claimed_by = NULL, claimed_at = NULL
+                    WHERE lead_id = ? AND claimed_by = ?
+                """, params)
+                if self._has_leads_table:
+                    conn.executemany(
+                        "UPDATE leads SET sync_status = 'pending' WHERE id = ? AND sync_status = 'syncing'",
+                        [(params_row[3],) for params_row in params]
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue depth and age.
+
+        Returns:
+            Dictionary with depth, ready, in_flight, retrying,
+            oldest_age_seconds and max_attempts
+        """
+        with self._connect() as conn:
+            row = conn.execute(f"""
+                SELECT
+                    COUNT(*) AS depth,
+                    ifnull(SUM(next_attempt_at <= {_NOW_SQL}
+                               AND (claimed_by IS NULL OR claimed_at < {_NOW_SQL} - ?)), 0) AS ready,
+                    ifnull(SUM(claimed_by IS NOT NULL AND claimed_at >= {_NOW_SQL} - ?), 0) AS in_flight,
+                    ifnull(SUM(attempts > 0), 0) AS retrying,
+                    ifnull({_NOW_SQL} - MIN(enqueued_at), 0) AS oldest_age_seconds,
+                    ifnull(MAX(attempts), 0) AS max_attempts
+                FROM sync_outbox
+            """, (self.claim_timeout, self.claim_timeout)).fetchone()
+
+        stats = dict(row)
+        stats['oldest_age_seconds'] = round(stats['oldest_age_seconds'], 3)
+        return stats
+
+
+class SyncOutboxWorkers:
+    """
+    Fixed-size pool of threads draining a SyncOutbox.
+    """
+
+    def __init__(self, outbox: SyncOutbox, sync_batch: Callable[[List[str]], Iterable[str]],
+                 workers: int = DEFAULT_WORKERS, poll_interval: float = DEFAULT_POLL_INTERVAL):
+        """
+        Initialize the worker pool.
+
+        Args:
+            outbox: Outbox to drain
+            sync_batch: Pushes a list of lead IDs and returns the IDs that
+                were synced; raising marks the whole batch as failed
+            workers: Number of worker threads
+            poll_interval: Seconds an idle worker waits before checking again
+        """
+        self.outbox = outbox
+        self.sync_batch = sync_batch
+        self.workers = workers
+        self.poll_interval = poll_interval
+
+        self._threads: List[threading.Thread] = []
+        self._running = threading.Event()
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker threads are running."""
+        return self._running.is_set()
+
+    def start(self) -> None:
+        """Start the worker threads (no-op if already running)."""
+        with self._lock:
+            if self._running.is_set():
+                return
+
+            self._running.set()
+            self._threads = [
+                threading.Thread(target=self._work, name=f"sync-outbox-{i}", daemon=True)
+                for i in range(self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+
+        logger.info(f"📬 Sync outbox workers started ({self.workers} threads)")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the worker threads after their current batch."""
+        with self._lock:
+            if not self._running.is_set():
+                return
+
+            self._running.clear()
+            self._wake.set()
+            for thread in self._threads:
+                thread.join(timeout=timeout)
+            self._threads = []
+
+        logger.info("📬 Sync outbox workers stopped")
+
+    def notify(self) -> None:
+        """Wake idle workers because new work was enqueued."""
+        self._wake.set()
+
+    def drain_once(self) -> int:
+        """
+        Claim and push a single batch in the calling thread.
+
+        Returns:
+            Number of leads claimed (0 if nothing was due)
+        """
+        claim = self.outbox.claim(OUTBOX_BATCH_SIZE)
+        if not claim:
+            return 0
+
+        self._push_claim(claim)
+        return len(claim['entries'])
+
+    def drain(self, lead_ids: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Push every due lead in the calling thread, batch by batch.
+
+        Runs alongside started workers; claims keep them from sending the
+        same lead twice.
+
+        Args:
+            lead_ids: Only push these leads (every due lead if None)
+
+        Returns:
+            Dictionary with synced_count and failed_count
+        """
+        if lead_ids is not None:
+            lead_ids = list(lead_ids)
+
+        totals = {'synced_count': 0, 'failed_count': 0}
+        while True:
+            claim = self.outbox.claim(OUTBOX_BATCH_SIZE, lead_ids)
+            if not claim:
+                return totals
+
+            synced = self._push_claim(claim)
+            totals['synced_count'] += synced
+            totals['failed_count'] += len(claim['entries']) - synced
+
+    def _push_claim(self, claim: Dict[str, Any]) -> int:
+        """Push one claimed batch and record the outcome; returns the number synced."""
+        lead_ids = [entry['lead_id'] for entry in claim['entries']]
+        try:
+            synced = set(self.sync_batch(lead_ids))
+        except Exception as e:
+            logger.error(f"❌ Outbox batch of {len(lead_ids)} leads failed: {str(e)}")
+            self.outbox.fail(claim, lead_ids, str(e))
+            return 0
+
+        failed = [lead_id for lead_id in lead_ids if lead_id not in synced]
+        if synced:
+            self.outbox.complete(claim, synced)
+        if failed:
+            self.outbox.fail(claim, failed, 'Sync to Airtable failed')
+
+        return len(lead_ids) - len(failed)
+
+    def _work(self) -> None:
+        """Worker loop: drain while there is work, otherwise wait."""
+        while self._running.is_set():
+            try:
+                if self.drain_once():
+                    continue
+            except Exception as e:
+                logger.error(f"❌ Sync outbox worker error: {str(e)}")
+
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
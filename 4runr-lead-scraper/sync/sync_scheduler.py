@@ -3,8 +3,11 @@
 Automatic Sync Scheduler
 
 Provides automatic bidirectional synchronization between the local database and Airtable:
-- Immediate sync to Airtable when changes are made to the database
+- Immediate sync to Airtable when changes are made to the database, through a
+  durable outbox drained by a fixed pool of workers
 - Daily sync from Airtable to get updates from external sources
+- Optionally, adaptive pushes of the pending backlog and pulls from Airtable
+  whose intervals follow the backlog and how often Airtable changes
 """
 
 import os
@@ -19,11 +22,16 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sync.adaptive_schedule import AdaptiveSyncPolicy, estimate_pull_requests
 from sync.airtable_sync import AirtableSync
+from sync.sync_outbox import SyncOutbox, SyncOutboxWorkers
 from database.models import get_lead_database
 from config.settings import get_settings
 from utils.logging import get_logger
 
+# Longest sleep of the scheduler loop, so scheduled jobs and stop() are noticed
+SCHEDULER_TICK_SECONDS = 30
+
 class SyncScheduler:
     """
     Automatic synchronization scheduler for bidirectional Airtable sync.
@@ -46,10 +54,24 @@ class SyncScheduler:
         self.immediate_sync_enabled = self.settings.sync.immediate_sync_enabled
         self.daily_sync_time = self.settings.sync.daily_sync_time
         self.sync_batch_size = self.settings.sync.batch_size
+        self.outbox_workers = self.settings.sync.outbox_workers
+        self.adaptive_scheduling = self.settings.sync.adaptive_scheduling
+        self.schedule_policy = AdaptiveSyncPolicy.from_settings(
+            self.settings.sync, SCHEDULER_TICK_SECONDS, self.airtable_sync.transport.limiter.rate
+        )
+        self._next_push_at = 0.0
+        
+        # Outbox of leads waiting for immediate sync (created on first use)
+        self._outbox = None
+        self._outbox_workers = None
+        self._outbox_lock = threading.Lock()
+        # Engagement defaults applied by the batches of a drain in the calling thread
+        self._drain_local = threading.local()
         
         self.logger.info("🔄 Sync Scheduler initialized")
         self.logger.info(f"⚙️ Immediate sync: {'Enabled' if self.immediate_sync_enabled else 'Disabled'}")
         self.logger.info(f"⚙️ Daily sync time: {self.daily_sync_time}")
+        self.logger.info(f"⚙️ Adaptive scheduling: {'Enabled' if self.adaptive_scheduling else 'Disabled'}")
     
     def start(self):
         """Start the sync scheduler."""
@@ -67,6 +89,10 @@ class SyncScheduler:
         self.scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
         self.scheduler_thread.start()
         
+        # Drain leads queued for immediate sync, including any left from a previous run
+        if self.immediate_sync_enabled:
+            self._get_outbox_workers().start()
+        
         self.logger.info("✅ Sync scheduler started successfully")
     
     def stop(self):
@@ -81,6 +107,9 @@ class SyncScheduler:
         # Clear scheduled jobs
         schedule.clear()
         
+        if self._outbox_workers:
+            self._outbox_workers.stop()
+        
         # Wait for scheduler thread to finish
         if self.scheduler_thread and self.scheduler_thread.is_alive():
             self.scheduler_thread.join(timeout=5)
@@ -91,6 +120,9 @@ class SyncScheduler:
         """
         Immediately sync a specific lead to Airtable.
         
+        The lead is pushed through the sync outbox (see push_leads_to_airtable),
+        so it is never sent alongside an outbox worker.
+        
         Args:
             lead_id: ID of the lead to sync
             
@@ -110,12 +142,10 @@ class SyncScheduler:
                 self.logger.error(f"❌ Lead {lead_id} not found")
                 return {'success': False, 'error': 'Lead not found'}
             
-            # Sync to Airtable
-            result = self.airtable_sync.sync_leads_to_airtable([lead], force=True)
+            result = self.push_leads_to_airtable([lead_id])
             
             if result['success']:
                 self.logger.info(f"✅ Lead {lead.name} synced to Airtable immediately")
-                self.last_sync_to_airtable = datetime.now()
             else:
                 self.logger.error(f"❌ Failed to sync lead {lead.name}: {result.get('errors', [])}")
             
@@ -125,35 +155,171 @@ class SyncScheduler:
             self.logger.error(f"❌ Immediate sync failed for lead {lead_id}: {str(e)}")
             return {'success': False, 'error': str(e)}
     
+    def push_leads_to_airtable(self, lead_ids: List[str], operation: str = 'update') -> Dict[str, Any]:
+        """
+        Push specific leads to Airtable now, through the sync outbox.
+        
+        The leads are queued and sent from the calling thread. A lead that an
+        outbox worker is already sending, or that is waiting out a retry
+        backoff, stays queued for the workers instead of being sent twice.
+        
+        Args:
+            lead_ids: IDs of the leads to push
+            operation: Type of operation ('insert' or 'update')
+            
+        Returns:
+            Sync result dictionary; queued_count leads were left to the workers
+        """
+        try:
+            lead_ids = list(dict.fromkeys(lead_ids))
+            workers = self._get_outbox_workers()
+            workers.outbox.enqueue(lead_ids, operation)
+            totals = self._drain(workers, lead_ids)
+            
+            queued = len(lead_ids) - totals['synced_count'] - totals['failed_count']
+            if queued and self.immediate_sync_enabled:
+                workers.start()
+                workers.notify()
+            
+            if totals['synced_count']:
+                self.last_sync_to_airtable = datetime.now()
+            
+            return {
+                'success': totals['failed_count'] == 0,
+                'synced_count': totals['synced_count'],
+                'failed_count': totals['failed_count'],
+                'queued_count': queued,
+                'errors': ([f"{totals['failed_count']} leads failed and were queued for retry"]
+                           if totals['failed_count'] else []),
+                'defaults_applied': totals['defaults_applied']
+            }
+            
+        except Exception as e:
+            self.logger.error(f"❌ Push to Airtable failed: {str(e)}")
+            return {'success': False, 'error': str(e), 'errors': [str(e)]}
+    
+    def enqueue_lead_sync(self, lead_id: str, operation: str = 'update'):
+        """
+        Queue a lead for immediate sync to Airtable.
+        
+        The lead is written to the durable outbox, so the request survives a
+        restart; repeated requests for the same lead before it is sent are
+        coalesced into one push.
+        
+        Args:
+            lead_id: ID of the lead to sync
+            operation: Type of operation ('insert' or 'update')
+        """
+        if not self.immediate_sync_enabled:
+            self.logger.debug(f"⏭️ Immediate sync disabled, skipping lead {lead_id}")
+            return
+        
+        workers = self._get_outbox_workers()
+        workers.outbox.enqueue([lead_id], operation)
+        workers.start()
+        workers.notify()
+    
+    def _get_outbox_workers(self) -> SyncOutboxWorkers:
+        """Get the outbox worker pool, creating the outbox on first use."""
+        with self._outbox_lock:
+            if self._outbox_workers is None:
+                self._outbox = SyncOutbox(self.db.db.db_path)
+                # Every write to the lead database queues the lead, whichever connection made it
+                self._outbox.install_triggers()
+                self._outbox_workers = SyncOutboxWorkers(
+                    self._outbox, self._sync_outbox_batch, workers=self.outbox_workers
+                )
+            return self._outbox_workers
+    
+    def _drain(self, workers: SyncOutboxWorkers, lead_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Drain the outbox in the calling thread.
+        
+        Returns:
+            The drain totals plus the engagement defaults its batches applied
+        """
+        defaults = {'count': 0, 'fields_updated': [], 'errors': []}
+        self._drain_local.defaults = defaults
+        try:
+            totals = workers.drain(lead_ids)
+        finally:
+            self._drain_local.defaults = None
+        return {**totals, 'defaults_applied': defaults}
+    
+    def _sync_outbox_batch(self, lead_ids: List[str]) -> List[str]:
+        """
+        Push one batch of queued leads to Airtable.
+        
+        Args:
+            lead_ids: IDs of the queued leads (at most one Airtable request's worth)
+            
+        Returns:
+            IDs that no longer need syncing: leads Airtable now matches and
+            leads that were deleted since they were queued
+        """
+        leads = [lead for lead in (self.db.get_lead(lead_id) for lead_id in lead_ids) if lead]
+        found = {lead.id for lead in leads}
+        done = [lead_id for lead_id in lead_ids if lead_id not in found]
+        
+        if leads:
+            result = self.airtable_sync.sync_leads_to_airtable(leads, force=True)
+            done.extend(result.get('synced_lead_ids', []))
+            
+            defaults = getattr(self._drain_local, 'defaults', None)
+            applied = result.get('defaults_applied')
+            if defaults is not None and applied:
+                defaults['count'] += applied.get('count', 0)
+                defaults['fields_updated'].extend(
+                    field for field in applied.get('fields_updated', []) if field not in defaults['fields_updated']
+                )
+                defaults['errors'].extend(applied.get('errors', []))
+            
+            if result['success']:
+                self.last_sync_to_airtable = datetime.now()
+            else:
+                self.logger.warning(f"⚠️ Outbox batch sync incomplete: {result.get('errors', [])}")
+        
+        return done
+    
     def sync_all_pending_to_airtable(self) -> Dict[str, Any]:
         """
         Sync all pending leads to Airtable.
         
+        Pending leads are pushed through the sync outbox, in the calling
+        thread and alongside any running outbox workers, so no lead is sent
+        by two paths at once.
+        
         Returns:
             Sync result dictionary
         """
         try:
             self.logger.info("📤 Syncing all pending leads to Airtable")
             
-            # Get pending leads
-            pending_leads = self.db.search_leads({'sync_status': 'pending'}, limit=self.sync_batch_size)
+            workers = self._get_outbox_workers()
+            queued = workers.outbox.enqueue_pending()
+            if queued:
+                self.logger.info(f"📋 Queued {queued} pending leads")
             
-            if not pending_leads:
-                self.logger.info("✅ No pending leads to sync")
-                return {'success': True, 'synced_count': 0}
-            
-            self.logger.info(f"📋 Found {len(pending_leads)} pending leads")
+            totals = self._drain(workers)
             
-            # Sync to Airtable
-            result = self.airtable_sync.sync_leads_to_airtable(pending_leads)
+            if totals['synced_count'] == 0 and totals['failed_count'] == 0:
+                self.logger.info("✅ No pending leads to sync")
+            elif totals['failed_count'] == 0:
+                self.logger.info(f"✅ {totals['synced_count']} leads synced to Airtable")
+            else:
+                self.logger.error(f"❌ Sync failed: {totals['failed_count']} failures (queued for retry)")
             
-            if result['success']:
-                self.logger.info(f"✅ {result['synced_count']} leads synced to Airtable")
+            if totals['synced_count']:
                 self.last_sync_to_airtable = datetime.now()
-            else:
-                self.logger.error(f"❌ Sync failed: {result['failed_count']} failures")
             
-            return result
+            return {
+                'success': totals['failed_count'] == 0,
+                'synced_count': totals['synced_count'],
+                'failed_count': totals['failed_count'],
+                'errors': ([f"{totals['failed_count']} leads failed and were queued for retry"]
+                           if totals['failed_count'] else []),
+                'defaults_applied': totals['defaults_applied']
+            }
             
         except Exception as e:
             self.logger.error(f"❌ Batch sync to Airtable failed: {str(e)}")
@@ -181,6 +347,14 @@ class SyncScheduler:
             else:
                 self.logger.error(f"❌ Sync from Airtable failed: {result.get('errors', [])}")
             
+            # Forced pulls re-apply every record, so they say nothing about the change rate;
+            # failed pulls count as finding nothing, so the interval backs off
+            if not force:
+                self.schedule_policy.record_pull(
+                    result['synced_count'] if result['success'] else 0,
+                    estimate_pull_requests(result, self.airtable_sync.pull_page_size)
+                )
+            
             return result
             
         except Exception as e:
@@ -197,6 +371,7 @@ class SyncScheduler:
         try:
             # Get base sync status from AirtableSync
             base_status = self.airtable_sync.get_sync_status()
+            backlog = self.get_push_backlog()
             
             # Add scheduler-specific information
             scheduler_status = {
@@ -206,7 +381,15 @@ class SyncScheduler:
                 'last_sync_to_airtable': self.last_sync_to_airtable.isoformat() if self.last_sync_to_airtable else None,
                 'last_sync_from_airtable': self.last_sync_from_airtable.isoformat() if self.last_sync_from_airtable else None,
                 'next_daily_sync': self._get_next_daily_sync_time(),
-                'pending_leads_count': len(self.db.search_leads({'sync_status': 'pending'}))
+                'pending_leads_count': backlog['pending_count'],
+                'adaptive_scheduling': self.adaptive_scheduling,
+                'schedule': self.schedule_policy.get_state(),
+                'backlog': backlog,
+                'outbox': {
+                    **self._get_outbox_workers().outbox.get_stats(),
+                    'workers': self.outbox_workers,
+                    'workers_running': self._outbox_workers.running
+                }
             }
             
             return {
@@ -231,8 +414,10 @@ class SyncScheduler:
                 if self.immediate_sync_enabled:
                     self._check_for_immediate_sync()
                 
-                # Sleep for a short interval
-                time.sleep(30)  # Check every 30 seconds
+                if self.adaptive_scheduling:
+                    time.sleep(self._run_adaptive_cycle())
+                else:
+                    time.sleep(SCHEDULER_TICK_SECONDS)  # Check every 30 seconds
                 
             except Exception as e:
                 self.logger.error(f"❌ Scheduler loop error: {str(e)}")
@@ -240,6 +425,52 @@ class SyncScheduler:
         
         self.logger.info("🔄 Scheduler loop stopped")
     
+    def _run_adaptive_cycle(self, now: Optional[float] = None) -> float:
+        """
+        Push the pending backlog and pull from Airtable when each is due.
+        
+        The push interval follows the depth of the sync outbox, and pushes
+        drain the outbox, so they never race the outbox workers.
+        
+        Args:
+            now: Monotonic time of the cycle (defaults to now)
+            
+        Returns:
+            Seconds to sleep before the next cycle
+        """
+        now = time.monotonic() if now is None else now
+        backlog = self.get_push_backlog()
+        
+        if now >= self._next_push_at:
+            if backlog['pending_count'] > 0:
+                self.sync_all_pending_to_airtable()
+                backlog = self.get_push_backlog()
+            push_interval = self.schedule_policy.next_push_interval(
+                backlog['pending_count'], backlog['oldest_pending_age_seconds']
+            )
+            self._next_push_at = now + push_interval
+        
+        if self.schedule_policy.pull_due(now):
+            self.sync_from_airtable_now()
+        
+        next_event = min(self._next_push_at - now, self.schedule_policy.seconds_until_pull())
+        return min(SCHEDULER_TICK_SECONDS, max(self.schedule_policy.min_push_interval, next_event))
+    
+    def get_push_backlog(self) -> Dict[str, Any]:
+        """
+        Size and age of the sync outbox, which holds every lead waiting to be pushed.
+        
+        Returns:
+            Dictionary with pending_count and oldest_pending_age_seconds
+        """
+        outbox = self._get_outbox_workers().outbox
+        outbox.enqueue_pending()
+        stats = outbox.get_stats()
+        return {
+            'pending_count': stats['depth'],
+            'oldest_pending_age_seconds': stats['oldest_age_seconds']
+        }
+    
     def _run_daily_sync_from_airtable(self):
         """Run the daily sync from Airtable (scheduled job)."""
         self.logger.info("📅 Running daily sync from Airtable")
@@ -261,25 +492,15 @@ class SyncScheduler:
             self.logger.error(f"❌ Daily sync job failed: {str(e)}")
     
     def _check_for_immediate_sync(self):
-        """Check for leads that need immediate sync."""
+        """Queue pending leads the outbox triggers did not see and wake the workers."""
         try:
-            # Get recently modified leads that haven't been synced
-            cutoff_time = datetime.now() - timedelta(minutes=5)  # Last 5 minutes
-            
-            # This is a simplified check - in a real implementation, you might want
-            # to track database changes more precisely
-            pending_leads = self.db.search_leads({
-                'sync_status': 'pending',
-                'updated_at_after': cutoff_time.isoformat()
-            }, limit=10)
-            
-            if pending_leads:
-                self.logger.debug(f"🔄 Found {len(pending_leads)} leads for immediate sync")
-                result = self.airtable_sync.sync_leads_to_airtable(pending_leads)
-                
-                if result['success'] and result['synced_count'] > 0:
-                    self.logger.info(f"✅ Immediately synced {result['synced_count']} leads")
-                    self.last_sync_to_airtable = datetime.now()
+            workers = self._get_outbox_workers()
+            queued = workers.outbox.enqueue_pending()
+            
+            if queued:
+                self.logger.debug(f"🔄 Queued {queued} pending leads for immediate sync")
+                workers.start()
+                workers.notify()
             
         except Exception as e:
             self.logger.debug(f"⚠️ Immediate sync check failed: {str(e)}")
@@ -329,6 +550,19 @@ def sync_lead_immediately(lead_id: str) -> Dict[str, Any]:
     scheduler = get_sync_scheduler()
     return scheduler.sync_lead_to_airtable_immediately(lead_id)
 
+def push_leads(lead_ids: List[str]) -> Dict[str, Any]:
+    """
+    Push specific leads to Airtable through the sync outbox (convenience function).
+    
+    Args:
+        lead_ids: IDs of the leads to push
+        
+    Returns:
+        Sync result dictionary
+    """
+    scheduler = get_sync_scheduler()
+    return scheduler.push_leads_to_airtable(lead_ids)
+
 def sync_all_pending() -> Dict[str, Any]:
     """
     Sync all pending leads to Airtable (convenience function).
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Tests for adaptive sync scheduling.
+
+Push intervals follow the pending backlog, pull intervals follow how often
+Airtable changes, and both stay within their share of the API budget.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add the parent directory to the path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import SyncConfig
+from database.models import LeadDatabase
+from sync.adaptive_schedule import AdaptiveSyncPolicy, SyncLagTracker
+
+
+class TestAdaptiveSyncPolicy(unittest.TestCase):
+    """Test push and pull interval decisions."""
+
+    def setUp(self):
+        """Create a policy with a generous API budget."""
+        self.policy = AdaptiveSyncPolicy(
+            base_push_interval=300, min_push_interval=15, max_push_interval=3600,
+            target_lag_seconds=300, min_pull_interval=900, max_pull_interval=86400,
+            requests_per_second=5, budget_share=0.5
+        )
+
+    def test_idle_push_backs_off(self):
+        """Push interval doubles per idle cycle up to the maximum."""
+        intervals = [self.policy.next_push_interval(0, 0) for _ in range(6)]
+
+        self.assertEqual(intervals[:4], [600, 1200, 2400, 3600])
+        self.assertEqual(intervals[-1], 3600)
+
+    def test_backlog_shortens_push_interval(self):
+        """Larger and older backlogs are pushed sooner, never below the minimum."""
+        small = self.policy.next_push_interval(5, 10)
+        large = self.policy.next_push_interval(500, 10)
+        stale = self.policy.next_push_interval(5, 900)
+        huge = self.policy.next_push_interval(100000, 100000)
+
+        self.assertLess(large, small)
+        self.assertLess(stale, small)
+        self.assertEqual(huge, 15)
+
+    def test_backlog_after_idle_resets_interval(self):
+        """A new backlog is pushed promptly even after a long idle period."""
+        for _ in range(10):
+            self.policy.next_push_interval(0, 0)
+
+        self.assertLessEqual(self.policy.next_push_interval(1, 0), 300)
+
+    def test_push_interval_stays_within_budget(self):
+        """A tight budget floors the push interval at the cost of one push cycle."""
+        policy = AdaptiveSyncPolicy(
+            base_push_interval=300, min_push_interval=1, max_push_interval=3600,
+            requests_per_second=0.1, budget_share=0.5
+        )
+
+        # 100 leads take 10 requests, which need 200 seconds at 0.05 requests per second
+        self.assertEqual(policy.next_push_interval(1000, 10000), 200)
+
+    def test_pull_interval_follows_changes(self):
+        """Pulls that find changes halve the interval, empty pulls double it."""
+        self.assertTrue(self.policy.pull_due(now=0))
+
+        self.assertEqual(self.policy.record_pull(3, now=0), 43200)
+        self.assertFalse(self.policy.pull_due(now=43199))
+        self.assertTrue(self.policy.pull_due(now=43200))
+
+        for _ in range(10):
+            self.policy.record_pull(1, now=0)
+        self.assertEqual(self.policy.pull_interval, 900)
+
+        self.assertEqual(self.policy.record_pull(0, now=0), 1800)
+
+    def test_pull_interval_stays_within_budget(self):
+        """Pulls that take many requests are spaced to fit the budget."""
+        # 200000 requests need 80000 seconds at 2.5 requests per second
+        interval = self.policy.record_pull(5000, requests=200000, now=0)
+
+        self.assertEqual(interval, 80000)
+
+
+class TestSyncLagTracker(unittest.TestCase):
+    """Test sync lag percentiles."""
+
+    def test_percentiles(self):
+        """p50 and p95 are nearest-rank percentiles of the recorded lags."""
+        tracker = SyncLagTracker()
+        synced_at = datetime(2025, 1, 1, 12, 0, 0)
+        for seconds in range(1, 101):
+            tracker.record((synced_at - timedelta(seconds=seconds)).isoformat(), synced_at)
+
+        snapshot = tracker.snapshot()
+
+        self.assertEqual(snapshot['samples'], 100)
+        self.assertEqual(snapshot['p50_seconds'], 50)
+        self.assertEqual(snapshot['p95_seconds'], 95)
+        self.assertEqual(snapshot['max_seconds'], 100)
+
+    def test_window_and_invalid_timestamps(self):
+        """Only the most recent samples are kept and unparseable timestamps are ignored."""
+        tracker = SyncLagTracker(window=3)
+        synced_at = datetime(2025, 1, 1, 12, 0, 0)
+        for seconds in (100, 1, 2, 3):
+            tracker.record(synced_at - timedelta(seconds=seconds), synced_at)
+        tracker.record('not a date', synced_at)
+        tracker.record(None, synced_at)
+
+        self.assertEqual(tracker.snapshot()['samples'], 3)
+        self.assertEqual(tracker.snapshot()['max_seconds'], 3)
+
+    def test_empty_snapshot(self):
+        """A tracker without samples reports no percentiles."""
+        self.assertIsNone(SyncLagTracker().snapshot()['p95_seconds'])
+
+
+class TestSyncBacklog(unittest.TestCase):
+    """Test the backlog query that drives the push interval."""
+
+    def setUp(self):
+        """Create a temporary database."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = LeadDatabase(os.path.join(self.temp_dir, 'leads.db'))
+        # Columns normally added by database/migrations.py
+        self.db.db.execute_update("ALTER TABLE leads ADD COLUMN website TEXT")
+        self.db.db.execute_update("ALTER TABLE leads ADD COLUMN website_search_attempted BOOLEAN DEFAULT FALSE")
+        self.db.db.execute_update("ALTER TABLE leads ADD COLUMN website_search_timestamp TIMESTAMP")
+
+    def tearDown(self):
+        """Remove the temporary database."""
+        self.db.db.close_connections()
+        shutil.rmtree(self.temp_dir)
+
+    def test_backlog_counts_pending_leads(self):
+        """Pending leads are counted and the oldest one's age is reported."""
+        self.assertEqual(self.db.get_sync_backlog(), {'pending_count': 0, 'oldest_pending_age_seconds': 0.0})
+
+        old_id = self.db.create_lead({'name': 'Ann Lee'})
+        self.db.create_lead({'name': 'Bo Chan'})
+        synced_id = self.db.create_lead({'name': 'Cy Diaz'})
+        self.db.db.execute_update(
+            "UPDATE leads SET updated_at = ? WHERE id = ?",
+            ((datetime.now() - timedelta(minutes=10)).isoformat(), old_id)
+        )
+        self.db.db.execute_update("UPDATE leads SET sync_status = 'synced' WHERE id = ?", (synced_id,))
+
+        backlog = self.db.get_sync_backlog()
+
+        self.assertEqual(backlog['pending_count'], 2)
+        self.assertGreaterEqual(backlog['oldest_pending_age_seconds'], 600)
+
+
+
+class TestAdaptiveSyncCycle(unittest.TestCase):
+    """Test that adaptive pushes follow and drain the sync outbox."""
+
+    def setUp(self):
+        """Create a scheduler on a temporary database with a stubbed push."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = LeadDatabase(os.path.join(self.temp_dir, 'leads.db'))
+        self.db.db.execute_update("ALTER TABLE leads ADD COLUMN website TEXT")
+        self.db.db.execute_update("ALTER TABLE leads ADD COLUMN website_search_attempted BOOLEAN DEFAULT FALSE")
+        self.db.db.execute_update("ALTER TABLE leads ADD COLUMN website_search_timestamp TIMESTAMP")
+
+        settings = Mock()
+        settings.airtable.api_key = 'test_api_key'
+        settings.airtable.base_id = 'appTEST'
+        settings.airtable.table_name = 'Leads'
+        settings.airtable.endpoint_url = 'https://api.airtable.com'
+        settings.engagement_defaults.enabled = False
+        settings.sync = SyncConfig()
+        self.settings = settings
+
+        from sync.sync_scheduler import SyncScheduler
+        with patch('sync.sync_scheduler.get_settings', return_value=settings), \
+                patch('sync.airtable_sync.get_settings', return_value=settings), \
+                patch('sync.sync_scheduler.get_lead_database', return_value=self.db), \
+                patch('sync.airtable_sync.get_lead_database', return_value=self.db):
+            self.scheduler = SyncScheduler()
+
+        self.pushed = []
+
+        def push(leads, force=False):
+            self.pushed.extend(lead.id for lead in leads)
+            return {'success': True, 'synced_lead_ids': [lead.id for lead in leads],
+                    'defaults_applied': {'count': len(leads), 'fields_updated': ['Engagement_Status'], 'errors': []}}
+
+        self.scheduler.airtable_sync.sync_leads_to_airtable = push
+        self.scheduler.schedule_policy.pull_due = lambda *args: False
+        self.scheduler.schedule_policy.seconds_until_pull = lambda *args: 3600
+        # Creating the outbox installs the triggers that queue changed leads
+        self.outbox = self.scheduler._get_outbox_workers().outbox
+
+    def tearDown(self):
+        """Remove the temporary database."""
+        self.db.db.close_connections()
+        shutil.rmtree(self.temp_dir)
+
+    def test_plain_updates_drive_the_push(self):
+        """Leads changed through update_lead are counted and pushed via the outbox."""
+        lead_id = self.db.create_lead({'name': 'Ann Lee'})
+        self.outbox.complete(self.outbox.claim(), [lead_id])
+        self.db.update_lead(lead_id, {'sync_status': 'synced'})
+
+        self.db.update_lead(lead_id, {'company': 'Acme'})
+        self.assertEqual(self.scheduler.get_push_backlog()['pending_count'], 1)
+
+        self.scheduler._run_adaptive_cycle(now=0.0)
+
+        self.assertEqual(self.pushed, [lead_id])
+        self.assertEqual(self.outbox.get_stats()['depth'], 0)
+        self.assertEqual(self.scheduler.get_push_backlog()['pending_count'], 0)
+
+    def test_push_leads_goes_through_outbox(self):
+        """Pushing named leads sends them once and leaves other queued leads alone."""
+        pushed_id = self.db.create_lead({'name': 'Ann Lee'})
+        other_id = self.db.create_lead({'name': 'Bo Chan'})
+
+        result = self.scheduler.push_leads_to_airtable([pushed_id])
+
+        self.assertTrue(result['success'])
+        self.assertEqual(self.pushed, [pushed_id])
+        self.assertEqual(result['defaults_applied']['count'], 1)
+        self.assertIsNone(self.outbox.claim(lead_ids=[pushed_id]))
+        self.assertEqual([entry['lead_id'] for entry in self.outbox.claim()['entries']], [other_id])
+
+        # A lead an outbox worker is already sending is not sent a second time
+        self.db.update_lead(pushed_id, {'company': 'Acme'})
+        self.assertIsNotNone(self.outbox.claim(lead_ids=[pushed_id]))
+        result = self.scheduler.push_leads_to_airtable([pushed_id])
+        workers = self.scheduler._get_outbox_workers()
+        self.assertTrue(workers.running)
+        workers.stop()
+
+        self.assertEqual(result['queued_count'], 1)
+        self.assertEqual(self.pushed, [pushed_id])
+
+    def test_status_and_manager_follow_the_outbox(self):
+        """Leads being sent are no longer 'pending' but still count as waiting to be pushed."""
+        self.db.create_lead({'name': 'Ann Lee'})
+        self.outbox.claim()
+        self.assertEqual(self.db.get_sync_backlog()['pending_count'], 0)
+
+        status = self.scheduler.get_sync_status()
+        self.assertEqual(status['scheduler']['pending_leads_count'], 1)
+
+        from sync.sync_manager import SyncManager
+        self.settings.airtable.sync_interval_minutes = 30
+        self.settings.airtable.auto_sync_enabled = False
+        with patch('sync.sync_manager.get_settings', return_value=self.settings), \
+                patch('sync.airtable_sync.get_settings', return_value=self.settings), \
+                patch('sync.sync_manager.get_lead_database', return_value=self.db), \
+                patch('sync.airtable_sync.get_lead_database', return_value=self.db):
+            manager = SyncManager()
+        manager.schedule_policy.next_push_interval = Mock(return_value=42)
+        manager.schedule_policy.seconds_until_pull = lambda *args: 3600
+
+        with patch('sync.sync_manager.get_sync_scheduler', return_value=self.scheduler):
+            self.assertEqual(manager._next_sync_wait(), 42)
+        self.assertEqual(manager.schedule_policy.next_push_interval.call_args.args[0], 1)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
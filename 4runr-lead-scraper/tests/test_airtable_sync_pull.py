@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental pulls from Airtable.
+
+Covers paging through LAST_MODIFIED_TIME()-filtered results, batched
+application of each page and the persisted high-water mark.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+import sys
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+
+# Add the parent directory to the path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sync.airtable_sync import AirtableSync
+from database.models import LeadDatabase
+
+
+def _page(records, offset=None):
+    """Build a mock Airtable list response."""
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {'records': records, **({'offset': offset} if offset else {})}
+    return response
+
+
+def _record(airtable_id, name, email):
+    return {'id': airtable_id, 'fields': {'Full Name': name, 'Email': email, 'Company': 'Acme'}}
+
+
+class TestIncrementalPull(unittest.TestCase):
+    """Test delta pulls into a real database."""
+    
+    def setUp(self):
+        """Create a temporary database and an AirtableSync using it."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = LeadDatabase(os.path.join(self.temp_dir, 'leads.db'))
+        # Columns normally added by database/migrations.py
+        self.db.db.execute_update("ALTER TABLE leads ADD COLUMN website TEXT")
+        self.db.db.execute_update("ALTER TABLE leads ADD COLUMN website_search_attempted BOOLEAN DEFAULT FALSE")
+        self.db.db.execute_update("ALTER TABLE leads ADD COLUMN website_search_timestamp TIMESTAMP")
+        
+        settings = Mock()
+        settings.airtable.api_key = 'test_api_key'
+        settings.airtable.base_id = 'appTEST'
+        settings.airtable.table_name = 'Leads'
+        settings.airtable.endpoint_url = 'https://api.airtable.com'
+        settings.engagement_defaults.enabled = False
+        
+        self.patchers = [
+            patch('sync.airtable_sync.get_settings', return_value=settings),
+            patch('sync.airtable_sync.get_lead_database', return_value=self.db),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        
+        self.airtable_sync = AirtableSync()
+    
+    def tearDown(self):
+        """Stop patches and remove the temporary database."""
+        for patcher in self.patchers:
+            patcher.stop()
+        self.db.db.close_connections()
+        shutil.rmtree(self.temp_dir)
+    
+    @patch('sync.airtable_transport.AirtableTransport.get')
+    def test_pull_walks_all_pages(self, mock_get):
+        """Every page is requested via offset and applied."""
+        mock_get.side_effect = [
+            _page([_record('rec1', 'Ann Lee', 'ann@acme.com')], offset='page2'),
+            _page([_record('rec2', 'Bob Ray', 'bob@acme.com')]),
+        ]
+        
+        result = self.airtable_sync.sync_updates_from_airtable()
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(result['synced_count'], 2)
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertNotIn('filterByFormula', mock_get.call_args_list[0][1]['params'])
+        self.assertEqual(mock_get.call_args_list[1][1]['params']['offset'], 'page2')
+        self.assertEqual(set(self.db.get_lead_ids_by_airtable_ids(['rec1', 'rec2'])), {'rec1', 'rec2'})
+    
+    @patch('sync.airtable_transport.AirtableTransport.get')
+    def test_pull_resumes_from_watermark(self, mock_get):
+        """The next pull filters on the stored high-water mark and updates in place."""
+        mock_get.return_value = _page([_record('rec1', 'Ann Lee', 'ann@acme.com')])
+        self.airtable_sync.sync_updates_from_airtable()
+        
+        mock_get.reset_mock()
+        mock_get.return_value = _page([_record('rec1', 'Ann Lee-Smith', 'ann@acme.com')])
+        result = self.airtable_sync.sync_updates_from_airtable()
+        
+        formula = mock_get.call_args[1]['params']['filterByFormula']
+        self.assertIn('LAST_MODIFIED_TIME()', formula)
+        since = datetime.strptime(formula.split("'")[1], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc)
+        self.assertLess(since, datetime.now(timezone.utc) - timedelta(seconds=250))
+        
+        self.assertEqual(result['synced_count'], 1)
+        leads = self.db.search_leads({'airtable_id': 'rec1'})
+        self.assertEqual([lead.name for lead in leads], ['Ann Lee-Smith'])
+    
+    @patch('sync.airtable_transport.AirtableTransport.get')
+    def test_failed_page_keeps_watermark(self, mock_get):
+        """A failed fetch does not advance the high-water mark."""
+        error = Mock(status_code=500, text='error')
+        mock_get.side_effect = [_page([_record('rec1', 'Ann Lee', 'ann@acme.com')], offset='page2'), error]
+        
+        result = self.airtable_sync.sync_updates_from_airtable()
+        
+        self.assertFalse(result['success'])
+        self.assertEqual(result['synced_count'], 1)
+        self.assertIsNone(self.db.get_sync_watermark('from_airtable:appTEST:Leads'))
+    
+    @patch('sync.airtable_transport.AirtableTransport.get')
+    def test_matches_existing_lead_by_email(self, mock_get):
+        """Leads created locally are linked by email instead of duplicated."""
+        lead_id = self.db.create_lead({'name': 'Ann Lee', 'email': 'Ann@Acme.com'})
+        mock_get.return_value = _page([_record('rec1', 'Ann Lee', 'ann@acme.com'), _record('rec2', '', 'x@y.com')])
+        
+        result = self.airtable_sync.sync_updates_from_airtable()
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(result['skipped_count'], 1)
+        self.assertEqual(self.db.get_lead_ids_by_airtable_ids(['rec1']), {'rec1': lead_id})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for changed-field pushes to Airtable.
+
+Leads already in Airtable are patched with only the fields that changed
+since the last successful push; unchanged leads are not sent at all.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+import sys
+from pathlib import Path
+
+# Add the parent directory to the path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sync.airtable_sync import AirtableSync
+from database.models import LeadDatabase
+
+
+def _response(records):
+    """Build a mock Airtable batch response."""
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {'records': records}
+    return response
+
+
+class TestChangedFieldPush(unittest.TestCase):
+    """Test dirty tracking against a real database."""
+    
+    def setUp(self):
+        """Create a temporary database and an AirtableSync using it."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = LeadDatabase(os.path.join(self.temp_dir, 'leads.db'))
+        # Columns normally added by database/migrations.py
+        self.db.db.execute_update("ALTER TABLE leads ADD COLUMN website TEXT")
+        self.db.db.execute_update("ALTER TABLE leads ADD COLUMN website_search_attempted BOOLEAN DEFAULT FALSE")
+        self.db.db.execute_update("ALTER TABLE leads ADD COLUMN website_search_timestamp TIMESTAMP")
+        
+        settings = Mock()
+        settings.airtable.api_key = 'test_api_key'
+        settings.airtable.base_id = 'appTEST'
+        settings.airtable.table_name = 'Leads'
+        settings.airtable.endpoint_url = 'https://api.airtable.com'
+        settings.engagement_defaults.enabled = False
+        
+        self.patchers = [
+            patch('sync.airtable_sync.get_settings', return_value=settings),
+            patch('sync.airtable_sync.get_lead_database', return_value=self.db),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        
+        self.airtable_sync = AirtableSync()
+        self.lead_id = self.db.create_lead({
+            'name': 'Ann Lee', 'email': 'ann@acme.com', 'company': 'Acme', 'title': 'CEO',
+            'linkedin_url': 'https://linkedin.com/in/annlee'
+        })
+    
+    def tearDown(self):
+        """Stop patches and remove the temporary database."""
+        for patcher in self.patchers:
+            patcher.stop()
+        self.db.db.close_connections()
+        shutil.rmtree(self.temp_dir)
+    
+    @patch('sync.airtable_transport.AirtableTransport.patch')
+    @patch('sync.airtable_transport.AirtableTransport.post')
+    def test_only_changed_fields_are_sent(self, mock_post, mock_patch):
+        """Create once, skip when unchanged, then patch the one changed field."""
+        mock_post.return_value = _response([{'id': 'rec1'}])
+        mock_patch.return_value = _response([{'id': 'rec1'}])
+        
+        result = self.airtable_sync.sync_leads_to_airtable([self.db.get_lead(self.lead_id)])
+        self.assertEqual(result['synced_count'], 1)
+        created_fields = mock_post.call_args[1]['json']['records'][0]['fields']
+        
+        # Marked pending again but nothing changed: no request
+        self.db.update_lead(self.lead_id, {'sync_status': 'pending'})
+        result = self.airtable_sync.sync_leads_to_airtable([self.db.get_lead(self.lead_id)])
+        mock_patch.assert_not_called()
+        self.assertEqual(result['skipped_count'], 1)
+        self.assertEqual(result['fields_saved'], len(created_fields))
+        self.assertGreater(result['bytes_saved'], 0)
+        self.assertEqual(self.db.get_lead(self.lead_id).sync_status, 'synced')
+        
+        # One changed column: a PATCH carrying just that field
+        self.db.update_lead(self.lead_id, {'title': 'Chair'})
+        result = self.airtable_sync.sync_leads_to_airtable([self.db.get_lead(self.lead_id)])
+        sent = mock_patch.call_args[1]['json']['records']
+        self.assertEqual(sent, [{'id': 'rec1', 'fields': {'Job Title': 'Chair'}}])
+        self.assertEqual(result['synced_count'], 1)
+        self.assertEqual(result['fields_saved'], len(created_fields) - 1)
+        self.assertEqual(mock_post.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,7 @@ Tests cover:
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import json
+import re
 import os
 import sys
 from pathlib import Path
@@ -33,6 +34,7 @@ class TestEngagementDefaultsManager(unittest.TestCase):
         self.mock_settings.airtable.api_key = 'test_api_key'
         self.mock_settings.airtable.base_id = 'test_base_id'
         self.mock_settings.airtable.table_name = 'test_table'
+        self.mock_settings.airtable.endpoint_url = 'https://api.airtable.com'
         self.mock_settings.engagement_defaults.enabled = True
         self.mock_settings.engagement_defaults.default_values = {
             'Engagement_Status': 'Auto-Send',
@@ -127,7 +129,7 @@ class TestEngagementDefaultsManager(unittest.TestCase):
         needed = self.manager._determine_needed_defaults(current_values)
         self.assertEqual(needed, {})
     
-    @patch('sync.engagement_defaults.requests.get')
+    @patch('sync.airtable_transport.AirtableTransport.get')
     def test_get_current_airtable_values_success(self, mock_get):
         """Test successful retrieval of current Airtable values."""
         # Mock successful API response
@@ -155,9 +157,9 @@ class TestEngagementDefaultsManager(unittest.TestCase):
         mock_get.assert_called_once()
         call_args = mock_get.call_args
         self.assertIn('test_record_id', call_args[0][0])  # URL contains record ID
-        self.assertEqual(call_args[1]['headers']['Authorization'], 'Bearer test_api_key')
+        self.assertEqual(self.manager.transport.session.headers['Authorization'], 'Bearer test_api_key')
     
-    @patch('sync.engagement_defaults.requests.get')
+    @patch('sync.airtable_transport.AirtableTransport.get')
     def test_get_current_airtable_values_not_found(self, mock_get):
         """Test handling of record not found (404) response."""
         mock_response = Mock()
@@ -167,7 +169,7 @@ class TestEngagementDefaultsManager(unittest.TestCase):
         result = self.manager._get_current_airtable_values('nonexistent_record')
         self.assertIsNone(result)
     
-    @patch('sync.engagement_defaults.requests.get')
+    @patch('sync.airtable_transport.AirtableTransport.get')
     def test_get_current_airtable_values_api_error(self, mock_get):
         """Test handling of API errors."""
         mock_response = Mock()
@@ -178,7 +180,7 @@ class TestEngagementDefaultsManager(unittest.TestCase):
         result = self.manager._get_current_airtable_values('test_record_id')
         self.assertIsNone(result)
     
-    @patch('sync.engagement_defaults.requests.get')
+    @patch('sync.airtable_transport.AirtableTransport.get')
     def test_get_current_airtable_values_timeout(self, mock_get):
         """Test handling of request timeout."""
         mock_get.side_effect = Exception('Request timeout')
@@ -186,7 +188,7 @@ class TestEngagementDefaultsManager(unittest.TestCase):
         result = self.manager._get_current_airtable_values('test_record_id')
         self.assertIsNone(result)
     
-    @patch('sync.engagement_defaults.requests.patch')
+    @patch('sync.airtable_transport.AirtableTransport.patch')
     def test_update_airtable_record_success(self, mock_patch):
         """Test successful Airtable record update."""
         mock_response = Mock()
@@ -204,38 +206,20 @@ class TestEngagementDefaultsManager(unittest.TestCase):
         self.assertIn('test_record_id', call_args[0][0])
         self.assertEqual(call_args[1]['json']['fields'], updates)
     
-    @patch('sync.engagement_defaults.requests.patch')
-    def test_update_airtable_record_rate_limit_retry(self, mock_patch):
-        """Test retry logic for rate limiting (429 response)."""
-        # First call returns 429, second call succeeds
-        mock_response_429 = Mock()
-        mock_response_429.status_code = 429
-        
-        mock_response_200 = Mock()
-        mock_response_200.status_code = 200
-        
-        mock_patch.side_effect = [mock_response_429, mock_response_200]
-        
-        with patch('sync.engagement_defaults.time.sleep'):  # Mock sleep to speed up test
-            updates = {'Engagement_Status': 'Auto-Send'}
-            result = self.manager._update_airtable_record('test_record_id', updates)
-        
-        self.assertTrue(result)
-        self.assertEqual(mock_patch.call_count, 2)  # Should have retried
-    
-    @patch('sync.engagement_defaults.requests.patch')
-    def test_update_airtable_record_max_retries_exceeded(self, mock_patch):
-        """Test behavior when max retries are exceeded."""
+    @patch('sync.airtable_transport.AirtableTransport.patch')
+    def test_update_airtable_record_api_error(self, mock_patch):
+        """Test that a final error response is reported without retrying here."""
+        # Retries for 429/5xx happen inside the shared transport
         mock_response = Mock()
-        mock_response.status_code = 429
+        mock_response.status_code = 422
+        mock_response.text = 'Unknown field name'
         mock_patch.return_value = mock_response
         
-        with patch('sync.engagement_defaults.time.sleep'):  # Mock sleep to speed up test
-            updates = {'Engagement_Status': 'Auto-Send'}
-            result = self.manager._update_airtable_record('test_record_id', updates)
+        updates = {'Engagement_Status': 'Auto-Send'}
+        result = self.manager._update_airtable_record('test_record_id', updates)
         
         self.assertFalse(result)
-        self.assertEqual(mock_patch.call_count, 3)  # Initial + 2 retries
+        self.assertEqual(mock_patch.call_count, 1)
     
     @patch.object(EngagementDefaultsManager, '_get_current_airtable_values')
     @patch.object(EngagementDefaultsManager, '_update_airtable_record')
@@ -298,15 +282,18 @@ class TestEngagementDefaultsManager(unittest.TestCase):
         self.assertFalse(result['success'])
         self.assertEqual(result['error'], 'Failed to update Airtable record')
     
-    @patch.object(EngagementDefaultsManager, 'apply_defaults_to_lead')
-    def test_apply_defaults_to_multiple_leads_success(self, mock_apply_single):
+    @patch('sync.airtable_transport.AirtableTransport.patch')
+    @patch('sync.airtable_transport.AirtableTransport.get')
+    def test_apply_defaults_to_multiple_leads_success(self, mock_get, mock_patch):
         """Test successful batch application of defaults."""
-        # Mock individual applications
-        mock_apply_single.side_effect = [
-            {'success': True, 'fields_updated': ['Engagement_Status'], 'values_applied': {'Engagement_Status': 'Auto-Send'}},
-            {'success': True, 'fields_updated': [], 'message': 'No defaults needed'},
-            {'success': True, 'fields_updated': ['Email_Confidence_Level'], 'values_applied': {'Email_Confidence_Level': 'Pattern'}}
-        ]
+        # One list request returns all three records
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {'records': [
+            {'id': 'airtable_1', 'fields': {'Email_Confidence_Level': 'Real', 'Level Engaged': '1st'}},
+            {'id': 'airtable_2', 'fields': {'Engagement_Status': 'Sent', 'Email_Confidence_Level': 'Real'}},
+            {'id': 'airtable_3', 'fields': {'Engagement_Status': 'Sent'}}
+        ]}
+        mock_patch.return_value.status_code = 200
         
         lead_records = [
             {'lead_id': 'lead_1', 'airtable_record_id': 'airtable_1'},
@@ -314,8 +301,7 @@ class TestEngagementDefaultsManager(unittest.TestCase):
             {'lead_id': 'lead_3', 'airtable_record_id': 'airtable_3'}
         ]
         
-        with patch('sync.engagement_defaults.time.sleep'):  # Mock sleep to speed up test
-            result = self.manager.apply_defaults_to_multiple_leads(lead_records)
+        result = self.manager.apply_defaults_to_multiple_leads(lead_records)
         
         self.assertTrue(result['success'])
         self.assertEqual(result['total_leads'], 3)
@@ -324,15 +310,65 @@ class TestEngagementDefaultsManager(unittest.TestCase):
         self.assertEqual(result['skipped_count'], 1)
         self.assertEqual(result['failed_count'], 0)
         self.assertEqual(set(result['fields_updated']), {'Engagement_Status', 'Email_Confidence_Level'})
-    
-    @patch.object(EngagementDefaultsManager, 'apply_defaults_to_lead')
-    def test_apply_defaults_to_multiple_leads_with_failures(self, mock_apply_single):
+        
+        # Current values are read with a single RECORD_ID() formula
+        mock_get.assert_called_once()
+        formula = mock_get.call_args[1]['params']['filterByFormula']
+        self.assertEqual(formula, "OR(RECORD_ID()='airtable_1',RECORD_ID()='airtable_2',RECORD_ID()='airtable_3')")
+        
+        # Both updates go out in one batch request
+        mock_patch.assert_called_once()
+        self.assertEqual(mock_patch.call_args[1]['json']['records'], [
+            {'id': 'airtable_1', 'fields': {'Engagement_Status': 'Auto-Send'}},
+            {'id': 'airtable_3', 'fields': {'Email_Confidence_Level': 'Pattern'}}
+        ])
+        
+        # Performance stats are still kept per lead
+        stats = self.manager.get_performance_stats()
+        self.assertEqual(stats['total_operations'], 3)
+        self.assertEqual(stats['successful_operations'], 3)
+    
+    @patch('sync.airtable_transport.AirtableTransport.patch')
+    @patch('sync.airtable_transport.AirtableTransport.get')
+    def test_apply_defaults_to_multiple_leads_batches_requests(self, mock_get, mock_patch):
+        """Reads are chunked by 100 records and writes by 10."""
+        def list_records(url, params=None, **kwargs):
+            response = Mock()
+            response.status_code = 200
+            record_ids = re.findall(r"RECORD_ID\(\)='([^']+)'", params['filterByFormula'])
+            response.json.return_value = {'records': [{'id': record_id, 'fields': {}} for record_id in record_ids]}
+            return response
+        
+        mock_get.side_effect = list_records
+        mock_patch.return_value.status_code = 200
+        
+        lead_records = [{'lead_id': f'lead_{i}', 'airtable_record_id': f'rec{i}'} for i in range(150)]
+        result = self.manager.apply_defaults_to_multiple_leads(lead_records)
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(result['updated_count'], 150)
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_patch.call_count, 15)
+        self.assertTrue(all(len(call[1]['json']['records']) == 10 for call in mock_patch.call_args_list))
+    
+    @patch('sync.airtable_transport.AirtableTransport.patch')
+    @patch('sync.airtable_transport.AirtableTransport.get')
+    def test_apply_defaults_to_multiple_leads_with_failures(self, mock_get, mock_patch):
         """Test batch application with some failures."""
-        mock_apply_single.side_effect = [
-            {'success': True, 'fields_updated': ['Engagement_Status']},
-            {'success': False, 'error': 'API timeout'},
-            Exception('Network error')
-        ]
+        # airtable_3 is not returned (deleted in Airtable)
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {'records': [
+            {'id': 'airtable_1', 'fields': {}},
+            {'id': 'airtable_2', 'fields': {}}
+        ]}
+        
+        def update_records(url, json=None, **kwargs):
+            response = Mock()
+            response.status_code = 422 if json['records'][0]['id'] == 'airtable_2' else 200
+            response.text = 'INVALID_VALUE_FOR_COLUMN'
+            return response
+        
+        mock_patch.side_effect = update_records
         
         lead_records = [
             {'lead_id': 'lead_1', 'airtable_record_id': 'airtable_1'},
@@ -340,13 +376,17 @@ class TestEngagementDefaultsManager(unittest.TestCase):
             {'lead_id': 'lead_3', 'airtable_record_id': 'airtable_3'}
         ]
         
-        with patch('sync.engagement_defaults.time.sleep'):  # Mock sleep to speed up test
+        with patch.object(self.manager, 'UPDATE_BATCH_SIZE', 1):
             result = self.manager.apply_defaults_to_multiple_leads(lead_records)
         
         self.assertFalse(result['success'])  # Should be False due to failures
         self.assertEqual(result['updated_count'], 1)
         self.assertEqual(result['failed_count'], 2)
-        self.assertEqual(len(result['errors']), 2)
+        self.assertEqual(result['errors'], [
+            'Lead lead_2: Failed to update Airtable record',
+            'Lead lead_3: Failed to retrieve current Airtable values'
+        ])
+        self.assertEqual(self.manager.get_performance_stats()['failed_operations'], 2)
     
     def test_apply_defaults_to_multiple_leads_missing_airtable_id(self):
         """Test handling of leads without Airtable record IDs."""
@@ -34,6 +34,7 @@ class TestSyncWithDefaultsIntegration(unittest.TestCase):
         self.mock_settings.airtable.api_key = 'test_api_key'
         self.mock_settings.airtable.base_id = 'test_base_id'
         self.mock_settings.airtable.table_name = 'test_table'
+        self.mock_settings.airtable.endpoint_url = 'https://api.airtable.com'
         self.mock_settings.engagement_defaults.enabled = True
         self.mock_settings.engagement_defaults.default_values = {
             'Engagement_Status': 'Auto-Send',
@@ -74,9 +75,9 @@ class TestSyncWithDefaultsIntegration(unittest.TestCase):
         lead.airtable_id = airtable_id
         return lead
     
-    @patch('sync.airtable_sync.requests.post')
-    @patch('sync.airtable_sync.requests.get')
-    @patch('sync.airtable_sync.requests.patch')
+    @patch('sync.airtable_transport.AirtableTransport.post')
+    @patch('sync.airtable_transport.AirtableTransport.get')
+    @patch('sync.airtable_transport.AirtableTransport.patch')
     def test_end_to_end_sync_with_defaults_new_leads(self, mock_patch, mock_get, mock_post):
         """Test complete workflow: new leads → sync → apply defaults."""
         # Setup: Create mock leads
@@ -100,7 +101,10 @@ class TestSyncWithDefaultsIntegration(unittest.TestCase):
         # Mock getting current Airtable values (empty - new records)
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {
-            'fields': {}  # Empty fields - all defaults needed
+            'records': [  # Empty fields - all defaults needed
+                {'id': 'airtable_rec_1', 'fields': {}},
+                {'id': 'airtable_rec_2', 'fields': {}}
+            ]
         }
         
         # Mock defaults application success
@@ -123,12 +127,13 @@ class TestSyncWithDefaultsIntegration(unittest.TestCase):
         
         # Verify: Airtable API calls were made
         mock_post.assert_called_once()  # Sync call
-        self.assertEqual(mock_get.call_count, 2)  # Get current values for each lead
-        self.assertEqual(mock_patch.call_count, 2)  # Apply defaults for each lead
+        mock_get.assert_called_once()  # Current values of both leads in one request
+        mock_patch.assert_called_once()  # Defaults for both leads in one request
+        self.assertEqual(len(mock_patch.call_args[1]['json']['records']), 2)
     
-    @patch('sync.airtable_sync.requests.post')
-    @patch('sync.airtable_sync.requests.get')
-    @patch('sync.airtable_sync.requests.patch')
+    @patch('sync.airtable_transport.AirtableTransport.post')
+    @patch('sync.airtable_transport.AirtableTransport.get')
+    @patch('sync.airtable_transport.AirtableTransport.patch')
     def test_sync_with_partial_engagement_data(self, mock_patch, mock_get, mock_post):
         """Test sync with leads that have some engagement fields already set."""
         # Setup: Create mock lead
@@ -145,11 +150,11 @@ class TestSyncWithDefaultsIntegration(unittest.TestCase):
         # Mock getting current values - some fields already set
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {
-            'fields': {
+            'records': [{'id': 'airtable_rec_1', 'fields': {
                 'Engagement_Status': 'Manual Review',  # Already set
                 'Email_Confidence_Level': '',  # Empty - needs default
                 'Level Engaged': '1st degree'  # Already set
-            }
+            }}]
         }
         
         mock_patch.return_value.status_code = 200
@@ -166,10 +171,12 @@ class TestSyncWithDefaultsIntegration(unittest.TestCase):
         # Verify: Only one patch call for the missing field
         mock_patch.assert_called_once()
         patch_call_data = mock_patch.call_args[1]['json']
-        self.assertEqual(patch_call_data['fields'], {'Email_Confidence_Level': 'Pattern'})
+        self.assertEqual(patch_call_data['records'], [
+            {'id': 'airtable_rec_1', 'fields': {'Email_Confidence_Level': 'Pattern'}}
+        ])
     
-    @patch('sync.airtable_sync.requests.post')
-    @patch('sync.airtable_sync.requests.get')
+    @patch('sync.airtable_transport.AirtableTransport.post')
+    @patch('sync.airtable_transport.AirtableTransport.get')
     def test_sync_with_complete_engagement_data(self, mock_get, mock_post):
         """Test sync with leads that already have all engagement fields set."""
         # Setup
@@ -186,11 +193,11 @@ class TestSyncWithDefaultsIntegration(unittest.TestCase):
         # Mock getting current values - all fields already set
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {
-            'fields': {
+            'records': [{'id': 'airtable_rec_1', 'fields': {
                 'Engagement_Status': 'Manual Review',
                 'Email_Confidence_Level': 'Real',
                 'Level Engaged': '2nd degree'
-            }
+            }}]
         }
         
         # Execute
@@ -203,14 +210,14 @@ class TestSyncWithDefaultsIntegration(unittest.TestCase):
         self.assertEqual(defaults['fields_updated'], [])
         
         # Verify: No patch calls were made (no defaults needed)
-        with patch('sync.airtable_sync.requests.patch') as mock_patch:
+        with patch('sync.airtable_transport.AirtableTransport.patch') as mock_patch:
             # Re-run to verify no patch calls
             self.airtable_sync._apply_engagement_defaults_after_sync(leads)
             mock_patch.assert_not_called()
     
-    @patch('sync.airtable_sync.requests.post')
-    @patch('sync.airtable_sync.requests.get')
-    @patch('sync.airtable_sync.requests.patch')
+    @patch('sync.airtable_transport.AirtableTransport.post')
+    @patch('sync.airtable_transport.AirtableTransport.get')
+    @patch('sync.airtable_transport.AirtableTransport.patch')
     def test_sync_with_defaults_api_errors(self, mock_patch, mock_get, mock_post):
         """Test handling of API errors during defaults application."""
         # Setup
@@ -226,7 +233,7 @@ class TestSyncWithDefaultsIntegration(unittest.TestCase):
         
         # Mock getting current values success
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {'fields': {}}
+        mock_get.return_value.json.return_value = {'records': [{'id': 'airtable_rec_1', 'fields': {}}]}
         
         # Mock defaults application failure
         mock_patch.return_value.status_code = 500
@@ -243,9 +250,9 @@ class TestSyncWithDefaultsIntegration(unittest.TestCase):
         self.assertEqual(defaults['count'], 0)  # No defaults applied due to error
         self.assertTrue(len(defaults['errors']) > 0)  # Should have error messages
     
-    @patch('sync.airtable_sync.requests.post')
-    @patch('sync.airtable_sync.requests.get')
-    @patch('sync.airtable_sync.requests.patch')
+    @patch('sync.airtable_transport.AirtableTransport.post')
+    @patch('sync.airtable_transport.AirtableTransport.get')
+    @patch('sync.airtable_transport.AirtableTransport.patch')
     def test_batch_processing_performance(self, mock_patch, mock_get, mock_post):
         """Test performance with batch processing of multiple leads."""
         # Setup: Create many mock leads
@@ -254,20 +261,25 @@ class TestSyncWithDefaultsIntegration(unittest.TestCase):
             for i in range(20)  # 20 leads for batch testing
         ]
         
-        # Mock successful sync responses
-        mock_post.return_value.status_code = 200
-        mock_post.return_value.json.return_value = {
-            'records': [
-                {'id': f'airtable_rec_{i}', 'fields': {}}
-                for i in range(10)  # Airtable batch limit is 10
-            ]
-        }
+        # Mock successful sync responses (Airtable batch limit is 10)
+        def create_records(url, json=None, **kwargs):
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {'records': [
+                {'id': f"airtable_rec_{record['fields']['Full Name'].split()[-1]}", 'fields': {}}
+                for record in json['records']
+            ]}
+            return response
+        
+        mock_post.side_effect = create_records
         
         self.mock_db.update_lead.return_value = True
         
         # Mock getting current values (empty - all need defaults)
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {'fields': {}}
+        mock_get.return_value.json.return_value = {
+            'records': [{'id': f'airtable_rec_{i}', 'fields': {}} for i in range(20)]
+        }
         
         # Mock successful defaults application
         mock_patch.return_value.status_code = 200
@@ -292,10 +304,10 @@ class TestSyncWithDefaultsIntegration(unittest.TestCase):
         
         # Verify: Correct number of API calls
         self.assertEqual(mock_post.call_count, 2)  # 2 batches (10 + 10)
-        self.assertEqual(mock_get.call_count, 20)  # Get current values for each lead
-        self.assertEqual(mock_patch.call_count, 20)  # Apply defaults for each lead
+        self.assertEqual(mock_get.call_count, 1)  # Current values of all 20 leads in one request
+        self.assertEqual(mock_patch.call_count, 2)  # Defaults written 10 records per request
     
-    @patch('sync.airtable_sync.requests.post')
+    @patch('sync.airtable_transport.AirtableTransport.post')
     def test_sync_failure_no_defaults_applied(self, mock_post):
         """Test that defaults are not applied when sync fails."""
         # Setup
@@ -330,7 +342,7 @@ class TestSyncWithDefaultsIntegration(unittest.TestCase):
         # Setup mock lead
         leads = [self._create_mock_lead('lead_1', 'John Doe', 'john@example.com')]
         
-        with patch('sync.airtable_sync.requests.post') as mock_post:
+        with patch('sync.airtable_transport.AirtableTransport.post') as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = {
                 'records': [{'id': 'airtable_rec_1', 'fields': {}}]
@@ -358,8 +370,15 @@ class TestSyncManagerIntegration(unittest.TestCase):
         self.mock_settings.airtable.api_key = 'test_api_key'
         self.mock_settings.airtable.base_id = 'test_base_id'
         self.mock_settings.airtable.table_name = 'test_table'
+        self.mock_settings.airtable.endpoint_url = 'https://api.airtable.com'
         self.mock_settings.airtable.sync_interval_minutes = 30
         self.mock_settings.airtable.auto_sync_enabled = True
+        self.mock_settings.sync.adaptive_scheduling = False
+        self.mock_settings.sync.min_push_interval_seconds = 15
+        self.mock_settings.sync.max_push_interval_seconds = 3600
+        self.mock_settings.sync.target_sync_lag_seconds = 300
+        self.mock_settings.sync.min_pull_interval_minutes = 15
+        self.mock_settings.sync.api_budget_share = 0.5
         self.mock_settings.engagement_defaults.enabled = True
         self.mock_settings.engagement_defaults.default_values = {
             'Engagement_Status': 'Auto-Send',
@@ -382,13 +401,15 @@ class TestSyncManagerIntegration(unittest.TestCase):
         self.settings_patcher.stop()
         self.db_patcher.stop()
     
+    @patch('sync.sync_manager.get_sync_scheduler')
     @patch('sync.sync_manager.AirtableSync')
-    def test_sync_manager_includes_defaults_in_logging(self, mock_airtable_sync_class):
+    def test_sync_manager_includes_defaults_in_logging(self, mock_airtable_sync_class, mock_get_sync_scheduler):
         """Test that SyncManager properly logs engagement defaults results."""
         from sync.sync_manager import SyncManager
         
         # Setup mock AirtableSync instance
         mock_airtable_sync = Mock()
+        mock_airtable_sync.transport.limiter.rate = 5.0
         mock_airtable_sync.sync_leads_to_airtable.return_value = {
             'success': True,
             'synced_count': 3,
@@ -401,6 +422,10 @@ class TestSyncManagerIntegration(unittest.TestCase):
             }
         }
         mock_airtable_sync_class.return_value = mock_airtable_sync
+        # Pushes go through the scheduler's outbox, which reports the same totals
+        mock_get_sync_scheduler.return_value.sync_all_pending_to_airtable.return_value = (
+            mock_airtable_sync.sync_leads_to_airtable.return_value
+        )
         
         # Create SyncManager
         sync_manager = SyncManager()
@@ -418,13 +443,15 @@ class TestSyncManagerIntegration(unittest.TestCase):
             mock_logger.info.assert_any_call("✅ Sync to Airtable completed: 3 leads synced")
             mock_logger.info.assert_any_call("🎯 Engagement defaults applied: 2 leads updated with fields ['Engagement_Status', 'Email_Confidence_Level']")
     
+    @patch('sync.sync_manager.get_sync_scheduler')
     @patch('sync.sync_manager.AirtableSync')
-    def test_sync_manager_handles_defaults_errors(self, mock_airtable_sync_class):
+    def test_sync_manager_handles_defaults_errors(self, mock_airtable_sync_class, mock_get_sync_scheduler):
         """Test SyncManager handling of defaults application errors."""
         from sync.sync_manager import SyncManager
         
         # Setup mock with defaults errors (no successful applications)
         mock_airtable_sync = Mock()
+        mock_airtable_sync.transport.limiter.rate = 5.0
         mock_airtable_sync.sync_leads_to_airtable.return_value = {
             'success': True,
             'synced_count': 2,
@@ -437,6 +464,9 @@ class TestSyncManagerIntegration(unittest.TestCase):
             }
         }
         mock_airtable_sync_class.return_value = mock_airtable_sync
+        mock_get_sync_scheduler.return_value.sync_all_pending_to_airtable.return_value = (
+            mock_airtable_sync.sync_leads_to_airtable.return_value
+        )
         
         sync_manager = SyncManager()
         
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Tests for the durable sync outbox.
+
+Lead changes are queued by SQLite triggers, coalesced per lead, claimed in
+batches of 10 by the outbox workers and retried with backoff on failure.
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+import sys
+from pathlib import Path
+
+# Add the parent directory to the path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.models import LeadDatabase
+from sync.sync_outbox import (
+    SyncOutbox, SyncOutboxWorkers, install_outbox_triggers, BACKOFF_BASE_SECONDS
+)
+
+
+class TestSyncOutbox(unittest.TestCase):
+    """Test the outbox table and its triggers against a real database."""
+
+    def setUp(self):
+        """Create a temporary database with outbox triggers installed."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'leads.db')
+        self.db = LeadDatabase(self.db_path)
+        # Columns normally added by database/migrations.py
+        self.db.db.execute_update("ALTER TABLE leads ADD COLUMN website TEXT")
+        self.db.db.execute_update("ALTER TABLE leads ADD COLUMN website_search_attempted BOOLEAN DEFAULT FALSE")
+        self.db.db.execute_update("ALTER TABLE leads ADD COLUMN website_search_timestamp TIMESTAMP")
+
+        conn = sqlite3.connect(self.db_path)
+        install_outbox_triggers(conn)
+        conn.commit()
+        conn.close()
+
+        self.outbox = SyncOutbox(self.db_path)
+
+    def tearDown(self):
+        """Remove the temporary database."""
+        self.db.db.close_connections()
+        shutil.rmtree(self.temp_dir)
+
+    def _rows(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute(
+                "SELECT lead_id, operation, generation FROM sync_outbox ORDER BY enqueued_at"
+            ).fetchall()
+        finally:
+            conn.close()
+
+    def test_changes_coalesce_per_lead(self):
+        """Repeated changes leave one row; bookkeeping updates are ignored."""
+        lead_id = self.db.create_lead({'name': 'Ann Lee', 'email': 'ann@acme.com'})
+        self.db.update_lead(lead_id, {'company': 'Acme'})
+        self.db.update_lead(lead_id, {'title': 'CEO'})
+        self.db.update_lead(lead_id, {'sync_status': 'synced', 'airtable_id': 'rec1'})
+
+        self.assertEqual(self._rows(), [(lead_id, 'insert', 2)])
+
+    def test_claims_are_exclusive(self):
+        """A claimed lead is not handed to a second worker."""
+        lead_ids = [self.db.create_lead({'name': f'Lead {i}'}) for i in range(12)]
+
+        first = self.outbox.claim()
+        second = self.outbox.claim()
+
+        self.assertEqual(len(first['entries']), 10)
+        self.assertEqual(len(second['entries']), 2)
+        claimed = [entry['lead_id'] for entry in first['entries'] + second['entries']]
+        self.assertEqual(sorted(claimed), sorted(lead_ids))
+        self.assertIsNone(self.outbox.claim())
+
+    def test_change_during_send_is_kept(self):
+        """A lead changed while being sent stays queued for another push."""
+        changed = self.db.create_lead({'name': 'Ann Lee'})
+        unchanged = self.db.create_lead({'name': 'Bob Ray'})
+
+        claim = self.outbox.claim()
+        self.db.update_lead(changed, {'company': 'Acme'})
+        self.outbox.complete(claim, [changed, unchanged])
+
+        self.assertEqual([row[0] for row in self._rows()], [changed])
+        self.assertEqual([entry['lead_id'] for entry in self.outbox.claim()['entries']], [changed])
+
+    def test_failed_leads_back_off(self):
+        """Failed leads are not claimable until their retry time."""
+        lead_id = self.db.create_lead({'name': 'Ann Lee'})
+
+        self.outbox.fail(self.outbox.claim(), [lead_id], 'HTTP 503')
+
+        self.assertIsNone(self.outbox.claim())
+        stats = self.outbox.get_stats()
+        self.assertEqual(stats['depth'], 1)
+        self.assertEqual(stats['ready'], 0)
+        self.assertEqual(stats['retrying'], 1)
+        self.assertEqual(stats['max_attempts'], 1)
+
+        conn = sqlite3.connect(self.db_path)
+        delay, error = conn.execute(
+            "SELECT next_attempt_at - enqueued_at, last_error FROM sync_outbox"
+        ).fetchone()
+        conn.close()
+        self.assertGreaterEqual(delay, BACKOFF_BASE_SECONDS)
+        self.assertEqual(error, 'HTTP 503')
+
+    def _sync_status(self, lead_id):
+        return self.db.get_lead(lead_id).sync_status
+
+    def test_claimed_leads_are_marked_syncing(self):
+        """Claimed leads leave the pending scan and return to it when they fail."""
+        lead_id = self.db.create_lead({'name': 'Ann Lee'})
+
+        claim = self.outbox.claim()
+        self.assertEqual(self._sync_status(lead_id), 'syncing')
+        self.assertEqual(self.db.get_sync_backlog()['pending_count'], 0)
+
+        self.outbox.fail(claim, [lead_id], 'HTTP 503')
+        self.assertEqual(self._sync_status(lead_id), 'pending')
+
+    def test_pulled_writes_are_not_queued(self):
+        """Writes applying Airtable records do not enqueue the leads again."""
+        lead_id = self.db.create_lead({'name': 'Ann Lee'})
+        self.outbox.complete(self.outbox.claim(), [lead_id])
+
+        self.db.bulk_update_leads({lead_id: {'company': 'Acme'}}, enqueue_sync=False)
+        self.db.bulk_insert_leads([{'name': 'Bob Ray', 'airtable_id': 'rec2'}], enqueue_sync=False)
+        self.assertEqual(self._rows(), [])
+
+        self.db.bulk_update_leads({lead_id: {'company': 'Globex'}})
+        self.assertEqual([row[0] for row in self._rows()], [lead_id])
+
+    def test_enqueue_pending_skips_queued_leads(self):
+        """Pending leads missing from the outbox are queued without touching queued ones."""
+        queued = self.db.create_lead({'name': 'Ann Lee'})
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DROP TRIGGER sync_outbox_after_insert")
+        conn.commit()
+        conn.close()
+        missed = self.db.create_lead({'name': 'Bob Ray'})
+
+        self.assertEqual(self.outbox.enqueue_pending(), 1)
+        self.assertEqual(self.outbox.enqueue_pending(), 0)
+        self.assertEqual(self._rows(), [(queued, 'insert', 0), (missed, 'insert', 0)])
+
+    def test_stats_report_depth_and_age(self):
+        """Stats report queue depth and the age of the oldest entry."""
+        self.assertEqual(self.outbox.get_stats()['depth'], 0)
+
+        self.db.create_lead({'name': 'Ann Lee'})
+        self.outbox.enqueue(['external-lead'])
+        time.sleep(0.05)
+
+        stats = self.outbox.get_stats()
+        self.assertEqual(stats['depth'], 2)
+        self.assertEqual(stats['ready'], 2)
+        self.assertGreater(stats['oldest_age_seconds'], 0)
+
+
+class TestSyncOutboxWorkers(unittest.TestCase):
+    """Test draining the outbox."""
+
+    def setUp(self):
+        """Create a temporary outbox."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.outbox = SyncOutbox(os.path.join(self.temp_dir, 'leads.db'))
+
+    def tearDown(self):
+        """Remove the temporary database."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_drains_in_batches_of_ten(self):
+        """Each sync call receives at most 10 leads."""
+        batches = []
+        workers = SyncOutboxWorkers(self.outbox, lambda ids: batches.append(ids) or ids)
+        self.outbox.enqueue([f'lead-{i}' for i in range(25)])
+
+        while workers.drain_once():
+            pass
+
+        self.assertEqual([len(batch) for batch in batches], [10, 10, 5])
+        self.assertEqual(self.outbox.get_stats()['depth'], 0)
+
+    def test_drain_reports_totals(self):
+        """drain pushes every due lead and counts the outcomes."""
+        workers = SyncOutboxWorkers(self.outbox, lambda ids: [i for i in ids if i != 'lead-3'])
+        self.outbox.enqueue([f'lead-{i}' for i in range(15)])
+
+        self.assertEqual(workers.drain(), {'synced_count': 14, 'failed_count': 1})
+        self.assertEqual(self.outbox.get_stats()['retrying'], 1)
+
+    def test_drain_named_leads(self):
+        """drain(lead_ids) pushes only those leads and skips ones another worker holds."""
+        pushed = []
+        workers = SyncOutboxWorkers(self.outbox, lambda ids: pushed.extend(ids) or ids)
+        self.outbox.enqueue(['lead-1', 'lead-2', 'lead-3'])
+        held = self.outbox.claim(lead_ids=['lead-2'])
+
+        totals = workers.drain(['lead-1', 'lead-2'])
+
+        self.assertEqual([entry['lead_id'] for entry in held['entries']], ['lead-2'])
+        self.assertEqual(pushed, ['lead-1'])
+        self.assertEqual(totals, {'synced_count': 1, 'failed_count': 0})
+        self.assertEqual(self.outbox.get_stats()['depth'], 2)
+
+    def test_partial_failure_retries_only_failed_leads(self):
+        """Leads missing from the synced list are retried; exceptions fail the batch."""
+        workers = SyncOutboxWorkers(self.outbox, lambda ids: ids[:1])
+        self.outbox.enqueue(['lead-1', 'lead-2'])
+        workers.drain_once()
+
+        self.assertEqual(self.outbox.get_stats()['retrying'], 1)
+
+        def broken(ids):
+            raise RuntimeError('Airtable unavailable')
+
+        self.outbox.enqueue(['lead-3'])
+        SyncOutboxWorkers(self.outbox, broken).drain_once()
+        self.assertEqual(self.outbox.get_stats()['retrying'], 2)
+
+    def test_worker_pool_drains_queue(self):
+        """Started workers drain the queue and wake on notify."""
+        synced = []
+        workers = SyncOutboxWorkers(self.outbox, lambda ids: synced.extend(ids) or ids,
+                                    workers=3, poll_interval=30)
+        workers.start()
+        try:
+            self.outbox.enqueue([f'lead-{i}' for i in range(30)])
+            workers.notify()
+
+            deadline = time.monotonic() + 10
+            while self.outbox.get_stats()['depth'] and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            workers.stop()
+
+        self.assertEqual(self.outbox.get_stats()['depth'], 0)
+        self.assertEqual(sorted(synced), sorted(f'lead-{i}' for i in range(30)))
+        self.assertFalse(workers.running)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,7 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
     from utils.google_scraper import search_company_website_google_sync
-    from sync.airtable_sync import AirtableSync
+    from sync.sync_scheduler import get_sync_scheduler
     from database.models import get_lead_database, Lead
     INTEGRATION_AVAILABLE = True
 except ImportError as e:
@@ -40,7 +40,7 @@ class GoogleScraperPipeline:
         
         # Initialize components
         self.db = get_lead_database()
-        self.airtable_sync = AirtableSync()
+        self.sync_scheduler = get_sync_scheduler()
         
         # Configuration
         self.max_batch_size = 50
@@ -230,9 +230,7 @@ class GoogleScraperPipeline:
             
             # Update Airtable
             try:
-                # Get updated lead for Airtable sync
-                updated_lead = self.db.get_lead(lead.id)
-                sync_result = self.airtable_sync.sync_leads_to_airtable([updated_lead], force=True)
+                sync_result = self.sync_scheduler.push_leads_to_airtable([lead.id])
                 
                 if sync_result.get('success'):
                     logger.info(f"✅ Airtable updated for lead {lead.id}")
@@ -287,9 +285,7 @@ class GoogleScraperPipeline:
             
             # Update Airtable with enrichment status
             try:
-                # Get updated lead for Airtable sync
-                updated_lead = self.db.get_lead(lead.id)
-                sync_result = self.airtable_sync.sync_leads_to_airtable([updated_lead], force=True)
+                sync_result = self.sync_scheduler.push_leads_to_airtable([lead.id])
                 
                 if sync_result.get('success'):
                     logger.info(f"✅ Airtable updated for lead {lead.id} (enrichment status set)")
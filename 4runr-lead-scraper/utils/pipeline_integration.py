@@ -18,7 +18,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from database.models import get_lead_database, Lead
-from sync.airtable_sync import AirtableSync
+from sync.sync_scheduler import get_sync_scheduler
 from utils.google_scraper_integration import GoogleScraperPipeline
 
 logger = logging.getLogger('pipeline-integration')
@@ -36,7 +36,7 @@ class LeadPipelineManager:
             enable_google_scraper: Enable Google website scraper fallback
         """
         self.db = get_lead_database()
-        self.airtable_sync = AirtableSync()
+        self.sync_scheduler = get_sync_scheduler()
         self.enable_google_scraper = enable_google_scraper
         
         if self.enable_google_scraper:
@@ -311,7 +311,7 @@ class LeadPipelineManager:
                 return False
             
             # Sync to Airtable
-            sync_result = self.airtable_sync.sync_leads_to_airtable([updated_lead], force=True)
+            sync_result = self.sync_scheduler.push_leads_to_airtable([updated_lead.id])
             
             if sync_result['success']:
                 logger.info(f"✅ Updated Airtable for lead {lead_id} with website: {website}")
@@ -364,7 +364,7 @@ class LeadPipelineManager:
             try:
                 updated_lead = self.db.get_lead(lead_id)
                 if updated_lead:
-                    self.airtable_sync.sync_leads_to_airtable([updated_lead], force=True)
+                    self.sync_scheduler.push_leads_to_airtable([updated_lead.id])
             except Exception as e:
                 logger.warning(f"⚠️ Failed to sync failed status to Airtable for lead {lead_id}: {str(e)}")
             
@@ -18,7 +18,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from database.models import get_lead_database, Lead
-from sync.airtable_sync import AirtableSync
+from sync.sync_scheduler import get_sync_scheduler
 from utils.website_content_scraper import scrape_website_content_sync
 from utils.website_content_analyzer import analyze_website_content
 
@@ -32,7 +32,7 @@ class WebsiteAnalysisPipeline:
     def __init__(self):
         """Initialize the website analysis pipeline."""
         self.db = get_lead_database()
-        self.airtable_sync = AirtableSync()
+        self.sync_scheduler = get_sync_scheduler()
         
         logger.info("🔬 Website Analysis Pipeline initialized")
     
@@ -311,7 +311,7 @@ class WebsiteAnalysisPipeline:
                 return False
             
             # Sync to Airtable
-            sync_result = self.airtable_sync.sync_leads_to_airtable([updated_lead], force=True)
+            sync_result = self.sync_scheduler.push_leads_to_airtable([updated_lead.id])
             
             if sync_result['success']:
                 logger.info(f"✅ Updated Airtable for lead {lead_id}")
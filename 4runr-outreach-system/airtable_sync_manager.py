@@ -8,13 +8,14 @@ and comprehensive error handling.
 
 import time
 import datetime
+import hashlib
 import json
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 from lead_database import LeadDatabase
-from shared.airtable_client import AirtableClient
+from shared.airtable_client import AirtableClient, BatchCreateResult
 from shared.field_mapping import (
     AIRTABLE_FIELD_MAPPING, 
     map_lead_data, 
@@ -50,6 +51,10 @@ class SyncResult:
     error_message: Optional[str] = None
     attempt_count: int = 0
     last_attempt: Optional[datetime.datetime] = None
+    fields_sent: int = 0
+    fields_saved: int = 0
+    bytes_saved: int = 0
+    pushed_hashes: Optional[Dict[str, str]] = None
 
 
 @dataclass
@@ -60,6 +65,9 @@ class SyncSummary:
     failed_syncs: int = 0
     created_records: int = 0
     updated_records: int = 0
+    skipped_records: int = 0
+    fields_saved: int = 0
+    bytes_saved: int = 0
     errors: List[str] = None
     sync_results: List[SyncResult] = None
     
@@ -97,6 +105,9 @@ class AirtableSyncManager:
         self.max_retries = 3
         self.retry_delay_base = 2  # Base delay for exponential backoff
         self.batch_size = 10  # Airtable API batch limit
+        self.untracked_push_fields = {'Last Sync'}  # Sent with every push, never diffed
+        self.pull_page_size = 100  # Airtable API page limit
+        self.pull_overlap_seconds = 300  # Re-fetch window covering clock skew
         
         # Field mappings for database to Airtable
         self.db_to_airtable_mapping = {
@@ -167,10 +178,14 @@ class AirtableSyncManager:
                 for result in batch_results:
                     if result.status == SyncStatus.SUCCESS:
                         summary.successful_syncs += 1
+                        summary.fields_saved += result.fields_saved
+                        summary.bytes_saved += result.bytes_saved
                         if result.operation == SyncOperation.CREATE:
                             summary.created_records += 1
-                        elif result.operation == SyncOperation.UPDATE:
+                        elif result.operation == SyncOperation.UPDATE and result.fields_sent:
                             summary.updated_records += 1
+                        elif result.operation == SyncOperation.UPDATE:
+                            summary.skipped_records += 1
                     else:
                         summary.failed_syncs += 1
                         if result.error_message:
@@ -184,13 +199,15 @@ class AirtableSyncManager:
             sync_results = {
                 "success": True,
                 "leads_synced": summary.successful_syncs,
-                "leads_skipped": 0,
+                "leads_skipped": summary.skipped_records,
                 "leads_failed": summary.failed_syncs,
                 "conflicts_resolved": 0,
                 "execution_time_ms": execution_time_ms,
                 "avg_sync_time_ms": execution_time_ms / max(summary.total_leads, 1),
-                "api_calls": summary.total_leads,  # Approximate
+                "api_calls": summary.total_leads - summary.skipped_records,  # Approximate
                 "data_transferred_mb": 0,  # Could be enhanced
+                "bytes_saved": summary.bytes_saved,
+                "fields_saved": summary.fields_saved,
                 "memory_peak_mb": 0  # Could be enhanced
             }
             
@@ -253,10 +270,34 @@ class AirtableSyncManager:
             else:
                 creates.append(lead)
         
+        # Leads whose earlier create may have reached Airtable are linked, not recreated
+        attempted = [lead for lead in creates if lead.get('last_sync_attempt')]
+        if attempted:
+            try:
+                existing_ids = self._find_existing_airtable_ids(attempted)
+            except Exception as e:
+                # Without the lookup a create could duplicate the earlier one
+                existing_ids = None
+                for lead in attempted:
+                    results.append(SyncResult(
+                        operation=SyncOperation.CREATE,
+                        lead_id=lead['id'],
+                        status=SyncStatus.FAILED,
+                        error_message=f"Lookup of earlier create failed: {str(e)}",
+                        attempt_count=1,
+                        last_attempt=datetime.datetime.now()
+                    ))
+                creates = [lead for lead in creates if not lead.get('last_sync_attempt')]
+            
+            if existing_ids:
+                updates.extend({**lead, 'airtable_id': existing_ids[lead['id']]}
+                               for lead in creates if lead['id'] in existing_ids)
+                creates = [lead for lead in creates if lead['id'] not in existing_ids]
+        
         # Process creates
-        for lead in creates:
-            result = self._create_lead_in_airtable(lead)
-            results.append(result)
+        if creates:
+            create_results = self._batch_create_leads_in_airtable(creates)
+            results.extend(create_results)
         
         # Process updates
         if updates:
@@ -265,6 +306,87 @@ class AirtableSyncManager:
         
         return results
     
+    def _find_existing_airtable_ids(self, leads: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Find Airtable records already created for leads.
+        
+        Leads are matched by email, or by LinkedIn URL when they have no
+        email. Leads with neither cannot be matched.
+        
+        Args:
+            leads: List of lead dictionaries without airtable_id
+            
+        Returns:
+            Mapping of lead ID to Airtable record ID for the leads found
+            
+        Raises:
+            Exception: If Airtable cannot be searched
+        """
+        by_email = {lead['email']: lead['id'] for lead in leads if lead.get('email')}
+        by_linkedin = {lead['linkedin_url']: lead['id'] for lead in leads
+                       if not lead.get('email') and lead.get('linkedin_url')}
+        
+        existing_ids = {}
+        for field, lead_ids in (('Email', by_email), ('LinkedIn', by_linkedin)):
+            if lead_ids:
+                for value, airtable_id in self.airtable.find_lead_ids(field, list(lead_ids)).items():
+                    existing_ids[lead_ids[value]] = airtable_id
+        return existing_ids
+    
+    def _batch_create_leads_in_airtable(self, leads: List[Dict[str, Any]]) -> List[SyncResult]:
+        """
+        Batch create leads in Airtable.
+        
+        Records are sent in requests of up to 10. Leads whose request was
+        rejected are retried one record at a time so that a single bad record
+        does not fail the rest of its batch. Leads whose request may have
+        been applied (a timeout or server error) are marked failed instead;
+        the next sync looks them up before creating them again.
+        
+        Args:
+            leads: List of lead dictionaries without airtable_id
+            
+        Returns:
+            List of SyncResult objects in the same order as leads
+        """
+        records = [self._map_db_to_airtable_fields(lead) for lead in leads]
+        
+        try:
+            create_results = list(self.airtable.batch_create_leads(records))
+        except Exception as e:
+            # Outcome unknown, so nothing is resent
+            create_results = [BatchCreateResult(error=str(e)) for _ in leads]
+        
+        results = []
+        for i, lead in enumerate(leads):
+            airtable_fields = records[i]
+            create_result = create_results[i] if i < len(create_results) else BatchCreateResult()
+            
+            if create_result.record_id:
+                results.append(SyncResult(
+                    operation=SyncOperation.CREATE,
+                    lead_id=lead['id'],
+                    status=SyncStatus.SUCCESS,
+                    airtable_id=create_result.record_id,
+                    attempt_count=1,
+                    last_attempt=datetime.datetime.now(),
+                    pushed_hashes=self._hash_push_fields(airtable_fields)
+                ))
+                results[-1].fields_sent = len(results[-1].pushed_hashes)
+            elif create_result.rejected:
+                results.append(self._create_lead_in_airtable(lead))
+            else:
+                results.append(SyncResult(
+                    operation=SyncOperation.CREATE,
+                    lead_id=lead['id'],
+                    status=SyncStatus.FAILED,
+                    error_message=create_result.error or "Batch create outcome unknown",
+                    attempt_count=1,
+                    last_attempt=datetime.datetime.now()
+                ))
+        
+        return results
+    
     def _create_lead_in_airtable(self, lead: Dict[str, Any]) -> SyncResult:
         """
         Create a new lead in Airtable.
@@ -291,6 +413,8 @@ class AirtableSyncManager:
                 if airtable_id:
                     result.status = SyncStatus.SUCCESS
                     result.airtable_id = airtable_id
+                    result.pushed_hashes = self._hash_push_fields(airtable_fields)
+                    result.fields_sent = len(result.pushed_hashes)
                     break
                 else:
                     result.error_message = "Failed to create record in Airtable"
@@ -314,37 +438,64 @@ class AirtableSyncManager:
         """
         Batch update leads in Airtable.
         
+        Only fields whose mapped value differs from the last successful push
+        are sent, and leads with no such fields are not sent at all. Fields
+        edited directly in Airtable are therefore left alone unless the same
+        field also changed locally.
+        
         Args:
             leads: List of lead dictionaries with airtable_id
             
         Returns:
-            List of SyncResult objects
+            List of SyncResult objects in the same order as leads
         """
         results = []
+        pending = []
         
         # Prepare batch update data
         updates = []
         for lead in leads:
             airtable_fields = self._map_db_to_airtable_fields(lead)
-            updates.append({
-                'id': lead['airtable_id'],
-                'fields': airtable_fields
-            })
+            hashes = self._hash_push_fields(airtable_fields)
+            changed_fields = self._diff_push_fields(airtable_fields, hashes, lead.get('airtable_push_hashes'))
+            full_size = self._payload_size(lead['airtable_id'], airtable_fields)
             
-            results.append(SyncResult(
+            result = SyncResult(
                 operation=SyncOperation.UPDATE,
                 lead_id=lead['id'],
-                airtable_id=lead['airtable_id']
-            ))
+                airtable_id=lead['airtable_id'],
+                pushed_hashes=hashes
+            )
+            results.append(result)
+            
+            if not changed_fields:
+                # Airtable already holds this payload
+                result.status = SyncStatus.SUCCESS
+                result.fields_saved = len(hashes)
+                result.bytes_saved = full_size
+                result.last_attempt = datetime.datetime.now()
+                continue
+            
+            result.fields_sent = len(changed_fields.keys() & hashes.keys())
+            result.fields_saved = len(hashes) - result.fields_sent
+            result.bytes_saved = full_size - self._payload_size(lead['airtable_id'], changed_fields)
+            updates.append({
+                'id': lead['airtable_id'],
+                'fields': changed_fields
+            })
+            pending.append(result)
+        
+        if not updates:
+            return results
         
         # Perform batch update with retries
         for attempt in range(self.max_retries):
             try:
-                successful_count = self.airtable.batch_update_leads(updates)
+                updated_ids = set(self.airtable.batch_update_leads(updates))
                 
-                # Mark results based on success
-                for i, result in enumerate(results):
-                    if i < successful_count:
+                # Batches complete in any order, so match results by record ID
+                for result in pending:
+                    if result.airtable_id in updated_ids:
                         result.status = SyncStatus.SUCCESS
                     else:
                         result.status = SyncStatus.FAILED
@@ -354,28 +505,84 @@ class AirtableSyncManager:
                 
             except Exception as e:
                 error_msg = str(e)
-                for result in results:
+                for result in pending:
                     result.error_message = error_msg
                     result.attempt_count = attempt + 1
                     result.last_attempt = datetime.datetime.now()
                 # Error logging handled by decorators
-,
-                    'attempt': attempt + 1
-                })
                 
                 if attempt < self.max_retries - 1:
                     time.sleep(self.retry_delay_base ** attempt)
         
         # Set final status for any remaining failed results
-        for result in results:
+        for result in pending:
             if result.status == SyncStatus.PENDING:
                 result.status = SyncStatus.FAILED
             result.attempt_count = min(result.attempt_count or self.max_retries, self.max_retries)
             if not result.last_attempt:
                 result.last_attempt = datetime.datetime.now()
         
-        return results    
-
+        return results
+    
+    def _hash_push_fields(self, airtable_fields: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Hash each mapped Airtable field value for change detection.
+        
+        Args:
+            airtable_fields: Mapped Airtable fields
+            
+        Returns:
+            Mapping of Airtable field name to a short digest of its value
+        """
+        return {
+            field: hashlib.sha1(
+                json.dumps(value, sort_keys=True, default=str).encode('utf-8')
+            ).hexdigest()[:16]
+            for field, value in airtable_fields.items()
+            if field not in self.untracked_push_fields
+        }
+    
+    def _diff_push_fields(self, airtable_fields: Dict[str, Any], hashes: Dict[str, str],
+                          pushed_hashes: Any) -> Dict[str, Any]:
+        """
+        Work out the minimal PATCH payload against the last successful push.
+        
+        Args:
+            airtable_fields: Mapped Airtable fields
+            hashes: Digests of airtable_fields from _hash_push_fields
+            pushed_hashes: Stored digests of the last push (JSON string or dict)
+            
+        Returns:
+            Changed fields plus the untracked fields, or an empty dict if
+            nothing changed
+        """
+        if isinstance(pushed_hashes, str):
+            try:
+                pushed_hashes = json.loads(pushed_hashes)
+            except ValueError:
+                pushed_hashes = None
+        if not isinstance(pushed_hashes, dict):
+            pushed_hashes = {}
+        
+        changed = {
+            field: airtable_fields[field]
+            for field, digest in hashes.items()
+            if pushed_hashes.get(field) != digest
+        }
+        if not changed:
+            return {}
+        
+        changed.update({
+            field: value for field, value in airtable_fields.items()
+            if field in self.untracked_push_fields
+        })
+        return changed
+    
+    @staticmethod
+    def _payload_size(airtable_id: str, fields: Dict[str, Any]) -> int:
+        """Size in bytes of one record in a batch update request body."""
+        return len(json.dumps({'id': airtable_id, 'fields': fields}, default=str).encode('utf-8'))
+    
     def _map_db_to_airtable_fields(self, lead: Dict[str, Any]) -> Dict[str, Any]:
         """
         Map database fields to Airtable field names.
@@ -415,137 +622,180 @@ class AirtableSyncManager:
         
         return airtable_fields
     
-    def sync_from_airtable(self, limit: Optional[int] = None) -> SyncSummary:
+    def sync_from_airtable(self, limit: Optional[int] = None, full: bool = False) -> SyncSummary:
         """
         Sync updates from Airtable to local database.
         
+        Only records modified since the last complete pull are fetched. Pages
+        are applied as they arrive, one database batch per page, and the
+        high-water mark advances only after every page has been applied
+        without write errors, so an interrupted or limited pull is picked up
+        again next time.
+        
         Args:
             limit: Maximum number of records to sync
+            full: Ignore the high-water mark and pull every record
             
         Returns:
             SyncSummary with detailed results
         """
         summary = SyncSummary()
+        watermark_key = self._get_pull_watermark_key()
+        pull_started = datetime.datetime.now(datetime.timezone.utc)
         
         try:
-            # Get all leads from Airtable
-            airtable_leads = self._get_all_airtable_leads(limit)
-            summary.total_leads = len(airtable_leads)
+            since = None if full else self._get_pull_since(watermark_key)
+            complete = True
             
-            if not airtable_leads:
-                # Logging handled by decorators
-return summary
-                # Logging handled by decorators
-} leads from Airtable'
-            })
-            
-            # Process each lead
-            for airtable_lead in airtable_leads:
-                result = self._sync_lead_from_airtable(airtable_lead)
-                summary.sync_results.append(result)
+            for page in self.airtable.iter_leads_modified_since(since, page_size=self.pull_page_size):
+                if limit is not None:
+                    page = page[:limit - summary.total_leads]
                 
-                if result.status == SyncStatus.SUCCESS:
-                    summary.successful_syncs += 1
-                    if result.operation == SyncOperation.CREATE:
-                        summary.created_records += 1
-                    elif result.operation == SyncOperation.UPDATE:
-                        summary.updated_records += 1
-                else:
-                    summary.failed_syncs += 1
-                    if result.error_message:
-                        summary.errors.append(f"Airtable {result.airtable_id}: {result.error_message}")
-                # Logging handled by decorators
-return summary
+                summary.total_leads += len(page)
+                
+                for result in self._apply_airtable_page(page):
+                    summary.sync_results.append(result)
+                    
+                    if result.status == SyncStatus.SUCCESS:
+                        summary.successful_syncs += 1
+                        if result.operation == SyncOperation.CREATE:
+                            summary.created_records += 1
+                        elif result.operation == SyncOperation.UPDATE:
+                            summary.updated_records += 1
+                    else:
+                        summary.failed_syncs += 1
+                        if result.attempt_count:
+                            # Failed writes are retried by keeping the mark where it is
+                            complete = False
+                        if result.error_message:
+                            summary.errors.append(f"Airtable {result.airtable_id}: {result.error_message}")
+                
+                if limit is not None and summary.total_leads >= limit:
+                    # More changes may remain; the next pull starts from the old mark
+                    complete = False
+                    break
+            
+            if complete:
+                self.db.set_sync_watermark(watermark_key, pull_started.isoformat())
+            
+            # Logging handled by decorators
+            return summary
             
         except Exception as e:
             summary.errors.append(f"Sync from Airtable failed: {str(e)}")
-                # Error logging handled by decorators
-return summary
+            # Error logging handled by decorators
+            return summary
     
-    def _get_all_airtable_leads(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def _get_pull_watermark_key(self) -> str:
+        """Name under which the pull high-water mark of this base and table is stored."""
+        config = self.airtable.config
+        return f"airtable_pull:{config['base_id']}:{config['table_name']}"
+    
+    def _get_pull_since(self, watermark_key: str) -> Optional[datetime.datetime]:
         """
-        Get all leads from Airtable.
+        Work out the modification time to pull changes from.
+        
+        The stored mark is the start time of the last complete pull. It is
+        moved back by pull_overlap_seconds so that records modified while
+        that pull was running, or hidden by clock skew, are fetched again.
         
         Args:
-            limit: Maximum number of records to retrieve
+            watermark_key: Name of the stored high-water mark
             
         Returns:
-            List of Airtable lead records
+            Time to pull changes from, or None for a full pull
         """
+        high_water_mark = self.db.get_sync_watermark(watermark_key)
+        if not high_water_mark:
+            return None
+        
         try:
-            # Use the existing method to get leads
-            leads = self.airtable.get_leads_for_engagement(limit or 1000)
-            return leads
-            
-        except Exception as e:
-                # Error logging handled by decorators
-return []
+            since = datetime.datetime.fromisoformat(high_water_mark)
+        except (TypeError, ValueError):
+            return None
+        
+        return since - datetime.timedelta(seconds=self.pull_overlap_seconds)
     
-    def _sync_lead_from_airtable(self, airtable_lead: Dict[str, Any]) -> SyncResult:
+    def _apply_airtable_page(self, airtable_leads: List[Dict[str, Any]]) -> List[SyncResult]:
         """
-        Sync a single lead from Airtable to database.
+        Apply one page of Airtable records to the database.
+        
+        Existing leads are found with one lookup and written with one
+        update_leads call; new leads are inserted with one add_leads_bulk
+        call, so a page costs a handful of queries regardless of its size.
         
         Args:
-            airtable_lead: Lead data from Airtable
+            airtable_leads: Lead records from Airtable
             
         Returns:
-            SyncResult object
+            SyncResult objects in the same order as airtable_leads
         """
-        airtable_id = airtable_lead.get('id')
-        result = SyncResult(
-            operation=SyncOperation.UPDATE,
-            lead_id='',  # Will be set later when we know if it's create or update
-            airtable_id=airtable_id
-        )
+        now = datetime.datetime.now()
+        results = [
+            SyncResult(operation=SyncOperation.UPDATE, lead_id='', airtable_id=lead.get('id'),
+                       attempt_count=1, last_attempt=now)
+            for lead in airtable_leads
+        ]
         
         try:
-            # Map Airtable fields to database fields
+            existing_ids = self.db.get_lead_ids_by_airtable_ids(
+                [lead['id'] for lead in airtable_leads if lead.get('id')]
+            )
+        except Exception as e:
+            for result in results:
+                result.status = SyncStatus.FAILED
+                result.error_message = f"Failed to look up leads in database: {str(e)}"
+            return results
+        
+        updates = {}      # lead_id -> database fields
+        creates = []      # (result, database fields)
+        
+        for airtable_lead, result in zip(airtable_leads, results):
             db_fields = self._map_airtable_to_db_fields(airtable_lead)
+            lead_id = existing_ids.get(result.airtable_id)
             
-            # Check if lead exists in database by airtable_id
-            existing_leads = self.db.search_leads({'airtable_id': airtable_id})
+            if lead_id:
+                result.lead_id = lead_id
+                updates[lead_id] = db_fields
+            elif not db_fields.get('full_name'):
+                result.operation = SyncOperation.CREATE
+                result.status = SyncStatus.FAILED
+                result.error_message = "Lead must have a name"
+                result.attempt_count = 0  # Not retryable until the record changes
+            else:
+                result.operation = SyncOperation.CREATE
+                db_fields['airtable_id'] = result.airtable_id
+                creates.append((result, db_fields))
+        
+        if updates:
+            try:
+                counts = self.db.update_leads(updates)
+            except Exception as e:
+                counts = {}
+                error_message = f"Failed to update lead in database: {str(e)}"
+            else:
+                error_message = "Failed to update lead in database"
             
-            if existing_leads:
-                # Update existing lead
-                existing_lead = existing_leads[0]
-                result.lead_id = existing_lead['id']
-                result.operation = SyncOperation.UPDATE
-                
-                # Check if update is needed (compare timestamps)
-                if self._should_update_from_airtable(existing_lead, airtable_lead):
-                    success = self.db.update_lead(existing_lead['id'], db_fields)
-                    if success:
+            for result in results:
+                if result.lead_id in updates:
+                    if counts.get(result.lead_id):
                         result.status = SyncStatus.SUCCESS
-                # Logging handled by decorators
-else:
+                    else:
                         result.status = SyncStatus.FAILED
-                        result.error_message = "Failed to update lead in database"
-                else:
-                    result.status = SyncStatus.SUCCESS  # No update needed
-                    
-            else:
-                # Create new lead
-                db_fields['airtable_id'] = airtable_id
-                db_fields['airtable_synced'] = True
-                db_fields['sync_pending'] = False
-                
-                lead_id = self.db.add_lead(db_fields)
-                if lead_id:
+                        result.error_message = error_message
+        
+        if creates:
+            try:
+                lead_ids = self.db.add_leads_bulk([db_fields for _, db_fields in creates])['lead_ids']
+                for (result, _), lead_id in zip(creates, lead_ids):
                     result.lead_id = lead_id
-                    result.operation = SyncOperation.CREATE
                     result.status = SyncStatus.SUCCESS
-                # Logging handled by decorators
-})
-                else:
+            except Exception as e:
+                for result, _ in creates:
                     result.status = SyncStatus.FAILED
-                    result.error_message = "Failed to create lead in database"
-            
-        except Exception as e:
-            result.status = SyncStatus.FAILED
-            result.error_message = str(e)
-                # Error logging handled by decorators
-result.last_attempt = datetime.datetime.now()
-        return result
+                    result.error_message = f"Failed to create lead in database: {str(e)}"
+        
+        return results
     
     def _map_airtable_to_db_fields(self, airtable_lead: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -628,9 +878,11 @@ result.last_attempt = datetime.datetime.now()
         Args:
             sync_results: List of sync results
         """
+        updates = {}
+        
         for result in sync_results:
             if result.lead_id and result.status == SyncStatus.SUCCESS:
-                updates = {
+                updates[result.lead_id] = {
                     'airtable_synced': True,
                     'sync_pending': False,
                     'last_sync_attempt': result.last_attempt.isoformat() if result.last_attempt else None,
@@ -638,18 +890,21 @@ result.last_attempt = datetime.datetime.now()
                 }
                 
                 if result.airtable_id:
-                    updates['airtable_id'] = result.airtable_id
+                    updates[result.lead_id]['airtable_id'] = result.airtable_id
                 
-                self.db.update_lead(result.lead_id, updates)
+                if result.pushed_hashes is not None:
+                    updates[result.lead_id]['airtable_push_hashes'] = json.dumps(result.pushed_hashes, sort_keys=True)
                 
             elif result.lead_id and result.status == SyncStatus.FAILED:
-                updates = {
+                updates[result.lead_id] = {
                     'sync_pending': True,
                     'last_sync_attempt': result.last_attempt.isoformat() if result.last_attempt else None,
                     'sync_error': result.error_message
                 }
-                
-                self.db.update_lead(result.lead_id, updates)
+        
+        if updates:
+            # One transaction for the whole sync run instead of one per lead
+            self.db.update_leads(updates)
     
     def bidirectional_sync(self, push_limit: Optional[int] = None, 
                           pull_limit: Optional[int] = None) -> Dict[str, SyncSummary]:
@@ -664,16 +919,17 @@ result.last_attempt = datetime.datetime.now()
             Dictionary with 'push' and 'pull' sync summaries
         """
         results = {}
-                # Logging handled by decorators
-# Push to Airtable first
+        
+        # Push to Airtable first
         push_summary = self.sync_to_airtable()
         results['push'] = push_summary
         
         # Then pull from Airtable
         pull_summary = self.sync_from_airtable(pull_limit)
         results['pull'] = pull_summary
-                # Logging handled by decorators
-return results
+        
+        # Logging handled by decorators
+        return results
     
     def get_sync_statistics(self) -> Dict[str, Any]:
         """
@@ -683,28 +939,25 @@ return results
             Dictionary with sync statistics
         """
         try:
-            # Get database stats
+            # Database stats carry the materialized sync counters
             db_stats = self.db.get_database_stats()
             
-            # Get sync pending leads
-            sync_pending = self.db.get_sync_pending_leads()
-            
-            # Get leads with Airtable IDs
-            synced_leads = self.db.search_leads({'airtable_synced': True})
+            sync_pending_count = db_stats.get('sync_queue', 0)
+            synced_leads_count = db_stats.get('synced_leads', 0)
             
             stats = {
                 'database_stats': db_stats,
-                'sync_pending_count': len(sync_pending),
-                'synced_leads_count': len(synced_leads),
-                'sync_rate': len(synced_leads) / db_stats.get('total_leads', 1) if db_stats.get('total_leads', 0) > 0 else 0,
+                'sync_pending_count': sync_pending_count,
+                'synced_leads_count': synced_leads_count,
+                'sync_rate': synced_leads_count / db_stats.get('total_leads', 1) if db_stats.get('total_leads', 0) > 0 else 0,
                 'last_check': datetime.datetime.now().isoformat()
             }
             
             return stats
             
         except Exception as e:
-                # Error logging handled by decorators
-return {'error': str(e)}
+            # Error logging handled by decorators
+            return {'error': str(e)}
     
     def mark_for_sync(self, lead_id: str) -> bool:
         """
@@ -739,14 +992,11 @@ return {'error': str(e)}
         
         if not failed_leads:
             summary = SyncSummary()
-                # Logging handled by decorators
-return summary
+            # Logging handled by decorators
+            return summary
         
         # Extract lead IDs
         lead_ids = [lead['id'] for lead in failed_leads]
-                # Logging handled by decorators
-} failed leads'
-        })
         
         # Retry sync
         return self.sync_to_airtable(lead_ids)
\ No newline at end of file
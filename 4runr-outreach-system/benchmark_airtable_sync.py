@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Airtable sync throughput benchmark.
+
+Runs AirtableSyncManager push, pull and bidirectional sync against the local
+Airtable stand-in (shared/airtable_stub.py) and reports records per second.
+The stand-in enforces Airtable's 5 requests/second per base and can add
+per-request latency, so the numbers show how close each path gets to the
+API's ceiling (50 records/s for batched writes, 500 records/s for reads).
+
+Usage:
+    python benchmark_airtable_sync.py
+    python benchmark_airtable_sync.py --sizes 1000 --latency-ms 80
+    python benchmark_airtable_sync.py --sizes 10000 --requests-per-second 0 --json
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+SCENARIOS = ('push', 'pull', 'bidirectional')
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+_API_KEY = 'keyBENCHMARK'
+_TABLE_NAME = 'Leads'
+
+
+def _configure_environment(work_dir: str, requests_per_second: float) -> None:
+    """Point the Airtable settings at the stand-in; must run before importing sync code."""
+    os.environ['AIRTABLE_API_KEY'] = _API_KEY
+    os.environ['AIRTABLE_BASE_ID'] = 'appBENCHMARK'
+    os.environ['AIRTABLE_TABLE_NAME'] = _TABLE_NAME
+    os.environ['AIRTABLE_RATE_LIMIT_DB'] = os.path.join(work_dir, 'airtable_rate_limit.db')
+    # 0 disables throttling on both sides
+    os.environ['AIRTABLE_REQUESTS_PER_SECOND'] = str(requests_per_second or 1000000)
+
+
+def _local_leads(count: int, prefix: str) -> List[Dict[str, Any]]:
+    return [{
+        'full_name': f'{prefix} Lead {i}',
+        'email': f'{prefix.lower()}.lead{i}@example{i % 97}.com',
+        'company': f'{prefix} Company {i}',
+        'title': 'Head of Operations',
+        'linkedin_url': f'https://linkedin.com/in/{prefix.lower()}-lead-{i}',
+        'needs_sync': True,
+    } for i in range(count)]
+
+
+def _remote_records(count: int, prefix: str) -> List[Dict[str, Any]]:
+    return [{
+        'Full Name': f'{prefix} Lead {i}',
+        'Email': f'{prefix.lower()}.lead{i}@example{i % 97}.com',
+        'Company': f'{prefix} Company {i}',
+        'Job Title': 'Head of Sales',
+        'LinkedIn': f'https://linkedin.com/in/{prefix.lower()}-lead-{i}',
+    } for i in range(count)]
+
+
+def run_scenario(scenario: str, size: int, server, work_dir: str) -> Dict[str, Any]:
+    """
+    Run one scenario against a fresh database and a fresh Airtable base.
+
+    Returns:
+        Dictionary with records synced, elapsed seconds, records/s and request counts
+    """
+    from airtable_sync_manager import AirtableSyncManager
+
+    base_id = f'app{scenario.upper()}{size}'
+    os.environ['AIRTABLE_BASE_ID'] = base_id
+    manager = AirtableSyncManager(os.path.join(work_dir, f'{scenario}_{size}.db'))
+
+    push_count = size if scenario == 'push' else size // 2 if scenario == 'bidirectional' else 0
+    pull_count = size - push_count
+    if push_count:
+        manager.db.add_leads_bulk(_local_leads(push_count, 'Local'))
+    if pull_count:
+        server.stub.seed(base_id, _TABLE_NAME, _remote_records(pull_count, 'Remote'))
+
+    before = server.stub.stats()
+    started = time.perf_counter()
+
+    if scenario == 'push':
+        summaries = [manager.sync_to_airtable()]
+    elif scenario == 'pull':
+        summaries = [manager.sync_from_airtable(full=True)]
+    else:
+        summaries = list(manager.bidirectional_sync().values())
+
+    elapsed = time.perf_counter() - started
+    after = server.stub.stats()
+
+    synced = sum(summary.successful_syncs for summary in summaries)
+    failed = sum(summary.failed_syncs for summary in summaries)
+    return {
+        'scenario': scenario,
+        'size': size,
+        'synced': synced,
+        'failed': failed,
+        'seconds': round(elapsed, 3),
+        'records_per_second': round(synced / elapsed, 1) if elapsed else 0.0,
+        'requests': after['requests'] - before['requests'],
+        'throttled': after['throttled'] - before['throttled'],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark Airtable sync against a local stand-in')
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help='Comma-separated lead counts (default: 1000,10000,100000)')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS),
+                        help='Comma-separated scenarios: push, pull, bidirectional')
+    parser.add_argument('--requests-per-second', type=float, default=5.0,
+                        help='Per-base request limit of the stand-in and the client (0 disables)')
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help='Latency added to every stand-in response')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    scenarios = [scenario.strip() for scenario in args.scenarios.split(',') if scenario.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    # Per-batch sync logging would dominate both the output and the timings
+    logging.disable(logging.INFO)
+
+    work_dir = tempfile.mkdtemp(prefix='airtable_benchmark_')
+    _configure_environment(work_dir, args.requests_per_second)
+
+    from shared.airtable_stub import AirtableStubServer
+
+    results = []
+    try:
+        with AirtableStubServer(requests_per_second=args.requests_per_second,
+                                latency=args.latency_ms / 1000.0) as server:
+            os.environ['AIRTABLE_ENDPOINT_URL'] = server.url
+            for size in sizes:
+                for scenario in scenarios:
+                    result = run_scenario(scenario, size, server, work_dir)
+                    results.append(result)
+                    if not args.json:
+                        print(f"{scenario:>13} {size:>7} leads: {result['records_per_second']:>8.1f} records/s "
+                              f"({result['synced']} synced, {result['failed']} failed, {result['seconds']:.1f}s, "
+                              f"{result['requests']} requests, {result['throttled']} throttled)")
+                        sys.stdout.flush()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps({
+            'requests_per_second': args.requests_per_second,
+            'latency_ms': args.latency_ms,
+            'results': results,
+        }, indent=2))
+
+    return 0 if all(result['failed'] == 0 for result in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
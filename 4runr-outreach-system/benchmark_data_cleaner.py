@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Data cleaner throughput benchmark.
+
+Replays a corpus of raw company names and websites through
+CleaningRulesEngine and reports cleaned values per second for each field.
+
+The corpus is recorded enricher output: the AuditLogger's cleaning logs
+(logs/data_cleaner/cleaning_log_*.ndjson, one entry per cleaned field with its
+original_value), or JSON/JSONL files of raw lead records as the enrichers
+produce them ({"Company": ..., "Website": ...}). Without --corpus a built-in
+sample of typical enricher output is used.
+
+Usage:
+    python benchmark_data_cleaner.py
+    python benchmark_data_cleaner.py --corpus logs/data_cleaner/cleaning_log_2025-01-15.ndjson
+    python benchmark_data_cleaner.py --corpus leads.jsonl --seconds 10 --json
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+COMPANY_FIELDS = ('company', 'company_name')
+WEBSITE_FIELDS = ('website', 'website_url', 'company_website')
+
+CONFIG_FILES = ('cleaning_rules.yaml', 'validation_rules.yaml')
+
+# Typical enricher output: mostly clean names with the artifacts seen in real data
+SAMPLE_COMPANIES = [
+    'Shopify', 'Lightspeed Commerce Inc.', 'Coveo Solutions inc', 'Nuvei Corporation', 'Hopper',
+    'Dialogue Health Technologies', 'Behaviour Interactive', 'Desjardins Group', 'CGI Group Inc',
+    'Frank And Oak', 'Busbud', 'Plusgrade', 'Alithya', 'Valsoft Corporation', 'Kinova',
+    'Moment Factory', 'Stingray Digital Group', 'Randstad GmbH', 'Atlassian Pty Ltd', 'Spotify AB',
+    'TechCorp Inc.', 'Acme Corp', 'Smith & Associates LLC', 'Johnson and Johnson',
+    'Sirius XM and ... Some results may have been delisted consistent with local laws. Learn more Next',
+    'About 1,234 results for TechCorp Inc',
+    'Search results for Acme Corp',
+    'for Busbud',
+    'Hopper - LinkedIn',
+    '<span>Coveo</span> &amp; Partners',
+    'Kinova &nbsp; Robotics',
+    'Plusgrade Learn more',
+    'Valsoft Corporation ...',
+    'Nuvei   Corporation\t',
+]
+
+SAMPLE_WEBSITES = [
+    'https://www.shopify.com/', 'https://lightspeedhq.com', 'http://www.coveo.com/en', 'nuvei.com',
+    'www.hopper.com', 'https://www.dialogue.co/', 'https://www.bhvr.com', 'https://www.desjardins.com/',
+    'https://www.cgi.com/en', 'frankandoak.com', 'https://www.busbud.com/en', 'https://plusgrade.com/',
+    'Website: https://www.alithya.com', '//kinova.ca', 'https://momentfactory.com:443/home',
+    'https://www.linkedin.com/company/hopper', 'https://www.google.com/search?q=acme',
+    'https://facebook.com/acme', 'not a website', 'https://www.stingray.com/?utm_source=google',
+]
+
+
+def _field_values(record: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """(field, raw value) pairs of one audit log entry or raw lead record."""
+    if 'original_value' in record and 'field_name' in record:
+        return [(str(record['field_name']).lower(), str(record['original_value']))]
+    return [(str(field).lower(), str(value)) for field, value in record.items()
+            if value and str(field).lower() in COMPANY_FIELDS + WEBSITE_FIELDS]
+
+
+def load_corpus(paths: List[str]) -> Dict[str, List[str]]:
+    """
+    Load raw company names and websites from recorded enricher output.
+
+    Args:
+        paths: JSON files holding a list of records, or JSONL files with one record per line
+
+    Returns:
+        Dictionary with 'company' and 'website' value lists
+    """
+    corpus = {'company': [], 'website': []}
+    for path in paths:
+        text = Path(path).read_text(encoding='utf-8')
+        try:
+            records = json.loads(text)
+            if isinstance(records, dict):
+                records = [records]
+        except json.JSONDecodeError:
+            records = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+        for record in records:
+            for field, value in _field_values(record):
+                if field in COMPANY_FIELDS:
+                    corpus['company'].append(value)
+                elif field in WEBSITE_FIELDS:
+                    corpus['website'].append(value)
+    return corpus
+
+
+def measure(clean, values: List[str], seconds: float) -> Dict[str, Any]:
+    """
+    Clean the values repeatedly for about the given time.
+
+    Returns:
+        Dictionary with values cleaned, elapsed seconds and values/s
+    """
+    # One untimed pass fills caches and lazy imports
+    for value in values:
+        clean(value)
+
+    cleaned = 0
+    started = time.perf_counter()
+    while True:
+        for value in values:
+            clean(value)
+        cleaned += len(values)
+        elapsed = time.perf_counter() - started
+        if elapsed >= seconds:
+            break
+
+    return {
+        'values': cleaned,
+        'seconds': round(elapsed, 3),
+        'values_per_second': round(cleaned / elapsed, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark data cleaner throughput on recorded enricher output')
+    parser.add_argument('--corpus', action='append', default=[],
+                        help='Cleaning log or raw lead records (JSON or JSONL); may be repeated')
+    parser.add_argument('--config-dir', default=str(Path(__file__).parent / 'shared' / 'data_cleaner_config'),
+                        help='Directory with cleaning_rules.yaml and validation_rules.yaml')
+    parser.add_argument('--seconds', type=float, default=3.0, help='Time spent cleaning each field')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    if args.corpus:
+        corpus = load_corpus(args.corpus)
+    else:
+        corpus = {'company': list(SAMPLE_COMPANIES), 'website': list(SAMPLE_WEBSITES)}
+
+    # Rejections are logged, but the Python logging output would swamp the results
+    logging.disable(logging.INFO)
+
+    # shared.config requires Airtable settings on import; the cleaner never calls Airtable
+    for name, placeholder in (('AIRTABLE_API_KEY', 'keyBENCHMARK'), ('AIRTABLE_BASE_ID', 'appBENCHMARK'),
+                              ('AIRTABLE_TABLE_NAME', 'Leads')):
+        os.environ.setdefault(name, placeholder)
+
+    # The configuration manager writes backups and version history next to the rules
+    work_dir = tempfile.mkdtemp(prefix='data_cleaner_benchmark_')
+    try:
+        for filename in CONFIG_FILES:
+            source = os.path.join(args.config_dir, filename)
+            if os.path.exists(source):
+                shutil.copy(source, work_dir)
+
+        from shared.data_cleaner import CleaningRulesEngine, ConfigurationManager
+
+        config_manager = ConfigurationManager(work_dir)
+        engine = CleaningRulesEngine(config_manager.cleaning_rules)
+
+        results = []
+        for field, clean in (('company', engine.clean_company_name), ('website', engine.clean_website_url)):
+            if not corpus[field]:
+                continue
+            result = {'field': field, 'corpus_size': len(corpus[field])}
+            result.update(measure(clean, corpus[field], args.seconds))
+            results.append(result)
+            if not args.json:
+                print(f"{field:>8}: {result['values_per_second']:>10.1f} values/s "
+                      f"({result['corpus_size']} inputs, {result['values']} cleaned in {result['seconds']:.1f}s)")
+                sys.stdout.flush()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps({'results': results}, indent=2))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
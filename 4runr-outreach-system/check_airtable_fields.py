@@ -9,26 +9,18 @@ def main():
     try:
         client = get_airtable_client()
         
-        # Get all records without filtering to see what fields exist
-        records = client.table.all(max_records=3)
+        # Field names come from the shared schema cache; refresh it explicitly
+        field_names = client.get_available_field_names(refresh=True)
         
-        # Convert generator to list to avoid subscriptable errors
-        records_list = list(records)
-        
-        if records_list:
-            print("Available fields in Airtable:")
+        if field_names:
+            print(f"Available fields in Airtable table '{client.table_name}':")
             print("-" * 50)
-            
-            # Show fields from first record
-            first_record = records_list[0]
-            print(f"Record ID: {first_record['id']}")
-            print("Fields:")
-            for field_name, value in first_record['fields'].items():
-                print(f"  {field_name}: {value}")
+            for field_name in field_names:
+                print(f"  {field_name}")
                 
-            print(f"\nTotal records found: {len(records)}")
+            print(f"\nTotal fields found: {len(field_names)}")
         else:
-            print("No records found in Airtable")
+            print("No fields found in Airtable")
             
     except Exception as e:
         print(f"Error accessing Airtable: {e}")
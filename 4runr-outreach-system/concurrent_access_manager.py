@@ -8,7 +8,9 @@ and concurrent access coordination for the lead database system.
 Features:
 - Thread-safe database operations
 - Deadlock detection and recovery
-- Operation queuing and prioritization
+- Operation queuing and prioritization on a sized worker pool
+- Future-based completion handoff (no result polling)
+- Shared-lock fast path for read-only operations
 - Resource locking and coordination
 - Performance monitoring for concurrent operations
 """
@@ -25,6 +27,9 @@ from enum import Enum
 import uuid
 import functools
 import weakref
+import contextlib
+from concurrent.futures import Future, InvalidStateError
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from contextlib import contextmanager
 
 from database_connection_pool import get_connection_pool, DatabaseConnectionPool
@@ -57,6 +62,7 @@ class OperationRequest:
     args: tuple = field(default_factory=tuple)
     kwargs: dict = field(default_factory=dict)
     thread_id: int = field(default_factory=threading.get_ident)
+    future: Future = field(default_factory=Future, compare=False, repr=False)
     
     def __lt__(self, other):
         """Enable priority queue ordering"""
@@ -118,8 +124,7 @@ class ConcurrentAccessManager:
         # Operation management
         self._operation_queue = queue.PriorityQueue()
         self._active_operations: Dict[str, OperationRequest] = {}
-        self._operation_results: Dict[str, Any] = {}
-        self._operation_errors: Dict[str, Exception] = {}
+        self._operation_futures: Dict[str, Future] = {}  # operation_id -> pending future
         
         # Resource locking
         self._resource_locks: Dict[str, List[ResourceLock]] = {}
@@ -127,8 +132,9 @@ class ConcurrentAccessManager:
         
         # Thread coordination
         self._access_lock = threading.RLock()
-        self._operation_semaphore = threading.Semaphore(max_concurrent_operations)
+        self._lock_released = threading.Condition(self._access_lock)
         self._shutdown_event = threading.Event()
+        self._worker_threads: List[threading.Thread] = []
         
         # Deadlock detection
         self._deadlock_detector_thread = None
@@ -140,6 +146,7 @@ class ConcurrentAccessManager:
             'operations_completed': 0,
             'operations_failed': 0,
             'operations_timeout': 0,
+            'shared_reads': 0,
             'deadlocks_detected': 0,
             'deadlocks_resolved': 0,
             'average_operation_time': 0.0,
@@ -151,13 +158,15 @@ class ConcurrentAccessManager:
     
     def _start_background_threads(self):
         """Start background threads for operation processing and deadlock detection"""
-        # Operation processor thread
-        self._processor_thread = threading.Thread(
-            target=self._operation_processor, 
-            daemon=True,
-            name="OperationProcessor"
-        )
-        self._processor_thread.start()
+        # Operation worker pool, sized to the concurrent operation limit
+        for worker_index in range(max(1, self.max_concurrent_operations)):
+            worker = threading.Thread(
+                target=self._operation_processor,
+                daemon=True,
+                name=f"OperationWorker-{worker_index}"
+            )
+            worker.start()
+            self._worker_threads.append(worker)
         
         # Deadlock detector thread
         self._deadlock_detector_thread = threading.Thread(
@@ -170,7 +179,7 @@ class ConcurrentAccessManager:
         logger.info("Started concurrent access manager background threads")
     
     def _operation_processor(self):
-        """Background thread that processes queued operations"""
+        """Worker thread that processes queued operations in priority order"""
         while not self._shutdown_event.is_set():
             try:
                 # Get next operation from queue (with timeout)
@@ -179,18 +188,18 @@ class ConcurrentAccessManager:
                 except queue.Empty:
                     continue
                 
-                # Acquire semaphore for concurrent operation limit
-                if self._operation_semaphore.acquire(timeout=operation.timeout):
-                    try:
-                        # Process the operation
+                try:
+                    waited = (datetime.now() - operation.requested_at).total_seconds()
+                    if operation.future.done():
+                        # Caller already gave up or the operation was aborted
+                        pass
+                    elif waited > operation.timeout:
+                        # Operation timed out waiting in the queue
+                        self._handle_operation_timeout(operation)
+                    else:
                         self._execute_operation(operation)
-                    finally:
-                        self._operation_semaphore.release()
-                else:
-                    # Operation timed out waiting for semaphore
-                    self._handle_operation_timeout(operation)
-                
-                self._operation_queue.task_done()
+                finally:
+                    self._operation_queue.task_done()
                 
             except Exception as e:
                 logger.error(f"Error in operation processor: {e}")
@@ -211,10 +220,10 @@ class ConcurrentAccessManager:
             # Execute the operation callback
             result = operation.callback(*operation.args, **operation.kwargs)
             
-            # Store result
+            # Hand the result to the waiting caller
             with self._access_lock:
-                self._operation_results[operation.operation_id] = result
                 self._stats['operations_completed'] += 1
+            self._resolve_future(operation, result=result)
             
             execution_time = time.time() - start_time
             self._update_average_operation_time(execution_time)
@@ -222,10 +231,10 @@ class ConcurrentAccessManager:
             logger.debug(f"Completed operation {operation.operation_id} in {execution_time:.3f}s")
             
         except Exception as e:
-            # Store error
+            # Hand the error to the waiting caller
             with self._access_lock:
-                self._operation_errors[operation.operation_id] = e
                 self._stats['operations_failed'] += 1
+            self._resolve_future(operation, error=e)
             
             logger.error(f"Operation {operation.operation_id} failed: {e}")
             
@@ -235,13 +244,25 @@ class ConcurrentAccessManager:
                 if operation.operation_id in self._active_operations:
                     del self._active_operations[operation.operation_id]
     
+    def _resolve_future(self, operation: OperationRequest, result: Any = None,
+                        error: Optional[BaseException] = None):
+        """Complete an operation's future unless it was already resolved"""
+        try:
+            if error is not None:
+                operation.future.set_exception(error)
+            else:
+                operation.future.set_result(result)
+        except InvalidStateError:
+            # Already aborted by deadlock resolution, timeout or shutdown
+            pass
+    
     def _handle_operation_timeout(self, operation: OperationRequest):
         """Handle operation timeout"""
         with self._access_lock:
-            self._operation_errors[operation.operation_id] = TimeoutError(
-                f"Operation {operation.operation_id} timed out after {operation.timeout} seconds"
-            )
             self._stats['operations_timeout'] += 1
+        self._resolve_future(operation, error=TimeoutError(
+            f"Operation {operation.operation_id} timed out after {operation.timeout} seconds"
+        ))
         
         logger.warning(f"Operation {operation.operation_id} timed out")
     
@@ -372,9 +393,9 @@ class ConcurrentAccessManager:
         # Abort the victim operation
         if victim_operation in self._active_operations:
             operation = self._active_operations[victim_operation]
-            self._operation_errors[victim_operation] = RuntimeError(
+            self._resolve_future(operation, error=RuntimeError(
                 f"Operation aborted due to deadlock resolution (deadlock_id: {deadlock_id})"
-            )
+            ))
             
             # Release any locks held by this operation
             self._release_operation_locks(victim_operation)
@@ -414,6 +435,8 @@ class ConcurrentAccessManager:
             # Clean up empty lock lists
             if not self._resource_locks[resource_id]:
                 del self._resource_locks[resource_id]
+        
+        self._lock_released.notify_all()
     
     @contextmanager
     def acquire_resource_lock(self, 
@@ -457,41 +480,44 @@ class ConcurrentAccessManager:
             logger.debug(f"Released {lock_type.value} lock on {resource_id} for operation {operation_id}")
     
     def _try_acquire_lock(self, lock: ResourceLock, timeout: int) -> bool:
-        """Try to acquire a resource lock"""
-        start_time = time.time()
+        """Try to acquire a resource lock, sleeping until a holder releases it"""
+        deadline = time.monotonic() + timeout
+        waiter = None
         
-        while time.time() - start_time < timeout:
-            with self._access_lock:
-                if self._can_acquire_lock(lock):
-                    # Acquire the lock
-                    if lock.resource_id not in self._resource_locks:
-                        self._resource_locks[lock.resource_id] = []
-                    
-                    self._resource_locks[lock.resource_id].append(lock)
-                    return True
-                else:
-                    # Add to waiters if not already there
-                    if lock.resource_id not in self._lock_waiters:
-                        self._lock_waiters[lock.resource_id] = []
-                    
-                    # Create a dummy operation request for waiting
-                    dummy_op = OperationRequest(
-                        operation_id=lock.operation_id,
-                        operation_type="lock_wait",
-                        priority=OperationPriority.NORMAL,
-                        requested_at=datetime.now(),
-                        timeout=timeout,
-                        callback=lambda: None,
-                        thread_id=lock.owner_thread
-                    )
+        with self._lock_released:
+            try:
+                while not self._can_acquire_lock(lock):
+                    if waiter is None:
+                        # Register as a waiter so deadlock detection can see us
+                        waiter = OperationRequest(
+                            operation_id=lock.operation_id,
+                            operation_type="lock_wait",
+                            priority=OperationPriority.NORMAL,
+                            requested_at=datetime.now(),
+                            timeout=timeout,
+                            callback=lambda: None,
+                            thread_id=lock.owner_thread
+                        )
+                        self._lock_waiters.setdefault(lock.resource_id, []).append(waiter)
                     
-                    if dummy_op not in self._lock_waiters[lock.resource_id]:
-                        self._lock_waiters[lock.resource_id].append(dummy_op)
-            
-            # Wait a bit before retrying
-            time.sleep(0.01)
-        
-        return False
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._lock_released.wait(remaining)
+                
+                # Acquire the lock
+                self._resource_locks.setdefault(lock.resource_id, []).append(lock)
+                return True
+            finally:
+                if waiter is not None:
+                    waiters = [
+                        op for op in self._lock_waiters.get(lock.resource_id, [])
+                        if op is not waiter
+                    ]
+                    if waiters:
+                        self._lock_waiters[lock.resource_id] = waiters
+                    else:
+                        self._lock_waiters.pop(lock.resource_id, None)
     
     def _can_acquire_lock(self, requested_lock: ResourceLock) -> bool:
         """Check if a lock can be acquired"""
@@ -542,6 +568,8 @@ class ConcurrentAccessManager:
                     
                     if not self._lock_waiters[lock.resource_id]:
                         del self._lock_waiters[lock.resource_id]
+            
+            self._lock_released.notify_all()
     
     def execute_operation(self, 
                          operation_type: str,
@@ -580,6 +608,11 @@ class ConcurrentAccessManager:
             kwargs=kwargs
         )
         
+        if not wait_for_result:
+            # Keep the future around so the result can be collected later
+            with self._access_lock:
+                self._operation_futures[operation.operation_id] = operation.future
+        
         if self.enable_operation_queuing:
             # Queue the operation
             self._operation_queue.put(operation)
@@ -588,7 +621,7 @@ class ConcurrentAccessManager:
                 self._stats['operations_queued'] += 1
             
             if wait_for_result:
-                return self._wait_for_operation_result(operation.operation_id, timeout)
+                return self._wait_for_future(operation, timeout)
             else:
                 return operation.operation_id
         else:
@@ -596,44 +629,102 @@ class ConcurrentAccessManager:
             self._execute_operation(operation)
             
             if wait_for_result:
-                return self._get_operation_result(operation.operation_id)
+                return operation.future.result()
             else:
                 return operation.operation_id
     
-    def _wait_for_operation_result(self, operation_id: str, timeout: int) -> Any:
-        """Wait for an operation to complete and return its result"""
+    def execute_read_operation(self,
+                               operation_type: str,
+                               callback: Callable,
+                               args: tuple = (),
+                               kwargs: dict = None,
+                               resource_locks: List[str] = None,
+                               timeout: int = None) -> Any:
+        """
+        Execute a read-only operation directly on the calling thread
+        
+        Read-only operations skip the operation queue and worker pool. They
+        hold SHARED locks on their resources, so they run concurrently with
+        each other but never alongside an exclusive writer.
+        
+        Args:
+            operation_type: Type of operation being performed
+            callback: Function to execute
+            args: Arguments for the callback
+            kwargs: Keyword arguments for the callback
+            resource_locks: Resources to hold shared locks on
+            timeout: Lock acquisition timeout (uses default if None)
+            
+        Returns:
+            Result of the callback
+        """
+        kwargs = kwargs or {}
+        timeout = timeout or self.operation_timeout
+        operation_id = str(uuid.uuid4())
         start_time = time.time()
         
-        while time.time() - start_time < timeout:
+        try:
+            with contextlib.ExitStack() as stack:
+                for resource_id in resource_locks or []:
+                    stack.enter_context(self.acquire_resource_lock(
+                        resource_id,
+                        lock_type=LockType.SHARED,
+                        timeout=timeout,
+                        operation_id=operation_id
+                    ))
+                result = callback(*args, **kwargs)
+        except Exception as e:
             with self._access_lock:
-                if operation_id in self._operation_results:
-                    result = self._operation_results[operation_id]
-                    del self._operation_results[operation_id]  # Clean up
-                    return result
-                
-                if operation_id in self._operation_errors:
-                    error = self._operation_errors[operation_id]
-                    del self._operation_errors[operation_id]  # Clean up
-                    raise error
-            
-            time.sleep(0.01)  # Small delay to avoid busy waiting
+                self._stats['operations_failed'] += 1
+            logger.error(f"Read operation {operation_type} ({operation_id}) failed: {e}")
+            raise
+        
+        with self._access_lock:
+            self._stats['operations_completed'] += 1
+            self._stats['shared_reads'] += 1
+        self._update_average_operation_time(time.time() - start_time)
         
-        raise TimeoutError(f"Operation {operation_id} did not complete within {timeout} seconds")
+        return result
+    
+    def _wait_for_future(self, operation: OperationRequest, timeout: int) -> Any:
+        """Block until an operation's future resolves and return its result"""
+        try:
+            return operation.future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # Mark it done so a worker that picks it up later skips it
+            operation.future.cancel()
+            raise TimeoutError(
+                f"Operation {operation.operation_id} did not complete within {timeout} seconds"
+            )
+    
+    def _wait_for_operation_result(self, operation_id: str, timeout: int) -> Any:
+        """Wait for a non-blocking operation to complete and return its result"""
+        with self._access_lock:
+            future = self._operation_futures.get(operation_id)
+        
+        if future is None:
+            raise RuntimeError(f"Operation {operation_id} result not available")
+        
+        try:
+            result = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise TimeoutError(f"Operation {operation_id} did not complete within {timeout} seconds")
+        finally:
+            if future.done():
+                with self._access_lock:
+                    self._operation_futures.pop(operation_id, None)
+        
+        return result
     
     def _get_operation_result(self, operation_id: str) -> Any:
-        """Get the result of an operation (non-blocking)"""
+        """Get the result of a non-blocking operation (non-blocking)"""
         with self._access_lock:
-            if operation_id in self._operation_results:
-                result = self._operation_results[operation_id]
-                del self._operation_results[operation_id]
-                return result
-            
-            if operation_id in self._operation_errors:
-                error = self._operation_errors[operation_id]
-                del self._operation_errors[operation_id]
-                raise error
+            future = self._operation_futures.get(operation_id)
+            if future is None or not future.done():
+                raise RuntimeError(f"Operation {operation_id} result not available")
+            del self._operation_futures[operation_id]
         
-        raise RuntimeError(f"Operation {operation_id} result not available")
+        return future.result()
     
     def get_stats(self) -> Dict[str, Any]:
         """Get concurrent access manager statistics"""
@@ -721,17 +812,27 @@ class ConcurrentAccessManager:
         self._shutdown_event.set()
         
         # Wait for background threads to finish
-        if self._processor_thread and self._processor_thread.is_alive():
-            self._processor_thread.join(timeout=5)
+        for worker in self._worker_threads:
+            if worker.is_alive():
+                worker.join(timeout=5)
         
         if self._deadlock_detector_thread and self._deadlock_detector_thread.is_alive():
             self._deadlock_detector_thread.join(timeout=5)
         
+        # Fail anything still queued so callers don't wait out their timeout
+        while True:
+            try:
+                operation = self._operation_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._resolve_future(operation, error=RuntimeError(
+                f"Operation {operation.operation_id} cancelled by shutdown"
+            ))
+        
         # Clear all data structures
         with self._access_lock:
             self._active_operations.clear()
-            self._operation_results.clear()
-            self._operation_errors.clear()
+            self._operation_futures.clear()
             self._resource_locks.clear()
             self._lock_waiters.clear()
         
@@ -741,7 +842,8 @@ class ConcurrentAccessManager:
 def thread_safe_operation(operation_type: str, 
                          priority: OperationPriority = OperationPriority.NORMAL,
                          timeout: int = None,
-                         resource_locks: List[str] = None):
+                         resource_locks: List[str] = None,
+                         read_only: bool = False):
     """
     Decorator to make database operations thread-safe
     
@@ -750,6 +852,8 @@ def thread_safe_operation(operation_type: str,
         priority: Operation priority
         timeout: Operation timeout
         resource_locks: List of resources to lock
+        read_only: Run on the calling thread under shared locks instead of
+                   queueing for a worker
     """
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
@@ -761,6 +865,16 @@ def thread_safe_operation(operation_type: str,
                 # Fallback to direct execution if no access manager
                 return func(*args, **kwargs)
             
+            if read_only:
+                return access_manager.execute_read_operation(
+                    operation_type=operation_type,
+                    callback=func,
+                    args=args,
+                    kwargs=kwargs,
+                    resource_locks=resource_locks,
+                    timeout=timeout
+                )
+            
             # Define the operation callback
             def operation_callback():
                 if resource_locks:
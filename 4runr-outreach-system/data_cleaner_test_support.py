@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Shared setup for unit tests that edit the data cleaner rules.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+
+CONFIG_DIR = Path(__file__).parent / 'shared' / 'data_cleaner_config'
+RULE_FILES = ('cleaning_rules.yaml', 'validation_rules.yaml')
+
+
+class ShippedRulesTestCase(unittest.TestCase):
+    """Test case working on a temporary copy of the shipped rules in self.temp_dir."""
+
+    def setUp(self):
+        """Copy the shipped rules to a temporary configuration directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        for filename in RULE_FILES:
+            shutil.copy(CONFIG_DIR / filename, self.temp_dir)
@@ -86,9 +86,11 @@ class DatabaseConnectionPool:
         
         # Thread-safe connection management
         self._pool_lock = threading.RLock()
-        self._available_connections = queue.Queue(maxsize=max_connections)
+        self._available_connections = queue.LifoQueue(maxsize=max_connections)  # LIFO keeps hot connections warm
         self._all_connections: Dict[str, ConnectionInfo] = {}
-        self._active_connections: Dict[int, str] = {}  # thread_id -> connection_id
+        self._connections: Dict[str, sqlite3.Connection] = {}  # connection_id -> live connection
+        self._connection_ids: Dict[int, str] = {}  # id(connection) -> connection_id
+        self._active_connections: Dict[int, List[str]] = {}  # thread_id -> checked out connection_ids
         
         # Transaction management
         self._transaction_lock = threading.RLock()
@@ -103,9 +105,19 @@ class DatabaseConnectionPool:
             'transactions_committed': 0,
             'transactions_rolled_back': 0,
             'deadlocks_detected': 0,
-            'connection_timeouts': 0
+            'connection_timeouts': 0,
+            'checkouts': 0,
+            'checkins': 0,
+            'checkout_waits': 0,
+            'total_wait_time_ms': 0.0,
+            'max_wait_time_ms': 0.0,
+            'health_checks': 0,
+            'health_check_failures': 0,
+            'connections_recycled': 0
         }
         
+        self._shutdown_event = threading.Event()
+        
         # Initialize the pool
         self._initialize_pool()
         
@@ -116,7 +128,9 @@ class DatabaseConnectionPool:
     def _initialize_pool(self):
         """Initialize the connection pool with minimum connections"""
         # Ensure database directory exists
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
         
         # Create minimum connections
         for _ in range(self.min_connections):
@@ -159,12 +173,12 @@ class DatabaseConnectionPool:
                 thread_id=threading.get_ident()
             )
             
-            # Store connection info separately (sqlite3.Connection doesn't support custom attributes)
-            # conn._connection_id = connection_id  # This doesn't work with sqlite3.Connection
-            # conn._connection_info = conn_info    # This doesn't work with sqlite3.Connection
-            
+            # sqlite3.Connection doesn't support custom attributes, so the live
+            # connection is tracked alongside its info and looked up by id()
             with self._pool_lock:
                 self._all_connections[connection_id] = conn_info
+                self._connections[connection_id] = conn
+                self._connection_ids[id(conn)] = connection_id
                 self._stats['connections_created'] += 1
             
             logger.debug(f"Created new database connection: {connection_id}")
@@ -175,26 +189,93 @@ class DatabaseConnectionPool:
             return None
     
     def _get_connection_by_id(self, connection_id: str) -> Optional[sqlite3.Connection]:
-        """Get the actual connection object by ID"""
-        # This is a simplified approach - in a real implementation,
-        # you'd store the connection objects separately
+        """Get the live connection object by ID"""
+        with self._pool_lock:
+            return self._connections.get(connection_id)
+    
+    def get_connection_id(self, connection: sqlite3.Connection) -> Optional[str]:
+        """Get the pool ID of a connection handed out by this pool"""
+        with self._pool_lock:
+            return self._connection_ids.get(id(connection))
+    
+    def _check_connection_health(self, connection_id: str) -> bool:
+        """Run a cheap query on a connection to verify it is still usable"""
+        conn = self._get_connection_by_id(connection_id)
+        if conn is None:
+            return False
+        
+        with self._pool_lock:
+            self._stats['health_checks'] += 1
+        
         try:
-            conn = sqlite3.connect(
-                self.db_path,
-                timeout=self.connection_timeout,
-                check_same_thread=False,
-                isolation_level=None
-            )
-            conn._connection_id = connection_id
-            return conn
-        except Exception as e:
-            logger.error(f"Failed to get connection {connection_id}: {e}")
-            return None
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"Connection {connection_id} failed health check: {e}")
+            with self._pool_lock:
+                self._stats['health_check_failures'] += 1
+                if connection_id in self._all_connections:
+                    self._all_connections[connection_id].is_healthy = False
+            return False
+    
+    def _checkout(self, timeout: float) -> str:
+        """Take an idle connection from the pool, growing it up to max_connections"""
+        try:
+            return self._available_connections.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._pool_lock:
+            if len(self._all_connections) < self.max_connections:
+                conn_info = self._create_connection()
+                if conn_info:
+                    return conn_info.connection_id
+        
+        # Pool is exhausted, wait for another thread to check a connection in
+        with self._pool_lock:
+            self._stats['checkout_waits'] += 1
+        try:
+            return self._available_connections.get(timeout=timeout)
+        except queue.Empty:
+            with self._pool_lock:
+                self._stats['connection_timeouts'] += 1
+            raise TimeoutError(f"Could not acquire connection within {timeout} seconds")
+    
+    def _checkin(self, connection_id: str):
+        """Return a connection to the pool, discarding it if it is no longer usable"""
+        conn = self._get_connection_by_id(connection_id)
+        if conn is None:
+            return
+        
+        with self._pool_lock:
+            conn_info = self._all_connections.get(connection_id)
+            healthy = conn_info is not None and conn_info.is_healthy
+        
+        if healthy and conn.in_transaction:
+            # Never hand an open transaction to the next caller
+            try:
+                conn.rollback()
+                logger.warning(f"Rolled back uncommitted work on connection {connection_id}")
+            except sqlite3.Error:
+                healthy = False
+        
+        if healthy:
+            with self._pool_lock:
+                self._stats['checkins'] += 1
+            self._available_connections.put(connection_id)
+        else:
+            self._destroy_connection(connection_id)
+            with self._pool_lock:
+                self._stats['connections_recycled'] += 1
     
     @contextlib.contextmanager
     def get_connection(self, timeout: Optional[int] = None):
         """
-        Get a connection from the pool
+        Check out a connection from the pool
+        
+        The connection is configured once when created (WAL, cache size,
+        busy timeout) and returned to the pool when the context exits, so
+        its page cache survives across calls.
         
         Args:
             timeout: Timeout for acquiring connection (uses default if None)
@@ -203,78 +284,79 @@ class DatabaseConnectionPool:
             sqlite3.Connection: Database connection
         """
         timeout = timeout or self.connection_timeout
-        connection_id = None
-        conn = None
+        thread_id = threading.get_ident()
+        
+        wait_start = time.perf_counter()
+        connection_id = self._checkout(timeout)
+        conn = self._get_connection_by_id(connection_id)
+        
+        with self._pool_lock:
+            conn_info = self._all_connections.get(connection_id)
+        
+        if conn is None or conn_info is None or not conn_info.is_healthy:
+            # Connection was destroyed or marked bad while idle, replace it
+            self._destroy_connection(connection_id)
+            conn_info = self._create_connection()
+            if not conn_info:
+                raise sqlite3.OperationalError(f"Could not open database connection to {self.db_path}")
+            connection_id = conn_info.connection_id
+            conn = self._get_connection_by_id(connection_id)
+        
+        wait_time_ms = (time.perf_counter() - wait_start) * 1000
+        
+        with self._pool_lock:
+            conn_info = self._all_connections[connection_id]
+            conn_info.last_used = datetime.now()
+            conn_info.thread_id = thread_id
+            conn_info.query_count += 1
+            
+            self._active_connections.setdefault(thread_id, []).append(connection_id)
+            self._stats['checkouts'] += 1
+            self._stats['total_wait_time_ms'] += wait_time_ms
+            if wait_time_ms > self._stats['max_wait_time_ms']:
+                self._stats['max_wait_time_ms'] = wait_time_ms
+        
+        logger.debug(f"Acquired connection {connection_id} for thread {thread_id}")
         
         try:
-            # Try to get an available connection
-            try:
-                connection_id = self._available_connections.get(timeout=timeout)
-            except queue.Empty:
-                # Try to create a new connection if under max limit
-                with self._pool_lock:
-                    if len(self._all_connections) < self.max_connections:
-                        conn_info = self._create_connection()
-                        if conn_info:
-                            connection_id = conn_info.connection_id
-                    
-                    if not connection_id:
-                        self._stats['connection_timeouts'] += 1
-                        raise TimeoutError(f"Could not acquire connection within {timeout} seconds")
-            
-            # Create a new connection for this request
-            conn = sqlite3.connect(
-                self.db_path,
-                timeout=self.connection_timeout,
-                check_same_thread=False,
-                isolation_level=None
-            )
-            conn.row_factory = sqlite3.Row
-            
-            # Update connection info
-            thread_id = threading.get_ident()
-            with self._pool_lock:
-                if connection_id in self._all_connections:
-                    conn_info = self._all_connections[connection_id]
-                    conn_info.last_used = datetime.now()
-                    conn_info.thread_id = thread_id
-                    conn_info.query_count += 1
-                
-                self._active_connections[thread_id] = connection_id
-            
-            logger.debug(f"Acquired connection {connection_id} for thread {thread_id}")
             yield conn
             
         except Exception as e:
             logger.error(f"Error with connection {connection_id}: {e}")
-            # Mark connection as unhealthy if it exists
-            if connection_id and connection_id in self._all_connections:
-                with self._pool_lock:
-                    self._all_connections[connection_id].is_healthy = False
+            # Errors from the caller's SQL don't break the connection itself;
+            # only discard it if it no longer answers a trivial query
+            if isinstance(e, sqlite3.Error):
+                self._check_connection_health(connection_id)
             raise
             
         finally:
-            # Close the connection
-            if conn:
-                try:
-                    conn.close()
-                    logger.debug(f"Closed connection {connection_id}")
-                except Exception as e:
-                    logger.error(f"Error closing connection {connection_id}: {e}")
-            
-            # Update tracking
-            thread_id = threading.get_ident()
             with self._pool_lock:
-                if thread_id in self._active_connections:
-                    del self._active_connections[thread_id]
+                thread_connections = self._active_connections.get(thread_id, [])
+                if connection_id in thread_connections:
+                    thread_connections.remove(connection_id)
+                if not thread_connections:
+                    self._active_connections.pop(thread_id, None)
+            
+            self._checkin(connection_id)
+            logger.debug(f"Released connection {connection_id}")
     
     def _destroy_connection(self, connection_id: str):
-        """Destroy a connection and remove it from tracking"""
+        """Close a connection and remove it from tracking"""
         with self._pool_lock:
+            conn = self._connections.pop(connection_id, None)
+            if conn is not None:
+                self._connection_ids.pop(id(conn), None)
+            
             if connection_id in self._all_connections:
                 del self._all_connections[connection_id]
                 self._stats['connections_destroyed'] += 1
                 logger.debug(f"Destroyed connection {connection_id}")
+        
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception as e:
+                logger.error(f"Error closing connection {connection_id}: {e}")
     
     def _cleanup_connection_transactions(self, connection_id: str):
         """Clean up any active transactions for a connection"""
@@ -313,7 +395,7 @@ class DatabaseConnectionPool:
         # Use provided connection or get one from pool
         if connection:
             conn = connection
-            connection_id = getattr(connection, '_connection_id', 'external')
+            connection_id = self.get_connection_id(connection) or 'external'
         else:
             # This would need to be implemented differently in practice
             # For now, we'll assume the connection is managed externally
@@ -461,9 +543,8 @@ class DatabaseConnectionPool:
     
     def _maintenance_worker(self):
         """Background thread for connection pool maintenance"""
-        while True:
+        while not self._shutdown_event.wait(60):  # Run maintenance every minute
             try:
-                time.sleep(60)  # Run maintenance every minute
                 self._perform_maintenance()
             except Exception as e:
                 logger.error(f"Error in maintenance worker: {e}")
@@ -473,34 +554,63 @@ class DatabaseConnectionPool:
         current_time = datetime.now()
         
         with self._pool_lock:
-            # Check for stale connections
-            stale_connections = []
+            # Check for long-running transactions (over 5 minutes)
             for conn_id, conn_info in self._all_connections.items():
-                # Mark connections as stale if unused for 10 minutes
-                if (current_time - conn_info.last_used).total_seconds() > 600:
-                    stale_connections.append(conn_id)
-                
-                # Check for long-running transactions (over 5 minutes)
                 if (conn_info.in_transaction and conn_info.transaction_start and
                     (current_time - conn_info.transaction_start).total_seconds() > 300):
                     logger.warning(f"Long-running transaction detected on connection {conn_id}")
+        
+        # Take idle connections out of the queue so they can be checked
+        # without racing a caller that wants to use them
+        idle_connections = []
+        while True:
+            try:
+                idle_connections.append(self._available_connections.get_nowait())
+            except queue.Empty:
+                break
+        
+        keep = []
+        for conn_id in idle_connections:
+            with self._pool_lock:
+                conn_info = self._all_connections.get(conn_id)
+                total = len(self._all_connections)
             
-            # Remove stale connections (but keep minimum)
-            connections_to_remove = min(
-                len(stale_connections),
-                len(self._all_connections) - self.min_connections
-            )
+            if conn_info is None:
+                continue
             
-            for conn_id in stale_connections[:connections_to_remove]:
+            # Drop connections unused for 10 minutes (but keep minimum)
+            is_stale = (current_time - conn_info.last_used).total_seconds() > 600
+            if is_stale and total > self.min_connections:
                 self._destroy_connection(conn_id)
                 logger.debug(f"Removed stale connection {conn_id}")
+                continue
+            
+            if not self._check_connection_health(conn_id):
+                self._destroy_connection(conn_id)
+                with self._pool_lock:
+                    self._stats['connections_recycled'] += 1
+                continue
+            
+            keep.append(conn_id)
+        
+        for conn_id in keep:
+            self._available_connections.put(conn_id)
+        
+        # Top the pool back up to the minimum size
+        with self._pool_lock:
+            missing = self.min_connections - len(self._all_connections)
+        for _ in range(max(0, missing)):
+            conn_info = self._create_connection()
+            if conn_info:
+                self._available_connections.put(conn_info.connection_id)
     
     def get_pool_stats(self) -> Dict[str, Any]:
         """Get connection pool statistics"""
         with self._pool_lock:
-            active_count = len(self._active_connections)
+            active_count = sum(len(ids) for ids in self._active_connections.values())
             available_count = self._available_connections.qsize()
             total_count = len(self._all_connections)
+            checkouts = self._stats['checkouts']
             
             return {
                 'total_connections': total_count,
@@ -509,6 +619,7 @@ class DatabaseConnectionPool:
                 'max_connections': self.max_connections,
                 'min_connections': self.min_connections,
                 'pool_utilization': active_count / self.max_connections if self.max_connections > 0 else 0,
+                'average_wait_time_ms': self._stats['total_wait_time_ms'] / checkouts if checkouts else 0.0,
                 **self._stats
             }
     
@@ -526,8 +637,9 @@ class DatabaseConnectionPool:
                 'deadlocks_detected': self._stats['deadlocks_detected'],
                 'success_rate': (
                     self._stats['transactions_committed'] / 
-                    max(1, self._stats['transactions_started'])
-                ) * 100
+                    self._stats['transactions_started'] * 100
+                    if self._stats['transactions_started'] else 100.0
+                )
             }
     
     def health_check(self) -> Dict[str, Any]:
@@ -576,54 +688,65 @@ class DatabaseConnectionPool:
     def close(self):
         """Close all connections and shut down the pool"""
         logger.info("Shutting down connection pool...")
+        self._shutdown_event.set()
         
         with self._pool_lock:
-            # Close all connections
-            for conn_id in list(self._all_connections.keys()):
-                self._destroy_connection(conn_id)
-            
             # Clear the available queue
             while not self._available_connections.empty():
                 try:
                     self._available_connections.get_nowait()
                 except queue.Empty:
                     break
+            
+            # Close all connections
+            for conn_id in list(self._all_connections.keys()):
+                self._destroy_connection(conn_id)
         
         logger.info("Connection pool shut down complete")
 
-# Global connection pool instance
-_connection_pool: Optional[DatabaseConnectionPool] = None
+# Global connection pool instances, one per database file. Pools hold live
+# connections, so a pool must never be shared between different databases.
+_connection_pools: Dict[str, DatabaseConnectionPool] = {}
+_default_pool_path: Optional[str] = None
 _pool_lock = threading.Lock()
 
 def get_connection_pool(db_path: str = None, **kwargs) -> DatabaseConnectionPool:
     """
-    Get the global connection pool instance (singleton pattern)
+    Get the global connection pool instance for a database (singleton per path)
     
     Args:
-        db_path: Database path (required for first call)
+        db_path: Database path (required for first call; defaults to the
+                 first pool created when omitted)
         **kwargs: Additional connection pool configuration
         
     Returns:
         DatabaseConnectionPool: The global connection pool instance
     """
-    global _connection_pool
+    global _default_pool_path
     
     with _pool_lock:
-        if _connection_pool is None:
-            if not db_path:
+        if not db_path:
+            if _default_pool_path is None:
                 raise ValueError("db_path is required for first connection pool initialization")
-            _connection_pool = DatabaseConnectionPool(db_path, **kwargs)
+            return _connection_pools[_default_pool_path]
+        
+        pool_key = os.path.abspath(db_path)
+        if pool_key not in _connection_pools:
+            _connection_pools[pool_key] = DatabaseConnectionPool(db_path, **kwargs)
+            if _default_pool_path is None:
+                _default_pool_path = pool_key
         
-        return _connection_pool
+        return _connection_pools[pool_key]
 
 def close_connection_pool():
-    """Close the global connection pool"""
-    global _connection_pool
+    """Close all global connection pools"""
+    global _default_pool_path
     
     with _pool_lock:
-        if _connection_pool:
-            _connection_pool.close()
-            _connection_pool = None
+        for pool in _connection_pools.values():
+            pool.close()
+        _connection_pools.clear()
+        _default_pool_path = None
 
 # Context managers for easy use
 @contextlib.contextmanager
@@ -27,6 +27,7 @@ from contextlib import contextmanager
 
 from database_config import get_database_config, DatabaseConfig
 from database_logger import database_logger, log_database_event
+from lead_stats import read_lead_stats
 
 
 @dataclass
@@ -391,8 +392,7 @@ class DatabaseHealthMonitor:
                     )
                 
                 # Count total records
-                cursor.execute("SELECT COUNT(*) FROM leads")
-                total_records = cursor.fetchone()[0]
+                total_records = read_lead_stats(conn)['total_leads']
                 
                 details = {"total_records": total_records}
                 
@@ -421,11 +421,13 @@ class DatabaseHealthMonitor:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Test basic SELECT performance
+                # Test basic SELECT performance with an indexed lookup
+                # (a full COUNT(*) scan here would make every poll O(n))
                 query_start = time.time()
-                cursor.execute("SELECT COUNT(*) FROM leads")
-                count_result = cursor.fetchone()[0]
+                cursor.execute("SELECT id FROM leads ORDER BY rowid DESC LIMIT 1")
+                cursor.fetchone()
                 count_time = (time.time() - query_start) * 1000
+                count_result = read_lead_stats(conn)['total_leads']
                 
                 details = {
                     "count_query_ms": count_time,
@@ -469,11 +471,8 @@ class DatabaseHealthMonitor:
             file_size_mb = file_size / (1024 * 1024)
             
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
                 # Get record count
-                cursor.execute("SELECT COUNT(*) FROM leads")
-                record_count = cursor.fetchone()[0]
+                record_count = read_lead_stats(conn)['total_leads']
                 
                 details = {
                     "file_size_mb": file_size_mb,
@@ -5,23 +5,292 @@ Database Logger for Lead Database Integration
 This module provides comprehensive logging for all database operations,
 sync activities, and migration processes. Follows the production logging
 pattern established in the 4Runr system.
+
+Log records are appended as newline-delimited JSON to rotating segment
+files by a background writer, so logging a call costs an in-memory
+enqueue instead of creating a file per record. Operation timings from
+monitor_performance go to the in-memory metrics registry and are only
+written out as snapshots.
 """
 
 import json
 import os
+import gzip
+import functools
+import queue
+import shutil
+import atexit
 import logging
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Iterator
 import uuid
 import traceback
+import weakref
+
+from metrics_registry import MetricsRegistry, get_metrics_registry
+
+
+class SegmentedLogWriter:
+    """
+    Buffered NDJSON log sink with size/time-based segment rotation.
+    
+    Records are queued in memory and appended by a background thread to
+    ``{prefix}_{YYYYMMDD_HHMMSS}_{session}_{seq}.ndjson`` segments. A segment
+    is rotated when it exceeds ``max_segment_bytes``, gets older than
+    ``max_segment_age_seconds`` or the day changes, and is optionally
+    gzipped after rotation.
+    """
+    
+    SEGMENT_SUFFIX = ".ndjson"
+    
+    def __init__(self, directory: Union[str, Path], prefix: str, session_id: str,
+                 max_segment_bytes: int = 16 * 1024 * 1024,
+                 max_segment_age_seconds: int = 3600,
+                 compress_on_rotate: bool = False,
+                 max_queue_size: int = 10000,
+                 flush_interval: float = 1.0):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self.session_id = session_id
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_age_seconds = max_segment_age_seconds
+        self.compress_on_rotate = compress_on_rotate
+        self.flush_interval = flush_interval
+        
+        self._queue: "queue.Queue[Optional[Dict]]" = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._sequence = 0
+        self._segment_path: Optional[Path] = None
+        self._segment_file = None
+        self._segment_opened_at: Optional[datetime] = None
+        self._segment_bytes = 0
+        self._closed = False
+        
+        self.stats = {
+            'records_written': 0,
+            'records_dropped': 0,
+            'segments_rotated': 0
+        }
+        
+        self._open_segment()
+        self._thread = threading.Thread(
+            target=self._writer_loop, daemon=True, name=f"SegmentedLogWriter-{prefix}"
+        )
+        self._thread.start()
+    
+    @property
+    def current_segment(self) -> Path:
+        """Path of the segment currently receiving records"""
+        with self._lock:
+            return self._segment_path
+    
+    def write(self, record: Dict) -> str:
+        """Queue a record for writing and return the active segment path"""
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            # Never block callers on a stalled disk
+            with self._stats_lock:
+                self.stats['records_dropped'] += 1
+        return str(self.current_segment)
+    
+    def flush(self, timeout: float = 10.0) -> None:
+        """Block until every queued record has been written to disk"""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.005)
+    
+    def close(self) -> None:
+        """Flush pending records and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout=10)
+        with self._lock:
+            self._close_segment(compress=False)
+    
+    def _writer_loop(self):
+        """Drain the queue into the active segment"""
+        while True:
+            try:
+                record = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                with self._lock:
+                    self._rotate_if_needed()
+                continue
+            
+            batch = [record]
+            # Coalesce whatever else is already queued into one write
+            while len(batch) < 1000:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self._write_batch([r for r in batch if r is not None])
+            except Exception as e:
+                logging.getLogger('database_logger').error(f"Log writer failed: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            
+            if any(r is None for r in batch):
+                return
+    
+    def _write_batch(self, records: List[Dict]):
+        """Append serialized records to the active segment, rotating as it fills"""
+        if not records:
+            return
+        
+        with self._lock:
+            self._rotate_if_needed()
+            buffer = []
+            buffered_bytes = 0
+            for record in records:
+                line = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode('utf-8')
+                buffer.append(line)
+                buffered_bytes += len(line)
+                if self._segment_bytes + buffered_bytes >= self.max_segment_bytes:
+                    self._append(buffer, buffered_bytes)
+                    buffer, buffered_bytes = [], 0
+                    self._rotate_if_needed()
+            self._append(buffer, buffered_bytes)
+            with self._stats_lock:
+                self.stats['records_written'] += len(records)
+    
+    def _append(self, lines: List[bytes], size: int):
+        """Write encoded lines to the active segment (lock held)"""
+        if not lines:
+            return
+        self._segment_file.write(b"".join(lines))
+        self._segment_file.flush()
+        self._segment_bytes += size
+    
+    def _open_segment(self):
+        """Open a new segment file"""
+        self._sequence += 1
+        opened_at = datetime.now()
+        name = (f"{self.prefix}_{opened_at.strftime('%Y%m%d_%H%M%S')}_"
+                f"{self.session_id}_{self._sequence:04d}{self.SEGMENT_SUFFIX}")
+        self._segment_path = self.directory / name
+        self._segment_file = open(self._segment_path, 'ab')
+        self._segment_opened_at = opened_at
+        self._segment_bytes = self._segment_path.stat().st_size
+    
+    def _close_segment(self, compress: bool):
+        """Close the active segment, gzipping it if requested"""
+        if self._segment_file is None:
+            return
+        
+        self._segment_file.close()
+        self._segment_file = None
+        
+        if compress and self._segment_bytes > 0:
+            gz_path = self._segment_path.with_name(self._segment_path.name + ".gz")
+            with open(self._segment_path, 'rb') as src, gzip.open(gz_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            self._segment_path.unlink()
+        elif self._segment_bytes == 0:
+            self._segment_path.unlink()
+    
+    def _rotate_if_needed(self):
+        """Rotate the active segment on size, age or date change (lock held)"""
+        if self._segment_file is None:
+            return
+        
+        now = datetime.now()
+        age = (now - self._segment_opened_at).total_seconds()
+        if (self._segment_bytes >= self.max_segment_bytes or
+                (self._segment_bytes > 0 and age >= self.max_segment_age_seconds) or
+                now.date() != self._segment_opened_at.date()):
+            self._close_segment(compress=self.compress_on_rotate)
+            self._open_segment()
+            with self._stats_lock:
+                self.stats['segments_rotated'] += 1
+    
+    @classmethod
+    def iter_records(cls, directory: Union[str, Path], date: str = None) -> Iterator[Dict]:
+        """
+        Stream records from the segments in a directory
+        
+        Args:
+            directory: Directory containing segment files
+            date: Only read segments written on this day (YYYY-MM-DD)
+            
+        Yields:
+            Decoded log records in segment order
+        """
+        directory = Path(directory)
+        if not directory.exists():
+            return
+        
+        pattern = f"*_{date.replace('-', '')}_*" if date else "*"
+        segments = sorted(
+            list(directory.glob(f"{pattern}{cls.SEGMENT_SUFFIX}")) +
+            list(directory.glob(f"{pattern}{cls.SEGMENT_SUFFIX}.gz")),
+            key=lambda path: path.name
+        )
+        
+        for segment in segments:
+            opener = gzip.open if segment.suffix == '.gz' else open
+            try:
+                with opener(segment, 'rt', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            yield json.loads(line)
+                        except json.JSONDecodeError:
+                            # Tolerate a torn final line from a crash
+                            continue
+            except OSError:
+                continue
+
+def _close_at_exit(logger_ref: "weakref.ReferenceType[DatabaseLogger]") -> None:
+    """Close a logger at interpreter exit if it is still alive"""
+    logger = logger_ref()
+    if logger is not None:
+        logger.close()
+
 
 class DatabaseLogger:
     """Production-grade logger for lead database operations"""
     
-    def __init__(self, log_directory: str = "database_logs"):
+    LOG_TYPE_DIRECTORIES = {
+        "database_operation": ("database_operations", "db_op"),
+        "sync_operation": ("sync_operations", "sync"),
+        "migration_operation": ("migration_operations", "migration"),
+        "performance_metrics": ("performance_metrics", "perf"),
+        "error_log": ("error_logs", "error"),
+        "monitoring_data": ("monitoring_data", "monitor")
+    }
+    
+    METRICS_FILENAME = "metrics_rolling.ndjson"
+    
+    def __init__(self, log_directory: str = "database_logs",
+                 max_segment_bytes: int = 16 * 1024 * 1024,
+                 max_segment_age_seconds: int = 3600,
+                 compress_segments: bool = False,
+                 metrics: MetricsRegistry = None,
+                 metrics_flush_interval: Optional[float] = None):
         self.log_directory = Path(log_directory)
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_age_seconds = max_segment_age_seconds
+        self.compress_segments = compress_segments
+        self._writers: Dict[str, SegmentedLogWriter] = {}
+        self._writers_lock = threading.Lock()
+        self.metrics = metrics or get_metrics_registry()
+        self._flushes_metrics = metrics_flush_interval is not None
+        # A weak reference lets discarded loggers be garbage collected
+        atexit.register(_close_at_exit, weakref.ref(self))
         self.log_directory.mkdir(exist_ok=True)
         
         # Create subdirectories for different log types
@@ -34,6 +303,12 @@ class DatabaseLogger:
         
         self.session_id = str(uuid.uuid4())[:8]
         
+        if self._flushes_metrics:
+            self.metrics.start_periodic_flush(
+                self.log_directory / "performance_metrics" / self.METRICS_FILENAME,
+                metrics_flush_interval
+            )
+        
         # Set up Python logging for console output
         self.logger = logging.getLogger('database_logger')
         self.logger.setLevel(logging.INFO)
@@ -46,6 +321,91 @@ class DatabaseLogger:
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
     
+    def _get_writer(self, log_type: str) -> SegmentedLogWriter:
+        """Get (or lazily create) the segment writer for a log type"""
+        subdirectory, prefix = self.LOG_TYPE_DIRECTORIES[log_type]
+        directory = self.log_directory / subdirectory
+        key = str(directory)
+        
+        writer = self._writers.get(key)
+        if writer is None:
+            with self._writers_lock:
+                writer = self._writers.get(key)
+                if writer is None:
+                    writer = SegmentedLogWriter(
+                        directory, prefix, self.session_id,
+                        max_segment_bytes=self.max_segment_bytes,
+                        max_segment_age_seconds=self.max_segment_age_seconds,
+                        compress_on_rotate=self.compress_segments
+                    )
+                    self._writers[key] = writer
+        return writer
+    
+    def _write_entry(self, log_entry: Dict) -> str:
+        """Queue a log entry on its segment writer and return the segment path"""
+        return self._get_writer(log_entry["log_type"]).write(log_entry)
+    
+    def flush(self, timeout: float = 10.0) -> None:
+        """Wait until all queued log records have been written"""
+        for writer in list(self._writers.values()):
+            writer.flush(timeout)
+    
+    def close(self) -> None:
+        """Flush and close all segment writers"""
+        with self._writers_lock:
+            writers = list(self._writers.values())
+            self._writers.clear()
+        for writer in writers:
+            writer.close()
+        
+        if self._flushes_metrics:
+            self.metrics.stop_periodic_flush()
+    
+    def get_metrics_snapshot(self) -> Dict:
+        """Current counters and per-operation latency percentiles"""
+        return self.metrics.snapshot()
+    
+    def log_metrics_snapshot(self) -> List[str]:
+        """
+        Write one performance_metrics record per operation from the registry
+        
+        Returns:
+            Segment paths the records were queued to
+        """
+        paths = []
+        for operation_name, stats in self.metrics.snapshot()["operations"].items():
+            paths.append(self.log_performance_metrics(operation_name, {
+                "total_duration_ms": stats["mean_ms"]
+            }, latency_summary=stats))
+        return paths
+    
+    def read_records(self, log_type: str, date: str = None) -> Iterator[Dict]:
+        """
+        Stream log records of one type, optionally limited to one day
+        
+        Args:
+            log_type: database_operation, sync_operation, migration_operation,
+                      performance_metrics, error_log or monitoring_data
+            date: Day to read (YYYY-MM-DD), all days if None
+            
+        Yields:
+            Log records, including legacy one-file-per-record JSON logs
+        """
+        subdirectory, prefix = self.LOG_TYPE_DIRECTORIES[log_type]
+        directory = self.log_directory / subdirectory
+        
+        yield from SegmentedLogWriter.iter_records(directory, date)
+        
+        # Older releases wrote one pretty-printed JSON file per record
+        if directory.exists():
+            pattern = f"{prefix}_*{date.replace('-', '')}*.json" if date else f"{prefix}_*.json"
+            for log_file in sorted(directory.glob(pattern)):
+                try:
+                    with open(log_file, 'r', encoding='utf-8') as f:
+                        yield json.load(f)
+                except Exception:
+                    continue
+    
     def log_database_operation(self, operation_type: str, lead_data: Dict, 
                              operation_result: Dict, performance_metrics: Dict = None) -> str:
         """Log database CRUD operations with performance metrics"""
@@ -93,14 +453,8 @@ class DatabaseLogger:
         self.logger.info(f"Database {operation_type}: {operation_result.get('success', False)} "
                         f"({performance_metrics.get('execution_time_ms', 0)}ms)")
         
-        # Save to file
-        filename = f"db_op_{operation_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{self.session_id}.json"
-        filepath = self.log_directory / "database_operations" / filename
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(log_entry, f, indent=2, ensure_ascii=False)
-            
-        return str(filepath)
+        # Queue for the background segment writer
+        return self._write_entry(log_entry)
     
     def log_sync_operation(self, sync_type: str, sync_details: Dict, 
                           sync_results: Dict, leads_processed: List[Dict]) -> str:
@@ -156,14 +510,8 @@ class DatabaseLogger:
         self.logger.info(f"Sync {sync_type}: {sync_results.get('leads_synced', 0)}/{len(leads_processed)} "
                         f"leads ({success_rate:.1f}% success)")
         
-        # Save to file
-        filename = f"sync_{sync_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{self.session_id}.json"
-        filepath = self.log_directory / "sync_operations" / filename
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(log_entry, f, indent=2, ensure_ascii=False)
-            
-        return str(filepath)
+        # Queue for the background segment writer
+        return self._write_entry(log_entry)
     
     def log_migration_operation(self, migration_type: str, migration_details: Dict, 
                                migration_results: Dict, data_summary: Dict) -> str:
@@ -209,14 +557,8 @@ class DatabaseLogger:
         self.logger.info(f"Migration {migration_type}: {migration_results.get('records_migrated', 0)}/{migration_results.get('total_records', 0)} "
                         f"records ({success_rate:.1f}% success)")
         
-        # Save to file
-        filename = f"migration_{migration_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{self.session_id}.json"
-        filepath = self.log_directory / "migration_operations" / filename
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(log_entry, f, indent=2, ensure_ascii=False)
-            
-        return str(filepath) 
+        # Queue for the background segment writer
+        return self._write_entry(log_entry) 
    
     def log_error(self, error_type: str, error_details: Dict, context: Dict = None) -> str:
         """Log errors with full context and stack traces"""
@@ -268,17 +610,11 @@ class DatabaseLogger:
         else:
             self.logger.info(log_message)
         
-        # Save to file
-        filename = f"error_{error_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{self.session_id}.json"
-        filepath = self.log_directory / "error_logs" / filename
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(log_entry, f, indent=2, ensure_ascii=False)
-            
-        return str(filepath)
+        # Queue for the background segment writer
+        return self._write_entry(log_entry)
     
     def log_performance_metrics(self, operation_name: str, metrics: Dict, 
-                               system_info: Dict = None) -> str:
+                               system_info: Dict = None, latency_summary: Dict = None) -> str:
         """Log detailed performance metrics for optimization"""
         system_info = system_info or {}
         
@@ -317,18 +653,15 @@ class DatabaseLogger:
             }
         }
         
+        if latency_summary:
+            log_entry["latency_summary"] = latency_summary
+        
         # Log to console
         self.logger.info(f"Performance {operation_name}: {metrics.get('total_duration_ms', 0)}ms "
                         f"(CPU: {metrics.get('cpu_usage', 0)}%, Memory: {metrics.get('memory_usage_mb', 0)}MB)")
         
-        # Save to file
-        filename = f"perf_{operation_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{self.session_id}.json"
-        filepath = self.log_directory / "performance_metrics" / filename
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(log_entry, f, indent=2, ensure_ascii=False)
-            
-        return str(filepath)
+        # Queue for the background segment writer
+        return self._write_entry(log_entry)
     
     def log_monitoring_data(self, monitoring_type: str, data: Dict, 
                            alerts: List[Dict] = None) -> str:
@@ -379,14 +712,8 @@ class DatabaseLogger:
             else:
                 self.logger.info(f"ALERT: {message}")
         
-        # Save to file
-        filename = f"monitor_{monitoring_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{self.session_id}.json"
-        filepath = self.log_directory / "monitoring_data" / filename
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(log_entry, f, indent=2, ensure_ascii=False)
-            
-        return str(filepath)
+        # Queue for the background segment writer
+        return self._write_entry(log_entry)
     
     def create_daily_summary(self, date: str = None) -> str:
         """Create a daily summary report from all log data"""
@@ -425,35 +752,32 @@ class DatabaseLogger:
             }
         }
         
-        # Analyze log files from the specified date
-        date_prefix = date.replace('-', '')
+        # Make sure queued records from this process are on disk
+        self.flush()
         
         # Process database operations
-        db_ops_dir = self.log_directory / "database_operations"
-        if db_ops_dir.exists():
-            for log_file in db_ops_dir.glob(f"*{date_prefix}*.json"):
-                try:
-                    with open(log_file, 'r', encoding='utf-8') as f:
-                        log_data = json.load(f)
-                        summary_data["operation_summary"]["total_database_operations"] += 1
-                        if log_data.get("operation_details", {}).get("success", False):
-                            summary_data["operation_summary"]["successful_operations"] += 1
-                        else:
-                            summary_data["operation_summary"]["failed_operations"] += 1
-                except Exception:
-                    continue
+        for log_data in self.read_records("database_operation", date):
+            summary_data["operation_summary"]["total_database_operations"] += 1
+            if log_data.get("operation_details", {}).get("success", False):
+                summary_data["operation_summary"]["successful_operations"] += 1
+            else:
+                summary_data["operation_summary"]["failed_operations"] += 1
         
         # Process sync operations
-        sync_ops_dir = self.log_directory / "sync_operations"
-        if sync_ops_dir.exists():
-            for log_file in sync_ops_dir.glob(f"*{date_prefix}*.json"):
-                try:
-                    with open(log_file, 'r', encoding='utf-8') as f:
-                        log_data = json.load(f)
-                        summary_data["sync_summary"]["total_sync_operations"] += 1
-                        summary_data["sync_summary"]["leads_synced"] += log_data.get("sync_results", {}).get("leads_synced", 0)
-                except Exception:
-                    continue
+        for log_data in self.read_records("sync_operation", date):
+            summary_data["sync_summary"]["total_sync_operations"] += 1
+            summary_data["sync_summary"]["leads_synced"] += log_data.get("sync_results", {}).get("leads_synced", 0)
+        
+        # Latency percentiles observed by this process
+        operation_latency = self.metrics.snapshot()["operations"]
+        if operation_latency:
+            summary_data["performance_summary"]["slowest_operation_ms"] = max(
+                stats["max_ms"] for stats in operation_latency.values()
+            )
+            summary_data["performance_summary"]["operation_latency"] = {
+                name: {key: stats[key] for key in ("count", "errors", "p50_ms", "p95_ms", "p99_ms")}
+                for name, stats in operation_latency.items()
+            }
         
         # Calculate success rates
         total_ops = summary_data["operation_summary"]["total_database_operations"]
@@ -612,7 +936,7 @@ class DatabaseLogger:
 
 
 # Global database logger instance
-database_logger = DatabaseLogger()
+database_logger = DatabaseLogger(metrics_flush_interval=60.0)
 
 
 def log_database_event(event_type: str, operation_data: Dict, results: Dict, 
@@ -658,33 +982,28 @@ def log_database_event(event_type: str, operation_data: Dict, results: Dict,
 
 # Performance monitoring decorator
 def monitor_performance(operation_name: str):
-    """Decorator to automatically monitor performance of database operations"""
+    """
+    Decorator to automatically monitor performance of database operations
+    
+    Durations are recorded in the in-memory metrics registry; only failures
+    are written to the error log.
+    """
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
-            start_timestamp = datetime.now().isoformat()
+            start_time = time.perf_counter()
             
             try:
                 result = func(*args, **kwargs)
                 
-                end_time = time.time()
-                execution_time_ms = (end_time - start_time) * 1000
-                
-                # Log performance metrics
-                metrics = {
-                    "start_time": start_timestamp,
-                    "end_time": datetime.now().isoformat(),
-                    "total_duration_ms": execution_time_ms,
-                    "success": True
-                }
-                
-                database_logger.log_performance_metrics(operation_name, metrics)
+                execution_time_ms = (time.perf_counter() - start_time) * 1000
+                database_logger.metrics.observe(operation_name, execution_time_ms)
                 
                 return result
                 
             except Exception as e:
-                end_time = time.time()
-                execution_time_ms = (end_time - start_time) * 1000
+                execution_time_ms = (time.perf_counter() - start_time) * 1000
+                database_logger.metrics.observe(operation_name, execution_time_ms, success=False)
                 
                 # Log error with performance context
                 error_details = {
@@ -703,4 +1022,4 @@ def monitor_performance(operation_name: str):
                 raise
         
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
@@ -353,9 +353,11 @@ enricher_data_cleaner = EnricherDataCleanerIntegration()
                 }
             ]
             
-            for i, test_case in enumerate(test_cases, 1):
-                result = data_cleaner.clean_and_validate(test_case['data'], test_case['context'])
-                
+            results = data_cleaner.clean_and_validate_many(
+                (test_case['data'], test_case['context']) for test_case in test_cases
+            )
+            
+            for i, (test_case, result) in enumerate(zip(test_cases, results), 1):
                 if result is not None:
                     print(f"   ✅ Test case {i}: Processing successful")
                     
@@ -365,26 +365,18 @@ class EngagementLevelTracker:
             True if field exists and is accessible, False otherwise
         """
         try:
-            # Try to get a single record to check field availability
-            records = self.airtable_client.table.all(max_records=1)
+            # Field names come from the shared schema cache, not a sample record
+            available_fields = self.airtable_client.get_available_field_names()
             
-            for record in records:
-                fields = record.get('fields', {})
-                if self.level_engaged_field in fields:
-                    self.logger.log_module_activity('engager', 'system', 'success', {
-                        'message': f'Level Engaged field validated successfully'
-                    })
-                    return True
-                else:
-                    self.logger.log_module_activity('engager', 'system', 'warning', {
-                        'message': f'Level Engaged field not found in Airtable',
-                        'available_fields': list(fields.keys())
-                    })
-                    return False
+            if self.level_engaged_field in available_fields:
+                self.logger.log_module_activity('engager', 'system', 'success', {
+                    'message': f'Level Engaged field validated successfully'
+                })
+                return True
             
-            # No records found, can't validate
             self.logger.log_module_activity('engager', 'system', 'warning', {
-                'message': 'No records found to validate Level Engaged field'
+                'message': f'Level Engaged field not found in Airtable',
+                'available_fields': available_fields
             })
             return False
             
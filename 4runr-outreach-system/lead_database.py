@@ -10,15 +10,17 @@ This module provides a comprehensive API for managing lead data with features in
 """
 
 import os
+import re
 import sqlite3
 import json
 import uuid
+import hashlib
 import datetime
 import threading
 import time
 import traceback
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Iterable, Iterator, Tuple
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 
@@ -26,6 +28,91 @@ from engager.local_database_manager import LocalDatabaseManager
 from database_logger import database_logger, monitor_performance, log_database_event
 from database_connection_pool import get_connection_pool, database_connection, database_transaction
 from concurrent_access_manager import get_concurrent_access_manager, thread_safe_operation, OperationPriority
+from lead_stats import ensure_lead_stats, read_lead_stats
+
+
+# Normalized dedupe key columns, in duplicate-matching priority order
+DEDUPE_KEY_COLUMNS = ('linkedin_key', 'email_key', 'name_company_key')
+
+# Columns written when a lead is inserted
+LEAD_INSERT_COLUMNS = (
+    'id', 'uuid', 'name', 'full_name', 'email', 'company', 'company_website',
+    'linkedin_url', 'title', 'location', 'industry', 'company_size',
+    'verified', 'enriched', 'needs_enrichment', 'status', 'source',
+    'scraped_at', 'enriched_at', 'airtable_id', 'airtable_synced',
+    'sync_pending', 'raw_data', 'created_at', 'updated_at',
+    'linkedin_key', 'email_key', 'name_company_key'
+)
+
+_LINKEDIN_SLUG_PATTERN = re.compile(r'linkedin\.com/(in|pub|company)/([^/?#]+)', re.IGNORECASE)
+
+
+def normalize_linkedin_slug(linkedin_url: Optional[str]) -> Optional[str]:
+    """
+    Reduce a LinkedIn profile URL to its canonical slug (e.g. 'in/jane-doe').
+    
+    Args:
+        linkedin_url: LinkedIn URL in any common form
+        
+    Returns:
+        Lowercase slug, or None if the URL is empty
+    """
+    if not linkedin_url or not str(linkedin_url).strip():
+        return None
+    
+    url = str(linkedin_url).strip()
+    match = _LINKEDIN_SLUG_PATTERN.search(url)
+    if match:
+        return f"{match.group(1)}/{match.group(2)}".lower()
+    
+    # Not a recognizable profile URL; fall back to the URL without scheme/host noise
+    url = re.sub(r'^https?://(www\.)?', '', url, flags=re.IGNORECASE)
+    return url.split('?', 1)[0].split('#', 1)[0].rstrip('/').lower() or None
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    """Lowercase and trim an email address for duplicate matching."""
+    if not email or not str(email).strip():
+        return None
+    return str(email).strip().lower()
+
+
+def name_company_key(name: Optional[str], company: Optional[str]) -> Optional[str]:
+    """
+    Build a hash of the normalized name and company.
+    
+    Returns:
+        Hex digest, or None unless both name and company are present
+    """
+    if not name or not company:
+        return None
+    
+    normalized_name = ' '.join(str(name).lower().split())
+    normalized_company = ' '.join(str(company).lower().split())
+    if not normalized_name or not normalized_company:
+        return None
+    
+    return hashlib.sha1(f"{normalized_name}|{normalized_company}".encode('utf-8')).hexdigest()
+
+
+def compute_dedupe_keys(lead_data: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """
+    Compute the normalized dedupe keys for a lead.
+    
+    Args:
+        lead_data: Lead data dictionary
+        
+    Returns:
+        Dictionary keyed by DEDUPE_KEY_COLUMNS
+    """
+    return {
+        'linkedin_key': normalize_linkedin_slug(lead_data.get('linkedin_url')),
+        'email_key': normalize_email(lead_data.get('email')),
+        'name_company_key': name_company_key(
+            lead_data.get('full_name') or lead_data.get('name'),
+            lead_data.get('company')
+        )
+    }
 
 
 @dataclass
@@ -54,6 +141,44 @@ class Lead:
     airtable_synced: bool = False
 
 
+class LeadRow(dict):
+    """
+    Lead row yielded by LeadDatabase.search_leads_iter.
+    
+    raw_data stays as JSON text until it is read through row['raw_data'] or
+    row.get('raw_data'); dict(row) and row.items() return the undecoded text.
+    """
+    
+    __slots__ = ('_raw_data_decoded',)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._raw_data_decoded = 'raw_data' not in self
+    
+    def _decode_raw_data(self) -> None:
+        if self._raw_data_decoded:
+            return
+        self._raw_data_decoded = True
+        
+        value = dict.get(self, 'raw_data')
+        if value:
+            try:
+                value = json.loads(value)
+            except (json.JSONDecodeError, TypeError):
+                value = None
+        dict.__setitem__(self, 'raw_data', value)
+    
+    def __getitem__(self, key):
+        if key == 'raw_data':
+            self._decode_raw_data()
+        return super().__getitem__(key)
+    
+    def get(self, key, default=None):
+        if key == 'raw_data':
+            self._decode_raw_data()
+        return super().get(key, default)
+
+
 class LeadDatabase:
     """
     Core Lead Database API providing comprehensive lead management functionality.
@@ -77,6 +202,9 @@ class LeadDatabase:
         # Thread safety
         self._lock = threading.RLock()
         
+        # Column names of the leads table, loaded lazily
+        self._lead_columns: Optional[set] = None
+        
         # Ensure extended schema
         self._ensure_extended_schema()
     
@@ -124,7 +252,11 @@ class LeadDatabase:
                     'sync_pending': 'BOOLEAN DEFAULT TRUE',
                     'last_sync_attempt': 'TEXT',
                     'sync_error': 'TEXT',
-                    'raw_data': 'TEXT'
+                    'airtable_push_hashes': 'TEXT',
+                    'raw_data': 'TEXT',
+                    'linkedin_key': 'TEXT',
+                    'email_key': 'TEXT',
+                    'name_company_key': 'TEXT'
                 }
                 
                 # Add missing columns
@@ -136,12 +268,120 @@ class LeadDatabase:
                             if "duplicate column name" not in str(e).lower():
                                 raise
                 
+                # Covering indexes so duplicate lookups never touch the table rows.
+                # Not UNIQUE: existing databases may already contain duplicates.
+                for key_column in DEDUPE_KEY_COLUMNS:
+                    cursor.execute(f"""
+                        CREATE INDEX IF NOT EXISTS idx_leads_{key_column}
+                        ON leads({key_column}, id)
+                    """)
+                
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_leads_uuid ON leads(uuid)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_leads_created_at ON leads(created_at)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_leads_airtable_id ON leads(airtable_id)")
+                
+                # Per-source high-water marks for incremental pulls
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS sync_watermarks (
+                        name TEXT PRIMARY KEY,
+                        high_water_mark TEXT NOT NULL,
+                        updated_at TEXT NOT NULL
+                    )
+                """)
+                
+                self._backfill_dedupe_keys(conn)
+                
+                # Trigger-maintained counters for get_database_stats and dashboards
+                ensure_lead_stats(conn)
+                
                 conn.commit()
                 
         except Exception as e:
             # Error will be logged by calling functions if needed
             raise
     
+    def _backfill_dedupe_keys(self, conn: sqlite3.Connection) -> int:
+        """
+        Compute dedupe keys for rows written before the key columns existed
+        or by writers that do not maintain them.
+        
+        Args:
+            conn: Open database connection
+            
+        Returns:
+            Number of rows updated
+        """
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT rowid, linkedin_url, email, full_name, name, company FROM leads
+            WHERE (linkedin_key IS NULL AND linkedin_url IS NOT NULL AND linkedin_url != '')
+               OR (email_key IS NULL AND email IS NOT NULL AND email != '')
+               OR (name_company_key IS NULL AND company IS NOT NULL AND company != ''
+                   AND COALESCE(full_name, name, '') != '')
+        """)
+        rows = cursor.fetchall()
+        if not rows:
+            return 0
+        
+        updates = []
+        for row in rows:
+            keys = compute_dedupe_keys(dict(row))
+            updates.append((keys['linkedin_key'], keys['email_key'], keys['name_company_key'], row['rowid']))
+        
+        cursor.executemany("""
+            UPDATE leads SET linkedin_key = ?, email_key = ?, name_company_key = ?
+            WHERE rowid = ?
+        """, updates)
+        return len(updates)
+    
+    def _build_insert_values(self, lead_data: Dict[str, Any], lead_id: str, lead_uuid: str,
+                             timestamp: str) -> tuple:
+        """
+        Build the INSERT parameter tuple for a lead, ordered as LEAD_INSERT_COLUMNS.
+        
+        Args:
+            lead_data: Lead data dictionary
+            lead_id: Lead ID to store
+            lead_uuid: Lead UUID to store
+            timestamp: ISO timestamp for created_at/updated_at
+            
+        Returns:
+            Tuple of column values
+        """
+        full_name = lead_data.get('full_name') or lead_data.get('name', '')
+        keys = compute_dedupe_keys(lead_data)
+        
+        return (
+            lead_id,
+            lead_uuid,
+            full_name,  # For backward compatibility
+            full_name,
+            lead_data.get('email'),
+            lead_data.get('company'),
+            lead_data.get('company_website') or lead_data.get('website'),
+            lead_data.get('linkedin_url'),
+            lead_data.get('title'),
+            lead_data.get('location'),
+            lead_data.get('industry'),
+            lead_data.get('company_size'),
+            lead_data.get('verified', False),
+            lead_data.get('enriched', False),
+            lead_data.get('needs_enrichment', True),
+            lead_data.get('status', 'new'),
+            lead_data.get('source'),
+            self._parse_datetime(lead_data.get('scraped_at')),
+            self._parse_datetime(lead_data.get('enriched_at')),
+            lead_data.get('airtable_id'),
+            lead_data.get('airtable_synced', False),
+            lead_data.get('sync_pending', True),
+            json.dumps(lead_data.get('raw_data')) if lead_data.get('raw_data') else None,
+            timestamp,
+            timestamp,
+            keys['linkedin_key'],
+            keys['email_key'],
+            keys['name_company_key']
+        )
+    
     @monitor_performance("add_lead")
     @thread_safe_operation("add_lead", priority=OperationPriority.NORMAL, resource_locks=["leads_table"])
     def add_lead(self, lead_data: Dict[str, Any]) -> str:
@@ -166,9 +406,6 @@ class LeadDatabase:
             if not lead_data.get('full_name') and not lead_data.get('name'):
                 raise ValueError("Lead must have a name (full_name or name field)")
             
-            # Normalize name field
-            full_name = lead_data.get('full_name') or lead_data.get('name', '')
-            
             # Check for duplicates
             existing_lead_id = self._find_duplicates(lead_data)
             
@@ -196,41 +433,10 @@ class LeadDatabase:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("""
-                    INSERT INTO leads (
-                        id, uuid, name, full_name, email, company, company_website,
-                        linkedin_url, title, location, industry, company_size,
-                        verified, enriched, needs_enrichment, status, source,
-                        scraped_at, enriched_at, airtable_id, airtable_synced,
-                        sync_pending, raw_data, created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    lead_id,
-                    lead_uuid,
-                    full_name,  # For backward compatibility
-                    full_name,
-                    lead_data.get('email'),
-                    lead_data.get('company'),
-                    lead_data.get('company_website') or lead_data.get('website'),
-                    lead_data.get('linkedin_url'),
-                    lead_data.get('title'),
-                    lead_data.get('location'),
-                    lead_data.get('industry'),
-                    lead_data.get('company_size'),
-                    lead_data.get('verified', False),
-                    lead_data.get('enriched', False),
-                    lead_data.get('needs_enrichment', True),
-                    lead_data.get('status', 'new'),
-                    lead_data.get('source'),
-                    self._parse_datetime(lead_data.get('scraped_at')),
-                    self._parse_datetime(lead_data.get('enriched_at')),
-                    lead_data.get('airtable_id'),
-                    lead_data.get('airtable_synced', False),
-                    lead_data.get('sync_pending', True),
-                    json.dumps(lead_data.get('raw_data')) if lead_data.get('raw_data') else None,
-                    now.isoformat(),
-                    now.isoformat()
-                ))
+                cursor.execute(
+                    self._insert_sql(),
+                    self._build_insert_values(lead_data, lead_id, lead_uuid, now.isoformat())
+                )
                 
                 conn.commit()
             
@@ -281,7 +487,7 @@ class LeadDatabase:
             raise
     
     @monitor_performance("get_lead")
-    @thread_safe_operation("get_lead", priority=OperationPriority.LOW, resource_locks=["leads_table"])
+    @thread_safe_operation("get_lead", priority=OperationPriority.LOW, resource_locks=["leads_table"], read_only=True)
     def get_lead(self, lead_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a lead by ID.
@@ -299,15 +505,14 @@ class LeadDatabase:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Try to find by ID first, then by UUID
-                cursor.execute("""
-                    SELECT * FROM leads 
-                    WHERE id = ? OR uuid = ?
-                    LIMIT 1
-                """, (lead_id, lead_id))
-                
+                # Try to find by ID first, then by UUID (each uses its own index)
+                cursor.execute("SELECT * FROM leads WHERE id = ?", (lead_id,))
                 row = cursor.fetchone()
                 
+                if not row:
+                    cursor.execute("SELECT * FROM leads WHERE uuid = ? LIMIT 1", (lead_id,))
+                    row = cursor.fetchone()
+                
                 if row:
                     lead_data = dict(row)
                     
@@ -389,7 +594,7 @@ class LeadDatabase:
         Update an existing lead with new data.
         
         Args:
-            lead_id: Lead identifier
+            lead_id: Lead identifier (ID or UUID)
             updates: Dictionary with fields to update
             
         Returns:
@@ -399,121 +604,421 @@ class LeadDatabase:
             if not updates:
                 return True
             
-            # Get current lead data
-            current_lead = self.get_lead(lead_id)
-            if not current_lead:
-                return False
+            fields = self._prepare_lead_update(updates)
+            if not fields:
+                return True
             
-            # Prepare update fields
-            update_fields = []
-            update_values = []
+            with self.get_connection() as conn:
+                counts = self._apply_lead_updates(conn, {lead_id: fields})
             
-            # Handle special fields
-            if 'name' in updates and 'full_name' not in updates:
-                updates['full_name'] = updates['name']
+            return counts[lead_id] > 0
             
-            # Build update query
-            for field, value in updates.items():
-                if field in ['id', 'uuid']:  # Skip immutable fields
-                    continue
-                    
-                if field == 'raw_data' and value is not None:
-                    value = json.dumps(value)
-                elif field in ['scraped_at', 'enriched_at'] and value:
-                    value = self._parse_datetime(value)
-                
-                update_fields.append(f"{field} = ?")
-                update_values.append(value)
-            
-            if not update_fields:
-                return True
+        except Exception as e:
+            return False
+    
+    @monitor_performance("update_leads")
+    @thread_safe_operation("update_leads", priority=OperationPriority.NORMAL, resource_locks=["leads_table"])
+    def update_leads(self, updates: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Update many leads in a single transaction.
+        
+        Rows are grouped by the set of columns they change and each group is
+        written with one executemany call.
+        
+        Args:
+            updates: Mapping of lead identifier (ID or UUID) to fields to update
             
-            # Add updated_at timestamp
-            update_fields.append("updated_at = ?")
-            update_values.append(datetime.datetime.now().isoformat())
+        Returns:
+            Mapping of lead identifier to number of rows affected (0 if not found)
             
-            # Execute update
+        Raises:
+            ValueError: If an update names a column the leads table does not have
+            Exception: If database operation fails (nothing is written)
+        """
+        start_time = time.time()
+        prepared = {lead_id: self._prepare_lead_update(fields) for lead_id, fields in updates.items()}
+        counts = {lead_id: 0 for lead_id in updates}
+        
+        try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                query = f"""
-                    UPDATE leads 
-                    SET {', '.join(update_fields)}
-                    WHERE id = ? OR uuid = ?
-                """
-                update_values.extend([lead_id, lead_id])
-                
-                cursor.execute(query, update_values)
+                counts.update(self._apply_lead_updates(
+                    conn, {lead_id: fields for lead_id, fields in prepared.items() if fields}
+                ))
+            
+            execution_time_ms = (time.time() - start_time) * 1000
+            log_database_event("database_operation", {"batch_size": len(updates)}, {
+                "success": True,
+                "records_affected": sum(counts.values())
+            }, {
+                "operation_type": "update_leads",
+                "performance_metrics": {
+                    "execution_time_ms": execution_time_ms,
+                    "database_queries": len({tuple(fields) for fields in prepared.values() if fields}) + 2,
+                    "memory_usage_mb": 0,
+                    "cpu_time_ms": execution_time_ms
+                }
+            })
+            
+            return counts
+            
+        except Exception as e:
+            execution_time_ms = (time.time() - start_time) * 1000
+            database_logger.log_error("database_error", {
+                "message": str(e),
+                "stack_trace": traceback.format_exc(),
+                "severity": "error"
+            }, {
+                "operation": "update_leads",
+                "batch_size": len(updates),
+                "execution_time_ms": execution_time_ms
+            })
+            raise
+    
+    def _prepare_lead_update(self, updates: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert caller-supplied updates into column values.
+        
+        Args:
+            updates: Dictionary with fields to update
+            
+        Returns:
+            Column -> value mapping (empty if nothing is updatable)
+        """
+        updates = dict(updates)
+        
+        # Handle special fields
+        if 'name' in updates and 'full_name' not in updates:
+            updates['full_name'] = updates['name']
+        
+        fields = {}
+        for field, value in updates.items():
+            if field in ['id', 'uuid']:  # Skip immutable fields
+                continue
+            
+            if field == 'raw_data' and value is not None:
+                value = json.dumps(value)
+            elif field in ['scraped_at', 'enriched_at'] and value:
+                value = self._parse_datetime(value)
+            
+            fields[field] = value
+        
+        if not fields:
+            return fields
+        
+        # Keep dedupe keys in step with the fields they are derived from
+        keys = compute_dedupe_keys(updates)
+        if 'linkedin_url' in updates:
+            fields['linkedin_key'] = keys['linkedin_key']
+        if 'email' in updates:
+            fields['email_key'] = keys['email_key']
+        if 'full_name' in updates and 'company' in updates:
+            fields['name_company_key'] = keys['name_company_key']
+        
+        fields['updated_at'] = datetime.datetime.now().isoformat()
+        return fields
+    
+    def _get_lead_columns(self, cursor: sqlite3.Cursor, refresh: bool = False) -> set:
+        """Get (and cache) the column names of the leads table."""
+        if self._lead_columns is None or refresh:
+            cursor.execute("PRAGMA table_info(leads)")
+            self._lead_columns = {row[1] for row in cursor.fetchall()}
+        return self._lead_columns
+    
+    def _resolve_lead_ids(self, cursor: sqlite3.Cursor, identifiers: List[str]) -> Dict[str, str]:
+        """
+        Resolve lead identifiers that may be IDs or UUIDs to row IDs.
+        
+        Args:
+            cursor: Database cursor
+            identifiers: Lead IDs and/or UUIDs
+            
+        Returns:
+            Mapping of identifier -> lead ID for identifiers that exist
+        """
+        resolved = {}
+        
+        for start in range(0, len(identifiers), 500):
+            chunk = identifiers[start:start + 500]
+            cursor.execute(f"SELECT id FROM leads WHERE id IN ({', '.join('?' * len(chunk))})", chunk)
+            resolved.update((row['id'], row['id']) for row in cursor.fetchall())
+        
+        remaining = [identifier for identifier in identifiers if identifier not in resolved]
+        for start in range(0, len(remaining), 500):
+            chunk = remaining[start:start + 500]
+            cursor.execute(f"SELECT id, uuid FROM leads WHERE uuid IN ({', '.join('?' * len(chunk))})", chunk)
+            resolved.update((row['uuid'], row['id']) for row in cursor.fetchall())
+        
+        return resolved
+    
+    def _apply_lead_updates(self, conn: sqlite3.Connection,
+                            updates: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Write prepared column updates in one transaction.
+        
+        Args:
+            conn: Database connection
+            updates: Mapping of lead identifier to prepared column values
+            
+        Returns:
+            Mapping of lead identifier to number of rows affected
+        """
+        cursor = conn.cursor()
+        counts = {identifier: 0 for identifier in updates}
+        if not updates:
+            return counts
+        
+        # Validate columns before writing anything
+        requested = set().union(*(fields.keys() for fields in updates.values()))
+        unknown = requested - self._get_lead_columns(cursor)
+        if unknown:
+            unknown = requested - self._get_lead_columns(cursor, refresh=True)
+        if unknown:
+            raise ValueError(f"Unknown lead fields: {', '.join(sorted(unknown))}")
+        
+        with get_connection_pool(self.db_path).transaction(conn):
+            resolved = self._resolve_lead_ids(cursor, list(updates))
+            
+            groups: Dict[tuple, List[tuple]] = {}
+            rekey_ids = []
+            for identifier, fields in updates.items():
+                lead_id = resolved.get(identifier)
+                if lead_id is None:
+                    continue
                 
-                if cursor.rowcount == 0:
-                    return False
+                groups.setdefault(tuple(fields), []).append(
+                    (identifier, list(fields.values()) + [lead_id])
+                )
                 
-                conn.commit()
+                if ('full_name' in fields or 'company' in fields) and 'name_company_key' not in fields:
+                    rekey_ids.append(lead_id)
             
-            return True
+            for columns, members in groups.items():
+                assignments = ', '.join(f"{column} = ?" for column in columns)
+                sql = f"UPDATE leads SET {assignments} WHERE id = ?"
+                cursor.executemany(sql, [row for _, row in members])
+                
+                if cursor.rowcount == len(members):
+                    # id is the primary key, so every row matched exactly once
+                    for identifier, _ in members:
+                        counts[identifier] = 1
+                else:
+                    # executemany only reports a total; measure each row to attribute it
+                    for identifier, row in members:
+                        cursor.execute(sql, row)
+                        counts[identifier] = cursor.rowcount
             
-        except Exception as e:
-            return False
+            # Only one of name/company changed; rebuild the key from the stored row
+            for start in range(0, len(rekey_ids), 500):
+                chunk = rekey_ids[start:start + 500]
+                cursor.execute(f"""
+                    SELECT id, full_name, name, company FROM leads
+                    WHERE id IN ({', '.join('?' * len(chunk))})
+                """, chunk)
+                cursor.executemany("UPDATE leads SET name_company_key = ? WHERE id = ?", [
+                    (compute_dedupe_keys(dict(row))['name_company_key'], row['id'])
+                    for row in cursor.fetchall()
+                ])
+        
+        return counts
     
     def _find_duplicates(self, lead_data: Dict[str, Any]) -> Optional[str]:
         """
         Find duplicate leads based on LinkedIn URL, email, or name+company.
         
+        Uses the normalized dedupe key columns so a single indexed query covers
+        all three checks.
+        
         Args:
             lead_data: Lead data to check for duplicates
             
         Returns:
             Lead ID if duplicate found, None otherwise
         """
+        try:
+            keys = compute_dedupe_keys(lead_data)
+            conditions = [f"{column} = ?" for column in DEDUPE_KEY_COLUMNS if keys[column]]
+            if not conditions:
+                return None
+            
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"""
+                    SELECT id, linkedin_key, email_key, name_company_key FROM leads
+                    WHERE {' OR '.join(conditions)}
+                    ORDER BY rowid
+                """, [keys[column] for column in DEDUPE_KEY_COLUMNS if keys[column]])
+                rows = cursor.fetchall()
+            
+            # Honour match priority: LinkedIn, then email, then name+company
+            for column in DEDUPE_KEY_COLUMNS:
+                if not keys[column]:
+                    continue
+                for row in rows:
+                    if row[column] == keys[column]:
+                        return row['id']
+            
+            return None
+                
+        except Exception as e:
+            return None
+    
+    def _match_existing_leads(self, cursor: sqlite3.Cursor,
+                              batch_keys: List[Dict[str, Optional[str]]]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Look up existing leads for a whole batch of dedupe keys.
+        
+        Args:
+            cursor: Cursor inside the bulk-ingest transaction
+            batch_keys: Dedupe keys for each incoming lead
+            
+        Returns:
+            Mapping of key column -> key value -> existing lead row
+        """
+        matches = {column: {} for column in DEDUPE_KEY_COLUMNS}
+        rows_by_id = {}
+        
+        for column in DEDUPE_KEY_COLUMNS:
+            values = sorted({keys[column] for keys in batch_keys if keys[column]})
+            
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(values), 500):
+                chunk = values[start:start + 500]
+                cursor.execute(f"""
+                    SELECT * FROM leads WHERE {column} IN ({', '.join('?' * len(chunk))})
+                    ORDER BY rowid
+                """, chunk)
+                for row in cursor.fetchall():
+                    # One shared dict per lead so merges are visible under every key
+                    lead_row = rows_by_id.setdefault(row['id'], dict(row))
+                    matches[column].setdefault(row[column], lead_row)
+        
+        return matches
+    
+    @monitor_performance("add_leads_bulk")
+    @thread_safe_operation("add_leads_bulk", priority=OperationPriority.NORMAL, resource_locks=["leads_table"])
+    def add_leads_bulk(self, leads: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Add a batch of leads in a single transaction.
+        
+        Duplicates are resolved against the database and within the batch using
+        the same rules as add_lead: matching leads are merged, the rest inserted.
+        
+        Args:
+            leads: Iterable of lead data dictionaries
+            
+        Returns:
+            Dictionary with 'lead_ids' (in input order), 'created' and 'merged' counts
+            
+        Raises:
+            ValueError: If any lead is missing a name (nothing is written)
+            Exception: If database operation fails (the batch is rolled back)
+        """
+        start_time = time.time()
+        leads = list(leads)
+        
+        for index, lead_data in enumerate(leads):
+            if not lead_data.get('full_name') and not lead_data.get('name'):
+                raise ValueError(f"Lead at index {index} must have a name (full_name or name field)")
+        
+        result = {'lead_ids': [], 'created': 0, 'merged': 0}
+        if not leads:
+            return result
+        
+        batch_keys = [compute_dedupe_keys(lead_data) for lead_data in leads]
+        now = datetime.datetime.now().isoformat()
+        
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
+                lead_columns = self._get_lead_columns(cursor)
                 
-                # Check by LinkedIn URL (highest priority)
-                linkedin_url = lead_data.get('linkedin_url')
-                if linkedin_url:
-                    cursor.execute("""
-                        SELECT id FROM leads 
-                        WHERE linkedin_url = ? AND linkedin_url != ''
-                        LIMIT 1
-                    """, (linkedin_url,))
+                with get_connection_pool(self.db_path).transaction(conn):
+                    matches = self._match_existing_leads(cursor, batch_keys)
                     
-                    result = cursor.fetchone()
-                    if result:
-                        return result['id']
-                
-                # Check by email (second priority)
-                email = lead_data.get('email')
-                if email:
-                    cursor.execute("""
-                        SELECT id FROM leads 
-                        WHERE email = ? AND email != ''
-                        LIMIT 1
-                    """, (email,))
+                    new_leads = {}       # lead_id -> merged lead data for rows to insert
+                    dirty_leads = {}     # lead_id -> changed fields for existing rows
+                    merged_rows = {}     # lead_id -> existing row with merges applied
                     
-                    result = cursor.fetchone()
-                    if result:
-                        return result['id']
-                
-                # Check by name + company (third priority)
-                name = lead_data.get('full_name') or lead_data.get('name')
-                company = lead_data.get('company')
-                
-                if name and company:
-                    cursor.execute("""
-                        SELECT id FROM leads 
-                        WHERE (full_name = ? OR name = ?) AND company = ?
-                        LIMIT 1
-                    """, (name, name, company))
+                    for lead_data, keys in zip(leads, batch_keys):
+                        existing = None
+                        for column in DEDUPE_KEY_COLUMNS:
+                            if keys[column] and keys[column] in matches[column]:
+                                existing = matches[column][keys[column]]
+                                break
+                        
+                        if existing is None:
+                            lead_id = lead_data.get('id') or str(uuid.uuid4())
+                            existing = dict(lead_data, id=lead_id)
+                            new_leads[lead_id] = existing
+                            result['created'] += 1
+                        else:
+                            lead_id = existing['id']
+                            merged = self._merge_fields(existing, lead_data)
+                            existing.update(merged)
+                            if lead_id not in new_leads:
+                                changed = dirty_leads.setdefault(lead_id, {})
+                                changed.update({k: v for k, v in merged.items() if k in lead_columns})
+                                merged_rows[lead_id] = existing
+                            result['merged'] += 1
+                        
+                        # Later leads in the batch must see this one as a duplicate
+                        for column, value in compute_dedupe_keys(existing).items():
+                            if value:
+                                matches[column].setdefault(value, existing)
+                        
+                        result['lead_ids'].append(lead_id)
                     
-                    result = cursor.fetchone()
-                    if result:
-                        return result['id']
-                
-                return None
-                
+                    if new_leads:
+                        cursor.executemany(self._insert_sql(), [
+                            self._build_insert_values(lead_data, lead_id, str(uuid.uuid4()), now)
+                            for lead_id, lead_data in new_leads.items()
+                        ])
+                    
+                    for lead_id, changes in dirty_leads.items():
+                        if not changes:
+                            continue
+                        if 'raw_data' in changes and not isinstance(changes['raw_data'], str):
+                            changes['raw_data'] = json.dumps(changes['raw_data'])
+                        for field in ('scraped_at', 'enriched_at'):
+                            if field in changes:
+                                changes[field] = self._parse_datetime(changes[field])
+                        changes.update(compute_dedupe_keys(merged_rows[lead_id]))
+                        changes['updated_at'] = now
+                        
+                        assignments = ', '.join(f"{field} = ?" for field in changes)
+                        cursor.execute(f"UPDATE leads SET {assignments} WHERE id = ?",
+                                       list(changes.values()) + [lead_id])
+            
+            execution_time_ms = (time.time() - start_time) * 1000
+            log_database_event("database_operation", {"batch_size": len(leads)}, {
+                "success": True,
+                "records_affected": result['created'] + len(dirty_leads),
+                "created": result['created'],
+                "merged": result['merged']
+            }, {
+                "operation_type": "add_leads_bulk",
+                "performance_metrics": {
+                    "execution_time_ms": execution_time_ms,
+                    "database_queries": len(DEDUPE_KEY_COLUMNS) + 1 + len(dirty_leads),
+                    "memory_usage_mb": 0,
+                    "cpu_time_ms": execution_time_ms
+                }
+            })
+            
+            return result
+            
         except Exception as e:
-            return None
+            execution_time_ms = (time.time() - start_time) * 1000
+            database_logger.log_error("database_error", {
+                "message": str(e),
+                "stack_trace": traceback.format_exc(),
+                "severity": "error"
+            }, {
+                "operation": "add_leads_bulk",
+                "batch_size": len(leads),
+                "execution_time_ms": execution_time_ms
+            })
+            raise
     
     def _merge_lead_data(self, existing_lead_id: str, new_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -531,27 +1036,47 @@ class LeadDatabase:
             if not existing_lead:
                 return new_data
             
-            merged_data = {}
-            
-            # Merge fields, preferring non-empty new values
-            for field, new_value in new_data.items():
-                existing_value = existing_lead.get(field)
-                
-                # Use new value if it's not empty/None and existing is empty/None
-                if new_value and not existing_value:
-                    merged_data[field] = new_value
-                # For enrichment status, prefer True over False
-                elif field in ['verified', 'enriched'] and new_value and not existing_value:
-                    merged_data[field] = new_value
-                # For dates, use the most recent
-                elif field in ['scraped_at', 'enriched_at'] and new_value:
-                    merged_data[field] = new_value
-            
-            return merged_data
+            return self._merge_fields(existing_lead, new_data)
             
         except Exception as e:
             return new_data
     
+    def _merge_fields(self, existing_lead: Dict[str, Any], new_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Work out which fields of an existing lead should take new values.
+        
+        Args:
+            existing_lead: Current lead data
+            new_data: New data to merge
+            
+        Returns:
+            Dictionary of fields to update
+        """
+        merged_data = {}
+        
+        # Merge fields, preferring non-empty new values
+        for field, new_value in new_data.items():
+            existing_value = existing_lead.get(field)
+            
+            # Use new value if it's not empty/None and existing is empty/None
+            if new_value and not existing_value:
+                merged_data[field] = new_value
+            # For enrichment status, prefer True over False
+            elif field in ['verified', 'enriched'] and new_value and not existing_value:
+                merged_data[field] = new_value
+            # For dates, use the most recent
+            elif field in ['scraped_at', 'enriched_at'] and new_value:
+                merged_data[field] = new_value
+        
+        return merged_data
+    
+    def _insert_sql(self) -> str:
+        """INSERT statement matching _build_insert_values."""
+        return f"""
+            INSERT INTO leads ({', '.join(LEAD_INSERT_COLUMNS)})
+            VALUES ({', '.join('?' * len(LEAD_INSERT_COLUMNS))})
+        """
+    
     def _parse_datetime(self, dt_value: Any) -> Optional[str]:
         """
         Parse datetime value to ISO format string.
@@ -594,6 +1119,68 @@ class LeadDatabase:
         except Exception as e:
             return []
     
+    def get_lead_ids_by_airtable_ids(self, airtable_ids: List[str]) -> Dict[str, str]:
+        """
+        Look up local lead IDs for a batch of Airtable record IDs.
+        
+        Args:
+            airtable_ids: Airtable record IDs
+            
+        Returns:
+            Mapping of Airtable record ID to lead ID for records that exist locally
+            
+        Raises:
+            Exception: If database operation fails
+        """
+        lead_ids = {}
+        airtable_ids = list(dict.fromkeys(airtable_ids))
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(airtable_ids), 500):
+                chunk = airtable_ids[start:start + 500]
+                cursor.execute(
+                    f"SELECT id, airtable_id FROM leads WHERE airtable_id IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                )
+                for row in cursor.fetchall():
+                    lead_ids.setdefault(row['airtable_id'], row['id'])
+        
+        return lead_ids
+    
+    def get_sync_watermark(self, name: str) -> Optional[str]:
+        """
+        Get the stored high-water mark of an incremental sync.
+        
+        Args:
+            name: Watermark name (e.g. the Airtable base and table)
+            
+        Returns:
+            ISO timestamp of the last complete sync, or None if never synced
+        """
+        with self.get_connection() as conn:
+            row = conn.execute(
+                "SELECT high_water_mark FROM sync_watermarks WHERE name = ?", (name,)
+            ).fetchone()
+        
+        return row['high_water_mark'] if row else None
+    
+    def set_sync_watermark(self, name: str, high_water_mark: str) -> None:
+        """
+        Store the high-water mark of an incremental sync.
+        
+        Args:
+            name: Watermark name (e.g. the Airtable base and table)
+            high_water_mark: ISO timestamp up to which changes have been applied
+        """
+        with self.get_connection() as conn:
+            conn.execute("""
+                INSERT INTO sync_watermarks (name, high_water_mark, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    high_water_mark = excluded.high_water_mark,
+                    updated_at = excluded.updated_at
+            """, (name, high_water_mark, datetime.datetime.now().isoformat()))
+    
     def mark_for_sync(self, lead_id: str) -> bool:
         """
         Mark a lead for sync to Airtable.
@@ -610,39 +1197,50 @@ class LeadDatabase:
         """
         Get database statistics.
         
+        Counts come from the trigger-maintained lead_stats table, so this is
+        constant time regardless of table size; recent additions use the
+        created_at index.
+        
         Returns:
             Dictionary with database statistics
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
+                stats = read_lead_stats(conn)
                 
-                # Total leads
-                cursor.execute("SELECT COUNT(*) as total FROM leads")
-                total_leads = cursor.fetchone()['total']
-                
-                # Pending syncs
-                cursor.execute("SELECT COUNT(*) as pending FROM leads WHERE sync_pending = TRUE")
-                pending_syncs = cursor.fetchone()['pending']
-                
-                # Enriched leads
-                cursor.execute("SELECT COUNT(*) as enriched FROM leads WHERE enriched = TRUE")
-                enriched_leads = cursor.fetchone()['enriched']
+                since = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
+                recent_additions = conn.execute(
+                    "SELECT COUNT(*) FROM leads WHERE created_at >= ?", (since,)
+                ).fetchone()[0]
                 
                 return {
-                    'total_leads': total_leads,
-                    'pending_syncs': pending_syncs,
-                    'enriched_leads': enriched_leads,
+                    'total_leads': stats['total_leads'],
+                    'pending_syncs': stats['sync_pending'],
+                    'enriched_leads': stats['enriched'],
+                    'synced_leads': stats['airtable_synced'],
+                    'sync_queue': stats['sync_queue'],
+                    'leads_with_email': stats['with_email'],
+                    'leads_with_company': stats['with_company'],
+                    'by_status': stats['status'],
+                    'stage_distribution': stats['engagement_stage'],
+                    'verification': {
+                        'verified': stats['verified'],
+                        'unverified': stats['total_leads'] - stats['verified']
+                    },
+                    'recent_additions': recent_additions,
                     'database_path': self.db_path
                 }
                 
         except Exception as e:
-            return {'error': str(e)}   
- 
+            return {'error': str(e)}
+    
+    @thread_safe_operation("search_leads", priority=OperationPriority.LOW, resource_locks=["leads_table"], read_only=True)
     def search_leads(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Search leads based on filters.
         
+        Loads every match into memory; use search_leads_iter for large scans.
+        
         Args:
             filters: Dictionary of field filters
             
@@ -653,18 +1251,7 @@ class LeadDatabase:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Build WHERE clause
-                where_conditions = []
-                values = []
-                
-                for field, value in filters.items():
-                    if value is None:
-                        where_conditions.append(f"{field} IS NULL OR {field} = ''")
-                    else:
-                        where_conditions.append(f"{field} = ?")
-                        values.append(value)
-                
-                where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+                where_clause, values = self._build_filter_clause(cursor, filters)
                 
                 query = f"SELECT * FROM leads WHERE {where_clause}"
                 cursor.execute(query, values)
@@ -690,4 +1277,135 @@ class LeadDatabase:
                 return results
                 
         except Exception as e:
-            return []
\ No newline at end of file
+            return []
+    
+    def search_leads_iter(self, filters: Optional[Dict[str, Any]] = None,
+                          columns: Optional[Iterable[str]] = None,
+                          order_by: str = 'id',
+                          after: Any = None,
+                          page_size: int = 500) -> Iterator[LeadRow]:
+        """
+        Stream leads matching filters one page at a time.
+        
+        Pages are fetched with keyset pagination on (order_by, id), so each
+        page is a range scan and no connection is held between pages. To
+        resume a scan, pass the last row's (row[order_by], row['id']) as
+        ``after``, or just row['id'] when ordering by id.
+        
+        Args:
+            filters: Dictionary of field filters (same semantics as search_leads)
+            columns: Columns to return (all columns if None); 'id' and the
+                order_by column are always included
+            order_by: Column to order by; prefix with '-' for descending order
+            after: Keyset cursor to start after
+            page_size: Rows fetched per query
+            
+        Returns:
+            Iterator of LeadRow dictionaries
+            
+        Raises:
+            ValueError: If a filter, column or order_by name is not a leads column,
+                or page_size is not positive
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        
+        descending = order_by.startswith('-')
+        order_column = order_by.lstrip('-')
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            where_clause, values = self._build_filter_clause(cursor, filters or {})
+            lead_columns = self._get_lead_columns(cursor)
+        
+        if columns is None:
+            selected = ['*']
+        else:
+            selected = list(dict.fromkeys(['id', order_column, *columns]))
+        
+        unknown = ({column for column in selected if column != '*'} | {order_column}) - lead_columns
+        if unknown:
+            raise ValueError(f"Unknown lead fields: {', '.join(sorted(unknown))}")
+        
+        if after is not None and order_column != 'id' and not isinstance(after, (tuple, list)):
+            raise ValueError("after must be an (order_by value, id) pair unless ordering by id")
+        
+        return self._iter_lead_pages(where_clause, values, selected, order_column,
+                                     descending, after, page_size)
+    
+    def _iter_lead_pages(self, where_clause: str, values: List[Any], selected: List[str],
+                         order_column: str, descending: bool, after: Any,
+                         page_size: int) -> Iterator[LeadRow]:
+        """Run the keyset-paginated queries behind search_leads_iter."""
+        direction = 'DESC' if descending else 'ASC'
+        comparison = '<' if descending else '>'
+        
+        if order_column == 'id':
+            order_clause = f"id {direction}"
+            keyset_clause = f"id {comparison} ?"
+        else:
+            # NULLs sort as '' so that ORDER BY and the keyset comparison agree
+            order_expression = f"ifnull({order_column}, '')"
+            order_clause = f"{order_expression} {direction}, id {direction}"
+            keyset_clause = f"({order_expression}, id) {comparison} (?, ?)"
+        
+        def cursor_values(position: Any) -> List[Any]:
+            if order_column == 'id':
+                return [position[-1] if isinstance(position, (tuple, list)) else position]
+            order_value, lead_id = position
+            return ['' if order_value is None else order_value, lead_id]
+        
+        while True:
+            query = f"SELECT {', '.join(selected)} FROM leads WHERE ({where_clause})"
+            params = list(values)
+            if after is not None:
+                query += f" AND {keyset_clause}"
+                params.extend(cursor_values(after))
+            query += f" ORDER BY {order_clause} LIMIT ?"
+            params.append(page_size)
+            
+            with self.get_connection() as conn:
+                rows = conn.execute(query, params).fetchall()
+            
+            for row in rows:
+                yield LeadRow(row)
+            
+            if len(rows) < page_size:
+                return
+            
+            last = rows[-1]
+            after = (last[order_column], last['id'])
+    
+    def _build_filter_clause(self, cursor: sqlite3.Cursor,
+                             filters: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        """
+        Build a WHERE clause for equality filters.
+        
+        Args:
+            cursor: Database cursor (used to load column names)
+            filters: Field -> value; None matches NULL or empty values
+            
+        Returns:
+            Tuple of (where clause, parameter values)
+            
+        Raises:
+            ValueError: If a filter names a column the leads table does not have
+        """
+        unknown = set(filters) - self._get_lead_columns(cursor)
+        if unknown:
+            unknown = set(filters) - self._get_lead_columns(cursor, refresh=True)
+        if unknown:
+            raise ValueError(f"Unknown lead fields: {', '.join(sorted(unknown))}")
+        
+        where_conditions = []
+        values = []
+        
+        for field, value in filters.items():
+            if value is None:
+                where_conditions.append(f"({field} IS NULL OR {field} = '')")
+            else:
+                where_conditions.append(f"{field} = ?")
+                values.append(value)
+        
+        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+        return where_clause, values
@@ -0,0 +1,247 @@
+"""
+Materialized Lead Counters.
+
+Keeps a small ``lead_stats`` table current through SQLite triggers on the
+``leads`` table so that dashboards, health checks and sync statistics can
+read lead counts in constant time instead of scanning the table with
+COUNT(*) on every poll. Because the triggers live in the database file,
+every writer (agents, scrapers, sync jobs) keeps the counters up to date.
+
+Usage:
+    with sqlite3.connect(db_path) as conn:
+        ensure_lead_stats(conn)
+        stats = read_lead_stats(conn)
+"""
+
+import hashlib
+import sqlite3
+from typing import Dict, Any
+
+
+# Counter name -> (columns it depends on, SQL predicate over a row alias)
+LEAD_COUNTERS = {
+    'total_leads': ((), '1'),
+    'sync_pending': (('sync_pending',), '{row}.sync_pending = 1'),
+    'sync_queue': (('sync_pending', 'airtable_synced'),
+                   '({row}.sync_pending = 1 OR {row}.airtable_synced = 0)'),
+    'airtable_synced': (('airtable_synced',), '{row}.airtable_synced = 1'),
+    'enriched': (('enriched',), '{row}.enriched = 1'),
+    'verified': (('verified',), '{row}.verified = 1'),
+    'with_email': (('email',), "({row}.email IS NOT NULL AND {row}.email != '')"),
+    'with_company': (('company',), "({row}.company IS NOT NULL AND {row}.company != '')"),
+}
+
+# Columns whose value distribution is counted, stored as '<column>:<value>'
+LEAD_GROUP_COUNTERS = ('engagement_stage', 'status')
+
+_TRIGGER_NAMES = ('lead_stats_after_insert', 'lead_stats_after_update', 'lead_stats_after_delete')
+
+
+def _active_definition(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """Work out which counters the current leads schema supports."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(leads)")}
+    counters = {
+        name: (dependencies, predicate)
+        for name, (dependencies, predicate) in LEAD_COUNTERS.items()
+        if set(dependencies) <= columns
+    }
+    groups = tuple(column for column in LEAD_GROUP_COUNTERS if column in columns)
+    signature = hashlib.sha1(repr((sorted(counters.items()), groups)).encode('utf-8')).hexdigest()
+    return {'counters': counters, 'groups': groups, 'signature': signature}
+
+
+def _watched_columns(definition: Dict[str, Any]) -> list:
+    """Columns whose updates can change a counter."""
+    dependencies = {column for columns, _ in definition['counters'].values() for column in columns}
+    return sorted(dependencies | set(definition['groups']))
+
+
+def _counter_delta(counters: Dict[str, tuple], row: str, sign: str) -> str:
+    """CASE expression adding one row's contribution to every counter."""
+    cases = ' '.join(
+        f"WHEN '{name}' THEN {sign}ifnull({predicate.format(row=row)}, 0)"
+        for name, (_, predicate) in counters.items()
+    )
+    return f"value + CASE name {cases} ELSE 0 END"
+
+
+def _group_key(column: str, row: str) -> str:
+    return f"'{column}:' || ifnull({row}.{column}, '')"
+
+
+def _create_triggers(conn: sqlite3.Connection, definition: Dict[str, Any]) -> None:
+    """(Re)create the triggers that maintain lead_stats."""
+    counters = definition['counters']
+    groups = definition['groups']
+    names = ', '.join(f"'{name}'" for name in counters)
+
+    for trigger in _TRIGGER_NAMES:
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+    insert_body = [f"UPDATE lead_stats SET value = {_counter_delta(counters, 'NEW', '+')} WHERE name IN ({names});"]
+    delete_body = [f"UPDATE lead_stats SET value = {_counter_delta(counters, 'OLD', '-')} WHERE name IN ({names});"]
+    update_body = [
+        f"UPDATE lead_stats SET value = {_counter_delta(counters, 'NEW', '+')} WHERE name IN ({names});",
+        f"UPDATE lead_stats SET value = {_counter_delta(counters, 'OLD', '-')} WHERE name IN ({names});",
+    ]
+
+    for column in groups:
+        insert_body.append(
+            f"INSERT INTO lead_stats (name, value) VALUES ({_group_key(column, 'NEW')}, 1) "
+            f"ON CONFLICT(name) DO UPDATE SET value = value + 1;"
+        )
+        delete_body.append(
+            f"UPDATE lead_stats SET value = value - 1 WHERE name = {_group_key(column, 'OLD')};"
+        )
+        changed = f"ifnull(OLD.{column}, '') != ifnull(NEW.{column}, '')"
+        update_body.append(
+            f"UPDATE lead_stats SET value = value - 1 WHERE name = {_group_key(column, 'OLD')} AND {changed};"
+        )
+        update_body.append(
+            f"INSERT INTO lead_stats (name, value) SELECT {_group_key(column, 'NEW')}, 1 WHERE {changed} "
+            f"ON CONFLICT(name) DO UPDATE SET value = value + 1;"
+        )
+
+    watched = _watched_columns(definition)
+
+    conn.execute(f"CREATE TRIGGER lead_stats_after_insert AFTER INSERT ON leads BEGIN {' '.join(insert_body)} END")
+    conn.execute(f"CREATE TRIGGER lead_stats_after_delete AFTER DELETE ON leads BEGIN {' '.join(delete_body)} END")
+    if watched:
+        conn.execute(
+            f"CREATE TRIGGER lead_stats_after_update AFTER UPDATE OF {', '.join(watched)} ON leads "
+            f"BEGIN {' '.join(update_body)} END"
+        )
+
+
+def _rebuild_counters(conn: sqlite3.Connection, definition: Dict[str, Any]) -> None:
+    """Recount everything with one scan of leads."""
+    counters = definition['counters']
+    conn.execute("DELETE FROM lead_stats")
+
+    if counters:
+        sums = ', '.join(
+            f"ifnull(sum(ifnull({predicate.format(row='leads')}, 0)), 0)"
+            for _, predicate in counters.values()
+        )
+        values = conn.execute(f"SELECT {sums} FROM leads").fetchone()
+        conn.executemany("INSERT INTO lead_stats (name, value) VALUES (?, ?)",
+                         zip(counters.keys(), values))
+
+    for column in definition['groups']:
+        conn.execute(f"""
+            INSERT INTO lead_stats (name, value)
+            SELECT '{column}:' || ifnull({column}, ''), COUNT(*) FROM leads
+            GROUP BY ifnull({column}, '')
+        """)
+
+
+def ensure_lead_stats(conn: sqlite3.Connection) -> bool:
+    """
+    Create or refresh the lead_stats table and its triggers.
+
+    Counters are rebuilt only when the table is new, a trigger is missing
+    or the leads schema gained columns a counter depends on.
+
+    Args:
+        conn: Connection to a database that has a leads table
+
+    Returns:
+        True if the counters were rebuilt
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS lead_stats (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS lead_stats_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+    """)
+
+    definition = _active_definition(conn)
+    stored = conn.execute("SELECT value FROM lead_stats_meta WHERE key = 'signature'").fetchone()
+    existing_triggers = {
+        row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'leads'"
+        )
+    }
+    expected_triggers = set(_TRIGGER_NAMES)
+    if not _watched_columns(definition):
+        expected_triggers.discard('lead_stats_after_update')
+
+    if stored and stored[0] == definition['signature'] and expected_triggers <= existing_triggers:
+        return False
+
+    # Rebuild atomically so no write is counted twice or missed
+    in_transaction = conn.in_transaction
+    if not in_transaction:
+        conn.execute("BEGIN IMMEDIATE")
+    try:
+        _create_triggers(conn, definition)
+        _rebuild_counters(conn, definition)
+        conn.execute(
+            "INSERT OR REPLACE INTO lead_stats_meta (key, value) VALUES ('signature', ?)",
+            (definition['signature'],)
+        )
+        if not in_transaction:
+            conn.execute("COMMIT")
+    except Exception:
+        if not in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+
+    return True
+
+
+def read_lead_stats(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """
+    Read the materialized lead counters.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        Dictionary with one entry per counter (e.g. total_leads, sync_pending,
+        enriched) plus a {value: count} mapping per grouped column
+    """
+    try:
+        rows = conn.execute("SELECT name, value FROM lead_stats").fetchall()
+    except sqlite3.OperationalError:
+        ensure_lead_stats(conn)
+        rows = conn.execute("SELECT name, value FROM lead_stats").fetchall()
+
+    stats: Dict[str, Any] = {name: 0 for name in LEAD_COUNTERS}
+    for column in LEAD_GROUP_COUNTERS:
+        stats[column] = {}
+
+    for name, value in rows:
+        column, separator, group_value = name.partition(':')
+        if separator and column in LEAD_GROUP_COUNTERS:
+            if value:
+                stats[column][group_value or None] = value
+        else:
+            stats[name] = value
+
+    return stats
+
+
+def get_lead_stats(db_path: str, timeout: float = 30.0) -> Dict[str, Any]:
+    """
+    Open a database, make sure counters exist and read them.
+
+    Args:
+        db_path: Path to the SQLite database
+        timeout: Busy timeout in seconds
+
+    Returns:
+        Counters as returned by read_lead_stats
+    """
+    conn = sqlite3.connect(db_path, timeout=timeout, isolation_level=None)
+    try:
+        ensure_lead_stats(conn)
+        return read_lead_stats(conn)
+    finally:
+        conn.close()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+In-process Metrics Registry for Lead Database Operations
+
+Keeps counters and fixed-bucket latency histograms in memory so that timing
+an operation costs a few additions under a lock instead of a log write.
+Snapshots can be exported on demand as JSON or Prometheus text format and
+periodically appended to a single rolling file.
+"""
+
+import json
+import math
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+
+# Upper bounds (ms) of the latency buckets; the last bucket is unbounded
+DEFAULT_LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, math.inf
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (not thread-safe; guarded by the registry)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.min_ms = math.inf
+        self.max_ms = 0.0
+
+    def observe(self, duration_ms: float) -> None:
+        """Record one duration"""
+        for index, upper_bound in enumerate(self.buckets):
+            if duration_ms <= upper_bound:
+                self.counts[index] += 1
+                break
+        self.count += 1
+        self.sum_ms += duration_ms
+        self.min_ms = min(self.min_ms, duration_ms)
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def percentile(self, quantile: float) -> float:
+        """
+        Estimate a percentile by linear interpolation inside its bucket
+
+        Args:
+            quantile: Value between 0 and 1 (e.g. 0.95)
+
+        Returns:
+            Estimated duration in ms (0 if nothing was observed)
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = quantile * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count == 0:
+                continue
+            if cumulative + bucket_count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index]
+                # Clamp to what was actually observed
+                lower = max(lower, self.min_ms)
+                upper = min(upper, self.max_ms)
+                fraction = (rank - cumulative) / bucket_count
+                return lower + (upper - lower) * fraction
+            cumulative += bucket_count
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summary of the histogram as plain data"""
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 3),
+            "mean_ms": round(self.sum_ms / self.count, 3) if self.count else 0.0,
+            "min_ms": round(self.min_ms, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": round(self.percentile(0.50), 3),
+            "p95_ms": round(self.percentile(0.95), 3),
+            "p99_ms": round(self.percentile(0.99), 3),
+            "buckets": {
+                ("+Inf" if math.isinf(bound) else str(bound)): count
+                for bound, count in zip(self.buckets, self.counts)
+            }
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe registry of counters and per-operation latency histograms"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._errors: Dict[str, int] = {}
+        self._started_at = datetime.now().isoformat()
+
+        # Periodic flush state
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_stop = threading.Event()
+        self._flush_path: Optional[Path] = None
+        self._flush_max_bytes = 0
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Add to a named counter"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, operation_name: str, duration_ms: float, success: bool = True) -> None:
+        """
+        Record the duration of one operation call
+
+        Args:
+            operation_name: Operation being timed (e.g. add_lead)
+            duration_ms: Wall-clock duration in milliseconds
+            success: False if the call raised
+        """
+        with self._lock:
+            histogram = self._histograms.get(operation_name)
+            if histogram is None:
+                histogram = self._histograms[operation_name] = LatencyHistogram(self.buckets)
+            histogram.observe(duration_ms)
+            if not success:
+                self._errors[operation_name] = self._errors.get(operation_name, 0) + 1
+
+    def reset(self) -> None:
+        """Drop all recorded values"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._errors.clear()
+            self._started_at = datetime.now().isoformat()
+
+    def get_operation_stats(self, operation_name: str) -> Optional[Dict[str, Any]]:
+        """Latency summary for one operation, or None if it was never observed"""
+        with self._lock:
+            histogram = self._histograms.get(operation_name)
+            if histogram is None:
+                return None
+            stats = histogram.snapshot()
+            stats["errors"] = self._errors.get(operation_name, 0)
+            return stats
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Consistent copy of all metrics
+
+        Returns:
+            Dictionary with counters and per-operation latency summaries
+        """
+        with self._lock:
+            operations = {}
+            for name, histogram in self._histograms.items():
+                operations[name] = histogram.snapshot()
+                operations[name]["errors"] = self._errors.get(name, 0)
+
+            return {
+                "timestamp": datetime.now().isoformat(),
+                "started_at": self._started_at,
+                "pid": os.getpid(),
+                "counters": dict(self._counters),
+                "operations": operations
+            }
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Export a snapshot as JSON"""
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self, prefix: str = "lead_db") -> str:
+        """
+        Export a snapshot in Prometheus text exposition format
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Exposition text
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {
+                name: (list(h.buckets), list(h.counts), h.sum_ms, h.count)
+                for name, h in self._histograms.items()
+            }
+            errors = dict(self._errors)
+
+        lines: List[str] = []
+
+        for name in sorted(counters):
+            metric = f"{prefix}_{_sanitize_metric_name(name)}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {_format_value(counters[name])}")
+
+        if histograms:
+            metric = f"{prefix}_operation_duration_ms"
+            lines.append(f"# HELP {metric} Operation latency in milliseconds")
+            lines.append(f"# TYPE {metric} histogram")
+            for name in sorted(histograms):
+                bounds, counts, sum_ms, count = histograms[name]
+                label = _escape_label(name)
+                cumulative = 0
+                for bound, bucket_count in zip(bounds, counts):
+                    cumulative += bucket_count
+                    le = "+Inf" if math.isinf(bound) else _format_value(bound)
+                    lines.append(f'{metric}_bucket{{operation="{label}",le="{le}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{operation="{label}"}} {_format_value(sum_ms)}')
+                lines.append(f'{metric}_count{{operation="{label}"}} {count}')
+
+            metric = f"{prefix}_operation_errors_total"
+            lines.append(f"# TYPE {metric} counter")
+            for name in sorted(histograms):
+                lines.append(f'{metric}{{operation="{_escape_label(name)}"}} {errors.get(name, 0)}')
+
+        return "\n".join(lines) + "\n"
+
+    def flush_to_file(self, path: Union[str, Path] = None) -> Optional[Path]:
+        """
+        Append a snapshot line to the rolling metrics file
+
+        When the file grows past the configured size it is renamed to
+        ``<name>.1`` (replacing the previous one) and a new file is started.
+
+        Args:
+            path: File to write (defaults to the periodic flush path)
+
+        Returns:
+            Path written, or None if no path is configured
+        """
+        path = Path(path) if path else self._flush_path
+        if path is None:
+            return None
+
+        line = (self.to_json() + "\n").encode("utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        max_bytes = self._flush_max_bytes
+        try:
+            if max_bytes and path.stat().st_size + len(line) > max_bytes:
+                os.replace(path, path.with_name(path.name + ".1"))
+        except FileNotFoundError:
+            pass
+
+        with open(path, "ab") as f:
+            f.write(line)
+        return path
+
+    def start_periodic_flush(self, path: Union[str, Path], interval_seconds: float = 60.0,
+                             max_bytes: int = 10 * 1024 * 1024) -> None:
+        """
+        Start a daemon thread that flushes snapshots every interval
+
+        Calling this again while a flusher is running only updates the path
+        and size limit.
+
+        Args:
+            path: Rolling metrics file
+            interval_seconds: Seconds between snapshots
+            max_bytes: Size at which the file is rolled over
+        """
+        self._flush_path = Path(path)
+        self._flush_max_bytes = max_bytes
+
+        if self._flush_thread and self._flush_thread.is_alive():
+            return
+
+        self._flush_stop.clear()
+
+        def flush_loop():
+            while not self._flush_stop.wait(interval_seconds):
+                try:
+                    self.flush_to_file()
+                except OSError:
+                    # Metrics are best effort; try again next interval
+                    pass
+
+        self._flush_thread = threading.Thread(target=flush_loop, name="MetricsFlusher", daemon=True)
+        self._flush_thread.start()
+
+    def stop_periodic_flush(self, final_flush: bool = True) -> None:
+        """Stop the flusher thread, optionally writing one last snapshot"""
+        thread = self._flush_thread
+        if thread is None:
+            return
+
+        self._flush_stop.set()
+        thread.join(timeout=5)
+        self._flush_thread = None
+
+        if final_flush:
+            try:
+                self.flush_to_file()
+            except OSError:
+                pass
+
+
+def _sanitize_metric_name(name: str) -> str:
+    """Make a string safe to use in a Prometheus metric name"""
+    return "".join(c if c.isalnum() or c == "_" else "_" for c in name)
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value without trailing noise"""
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(round(value, 6))
+
+
+# Global registry used by monitor_performance
+metrics_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry"""
+    return metrics_registry
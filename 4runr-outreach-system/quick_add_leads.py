@@ -8,6 +8,7 @@ connection pool issues.
 
 import sys
 import sqlite3
+import itertools
 import datetime
 import uuid
 from pathlib import Path
@@ -361,8 +362,7 @@ def test_sync():
         # Get first 5 leads
         from lead_database import LeadDatabase
         db = LeadDatabase()
-        leads = db.search_leads({})
-        first_5_leads = leads[:5]
+        first_5_leads = list(itertools.islice(db.search_leads_iter({}, columns=['id'], page_size=5), 5))
         
         if first_5_leads:
             lead_ids = [lead['id'] for lead in first_5_leads]
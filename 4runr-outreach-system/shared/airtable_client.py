@@ -5,24 +5,54 @@ Provides an abstraction layer for interacting with the Airtable API,
 handling authentication, error handling, and data transformation.
 """
 
-import time
+import datetime
 import logging
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from typing import Iterator, List, Dict, Any, Optional
+import requests
 from pyairtable import Api
 from pyairtable.formulas import match
+from .airtable_transport import get_airtable_transport
 from .config import get_airtable_config
 
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class BatchCreateResult:
+    """Outcome of creating one record as part of a batch."""
+    record_id: Optional[str] = None
+    rejected: bool = False  # True when the record was certainly not created
+    error: Optional[str] = None
+
+
+def _request_rejected(error: Exception) -> bool:
+    """
+    Tell whether a failed write certainly did not reach Airtable.
+
+    Client errors (4xx) are answered before anything is written, and a
+    request that could not connect or get a rate limit token was never
+    sent. Anything else, such as a read timeout or a server error, may have
+    been applied.
+    """
+    if isinstance(error, (requests.ConnectTimeout, TimeoutError)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return 400 <= error.response.status_code < 500
+    return False
+
+
 class AirtableClient:
     """Client for interacting with Airtable API."""
     
     def __init__(self):
         """Initialize the Airtable client."""
         self.config = get_airtable_config()
-        self.api = Api(self.config['api_key'])
+        self.transport = get_airtable_transport(self.config['api_key'], self.config['base_id'],
+                                                self.config.get('endpoint_url'))
+        self.api = self.transport.attach(Api(self.config['api_key'], retry_strategy=None,
+                                             endpoint_url=self.transport.endpoint_url))
         self.table = self.api.table(self.config['base_id'], self.config['table_name'])
     
     def get_leads_for_outreach(self, limit: int = 100) -> List[Dict[str, Any]]:
@@ -136,74 +166,100 @@ class AirtableClient:
             logger.error(f"Error retrieving leads for engagement: {str(e)}")
             return []
     
+    def iter_leads_modified_since(self, since: Optional[datetime.datetime] = None,
+                                  page_size: int = 100) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Page through lead records changed after a point in time.
+
+        Filtering happens server-side on LAST_MODIFIED_TIME(), so the number
+        of requests depends on how many records changed rather than on the
+        size of the table. Pages are fetched lazily as the caller iterates.
+
+        Args:
+            since: Only return records modified after this time (all records if None)
+            page_size: Records per request (Airtable maximum is 100)
+
+        Yields:
+            Lists of lead records with their fields, one list per page
+
+        Raises:
+            Exception: If a page cannot be fetched
+        """
+        formula = None
+        if since is not None:
+            if since.tzinfo is not None:
+                since = since.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+            formula = (
+                "IS_AFTER(LAST_MODIFIED_TIME(), "
+                f"DATETIME_PARSE('{since.strftime('%Y-%m-%dT%H:%M:%S')}Z'))"
+            )
+
+        for page in self.table.iterate(formula=formula, page_size=min(page_size, 100)):
+            yield [{'id': record['id'], **record['fields']} for record in page]
+
     def update_lead_fields(self, lead_id: str, fields: Dict[str, Any], max_retries: int = 3) -> bool:
         """
         Update specific fields for a lead record.
         
+        Throttled, failed and timed out requests are retried by the shared
+        transport, so an error raised here is final.
+        
         Args:
             lead_id: Airtable record ID
             fields: Dictionary of fields to update
-            max_retries: Maximum number of retry attempts
+            max_retries: Unused; kept for backward compatibility
             
         Returns:
             True if successful, False otherwise
         """
-        for attempt in range(max_retries):
-            try:
-                self.table.update(lead_id, fields)
-                logger.debug(f"Updated lead {lead_id} with fields: {list(fields.keys())}")
-                return True
-                
-            except Exception as e:
-                logger.warning(f"Attempt {attempt + 1} failed to update lead {lead_id}: {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    logger.error(f"Failed to update lead {lead_id} after {max_retries} attempts")
-                    return False
-        
-        return False
+        try:
+            self.table.update(lead_id, fields)
+            logger.debug(f"Updated lead {lead_id} with fields: {list(fields.keys())}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to update lead {lead_id}: {str(e)}")
+            return False
     
-    def batch_update_leads(self, updates: List[Dict[str, Any]], max_retries: int = 3) -> int:
+    def batch_update_leads(self, updates: List[Dict[str, Any]], max_retries: int = 3) -> List[str]:
         """
         Perform bulk updates for multiple leads.
         
+        Batches are sent concurrently and fail independently, so the caller
+        gets back which records were updated rather than a count.
+        
         Args:
             updates: List of update dictionaries with 'id' and 'fields' keys
-            max_retries: Maximum number of retry attempts
+            max_retries: Unused; retries are handled by the shared transport
             
         Returns:
-            Number of successfully updated records
+            IDs of the records that were updated
         """
-        successful_updates = 0
-        
-        # Process in batches of 10 (Airtable API limit)
+        # Process in batches of 10 (Airtable API limit), several in flight at once
         batch_size = 10
-        for i in range(0, len(updates), batch_size):
-            batch = updates[i:i + batch_size]
-            
-            for attempt in range(max_retries):
-                try:
-                    # Format for batch update
-                    batch_records = [
-                        {'id': update['id'], 'fields': update['fields']}
-                        for update in batch
-                    ]
-                    
-                    self.table.batch_update(batch_records)
-                    successful_updates += len(batch)
-                    logger.debug(f"Batch updated {len(batch)} leads")
-                    break
-                    
-                except Exception as e:
-                    logger.warning(f"Batch update attempt {attempt + 1} failed: {str(e)}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                    else:
-                        logger.error(f"Failed to batch update {len(batch)} leads after {max_retries} attempts")
+        batches = [updates[i:i + batch_size] for i in range(0, len(updates), batch_size)]
         
-        logger.info(f"Successfully updated {successful_updates} out of {len(updates)} leads")
-        return successful_updates
+        def update_batch(batch: List[Dict[str, Any]]) -> List[str]:
+            try:
+                updated = self.table.batch_update([
+                    {'id': update['id'], 'fields': update['fields']}
+                    for update in batch
+                ])
+                logger.debug(f"Batch updated {len(batch)} leads")
+                return [record['id'] for record in updated]
+                
+            except Exception as e:
+                logger.error(f"Failed to batch update {len(batch)} leads: {str(e)}")
+                return []
+        
+        updated_ids = [
+            record_id
+            for batch_ids in self.transport.map(update_batch, batches)
+            for record_id in batch_ids
+        ]
+        
+        logger.info(f"Successfully updated {len(updated_ids)} out of {len(updates)} leads")
+        return updated_ids
     
     def get_lead_by_id(self, lead_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -243,14 +299,82 @@ class AirtableClient:
             logger.error(f"Error creating lead record: {str(e)}")
             return None
 
+    def batch_create_leads(self, records: List[Dict[str, Any]]) -> List[BatchCreateResult]:
+        """
+        Create lead records in batches of 10 (Airtable API limit).
+
+        Each batch is a single request, so a failure affects only the
+        records of that batch. Failed batches are not retried here: a create
+        is not idempotent, so callers decide how to retry, and should only
+        resend records whose batch was rejected.
+
+        Args:
+            records: List of field dictionaries, one per record
+
+        Returns:
+            One BatchCreateResult per record, in the same order as records
+        """
+        batch_size = 10
+        batches = [records[i:i + batch_size] for i in range(0, len(records), batch_size)]
+
+        def create_batch(batch: List[Dict[str, Any]]) -> List[BatchCreateResult]:
+            try:
+                created = self.table.batch_create(batch)
+                batch_ids = [record['id'] for record in created]
+                if len(batch_ids) != len(batch):
+                    # Airtable accepted the request, so some records may exist
+                    error = f"Expected {len(batch)} created records, got {len(batch_ids)}"
+                    logger.warning(f"Batch create of {len(batch)} leads returned an unexpected result: {error}")
+                    return [BatchCreateResult(error=error) for _ in batch]
+                logger.debug(f"Batch created {len(batch)} leads")
+                return [BatchCreateResult(record_id=record_id) for record_id in batch_ids]
+
+            except Exception as e:
+                rejected = _request_rejected(e)
+                outcome = "was rejected" if rejected else "may have been applied"
+                logger.warning(f"Batch create of {len(batch)} leads {outcome}: {str(e)}")
+                return [BatchCreateResult(rejected=rejected, error=str(e)) for _ in batch]
 
-# Import the new configurable client for backward compatibility
-from .configurable_airtable_client import get_configurable_airtable_client, ConfigurableAirtableClient
+        results: List[BatchCreateResult] = [
+            result
+            for batch_results in self.transport.map(create_batch, batches)
+            for result in batch_results
+        ]
+
+        created_count = sum(1 for result in results if result.record_id)
+        logger.info(f"Created {created_count} out of {len(records)} leads")
+        return results
+
+    def find_lead_ids(self, field: str, values: List[str]) -> Dict[str, str]:
+        """
+        Look up existing records by the value of one field.
 
-# Global client instance
-_client = None
+        Used before recreating leads whose earlier create had an unknown
+        outcome. Values are matched exactly, 50 per request.
+
+        Args:
+            field: Airtable field name, e.g. 'Email'
+            values: Field values to look up
+
+        Returns:
+            Mapping of value to record ID for the values found
+
+        Raises:
+            Exception: If a lookup request fails
+        """
+        values = list(dict.fromkeys(value for value in values if value))
+        chunks = [values[i:i + 50] for i in range(0, len(values), 50)]
 
+        def find_chunk(chunk: List[str]) -> Dict[str, str]:
+            formula = "OR(" + ", ".join(str(match({field: value})) for value in chunk) + ")"
+            found = {}
+            for record in self.table.all(formula=formula, fields=[field]):
+                value = record['fields'].get(field)
+                if value is not None:
+                    found.setdefault(value, record['id'])
+            return found
 
-def get_airtable_client() -> ConfigurableAirtableClient:
-    """Get the global Airtable client instance (now uses configurable client)."""
-    return get_configurable_airtable_client()
\ No newline at end of file
+        record_ids: Dict[str, str] = {}
+        for found in self.transport.map(find_chunk, chunks):
+            record_ids.update(found)
+        return record_ids
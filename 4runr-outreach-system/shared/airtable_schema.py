@@ -0,0 +1,212 @@
+"""
+Shared Airtable schema cache.
+
+Field names change rarely, but agents used to rediscover them by fetching
+sample records or calling the metadata API on startup and on every error.
+This cache keeps each table's field names in a small SQLite file next to
+the rate limiter database, so every agent on the machine shares them:
+
+- one metadata request fills the field names of every table in the base
+  (falls back to sampling records when the token cannot read schemas)
+- entries expire after AIRTABLE_SCHEMA_TTL_SECONDS (default one hour)
+- invalidate() drops a table as soon as a request fails because a field
+  is unknown, so the next lookup sees the renamed or added field
+
+Usage:
+    schema = get_airtable_schema_cache(transport)
+    if 'Level Engaged' in schema.get_field_names('Leads'):
+        ...
+
+    except Exception as e:
+        if is_unknown_field_error(e):
+            schema.invalidate('Leads')
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from shared.airtable_transport import AirtableTransport
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCHEMA_TTL_SECONDS = 3600.0
+SAMPLE_RECORDS = 10
+
+_UNKNOWN_FIELD_MARKERS = ('UNKNOWN_FIELD_NAME', 'Unknown field name')
+
+
+def default_schema_cache_path() -> str:
+    """Location of the shared schema database (AIRTABLE_SCHEMA_CACHE_DB overrides it)."""
+    return os.getenv(
+        "AIRTABLE_SCHEMA_CACHE_DB",
+        os.path.join(tempfile.gettempdir(), "4runr_airtable_schema.db")
+    )
+
+
+def is_unknown_field_error(error: BaseException) -> bool:
+    """Whether an Airtable error was caused by a field name the table does not have."""
+    text = str(error)
+    return any(marker.lower() in text.lower() for marker in _UNKNOWN_FIELD_MARKERS)
+
+
+class AirtableSchemaCache:
+    """Field names of one base's tables, shared between processes through SQLite."""
+
+    def __init__(self, transport: AirtableTransport, ttl: float = DEFAULT_SCHEMA_TTL_SECONDS,
+                 db_path: Optional[str] = None):
+        """
+        Args:
+            transport: Transport of the base (all fetches go through its limiter)
+            ttl: Seconds a cached schema stays valid
+            db_path: Schema database (defaults to default_schema_cache_path())
+        """
+        self.transport = transport
+        self.base_id = transport.base_id
+        self.ttl = ttl
+        self.db_path = db_path or default_schema_cache_path()
+        self._local = threading.local()
+        self._fetch_lock = threading.Lock()
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def _ensure_schema(self) -> None:
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._connect().execute("""
+            CREATE TABLE IF NOT EXISTS table_schemas (
+                base_id TEXT NOT NULL,
+                table_name TEXT NOT NULL,
+                field_names TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (base_id, table_name)
+            )
+        """)
+
+    def _load(self, table_name: str) -> Optional[List[str]]:
+        """Cached field names, or None if missing or expired."""
+        row = self._connect().execute(
+            "SELECT field_names, fetched_at FROM table_schemas WHERE base_id = ? AND table_name = ?",
+            (self.base_id, table_name)
+        ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return json.loads(row[0])
+
+    def _store(self, tables: Dict[str, List[str]]) -> None:
+        now = time.time()
+        self._connect().executemany(
+            "INSERT OR REPLACE INTO table_schemas (base_id, table_name, field_names, fetched_at) "
+            "VALUES (?, ?, ?, ?)",
+            [(self.base_id, name, json.dumps(fields), now) for name, fields in tables.items()]
+        )
+
+    def _fetch_base_schema(self) -> Optional[Dict[str, List[str]]]:
+        """Field names of every table from the metadata API (None if not permitted)."""
+        url = f"{self.transport.endpoint_url}/v0/meta/bases/{self.base_id}/tables"
+        response = self.transport.get(url)
+        if not response.ok:
+            logger.debug(f"Airtable metadata API returned {response.status_code}; sampling records instead")
+            return None
+        return {
+            table['name']: [field['name'] for field in table.get('fields', [])]
+            for table in response.json().get('tables', [])
+        }
+
+    def _sample_field_names(self, table_name: str) -> List[str]:
+        """Field names seen in a page of records (empty fields are never returned)."""
+        response = self.transport.get(
+            self.transport.table_url(table_name),
+            params={'pageSize': SAMPLE_RECORDS, 'maxRecords': SAMPLE_RECORDS}
+        )
+        response.raise_for_status()
+        names: Dict[str, None] = {}
+        for record in response.json().get('records', []):
+            names.update(dict.fromkeys(record.get('fields', {})))
+        return list(names)
+
+    def get_field_names(self, table_name: str, refresh: bool = False) -> List[str]:
+        """
+        Field names of a table, fetched only when not cached or expired.
+
+        Args:
+            table_name: Table name
+            refresh: Ignore the cached entry
+
+        Returns:
+            Field names
+
+        Raises:
+            requests.RequestException: If the schema had to be fetched and could not be
+        """
+        if not refresh:
+            cached = self._load(table_name)
+            if cached is not None:
+                return cached
+
+        with self._fetch_lock:
+            # Another thread may have fetched it while this one waited
+            if not refresh:
+                cached = self._load(table_name)
+                if cached is not None:
+                    return cached
+
+            tables = self._fetch_base_schema()
+            if tables is None or table_name not in tables:
+                tables = dict(tables or {})
+                tables[table_name] = self._sample_field_names(table_name)
+            self._store(tables)
+            return tables[table_name]
+
+    def has_field(self, table_name: str, field_name: str) -> bool:
+        """Whether a table has a field."""
+        return field_name in self.get_field_names(table_name)
+
+    def invalidate(self, table_name: Optional[str] = None) -> None:
+        """Drop one table's cached schema, or the whole base's."""
+        if table_name is None:
+            self._connect().execute("DELETE FROM table_schemas WHERE base_id = ?", (self.base_id,))
+        else:
+            self._connect().execute(
+                "DELETE FROM table_schemas WHERE base_id = ? AND table_name = ?",
+                (self.base_id, table_name)
+            )
+
+
+_schema_caches: Dict[Tuple[str, str, str], AirtableSchemaCache] = {}
+_schema_caches_lock = threading.Lock()
+
+
+def get_airtable_schema_cache(transport: AirtableTransport) -> AirtableSchemaCache:
+    """
+    Get the process-wide schema cache for a transport's base.
+
+    The TTL and location come from AIRTABLE_SCHEMA_TTL_SECONDS and
+    AIRTABLE_SCHEMA_CACHE_DB when set.
+    """
+    key = (transport.api_key, transport.base_id, transport.endpoint_url)
+
+    with _schema_caches_lock:
+        cache = _schema_caches.get(key)
+        if cache is None:
+            cache = AirtableSchemaCache(
+                transport,
+                ttl=float(os.getenv("AIRTABLE_SCHEMA_TTL_SECONDS", DEFAULT_SCHEMA_TTL_SECONDS)),
+                db_path=os.getenv("AIRTABLE_SCHEMA_CACHE_DB")
+            )
+            _schema_caches[key] = cache
+        return cache
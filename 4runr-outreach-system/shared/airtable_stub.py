@@ -0,0 +1,811 @@
+"""
+Local Airtable stand-in server.
+
+Implements the part of the Airtable REST API the sync code uses, so sync
+throughput can be measured and tested offline:
+
+- list records with filterByFormula, pageSize, maxRecords, fields[] and
+  offset (GET, or POST .../listRecords as pyairtable does for long URLs)
+- get, create and update single records; batch create and update of up
+  to 10 records
+- the base schema endpoint (GET /v0/meta/bases/{base}/tables)
+- 5 requests per second per base, answering 429 RATE_LIMIT_REACHED
+  above that, and a configurable latency added to every response
+
+filterByFormula supports field references, string/number literals,
+comparison and arithmetic operators, & and the functions AND, OR, NOT,
+IF, RECORD_ID, CREATED_TIME, LAST_MODIFIED_TIME, DATETIME_PARSE,
+IS_AFTER, IS_BEFORE, IS_SAME, LOWER, UPPER, TRIM, LEN, FIND, SEARCH,
+CONCATENATE, BLANK, TRUE and FALSE. Anything else is rejected with 422
+INVALID_FILTER_BY_FORMULA, like a formula Airtable cannot parse.
+
+Point a client at it through AIRTABLE_ENDPOINT_URL (shared/config.py in
+the outreach system, config/settings.py in the lead scraper).
+
+Usage:
+    with AirtableStubServer(latency=0.05) as server:
+        os.environ['AIRTABLE_ENDPOINT_URL'] = server.url
+        ...
+
+    python -m shared.airtable_stub --port 8765 --latency-ms 50
+"""
+
+import argparse
+import datetime
+import itertools
+import json
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+MAX_PAGE_SIZE = 100
+MAX_BATCH_SIZE = 10
+MAX_OPEN_ITERATORS = 1000
+
+_BASE62 = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+
+
+class AirtableStubError(Exception):
+    """Error answered to the client as an Airtable error response."""
+
+    def __init__(self, status: int, error_type: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.error_type = error_type
+        self.message = message
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def _format_time(value: datetime.datetime) -> str:
+    return value.strftime('%Y-%m-%dT%H:%M:%S.') + f"{value.microsecond // 1000:03d}Z"
+
+
+def _parse_time(value: Any) -> Optional[datetime.datetime]:
+    """Parse an ISO 8601 string (or pass a datetime through) as UTC."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime.datetime):
+        parsed = value
+    else:
+        text = str(value).strip().replace('Z', '+00:00')
+        try:
+            parsed = datetime.datetime.fromisoformat(text)
+        except ValueError:
+            raise AirtableStubError(422, 'INVALID_FILTER_BY_FORMULA', f"Cannot parse date: {value!r}")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed
+
+
+def _is_empty(value: Any) -> bool:
+    """Values Airtable treats as an empty cell (and omits from responses)."""
+    return value is None or value == '' or value == [] or value is False
+
+
+# ---------------------------------------------------------------------------
+# Formulas
+
+_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<field>\{[^}]*\})
+      | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<number>\d+(?:\.\d+)?)
+      | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+      | (?P<op>!=|>=|<=|=|<|>|&|\+|-|\*|/|\(|\)|,)
+    )""", re.VERBOSE)
+
+_COMPARISONS = {
+    '=': lambda a, b: _equals(a, b),
+    '!=': lambda a, b: not _equals(a, b),
+    '>': lambda a, b: _ordered(a, b) > 0,
+    '<': lambda a, b: _ordered(a, b) < 0,
+    '>=': lambda a, b: _ordered(a, b) >= 0,
+    '<=': lambda a, b: _ordered(a, b) <= 0,
+}
+
+
+def _to_number(value: Any) -> float:
+    if value is None or value == '':
+        return 0
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _to_text(value: Any) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, list):
+        return ', '.join(_to_text(item) for item in value)
+    if isinstance(value, datetime.datetime):
+        return _format_time(value)
+    return str(value)
+
+
+def _truthy(value: Any) -> bool:
+    if isinstance(value, str):
+        return value != ''
+    return bool(value)
+
+
+def _equals(left: Any, right: Any) -> bool:
+    if _is_empty(left) or _is_empty(right):
+        # Blank equals '', 0 and FALSE()
+        return (_is_empty(left) or left == 0) and (_is_empty(right) or right == 0)
+    if isinstance(left, (int, float)) and isinstance(right, (int, float)):
+        return left == right
+    if isinstance(left, datetime.datetime) or isinstance(right, datetime.datetime):
+        return _parse_time(left) == _parse_time(right)
+    return _to_text(left) == _to_text(right)
+
+
+def _ordered(left: Any, right: Any) -> int:
+    if isinstance(left, datetime.datetime) or isinstance(right, datetime.datetime):
+        left, right = _parse_time(left), _parse_time(right)
+        if left is None or right is None:
+            return 0
+    elif isinstance(left, str) and isinstance(right, str):
+        pass
+    else:
+        left, right = _to_number(left), _to_number(right)
+    return (left > right) - (left < right)
+
+
+def _find(needle: Any, haystack: Any, start: Any = 1, ignore_case: bool = False) -> int:
+    needle, haystack = _to_text(needle), _to_text(haystack)
+    if ignore_case:
+        needle, haystack = needle.lower(), haystack.lower()
+    return haystack.find(needle, max(int(_to_number(start)) - 1, 0)) + 1
+
+
+# name -> (min args, max args, implementation taking evaluated args)
+_FUNCTIONS: Dict[str, Tuple[int, Optional[int], Callable[..., Any]]] = {
+    'AND': (1, None, lambda *args: all(_truthy(arg) for arg in args)),
+    'OR': (1, None, lambda *args: any(_truthy(arg) for arg in args)),
+    'NOT': (1, 1, lambda value: not _truthy(value)),
+    'DATETIME_PARSE': (1, 3, lambda value, *_: _parse_time(_to_text(value))),
+    'IS_AFTER': (2, 2, lambda a, b: _ordered(_parse_time(a), _parse_time(b)) > 0),
+    'IS_BEFORE': (2, 2, lambda a, b: _ordered(_parse_time(a), _parse_time(b)) < 0),
+    'IS_SAME': (2, 3, lambda a, b, *_: _parse_time(a) == _parse_time(b)),
+    'LOWER': (1, 1, lambda value: _to_text(value).lower()),
+    'UPPER': (1, 1, lambda value: _to_text(value).upper()),
+    'TRIM': (1, 1, lambda value: _to_text(value).strip()),
+    'LEN': (1, 1, lambda value: len(_to_text(value))),
+    'FIND': (2, 3, lambda needle, haystack, start=1: _find(needle, haystack, start)),
+    'SEARCH': (2, 3, lambda needle, haystack, start=1: _find(needle, haystack, start, True)),
+    'CONCATENATE': (1, None, lambda *args: ''.join(_to_text(arg) for arg in args)),
+    'BLANK': (0, 0, lambda: None),
+    'TRUE': (0, 0, lambda: True),
+    'FALSE': (0, 0, lambda: False),
+}
+
+# Functions that read the record instead of their arguments
+_RECORD_FUNCTIONS = {
+    'RECORD_ID': lambda record: record['id'],
+    'CREATED_TIME': lambda record: record['created'],
+    'LAST_MODIFIED_TIME': lambda record: record['modified'],
+}
+
+Evaluator = Callable[[Dict[str, Any]], Any]
+
+
+class _FormulaParser:
+    """Recursive-descent parser compiling a formula into a record predicate."""
+
+    def __init__(self, formula: str):
+        self.tokens = self._tokenize(formula)
+        self.position = 0
+        self.field_names: List[str] = []
+
+    @staticmethod
+    def _tokenize(formula: str) -> List[Tuple[str, str]]:
+        tokens = []
+        position = 0
+        formula = formula.rstrip()
+        while position < len(formula):
+            match = _TOKEN_RE.match(formula, position)
+            if not match or match.end() == position:
+                raise AirtableStubError(422, 'INVALID_FILTER_BY_FORMULA',
+                                        f"Invalid formula near: {formula[position:position + 20]!r}")
+            kind = match.lastgroup
+            tokens.append((kind, match.group(kind)))
+            position = match.end()
+        return tokens
+
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _take(self, value: Optional[str] = None) -> Tuple[str, str]:
+        token = self._peek()
+        if token is None or (value is not None and token[1] != value):
+            expected = f"'{value}'" if value else 'an expression'
+            raise AirtableStubError(422, 'INVALID_FILTER_BY_FORMULA', f"Invalid formula: expected {expected}")
+        self.position += 1
+        return token
+
+    def parse(self) -> Evaluator:
+        evaluator = self._comparison()
+        if self._peek() is not None:
+            raise AirtableStubError(422, 'INVALID_FILTER_BY_FORMULA',
+                                    f"Invalid formula: unexpected {self._peek()[1]!r}")
+        return evaluator
+
+    def _comparison(self) -> Evaluator:
+        left = self._concatenation()
+        token = self._peek()
+        if token and token[0] == 'op' and token[1] in _COMPARISONS:
+            self._take()
+            compare = _COMPARISONS[token[1]]
+            right = self._concatenation()
+            return lambda record: compare(left(record), right(record))
+        return left
+
+    def _concatenation(self) -> Evaluator:
+        parts = [self._additive()]
+        while self._peek() == ('op', '&'):
+            self._take()
+            parts.append(self._additive())
+        if len(parts) == 1:
+            return parts[0]
+        return lambda record: ''.join(_to_text(part(record)) for part in parts)
+
+    def _binary(self, operand: Callable[[], Evaluator], operators: Dict[str, Callable]) -> Evaluator:
+        left = operand()
+        while self._peek() and self._peek()[0] == 'op' and self._peek()[1] in operators:
+            apply = operators[self._take()[1]]
+            right = operand()
+            left = (lambda l, r, f: lambda record: f(_to_number(l(record)), _to_number(r(record))))(left, right, apply)
+        return left
+
+    def _additive(self) -> Evaluator:
+        return self._binary(self._multiplicative, {'+': lambda a, b: a + b, '-': lambda a, b: a - b})
+
+    def _multiplicative(self) -> Evaluator:
+        return self._binary(self._unary, {'*': lambda a, b: a * b, '/': lambda a, b: a / b if b else 0})
+
+    def _unary(self) -> Evaluator:
+        if self._peek() == ('op', '-'):
+            self._take()
+            operand = self._unary()
+            return lambda record: -_to_number(operand(record))
+        return self._primary()
+
+    def _primary(self) -> Evaluator:
+        kind, value = self._take()
+
+        if kind == 'number':
+            number = float(value) if '.' in value else int(value)
+            return lambda record: number
+        if kind == 'string':
+            text = re.sub(r'\\(.)', r'\1', value[1:-1])
+            return lambda record: text
+        if kind == 'field':
+            name = value[1:-1]
+            self.field_names.append(name)
+            return lambda record: record['fields'].get(name)
+        if kind == 'op' and value == '(':
+            inner = self._comparison()
+            self._take(')')
+            return inner
+        if kind == 'name':
+            return self._call(value.upper())
+
+        raise AirtableStubError(422, 'INVALID_FILTER_BY_FORMULA', f"Invalid formula: unexpected {value!r}")
+
+    def _call(self, name: str) -> Evaluator:
+        has_parens = self._peek() == ('op', '(')
+        args: List[Evaluator] = []
+        if has_parens:
+            self._take('(')
+            if self._peek() != ('op', ')'):
+                args.append(self._comparison())
+                while self._peek() == ('op', ','):
+                    self._take()
+                    args.append(self._comparison())
+            self._take(')')
+
+        if name in _RECORD_FUNCTIONS and has_parens and not args:
+            return _RECORD_FUNCTIONS[name]
+
+        if name == 'IF' and has_parens and len(args) in (2, 3):
+            condition, then = args[0], args[1]
+            otherwise = args[2] if len(args) == 3 else (lambda record: None)
+            return lambda record: then(record) if _truthy(condition(record)) else otherwise(record)
+
+        if name in ('TRUE', 'FALSE') and not has_parens:
+            constant = name == 'TRUE'
+            return lambda record: constant
+
+        if name not in _FUNCTIONS or not has_parens:
+            raise AirtableStubError(422, 'INVALID_FILTER_BY_FORMULA', f"Unknown function: {name}")
+
+        minimum, maximum, function = _FUNCTIONS[name]
+        if len(args) < minimum or (maximum is not None and len(args) > maximum):
+            raise AirtableStubError(422, 'INVALID_FILTER_BY_FORMULA',
+                                    f"Wrong number of arguments to {name}")
+        return lambda record: function(*(arg(record) for arg in args))
+
+
+def compile_formula(formula: str) -> Tuple[Callable[[Dict[str, Any]], bool], List[str]]:
+    """
+    Compile a filterByFormula expression.
+
+    Args:
+        formula: Airtable formula
+
+    Returns:
+        (predicate over stored records, field names the formula references)
+
+    Raises:
+        AirtableStubError: If the formula uses unsupported syntax
+    """
+    parser = _FormulaParser(formula)
+    evaluator = parser.parse()
+    return (lambda record: _truthy(evaluator(record))), parser.field_names
+
+
+# ---------------------------------------------------------------------------
+# Storage
+
+class _Table:
+    """Records of one table, in creation order."""
+
+    def __init__(self, name: str, field_names: Optional[Iterable[str]] = None):
+        self.name = name
+        self.records: Dict[str, Dict[str, Any]] = {}
+        # None accepts any field; otherwise writes to other fields fail
+        self.field_names = set(field_names) if field_names is not None else None
+        self.seen_fields: Dict[str, None] = {}
+
+    def check_fields(self, names: Iterable[str]) -> None:
+        for name in names:
+            if self.field_names is not None and name not in self.field_names:
+                raise AirtableStubError(422, 'UNKNOWN_FIELD_NAME', f'Unknown field name: "{name}"')
+
+
+class AirtableStub:
+    """
+    In-memory Airtable data, throttling and request accounting.
+
+    Used by the HTTP handler; tests and benchmarks can seed and inspect
+    records directly without going through HTTP.
+    """
+
+    def __init__(self, requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+                 latency: float = 0.0, throttle_penalty: float = 0.0,
+                 api_key: Optional[str] = None):
+        """
+        Args:
+            requests_per_second: Requests allowed per base in any one-second
+                window (0 disables throttling)
+            latency: Seconds added to every response
+            throttle_penalty: Seconds every request to a base is refused
+                after it was throttled (Airtable uses 30)
+            api_key: Required bearer token (any token if None)
+        """
+        self.requests_per_second = requests_per_second
+        self.latency = latency
+        self.throttle_penalty = throttle_penalty
+        self.api_key = api_key
+
+        self._lock = threading.Lock()
+        self._tables: Dict[Tuple[str, str], _Table] = {}
+        self._ids = itertools.count(1)
+        self._iterators: 'OrderedDict[str, Tuple[List[str], Optional[List[str]]]]' = OrderedDict()
+        self._iterator_ids = itertools.count(1)
+        self._windows: Dict[str, deque] = {}
+        self._blocked_until: Dict[str, float] = {}
+
+        self.request_count = 0
+        self.throttled_count = 0
+        self.requests_by_method: Dict[str, int] = {}
+
+    # -- setup and inspection -------------------------------------------------
+
+    def define_table(self, base_id: str, table_name: str, field_names: Optional[Iterable[str]] = None) -> None:
+        """Create a table, optionally with a fixed set of field names."""
+        with self._lock:
+            table = self._table(base_id, table_name)
+            table.field_names = set(field_names) if field_names is not None else None
+
+    def seed(self, base_id: str, table_name: str, records: Iterable[Dict[str, Any]],
+             modified_at: Optional[datetime.datetime] = None) -> List[str]:
+        """
+        Insert records without going through HTTP or throttling.
+
+        Args:
+            base_id: Base ID
+            table_name: Table name
+            records: Field dictionaries
+            modified_at: Created and last-modified time (now if None)
+
+        Returns:
+            IDs of the new records
+        """
+        with self._lock:
+            table = self._table(base_id, table_name)
+            return [self._insert(table, fields, modified_at) for fields in records]
+
+    def get_records(self, base_id: str, table_name: str) -> List[Dict[str, Any]]:
+        """All records of a table in Airtable's response format."""
+        with self._lock:
+            table = self._table(base_id, table_name)
+            return [self._render(record) for record in table.records.values()]
+
+    def stats(self) -> Dict[str, Any]:
+        """Request counters."""
+        with self._lock:
+            return {
+                'requests': self.request_count,
+                'throttled': self.throttled_count,
+                'by_method': dict(self.requests_by_method),
+            }
+
+    # -- request entry point ---------------------------------------------------
+
+    def handle(self, method: str, path: str, query: Dict[str, List[str]],
+               body: Optional[Dict[str, Any]], authorization: Optional[str]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Answer one API request.
+
+        Returns:
+            (HTTP status, JSON body)
+        """
+        if self.latency:
+            time.sleep(self.latency)
+
+        parts = [unquote(part) for part in path.strip('/').split('/')]
+        try:
+            if not authorization or not authorization.startswith('Bearer ') or (
+                    self.api_key is not None and authorization != f'Bearer {self.api_key}'):
+                raise AirtableStubError(401, 'AUTHENTICATION_REQUIRED', 'Authentication required')
+
+            if len(parts) == 5 and parts[:3] == ['v0', 'meta', 'bases'] and parts[4] == 'tables':
+                base_id = parts[3]
+            elif len(parts) >= 3 and parts[0] == 'v0':
+                base_id = parts[1]
+            else:
+                raise AirtableStubError(404, 'NOT_FOUND', 'Could not find what you are looking for')
+
+            with self._lock:
+                self.request_count += 1
+                self.requests_by_method[method] = self.requests_by_method.get(method, 0) + 1
+                self._throttle(base_id)
+                return 200, self._route(method, parts, query, body or {})
+
+        except AirtableStubError as e:
+            if e.status == 429:
+                return 429, {'errors': [{'error': e.error_type, 'message': e.message}]}
+            return e.status, {'error': {'type': e.error_type, 'message': e.message}}
+
+    # -- internals (called with the lock held) ---------------------------------
+
+    def _throttle(self, base_id: str) -> None:
+        if not self.requests_per_second:
+            return
+
+        now = time.monotonic()
+        if now < self._blocked_until.get(base_id, 0):
+            self.throttled_count += 1
+            raise AirtableStubError(429, 'RATE_LIMIT_REACHED', 'Rate limit exceeded. Please try again later')
+
+        window = self._windows.setdefault(base_id, deque())
+        while window and window[0] <= now - 1.0:
+            window.popleft()
+
+        if len(window) >= self.requests_per_second:
+            self.throttled_count += 1
+            if self.throttle_penalty:
+                self._blocked_until[base_id] = now + self.throttle_penalty
+            raise AirtableStubError(429, 'RATE_LIMIT_REACHED', 'Rate limit exceeded. Please try again later')
+
+        window.append(now)
+
+    def _table(self, base_id: str, table_name: str) -> _Table:
+        key = (base_id, table_name)
+        if key not in self._tables:
+            self._tables[key] = _Table(table_name)
+        return self._tables[key]
+
+    def _new_id(self) -> str:
+        number, digits = next(self._ids), ''
+        while number:
+            number, digit = divmod(number, 62)
+            digits = _BASE62[digit] + digits
+        return 'rec' + digits.rjust(14, '0')
+
+    def _insert(self, table: _Table, fields: Dict[str, Any],
+                timestamp: Optional[datetime.datetime] = None) -> str:
+        table.check_fields(fields)
+        timestamp = timestamp or _now()
+        record_id = self._new_id()
+        table.records[record_id] = {
+            'id': record_id,
+            'created': timestamp,
+            'modified': timestamp,
+            'fields': {name: value for name, value in fields.items() if not _is_empty(value)},
+        }
+        table.seen_fields.update(dict.fromkeys(fields))
+        return record_id
+
+    def _update(self, table: _Table, record_id: str, fields: Dict[str, Any], replace: bool = False) -> Dict[str, Any]:
+        record = table.records.get(record_id)
+        if record is None:
+            raise AirtableStubError(404, 'NOT_FOUND', f'Record not found: {record_id}')
+        table.check_fields(fields)
+
+        stored = {} if replace else dict(record['fields'])
+        for name, value in fields.items():
+            if _is_empty(value):
+                stored.pop(name, None)
+            else:
+                stored[name] = value
+        record['fields'] = stored
+        record['modified'] = _now()
+        table.seen_fields.update(dict.fromkeys(fields))
+        return record
+
+    @staticmethod
+    def _render(record: Dict[str, Any], field_names: Optional[List[str]] = None) -> Dict[str, Any]:
+        fields = record['fields']
+        if field_names is not None:
+            fields = {name: fields[name] for name in field_names if name in fields}
+        return {'id': record['id'], 'createdTime': _format_time(record['created']), 'fields': dict(fields)}
+
+    def _route(self, method: str, parts: List[str], query: Dict[str, List[str]],
+               body: Dict[str, Any]) -> Dict[str, Any]:
+        if parts[1] == 'meta':
+            if method != 'GET':
+                raise AirtableStubError(404, 'NOT_FOUND', 'Could not find what you are looking for')
+            return self._schema(parts[3])
+
+        base_id, table_name = parts[1], parts[2]
+        table = self._table(base_id, table_name)
+
+        if len(parts) == 3:
+            if method == 'GET':
+                return self._list(table, self._list_options(query))
+            if method == 'POST':
+                return self._create(table, body)
+            if method in ('PATCH', 'PUT'):
+                return self._batch_update(table, body, replace=method == 'PUT')
+        elif len(parts) == 4 and parts[3] == 'listRecords' and method == 'POST':
+            return self._list(table, body)
+        elif len(parts) == 4:
+            record_id = parts[3]
+            if method == 'GET':
+                record = table.records.get(record_id)
+                if record is None:
+                    raise AirtableStubError(404, 'NOT_FOUND', f'Record not found: {record_id}')
+                return self._render(record)
+            if method in ('PATCH', 'PUT'):
+                return self._render(self._update(table, record_id, body.get('fields', {}), replace=method == 'PUT'))
+
+        raise AirtableStubError(404, 'NOT_FOUND', 'Could not find what you are looking for')
+
+    @staticmethod
+    def _list_options(query: Dict[str, List[str]]) -> Dict[str, Any]:
+        options: Dict[str, Any] = {name: values[-1] for name, values in query.items()}
+        fields = query.get('fields[]') or query.get('fields')
+        if fields:
+            options['fields'] = fields
+        return options
+
+    def _list(self, table: _Table, options: Dict[str, Any]) -> Dict[str, Any]:
+        page_size = int(options.get('pageSize') or MAX_PAGE_SIZE)
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise AirtableStubError(422, 'INVALID_PAGE_SIZE', f'pageSize must be between 1 and {MAX_PAGE_SIZE}')
+
+        offset = options.get('offset')
+        if offset:
+            iterator_id, _, position = str(offset).partition('/')
+            if iterator_id not in self._iterators:
+                raise AirtableStubError(422, 'LIST_RECORDS_ITERATOR_NOT_AVAILABLE', 'Iterator not available')
+            matches, field_names = self._iterators[iterator_id]
+            start = int(position or 0)
+        else:
+            formula = options.get('filterByFormula')
+            if formula:
+                predicate, referenced = compile_formula(formula)
+                table.check_fields(referenced)
+                matches = [record_id for record_id, record in table.records.items() if predicate(record)]
+            else:
+                matches = list(table.records)
+
+            max_records = options.get('maxRecords')
+            if max_records:
+                matches = matches[:int(max_records)]
+
+            field_names = options.get('fields')
+            iterator_id = f"itr{next(self._iterator_ids)}"
+            start = 0
+
+        page = [table.records[record_id] for record_id in matches[start:start + page_size]
+                if record_id in table.records]
+        response: Dict[str, Any] = {'records': [self._render(record, field_names) for record in page]}
+
+        if start + page_size < len(matches):
+            # Snapshot the match list so later pages do not re-run the formula
+            self._iterators[iterator_id] = (matches, field_names)
+            self._iterators.move_to_end(iterator_id)
+            while len(self._iterators) > MAX_OPEN_ITERATORS:
+                self._iterators.popitem(last=False)
+            response['offset'] = f"{iterator_id}/{start + page_size}"
+        else:
+            self._iterators.pop(iterator_id, None)
+
+        return response
+
+    def _create(self, table: _Table, body: Dict[str, Any]) -> Dict[str, Any]:
+        if 'records' not in body:
+            return self._render(table.records[self._insert(table, body.get('fields', {}))])
+
+        records = body['records']
+        if not 1 <= len(records) <= MAX_BATCH_SIZE:
+            raise AirtableStubError(422, 'INVALID_RECORDS', f'Between 1 and {MAX_BATCH_SIZE} records per request')
+        for record in records:
+            table.check_fields(record.get('fields', {}))
+
+        record_ids = [self._insert(table, record.get('fields', {})) for record in records]
+        return {'records': [self._render(table.records[record_id]) for record_id in record_ids]}
+
+    def _batch_update(self, table: _Table, body: Dict[str, Any], replace: bool) -> Dict[str, Any]:
+        records = body.get('records', [])
+        if not 1 <= len(records) <= MAX_BATCH_SIZE:
+            raise AirtableStubError(422, 'INVALID_RECORDS', f'Between 1 and {MAX_BATCH_SIZE} records per request')
+        for record in records:
+            if record.get('id') not in table.records:
+                raise AirtableStubError(422, 'ROW_DOES_NOT_EXIST', f"Record not found: {record.get('id')}")
+            table.check_fields(record.get('fields', {}))
+
+        updated = [self._update(table, record['id'], record.get('fields', {}), replace) for record in records]
+        return {'records': [self._render(record) for record in updated]}
+
+    def _schema(self, base_id: str) -> Dict[str, Any]:
+        tables = []
+        for (table_base, table_name), table in self._tables.items():
+            if table_base != base_id:
+                continue
+            names = sorted(table.field_names) if table.field_names is not None else list(table.seen_fields)
+            fields = [{'id': f"fld{index:014d}", 'name': name, 'type': 'singleLineText'}
+                      for index, name in enumerate(names, 1)]
+            tables.append({
+                'id': f"tbl{len(tables) + 1:014d}",
+                'name': table_name,
+                'primaryFieldId': fields[0]['id'] if fields else None,
+                'fields': fields,
+            })
+        return {'tables': tables}
+
+
+# ---------------------------------------------------------------------------
+# HTTP server
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _dispatch(self, method: str) -> None:
+        parsed = urlparse(self.path)
+        body = None
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            try:
+                body = json.loads(self.rfile.read(length))
+            except ValueError:
+                self._respond(422, {'error': {'type': 'INVALID_REQUEST_BODY', 'message': 'Invalid JSON'}})
+                return
+
+        status, payload = self.server.stub.handle(
+            method, parsed.path, parse_qs(parsed.query), body, self.headers.get('Authorization')
+        )
+        self._respond(status, payload)
+
+    def _respond(self, status: int, payload: Dict[str, Any]) -> None:
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PATCH(self):
+        self._dispatch('PATCH')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def log_message(self, format, *args):
+        pass
+
+
+class AirtableStubServer:
+    """Runs an AirtableStub behind a local HTTP server on a background thread."""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, stub: Optional[AirtableStub] = None, **options):
+        """
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one)
+            stub: Stub to serve (created from options if None)
+            **options: AirtableStub arguments (requests_per_second, latency, ...)
+        """
+        self.stub = stub or AirtableStub(**options)
+        self._server = ThreadingHTTPServer((host, port), _StubRequestHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self.stub
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Endpoint URL to configure clients with."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'AirtableStubServer':
+        """Start serving in a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name='airtable-stub', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> 'AirtableStubServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Local Airtable stand-in server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--requests-per-second', type=float, default=DEFAULT_REQUESTS_PER_SECOND,
+                        help='Requests per base per second before 429s (0 disables throttling)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Latency added to every response')
+    parser.add_argument('--throttle-penalty', type=float, default=0.0,
+                        help='Seconds a base stays blocked after a 429 (Airtable uses 30)')
+    args = parser.parse_args()
+
+    server = AirtableStubServer(args.host, args.port, requests_per_second=args.requests_per_second,
+                                latency=args.latency_ms / 1000.0, throttle_penalty=args.throttle_penalty)
+    print(f"Airtable stub listening on {server.url} (set AIRTABLE_ENDPOINT_URL={server.url})")
+    server.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,397 @@
+"""
+Shared Airtable HTTP transport.
+
+Airtable allows 5 requests per second per base. Every agent, sync job and
+script that talks to the same base goes through this transport so that
+together they stay under that limit instead of each throttling on its own:
+
+- a token bucket stored in a small SQLite file, shared by all processes
+  on the machine (one bucket per base)
+- a bounded number of concurrent in-flight requests per process
+- 429/5xx handling that honours Retry-After and pauses every process
+  using the bucket, not just the one that was throttled
+- POST (record creation) is only retried when it cannot have reached
+  Airtable: connect timeouts and 429s. Other failures may have created the
+  records, and repeating the request would create duplicates
+- one keep-alive requests.Session per base
+
+The outreach system (shared/airtable_transport.py) and the lead scraper
+(sync/airtable_transport.py) each ship an identical copy of this module so
+that either can be deployed on its own. Both copies default to the same
+limiter database, so their requests still share one budget. Change both
+files together; test_airtable_transport.py in the outreach system fails
+when they differ.
+
+Usage:
+    transport = get_airtable_transport(api_key, base_id)
+    response = transport.get(transport.table_url('Leads'), params={'pageSize': 100})
+
+    # pyairtable clients
+    api = transport.attach(Api(api_key, retry_strategy=None, endpoint_url=transport.endpoint_url))
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENDPOINT_URL = "https://api.airtable.com"
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+DEFAULT_MAX_IN_FLIGHT = 4
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_CONNECT_RETRIES = 2
+DEFAULT_TIMEOUT = 30
+MAX_BACKOFF_SECONDS = 30.0
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# PATCH sets field values (upserts match on merge fields), so repeating it converges
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"})
+
+
+def default_limiter_path() -> str:
+    """Location of the shared limiter database (AIRTABLE_RATE_LIMIT_DB overrides it)."""
+    return os.getenv(
+        "AIRTABLE_RATE_LIMIT_DB",
+        os.path.join(tempfile.gettempdir(), "4runr_airtable_rate_limit.db")
+    )
+
+
+class TokenBucketLimiter:
+    """
+    Token bucket shared between processes through a SQLite file.
+
+    Each acquire takes one token inside a BEGIN IMMEDIATE transaction, so
+    concurrent processes serialize on the row for a few microseconds and
+    then sleep outside the lock until a token is available.
+    """
+
+    def __init__(self, key: str, rate: float = DEFAULT_REQUESTS_PER_SECOND,
+                 capacity: Optional[float] = None, db_path: Optional[str] = None):
+        """
+        Args:
+            key: Bucket name (the Airtable base ID)
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to rate)
+            db_path: Limiter database (defaults to default_limiter_path())
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.key = key
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.db_path = db_path or default_limiter_path()
+        self._local = threading.local()
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def _ensure_schema(self) -> None:
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._connect()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS token_buckets (
+                key TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                blocked_until REAL NOT NULL DEFAULT 0
+            )
+        """)
+        conn.execute(
+            "INSERT OR IGNORE INTO token_buckets (key, tokens, updated_at) VALUES (?, ?, ?)",
+            (self.key, self.capacity, time.time())
+        )
+
+    def _try_acquire(self) -> float:
+        """Take a token if one is available; otherwise return how long to wait."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated_at, blocked_until FROM token_buckets WHERE key = ?",
+                (self.key,)
+            ).fetchone()
+            now = time.time()
+            if row is None:
+                tokens, blocked_until = self.capacity, 0.0
+            else:
+                tokens, updated_at, blocked_until = row
+                tokens = min(self.capacity, tokens + max(0.0, now - updated_at) * self.rate)
+
+            if now < blocked_until:
+                wait = blocked_until - now
+            elif tokens >= 1.0:
+                tokens -= 1.0
+                wait = 0.0
+            else:
+                wait = (1.0 - tokens) / self.rate
+
+            conn.execute(
+                "INSERT OR REPLACE INTO token_buckets (key, tokens, updated_at, blocked_until) "
+                "VALUES (?, ?, ?, ?)",
+                (self.key, tokens, now, blocked_until)
+            )
+            conn.execute("COMMIT")
+            return wait
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        Block until a token is available.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            TimeoutError: If no token became available within timeout
+        """
+        started = time.monotonic()
+        while True:
+            wait = self._try_acquire()
+            if wait <= 0:
+                return time.monotonic() - started
+            if timeout is not None and time.monotonic() - started + wait > timeout:
+                raise TimeoutError(f"No Airtable request token for '{self.key}' within {timeout}s")
+            time.sleep(wait)
+
+    def block_for(self, seconds: float) -> None:
+        """Pause every user of this bucket for the given number of seconds."""
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "UPDATE token_buckets SET tokens = 0, updated_at = ?, "
+                "blocked_until = max(blocked_until, ?) WHERE key = ?",
+                (now, now + seconds, self.key)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Parse a numeric Retry-After header."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class AirtableSession(requests.Session):
+    """
+    Keep-alive session that rate limits, bounds concurrency and retries.
+
+    Drop-in replacement for requests.Session. All limiting happens in send(),
+    which both request() and pyairtable (which sends prepared requests
+    itself) go through.
+    """
+
+    def __init__(self, limiter: TokenBucketLimiter, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                 max_retries: int = DEFAULT_MAX_RETRIES, connect_retries: int = DEFAULT_CONNECT_RETRIES,
+                 timeout: float = DEFAULT_TIMEOUT):
+        super().__init__()
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.connect_retries = min(connect_retries, max_retries)
+        self.timeout = timeout
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_in_flight)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        retry_after = _retry_after_seconds(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, MAX_BACKOFF_SECONDS)
+        return min(2 ** attempt, MAX_BACKOFF_SECONDS)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        method = request.method
+        idempotent = (method or "").upper() in IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            with self._in_flight:
+                self.limiter.acquire()
+                try:
+                    response = super().send(request, **kwargs)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    if attempt >= self.connect_retries:
+                        raise
+                    if not idempotent and not isinstance(e, requests.ConnectTimeout):
+                        # The request may have been received; retrying could repeat it
+                        raise
+                    delay = self._backoff(attempt)
+                    logger.warning(f"Airtable {method} failed ({e}); retrying in {delay:.1f}s")
+                    response = None
+
+            if response is not None:
+                if (response.status_code not in RETRYABLE_STATUS_CODES or attempt >= self.max_retries or
+                        (not idempotent and response.status_code != 429)):
+                    return response
+
+                delay = self._backoff(attempt, response)
+                logger.warning(
+                    f"Airtable {method} returned {response.status_code}; retrying in {delay:.1f}s"
+                )
+                response.close()
+                if response.status_code == 429:
+                    # Throttling applies to the whole base, so pause everyone
+                    self.limiter.block_for(delay)
+                    delay = 0
+
+            if delay:
+                time.sleep(delay)
+            attempt += 1
+
+
+class AirtableTransport:
+    """Rate-limited, concurrent HTTP access to one Airtable base."""
+
+    def __init__(self, api_key: str, base_id: str, *,
+                 endpoint_url: str = DEFAULT_ENDPOINT_URL,
+                 requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 limiter_path: Optional[str] = None):
+        """
+        Args:
+            api_key: Airtable API key or personal access token
+            base_id: Airtable base ID (also the rate limit bucket)
+            endpoint_url: API root URL
+            requests_per_second: Request budget shared by all processes
+            max_in_flight: Concurrent requests allowed from this process
+            max_retries: Retries for throttled, failed or timed out requests
+            limiter_path: Shared limiter database
+        """
+        self.api_key = api_key
+        self.base_id = base_id
+        self.endpoint_url = endpoint_url.rstrip("/")
+        self.max_in_flight = max_in_flight
+
+        self.limiter = TokenBucketLimiter(base_id, requests_per_second, db_path=limiter_path)
+        self.session = AirtableSession(self.limiter, max_in_flight=max_in_flight,
+                                       max_retries=max_retries)
+        self.session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        })
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def table_url(self, table_name: str, record_id: Optional[str] = None) -> str:
+        """URL of a table, or of one record in it."""
+        url = f"{self.endpoint_url}/v0/{self.base_id}/{quote(table_name)}"
+        return f"{url}/{record_id}" if record_id else url
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the shared limiter."""
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def map(self, func: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """
+        Run func over items on the transport's worker pool.
+
+        At most max_in_flight calls run at once; results keep the order of
+        items and the first exception raised by func is re-raised.
+        """
+        items = list(items)
+        if len(items) <= 1 or self.max_in_flight <= 1:
+            return [func(item) for item in items]
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_in_flight, thread_name_prefix="airtable"
+                )
+        return list(self._executor.map(func, items))
+
+    def attach(self, api):
+        """
+        Route a pyairtable Api through this transport.
+
+        Create the Api with retry_strategy=None; retries happen here.
+        """
+        api.session = self.session
+        return api
+
+    def close(self) -> None:
+        """Shut down the worker pool and close pooled connections."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        self.session.close()
+
+
+_transports: Dict[Tuple[str, str, str], AirtableTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_airtable_transport(api_key: str, base_id: str,
+                           endpoint_url: Optional[str] = None) -> AirtableTransport:
+    """
+    Get the process-wide transport for a base.
+
+    Limits come from AIRTABLE_REQUESTS_PER_SECOND, AIRTABLE_MAX_IN_FLIGHT and
+    AIRTABLE_RATE_LIMIT_DB when set.
+    """
+    endpoint_url = endpoint_url or DEFAULT_ENDPOINT_URL
+    key = (api_key, base_id, endpoint_url)
+
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            transport = AirtableTransport(
+                api_key, base_id,
+                endpoint_url=endpoint_url,
+                requests_per_second=float(os.getenv("AIRTABLE_REQUESTS_PER_SECOND", DEFAULT_REQUESTS_PER_SECOND)),
+                max_in_flight=int(os.getenv("AIRTABLE_MAX_IN_FLIGHT", DEFAULT_MAX_IN_FLIGHT)),
+                limiter_path=os.getenv("AIRTABLE_RATE_LIMIT_DB")
+            )
+            _transports[key] = transport
+        return transport
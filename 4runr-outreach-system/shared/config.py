@@ -38,7 +38,8 @@ class Config:
         return {
             'api_key': os.getenv('AIRTABLE_API_KEY'),
             'base_id': os.getenv('AIRTABLE_BASE_ID'),
-            'table_name': os.getenv('AIRTABLE_TABLE_NAME', 'Leads')
+            'table_name': os.getenv('AIRTABLE_TABLE_NAME', 'Leads'),
+            'endpoint_url': os.getenv('AIRTABLE_ENDPOINT_URL', 'https://api.airtable.com')
         }
     
     def get_ai_config(self) -> Dict[str, str]:
@@ -7,17 +7,50 @@ defensive error handling, and fallback mechanisms for 422 INVALID_FILTER_BY_FORM
 
 from __future__ import annotations
 import os
-import time
 import logging
 import urllib.parse as up
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from pyairtable import Api
 from pyairtable.formulas import match
 
+from shared.airtable_schema import get_airtable_schema_cache, is_unknown_field_error
+from shared.airtable_transport import get_airtable_transport
 from shared.config import get_airtable_config
 from shared.logging_utils import get_logger
 
 
+# Environment variable and default for each configurable field
+_FIELD_SETTINGS = {
+    'website': ("AIRTABLE_FIELD_WEBSITE", "Website"),
+    'company_description': ("AIRTABLE_FIELD_COMPANY_DESCRIPTION", "Company Description"),
+    'email': ("AIRTABLE_FIELD_EMAIL", "Email"),
+    'company_name': ("AIRTABLE_FIELD_COMPANY_NAME", "Company Name"),
+    'name': ("AIRTABLE_FIELD_NAME", "Name"),
+    'job_title': ("AIRTABLE_FIELD_JOB_TITLE", "Job Title"),
+    'email_confidence_level': ("AIRTABLE_FIELD_EMAIL_CONFIDENCE_LEVEL", "Email_Confidence_Level"),
+    'custom_message': ("AIRTABLE_FIELD_CUSTOM_MESSAGE", "Custom_Message"),
+    'engagement_status': ("AIRTABLE_FIELD_ENGAGEMENT_STATUS", "Engagement_Status"),
+    'date_messaged': ("AIRTABLE_FIELD_DATE_MESSAGED", "Date Messaged"),
+}
+
+
+@lru_cache(maxsize=None)
+def _configured_field_names() -> Dict[str, str]:
+    """Logical field names to Airtable field names, read from the environment once."""
+    return {logical_name: os.getenv(env_var, default)
+            for logical_name, (env_var, default) in _FIELD_SETTINGS.items()}
+
+
+@lru_cache(maxsize=None)
+def _formula_fields() -> Dict[str, str]:
+    """Field lookup used by the formula builders, including their aliases."""
+    fields = dict(_configured_field_names())
+    fields['ai_message'] = fields['custom_message']
+    fields['contacted'] = fields['engagement_status']  # Use engagement_status as contacted indicator
+    return fields
+
+
 class ConfigurableAirtableClient:
     """Configurable Airtable client with defensive error handling."""
     
@@ -26,39 +59,22 @@ class ConfigurableAirtableClient:
         self.logger = get_logger('airtable_client')
         self.config = get_airtable_config()
         
-        # Initialize API connection
-        self.api = Api(self.config['api_key'])
+        # Initialize API connection through the shared rate-limited transport
         self.base_id = self.config['base_id']
+        self.transport = get_airtable_transport(self.config['api_key'], self.base_id,
+                                                self.config.get('endpoint_url'))
+        self.api = self.transport.attach(Api(self.config['api_key'], retry_strategy=None,
+                                             endpoint_url=self.transport.endpoint_url))
         self.table_name = self.config['table_name']
         self.table = self.api.table(self.base_id, self.table_name)
         
-        # Load configurable field names from environment
-        self.field_website = os.getenv("AIRTABLE_FIELD_WEBSITE", "Website")
-        self.field_company_description = os.getenv("AIRTABLE_FIELD_COMPANY_DESCRIPTION", "Company Description")
-        self.field_email = os.getenv("AIRTABLE_FIELD_EMAIL", "Email")
-        self.field_company_name = os.getenv("AIRTABLE_FIELD_COMPANY_NAME", "Company Name")
-        self.field_name = os.getenv("AIRTABLE_FIELD_NAME", "Name")
-        self.field_job_title = os.getenv("AIRTABLE_FIELD_JOB_TITLE", "Job Title")
-        self.field_email_confidence_level = os.getenv("AIRTABLE_FIELD_EMAIL_CONFIDENCE_LEVEL", "Email_Confidence_Level")
-        self.field_custom_message = os.getenv("AIRTABLE_FIELD_CUSTOM_MESSAGE", "Custom_Message")
-        self.field_engagement_status = os.getenv("AIRTABLE_FIELD_ENGAGEMENT_STATUS", "Engagement_Status")
-        self.field_date_messaged = os.getenv("AIRTABLE_FIELD_DATE_MESSAGED", "Date Messaged")
-        
-        # Create field mapping dictionary for defensive formula building
-        self.fields = {
-            'website': self.field_website,
-            'company_description': self.field_company_description,
-            'email': self.field_email,
-            'company_name': self.field_company_name,
-            'name': self.field_name,
-            'job_title': self.field_job_title,
-            'email_confidence_level': self.field_email_confidence_level,
-            'ai_message': self.field_custom_message,
-            'custom_message': self.field_custom_message,
-            'engagement_status': self.field_engagement_status,
-            'contacted': self.field_engagement_status,  # Use engagement_status as contacted indicator
-            'date_messaged': self.field_date_messaged
-        }
+        # Field names come from the environment once per process
+        for logical_name, field_name in _configured_field_names().items():
+            setattr(self, f'field_{logical_name}', field_name)
+        self.fields = _formula_fields()
+        
+        # Shared, disk-backed schema so startup and error paths skip extra API calls
+        self.schema = get_airtable_schema_cache(self.transport)
         
         # Set default limit for record fetching
         self.default_limit = int(os.getenv("AIRTABLE_DEFAULT_LIMIT", "10"))
@@ -111,7 +127,7 @@ class ConfigurableAirtableClient:
             })
             
             # Log available field names for debugging
-            available_fields = self._get_available_field_names()
+            available_fields = self._get_available_field_names(e)
             self.logger.log_module_activity('airtable_client', 'system', 'info', {
                 'message': 'Available field names for debugging',
                 'available_fields': available_fields
@@ -140,7 +156,7 @@ class ConfigurableAirtableClient:
                 'message': f'Both primary and fallback filters failed',
                 'primary_error': str(e) if 'e' in locals() else 'unknown',
                 'fallback_error': str(fallback_error),
-                'available_fields': self._get_available_field_names()
+                'available_fields': self._get_available_field_names(fallback_error)
             })
             return []
     
@@ -175,7 +191,7 @@ class ConfigurableAirtableClient:
         except Exception as e:
             self.logger.log_module_activity('airtable_client', 'system', 'warning', {
                 'message': f'Message generation filter failed: {str(e)}',
-                'available_fields': self._get_available_field_names()
+                'available_fields': self._get_available_field_names(e)
             })
         
         # Fallback - get leads with company descriptions
@@ -233,7 +249,7 @@ class ConfigurableAirtableClient:
         except Exception as e:
             self.logger.log_module_activity('airtable_client', 'system', 'warning', {
                 'message': f'Engagement filter failed: {str(e)}',
-                'available_fields': self._get_available_field_names()
+                'available_fields': self._get_available_field_names(e)
             })
         
         # Fallback - get leads with emails
@@ -262,42 +278,35 @@ class ConfigurableAirtableClient:
     
     def update_lead_fields(self, lead_id: str, fields: Dict[str, Any], max_retries: int = 3) -> bool:
         """
-        Update specific fields for a lead record with retry logic.
+        Update specific fields for a lead record.
+        
+        Throttled, failed and timed out requests are retried by the shared
+        transport, so an error raised here is final.
         
         Args:
             lead_id: Airtable record ID
             fields: Dictionary of fields to update
-            max_retries: Maximum number of retry attempts
+            max_retries: Unused; kept for backward compatibility
             
         Returns:
             True if successful, False otherwise
         """
-        for attempt in range(max_retries):
-            try:
-                self.table.update(lead_id, fields)
-                
-                self.logger.log_module_activity('airtable_client', lead_id, 'success', {
-                    'message': f'Updated lead fields: {list(fields.keys())}',
-                    'attempt': attempt + 1
-                })
-                
-                return True
-                
-            except Exception as e:
-                self.logger.log_module_activity('airtable_client', lead_id, 'warning', {
-                    'message': f'Update attempt {attempt + 1} failed: {str(e)}',
-                    'fields': list(fields.keys())
-                })
-                
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    self.logger.log_module_activity('airtable_client', lead_id, 'error', {
-                        'message': f'Failed to update lead after {max_retries} attempts',
-                        'final_error': str(e)
-                    })
-        
-        return False
+        try:
+            self.table.update(lead_id, fields)
+            
+            self.logger.log_module_activity('airtable_client', lead_id, 'success', {
+                'message': f'Updated lead fields: {list(fields.keys())}'
+            })
+            
+            return True
+            
+        except Exception as e:
+            self._invalidate_schema_if_unknown_field(e)
+            self.logger.log_module_activity('airtable_client', lead_id, 'error', {
+                'message': f'Failed to update lead: {str(e)}',
+                'fields': list(fields.keys())
+            })
+            return False
     
     def get_lead_by_id(self, lead_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -350,6 +359,7 @@ class ConfigurableAirtableClient:
             return record_id
             
         except Exception as e:
+            self._invalidate_schema_if_unknown_field(e)
             self.logger.log_module_activity('airtable_client', 'system', 'error', {
                 'message': f'Error creating lead record: {str(e)}',
                 'fields': list(fields.keys())
@@ -362,48 +372,35 @@ class ConfigurableAirtableClient:
         
         Args:
             updates: List of update dictionaries with 'id' and 'fields' keys
-            max_retries: Maximum number of retry attempts
+            max_retries: Unused; retries are handled by the shared transport
             
         Returns:
             Number of successfully updated records
         """
-        successful_updates = 0
-        
-        # Process in batches of 10 (Airtable API limit)
+        # Process in batches of 10 (Airtable API limit), several in flight at once
         batch_size = 10
-        for i in range(0, len(updates), batch_size):
-            batch = updates[i:i + batch_size]
-            
-            for attempt in range(max_retries):
-                try:
-                    # Format for batch update
-                    batch_records = [
-                        {'id': update['id'], 'fields': update['fields']}
-                        for update in batch
-                    ]
-                    
-                    self.table.batch_update(batch_records)
-                    successful_updates += len(batch)
-                    
-                    self.logger.log_module_activity('airtable_client', 'system', 'success', {
-                        'message': f'Batch updated {len(batch)} leads',
-                        'attempt': attempt + 1
-                    })
-                    
-                    break
-                    
-                except Exception as e:
-                    self.logger.log_module_activity('airtable_client', 'system', 'warning', {
-                        'message': f'Batch update attempt {attempt + 1} failed: {str(e)}',
-                        'batch_size': len(batch)
-                    })
-                    
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                    else:
-                        self.logger.log_module_activity('airtable_client', 'system', 'error', {
-                            'message': f'Failed to batch update {len(batch)} leads after {max_retries} attempts'
-                        })
+        batches = [updates[i:i + batch_size] for i in range(0, len(updates), batch_size)]
+        
+        def update_batch(batch: List[Dict[str, Any]]) -> int:
+            try:
+                self.table.batch_update([
+                    {'id': update['id'], 'fields': update['fields']}
+                    for update in batch
+                ])
+                
+                self.logger.log_module_activity('airtable_client', 'system', 'success', {
+                    'message': f'Batch updated {len(batch)} leads'
+                })
+                return len(batch)
+                
+            except Exception as e:
+                self._invalidate_schema_if_unknown_field(e)
+                self.logger.log_module_activity('airtable_client', 'system', 'error', {
+                    'message': f'Failed to batch update {len(batch)} leads: {str(e)}'
+                })
+                return 0
+        
+        successful_updates = sum(self.transport.map(update_batch, batches))
         
         self.logger.log_module_activity('airtable_client', 'system', 'info', {
             'message': f'Batch update completed: {successful_updates}/{len(updates)} successful'
@@ -499,7 +496,7 @@ class ConfigurableAirtableClient:
                 'message': 'Airtable fetch failed',
                 'error': str(e),
                 'kwargs': kwargs,
-                'available_fields': self._get_available_field_names()
+                'available_fields': self._get_available_field_names(e)
             })
             return []
     
@@ -586,22 +583,42 @@ class ConfigurableAirtableClient:
         
         return leads
     
-    def _get_available_field_names(self) -> List[str]:
+    def get_available_field_names(self, refresh: bool = False) -> List[str]:
+        """
+        Get the table's field names from the shared schema cache.
+        
+        Args:
+            refresh: Fetch the schema even if a cached copy is still valid
+            
+        Returns:
+            List of field names
+        """
+        return self.schema.get_field_names(self.table_name, refresh=refresh)
+    
+    def _invalidate_schema_if_unknown_field(self, error: Exception) -> None:
+        """Drop the cached schema when a request failed on a field the table does not have."""
+        if is_unknown_field_error(error):
+            self.schema.invalidate(self.table_name)
+    
+    def _get_available_field_names(self, error: Optional[Exception] = None) -> List[str]:
         """
-        Get available field names from a sample record for debugging.
+        Get available field names for debugging a failed request.
         
+        A failure caused by an unknown field invalidates the cached schema
+        first, so the names logged (and later lookups) are current.
+        
+        Args:
+            error: The exception the request failed with, if any
+            
         Returns:
             List of available field names or error message
         """
+        if error is not None:
+            self._invalidate_schema_if_unknown_field(error)
+        
         try:
-            records = self.table.all(max_records=1)
-            records_list = list(records)
-            
-            if records_list:
-                return list(records_list[0]['fields'].keys())
-            else:
-                return ["No records available to determine field names"]
-                
+            field_names = self.get_available_field_names()
+            return field_names or ["No fields available to determine field names"]
         except Exception as e:
             return [f"Unable to retrieve field names: {str(e)}"]
     
@@ -612,18 +629,7 @@ class ConfigurableAirtableClient:
         Returns:
             Dictionary of logical field names to Airtable field names
         """
-        return {
-            'website': self.field_website,
-            'company_description': self.field_company_description,
-            'email': self.field_email,
-            'company_name': self.field_company_name,
-            'name': self.field_name,
-            'job_title': self.field_job_title,
-            'email_confidence_level': self.field_email_confidence_level,
-            'custom_message': self.field_custom_message,
-            'engagement_status': self.field_engagement_status,
-            'date_messaged': self.field_date_messaged
-        }
+        return dict(_configured_field_names())
 
 
 # Global client instance
@@ -11,13 +11,20 @@ import re
 import os
 import yaml
 import json
+import hashlib
+import sqlite3
 import datetime
+import itertools
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta
-from typing import Dict, Any, List, Optional, Union
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
+from dataclasses import dataclass, asdict, astuple
 from pathlib import Path
 
-from .logging_utils import get_logger
+from .logging_utils import JSON_LOG_SUFFIX, append_json_log, get_logger
+from .streaming_stats import Histogram, RunningStats, TopKCounter
 
 
 @dataclass
@@ -66,19 +73,458 @@ class CleaningResult:
     processing_time: float
 
 
+# Substitutions fused under one guard pattern
+RULES_PER_GUARD = 8
+
+# Patterns that cannot be searched as part of an alternation: backreferences
+# and conditionals depend on group numbers, global inline flags on position
+_UNFUSABLE_PATTERN = re.compile(r'\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)')
+
+# Records sent to a worker process at a time by DataCleaner.clean_and_validate_many
+BATCH_CHUNK_SIZE = 100
+
+# Most recent entries of each audit log kept in memory by AuditLogger
+AUDIT_RING_SIZE = 1000
+AUDIT_REPORTS_KEPT = 20
+
+# Distinct cleaning rules and validation errors counted by AuditLogger
+AUDIT_TOP_K = 100
+
+# Upper bucket edges of the AuditLogger histograms
+CONFIDENCE_BUCKETS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+PROCESSING_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Rule files watched for changes by ConfigurationManager
+RULE_FILES = ('cleaning_rules.yaml', 'validation_rules.yaml')
+
+# Seconds between checks of the ConfigurationManager watcher thread
+CONFIG_WATCH_INTERVAL = 1.0
+
+# Cleaned values and validation results kept in memory by CleaningResultCache
+# (DATA_CLEANER_CACHE_SIZE overrides it, 0 disables the cache)
+DEFAULT_RESULT_CACHE_SIZE = 10000
+
+_SCOPED_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+
+class CompiledRuleGroup:
+    """
+    A sequence of regex substitutions, compiled once and applied in order.
+
+    Consecutive substitutions are fused into one alternation that is searched
+    first: if none of their patterns matches, none of them can change the text,
+    so they are skipped with a single pass instead of one re.sub each. Results
+    are always the same as applying every substitution in turn.
+    """
+
+    def __init__(self, rules: List[Tuple[str, str, int]]):
+        """
+        Compile a rule group.
+
+        Args:
+            rules: (pattern, replacement, flags) substitutions in application order
+
+        Raises:
+            re.error: If a pattern is invalid
+        """
+        self.chunks = []
+        for start in range(0, len(rules), RULES_PER_GUARD):
+            chunk = rules[start:start + RULES_PER_GUARD]
+            compiled = [(re.compile(pattern, flags), replacement) for pattern, replacement, flags in chunk]
+            self.chunks.append((self._fuse(chunk), compiled))
+
+    @staticmethod
+    def _fuse(rules: List[Tuple[str, str, int]]) -> Optional[re.Pattern]:
+        """Alternation matching wherever any of the patterns matches (None if they cannot be fused)."""
+        alternatives = []
+        for pattern, _, flags in rules:
+            if _UNFUSABLE_PATTERN.search(pattern) or flags & ~(re.IGNORECASE | re.MULTILINE | re.DOTALL):
+                return None
+            letters = ''.join(letter for flag, letter in _SCOPED_FLAGS if flags & flag)
+            alternatives.append(f'(?{letters}:{pattern})')
+
+        try:
+            return re.compile('|'.join(alternatives))
+        except re.error:
+            return None
+
+    def apply(self, text: str) -> str:
+        """Apply every substitution in order."""
+        for guard, compiled in self.chunks:
+            if guard is not None and not guard.search(text):
+                continue
+            for pattern, replacement in compiled:
+                text = pattern.sub(replacement, text)
+        return text
+
+
+def _literal_alternation(literals: List[str]) -> Optional[re.Pattern]:
+    """Pattern matching any of some substrings (None if there are none)."""
+    if not literals:
+        return None
+    return re.compile('|'.join(re.escape(literal) for literal in literals))
+
+
+def _first_contained(text: str, literals: List[str], alternation: Optional[re.Pattern]) -> Optional[int]:
+    """Index of the first of some substrings, in list order, that the text contains."""
+    if alternation is None or not alternation.search(text):
+        return None
+    return next(index for index, literal in enumerate(literals) if literal in text)
+
+
+# Rule sets built into CleaningRulesEngine, compiled once at import
+
+# Search artifacts removed after those from the configuration
+_SEARCH_ARTIFACT_RULES = [
+    # Additional aggressive search artifact removal
+    (r'Showing results for\s*', '', re.IGNORECASE),
+    (r'Search results for\s*', '', re.IGNORECASE),
+    (r'Results for\s*', '', re.IGNORECASE),
+    (r'About.*?results for\s*', '', re.IGNORECASE),  # More aggressive "About X results for" removal
+
+    # Remove common Google search navigation elements
+    (r'About \d{1,3}(,\d{3})* results', '', re.IGNORECASE),
+    (r'Search instead for.*', '', re.IGNORECASE),
+    (r'Did you mean:.*', '', re.IGNORECASE),
+    (r'Showing results for.*', '', re.IGNORECASE),
+    (r'No results found for.*', '', re.IGNORECASE),
+    (r'Learn more Next', '', re.IGNORECASE),
+    (r'Previous.*Next', '', re.IGNORECASE),
+    (r'Page \d+ of \d+', '', re.IGNORECASE),
+    (r'More results', '', re.IGNORECASE),
+    (r'Related searches', '', re.IGNORECASE),
+    (r'People also ask', '', re.IGNORECASE),
+    (r'Videos.*Images.*News.*Shopping', '', re.IGNORECASE),
+    (r'Cached.*Similar.*', '', re.IGNORECASE),
+    (r'More from.*', '', re.IGNORECASE),
+    (r'Jump to.*', '', re.IGNORECASE),
+    (r'See results about.*', '', re.IGNORECASE),
+
+    # Remove specific garbage patterns that appear in real data
+    (r'Sirius XM.*', '', re.IGNORECASE | re.DOTALL),  # Remove anything starting with "Sirius XM"
+    (r'Some results may have been delisted.*', '', re.IGNORECASE | re.DOTALL),
+    (r'consistent with local laws.*', '', re.IGNORECASE | re.DOTALL),
+    (r'\.{3,}.*?Next', '', re.IGNORECASE | re.DOTALL),  # Multiple dots followed by Next
+    (r'and\s*\.{3,}.*?Next', '', re.IGNORECASE | re.DOTALL),  # "and ..." patterns
+    (r'and\s*\.{3,}.*', '', re.IGNORECASE | re.DOTALL),  # "and ..." at end of text
+    (r'Learn more.*', '', re.IGNORECASE | re.DOTALL),  # Remove anything starting with "Learn more"
+]
+
+_HTML_TAG_RULES = CompiledRuleGroup([
+    # Remove script and style tags with their content
+    (r'<script[^>]*>.*?</script>', '', re.IGNORECASE | re.DOTALL),
+    (r'<style[^>]*>.*?</style>', '', re.IGNORECASE | re.DOTALL),
+
+    # Remove HTML comments
+    (r'<!--.*?-->', '', re.DOTALL),
+
+    # Remove all HTML tags (including malformed ones)
+    (r'<[^>]*>', '', 0),
+    (r'<[^>]*$', '', 0),  # Handle incomplete tags at end
+    (r'^[^<]*>', '', 0),  # Handle incomplete tags at start
+])
+
+# Remove any remaining HTML entities (numeric and named)
+_HTML_ENTITY_RULES = CompiledRuleGroup([
+    (r'&#\d+;', '', 0),  # Numeric entities
+    (r'&#x[0-9a-fA-F]+;', '', 0),  # Hex entities
+    (r'&[a-zA-Z][a-zA-Z0-9]*;', '', 0),  # Named entities
+])
+
+# Remove CSS remnants
+_CSS_RULES = CompiledRuleGroup([
+    (r'style\s*=\s*["\'][^"\']*["\']', '', re.IGNORECASE),
+    (r'class\s*=\s*["\'][^"\']*["\']', '', re.IGNORECASE),
+])
+
+# Remove control characters (except newlines and tabs which we'll handle separately),
+# zero-width characters and other invisible Unicode characters
+_INVISIBLE_CHARACTERS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f\u200b-\u200d\ufeff\u2060\u180e]')
+
+_WHITESPACE = re.compile(r'\s+')
+
+_SEARCH_PREFIX_RULES = CompiledRuleGroup([(pattern, '', re.IGNORECASE) for pattern in [
+    r'^About \d{1,3}(,\d{3})* results for\s*',
+    r'^Search results for\s*',
+    r'^Results for\s*',
+    r'^Showing results for\s*',
+    r'^\d+ results for\s*',
+    r'^.*results for\s*',
+    r'^for\s+',  # Remove standalone "for" at beginning
+]])
+
+_TRAILING_GARBAGE_RULES = CompiledRuleGroup([(pattern, '', re.IGNORECASE) for pattern in [
+    r'\s*Learn more.*$',
+    r'\s*Next$',
+    r'\s*More results.*$',
+    r'\s*Related searches.*$',
+    r'\s*People also ask.*$',
+    r'\s*\.\.\.$',  # Trailing ellipsis
+]])
+
+# Remove common prefixes that shouldn't be part of company names
+_UNWANTED_PREFIX_RULES = CompiledRuleGroup([(pattern, '', re.IGNORECASE) for pattern in [
+    r'^for\s+',  # "for TechCorp Inc"
+    r'^about\s+',  # "about TechCorp Inc"
+    r'^the\s+results?\s+for\s+',  # "the results for TechCorp"
+]])
+
+# Fix common OCR/parsing errors in company names
+_OCR_FIX_RULES = CompiledRuleGroup([(pattern, replacement, re.IGNORECASE) for pattern, replacement in [
+    (r'\bl+c\b', 'LLC'),  # "llc" -> "LLC"
+    (r'\binc\b', 'Inc'),  # "inc" -> "Inc"
+    (r'\bcorp\b', 'Corp'),  # "corp" -> "Corp"
+    (r'\bltd\b', 'Ltd'),  # "ltd" -> "Ltd"
+]])
+
+# Remaining garbage indicators that reject a cleaned company name
+_GARBAGE_INDICATORS = ['google', 'search', 'results', 'linkedin', 'facebook', 'www.', 'http', '.com', 'company/']
+_GARBAGE_INDICATOR_PATTERN = _literal_alternation(_GARBAGE_INDICATORS)
+
+_URL_LIKE = re.compile(r'^[a-z]+://.*')
+
+_DOMAIN_MATCHES = re.compile(r'https?://([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})')
+_DOMAIN_MATCH = re.compile(r'\b([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b')
+_DOMAIN_FORMAT = re.compile(r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+_SUSPICIOUS_DOMAIN_PATTERN = re.compile('|'.join([
+    r'\.\.+',  # Multiple consecutive dots
+    r'^-',     # Starting with dash
+    r'-\.',    # Ending with dash before TLD
+    r'--',     # Double dashes
+]))
+
+_IP_ADDRESS = re.compile(r'^\d+\.\d+\.\d+\.\d+')
+
+
+def _rules_version(rules: Dict[str, Any]) -> str:
+    """Hash identifying a rules configuration."""
+    return hashlib.md5(json.dumps(rules, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class CleaningProgram:
+    """
+    Cleaning rules from cleaning_rules.yaml compiled into rule groups.
+
+    Compiled once per load of the rules. The version stamp identifies the rules
+    a program was built from; CleaningRulesEngine swaps whole programs, so a
+    value is never cleaned with a mix of old and new rules.
+    """
+
+    def __init__(self, rules: Dict[str, Any]):
+        """
+        Compile cleaning rules.
+
+        Args:
+            rules: Cleaning rules configuration dictionary
+
+        Raises:
+            re.error: If a pattern is invalid
+        """
+        self.rules = rules
+        self.version = _rules_version(rules)
+
+        artifacts = rules.get('search_artifacts', {}).get('remove_patterns', [])
+        self.search_artifacts = CompiledRuleGroup(
+            [(pattern, '', re.IGNORECASE | re.MULTILINE) for pattern in artifacts] + _SEARCH_ARTIFACT_RULES
+        )
+
+        company_rules = rules.get('company_name', {})
+        self.company_remove = CompiledRuleGroup(
+            [(pattern, '', re.IGNORECASE) for pattern in company_rules.get('remove_patterns', [])]
+        )
+        self.company_normalize = CompiledRuleGroup([
+            (pattern_config.get('pattern', ''), pattern_config.get('replacement', ''), re.IGNORECASE)
+            for pattern_config in company_rules.get('normalize_patterns', [])
+            if pattern_config.get('pattern', '') and pattern_config.get('replacement', '')
+        ])
+
+        self.invalid_domains = list(rules.get('website_url', {}).get('remove_patterns', []))
+        self.invalid_domains_lower = [pattern.lower() for pattern in self.invalid_domains]
+        self.invalid_domain_pattern = _literal_alternation(self.invalid_domains_lower)
+
+
+class CleaningResultCache:
+    """
+    Bounded LRU cache of cleaned values and validation results.
+    
+    Entries are keyed on (field, raw value, rule version), where the version
+    identifies the rules the engine computed the result with, so an engine
+    still on earlier rules never stores results under the new version.
+    ConfigurationManager drops the entries of other versions whenever rules
+    are loaded, updated, reloaded or restored. With a db_path, results are
+    also written to SQLite so they survive restarts and are shared between
+    processes running the same rules.
+    """
+    
+    def __init__(self, max_entries: int = DEFAULT_RESULT_CACHE_SIZE, db_path: Optional[str] = None):
+        """
+        Args:
+            max_entries: Entries kept in memory
+            db_path: SQLite database for persisted results (memory only if not given)
+        """
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        
+        if db_path:
+            self._ensure_schema()
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            # Losing the last writes on a crash only costs recomputing them
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=OFF')
+            self._local.conn = conn
+        return conn
+    
+    def _ensure_schema(self) -> None:
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._connect().execute("""
+            CREATE TABLE IF NOT EXISTS cleaning_results (
+                field TEXT NOT NULL,
+                raw_value TEXT NOT NULL,
+                rule_version TEXT NOT NULL,
+                result TEXT NOT NULL,
+                PRIMARY KEY (field, raw_value, rule_version)
+            )
+        """)
+    
+    def retain_versions(self, versions: Iterable[str]) -> None:
+        """
+        Drop the results of every rule version but the given ones.
+        
+        Args:
+            versions: Identifiers of the rules still in use
+        """
+        versions = set(versions)
+        with self._lock:
+            for key in [key for key in self._entries if key[2] not in versions]:
+                del self._entries[key]
+        
+        if self.db_path:
+            placeholders = ', '.join('?' for _ in versions)
+            self._connect().execute(
+                f"DELETE FROM cleaning_results WHERE rule_version NOT IN ({placeholders})", tuple(versions)
+            )
+    
+    def get(self, field: str, raw_value: str, version: str) -> Any:
+        """
+        Cached result for a raw value under some rules.
+        
+        Args:
+            field: Cleaning or validation step the result belongs to
+            raw_value: Input value
+            version: Identifier of the rules the result must come from
+        
+        Returns:
+            The stored result, or None on a miss
+        """
+        key = (field, raw_value, version)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+        
+        if self.db_path:
+            row = self._connect().execute(
+                "SELECT result FROM cleaning_results WHERE field = ? AND raw_value = ? AND rule_version = ?",
+                key
+            ).fetchone()
+            if row is not None:
+                result = json.loads(row[0])
+                self._remember(key, result)
+                with self._lock:
+                    self.hits += 1
+                return result
+        
+        with self._lock:
+            self.misses += 1
+        return None
+    
+    def put(self, field: str, raw_value: str, version: str, result: Any) -> None:
+        """
+        Store a result computed under some rules.
+        
+        Args:
+            field: Cleaning or validation step the result belongs to
+            raw_value: Input value
+            version: Identifier of the rules the result was computed with
+            result: JSON-serializable result
+        """
+        key = (field, raw_value, version)
+        self._remember(key, result)
+        
+        if self.db_path:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO cleaning_results (field, raw_value, rule_version, result) "
+                "VALUES (?, ?, ?, ?)",
+                key + (json.dumps(result),)
+            )
+    
+    def _remember(self, key: Tuple[str, str, str], result: Any) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit and miss counts of the cache."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / lookups) * 100 if lookups else 0.0,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries
+        }
+
+
 class CleaningRulesEngine:
     """Engine for applying text cleaning rules to remove artifacts and normalize data."""
     
-    def __init__(self, rules_config: Dict[str, Any]):
+    def __init__(self, rules_config: Dict[str, Any], program: Optional[CleaningProgram] = None,
+                 cache: Optional[CleaningResultCache] = None):
         """
         Initialize the cleaning rules engine.
         
         Args:
             rules_config: Configuration dictionary with cleaning rules
+            program: Rules already compiled from rules_config (compiled here if not given)
+            cache: Cache of cleaned values, keyed on the program version
         """
-        self.rules = rules_config
+        self.program = program if program is not None else CleaningProgram(rules_config)
+        self.cache = cache
         self.logger = get_logger('data_cleaner')
     
+    @property
+    def rules(self) -> Dict[str, Any]:
+        """Cleaning rules of the current program."""
+        return self.program.rules
+    
+    def use_program(self, program: CleaningProgram) -> None:
+        """
+        Switch to newly compiled rules.
+        
+        Values being cleaned finish with the program they started with.
+        
+        Args:
+            program: Compiled cleaning rules
+        """
+        self.program = program
+    
     def clean_company_name(self, company: str) -> str:
         """
         Clean company name by removing search artifacts and normalizing format.
@@ -95,6 +541,18 @@ class CleaningRulesEngine:
         Returns:
             Cleaned and normalized company name, or empty string if garbage
         """
+        program = self.program
+        if self.cache is None or not isinstance(company, str):
+            return self._clean_company_name(company, program)
+        
+        cleaned = self.cache.get('company_name', company, program.version)
+        if cleaned is None:
+            cleaned = self._clean_company_name(company, program)
+            self.cache.put('company_name', company, program.version, cleaned)
+        return cleaned
+    
+    def _clean_company_name(self, company: str, program: CleaningProgram) -> str:
+        """Clean a company name with a program, without consulting the cache."""
         if not company or not isinstance(company, str):
             return ""
         
@@ -102,53 +560,25 @@ class CleaningRulesEngine:
         cleaned = company.strip()
         
         # Step 1: Remove search artifacts first (most aggressive cleaning)
-        cleaned = self.remove_search_artifacts(cleaned)
+        cleaned = self._remove_search_artifacts(cleaned, program)
         
         # Step 2: Remove HTML fragments and entities
         cleaned = self.remove_html_fragments(cleaned)
         
         # Step 3: Remove specific company name garbage patterns
-        company_garbage_patterns = self.rules.get('company_name', {}).get('remove_patterns', [])
-        for pattern in company_garbage_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+        cleaned = program.company_remove.apply(cleaned)
         
         # Step 4: Remove search result prefixes and suffixes
-        search_prefixes = [
-            r'^About \d{1,3}(,\d{3})* results for\s*',
-            r'^Search results for\s*',
-            r'^Results for\s*',
-            r'^Showing results for\s*',
-            r'^\d+ results for\s*',
-            r'^.*results for\s*',
-            r'^for\s+',  # Remove standalone "for" at beginning
-        ]
-        
-        for prefix_pattern in search_prefixes:
-            cleaned = re.sub(prefix_pattern, '', cleaned, flags=re.IGNORECASE)
+        cleaned = _SEARCH_PREFIX_RULES.apply(cleaned)
         
         # Step 5: Remove trailing garbage
-        trailing_garbage = [
-            r'\s*Learn more.*$',
-            r'\s*Next$',
-            r'\s*More results.*$',
-            r'\s*Related searches.*$',
-            r'\s*People also ask.*$',
-            r'\s*\.\.\.$',  # Trailing ellipsis
-        ]
-        
-        for trailing_pattern in trailing_garbage:
-            cleaned = re.sub(trailing_pattern, '', cleaned, flags=re.IGNORECASE)
+        cleaned = _TRAILING_GARBAGE_RULES.apply(cleaned)
         
         # Step 6: Normalize text (whitespace, encoding, etc.)
         cleaned = self.normalize_text(cleaned)
         
         # Step 7: Normalize company suffixes and legal entities
-        normalize_patterns = self.rules.get('company_name', {}).get('normalize_patterns', [])
-        for pattern_config in normalize_patterns:
-            pattern = pattern_config.get('pattern', '')
-            replacement = pattern_config.get('replacement', '')
-            if pattern and replacement:
-                cleaned = re.sub(pattern, replacement, cleaned, flags=re.IGNORECASE)
+        cleaned = program.company_normalize.apply(cleaned)
         
         # Step 8: Additional company-specific cleaning
         cleaned = self._apply_company_specific_rules(cleaned)
@@ -163,19 +593,18 @@ class CleaningRulesEngine:
             return ""
         
         # Check for remaining garbage indicators
-        garbage_indicators = ['google', 'search', 'results', 'linkedin', 'facebook', 'www.', 'http', '.com', 'company/']
         cleaned_lower = cleaned.lower()
-        for indicator in garbage_indicators:
-            if indicator in cleaned_lower:
-                self.logger.log_module_activity('data_cleaner', 'company_cleaning', 'info', {
-                    'message': f'Company name contains garbage indicator "{indicator}", rejecting',
-                    'original': original_company,
-                    'cleaned': cleaned
-                })
-                return ""
+        indicator_index = _first_contained(cleaned_lower, _GARBAGE_INDICATORS, _GARBAGE_INDICATOR_PATTERN)
+        if indicator_index is not None:
+            self.logger.log_module_activity('data_cleaner', 'company_cleaning', 'info', {
+                'message': f'Company name contains garbage indicator "{_GARBAGE_INDICATORS[indicator_index]}", rejecting',
+                'original': original_company,
+                'cleaned': cleaned
+            })
+            return ""
         
         # Special check for URL-like patterns
-        if re.match(r'^[a-z]+://.*', cleaned_lower) or '///' in cleaned:
+        if _URL_LIKE.match(cleaned_lower) or '///' in cleaned:
             self.logger.log_module_activity('data_cleaner', 'company_cleaning', 'info', {
                 'message': 'Company name looks like URL, rejecting',
                 'original': original_company,
@@ -184,7 +613,7 @@ class CleaningRulesEngine:
             return ""
         
         # Final cleanup
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = _WHITESPACE.sub(' ', cleaned).strip()
         
         return cleaned
     
@@ -201,28 +630,11 @@ class CleaningRulesEngine:
         if not company:
             return ""
         
-        cleaned = company
-        
         # Remove common prefixes that shouldn't be part of company names
-        unwanted_prefixes = [
-            r'^for\s+',  # "for TechCorp Inc"
-            r'^about\s+',  # "about TechCorp Inc"
-            r'^the\s+results?\s+for\s+',  # "the results for TechCorp"
-        ]
-        
-        for prefix in unwanted_prefixes:
-            cleaned = re.sub(prefix, '', cleaned, flags=re.IGNORECASE)
+        cleaned = _UNWANTED_PREFIX_RULES.apply(company)
         
         # Fix common OCR/parsing errors in company names
-        ocr_fixes = {
-            r'\bl+c\b': 'LLC',  # "llc" -> "LLC"
-            r'\binc\b': 'Inc',  # "inc" -> "Inc"
-            r'\bcorp\b': 'Corp',  # "corp" -> "Corp"
-            r'\bltd\b': 'Ltd',  # "ltd" -> "Ltd"
-        }
-        
-        for pattern, replacement in ocr_fixes.items():
-            cleaned = re.sub(pattern, replacement, cleaned, flags=re.IGNORECASE)
+        cleaned = _OCR_FIX_RULES.apply(cleaned)
         
         # Remove duplicate words (common in scraped data)
         words = cleaned.split()
@@ -251,6 +663,18 @@ class CleaningRulesEngine:
         Returns:
             Cleaned and validated website URL, or empty string if invalid
         """
+        program = self.program
+        if self.cache is None or not isinstance(website, str):
+            return self._clean_website_url(website, program)
+        
+        cleaned = self.cache.get('website_url', website, program.version)
+        if cleaned is None:
+            cleaned = self._clean_website_url(website, program)
+            self.cache.put('website_url', website, program.version, cleaned)
+        return cleaned
+    
+    def _clean_website_url(self, website: str, program: CleaningProgram) -> str:
+        """Clean a website URL with a program, without consulting the cache."""
         if not website or not isinstance(website, str):
             return ""
         
@@ -258,20 +682,19 @@ class CleaningRulesEngine:
         cleaned = website.strip()
         
         # Step 1: Remove search artifacts and HTML fragments first
-        cleaned = self.remove_search_artifacts(cleaned)
+        cleaned = self._remove_search_artifacts(cleaned, program)
         cleaned = self.remove_html_fragments(cleaned)
         cleaned = self.normalize_text(cleaned)
         
         # Step 2: Check for invalid domains that should be rejected entirely
-        invalid_domains = self.rules.get('website_url', {}).get('remove_patterns', [])
-        for pattern in invalid_domains:
-            if pattern.lower() in cleaned.lower():
-                self.logger.log_module_activity('data_cleaner', 'url_cleaning', 'info', {
-                    'message': f'URL contains invalid domain "{pattern}", rejecting',
-                    'original': original_website,
-                    'cleaned': cleaned
-                })
-                return ""
+        domain_index = _first_contained(cleaned.lower(), program.invalid_domains_lower, program.invalid_domain_pattern)
+        if domain_index is not None:
+            self.logger.log_module_activity('data_cleaner', 'url_cleaning', 'info', {
+                'message': f'URL contains invalid domain "{program.invalid_domains[domain_index]}", rejecting',
+                'original': original_website,
+                'cleaned': cleaned
+            })
+            return ""
         
         # Step 3: Handle malformed URLs and extract domain
         cleaned = self._extract_and_clean_domain(cleaned)
@@ -375,14 +798,14 @@ class CleaningRulesEngine:
         except Exception:
             # URL parsing failed, try basic domain extraction
             # Look for domain-like patterns, but be more selective
-            domain_matches = re.findall(r'https?://([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', cleaned)
+            domain_matches = _DOMAIN_MATCHES.findall(cleaned)
             if domain_matches:
                 # Take the first valid-looking domain
                 domain = domain_matches[0].lower()
                 return f"https://{domain}"
             
             # Try without protocol
-            domain_match = re.search(r'\b([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b', cleaned)
+            domain_match = _DOMAIN_MATCH.search(cleaned)
             if domain_match:
                 domain = domain_match.group(1).lower()
                 # Basic validation before returning
@@ -418,7 +841,7 @@ class CleaningRulesEngine:
                 domain = domain[4:]
             
             # Basic domain format validation
-            if not re.match(r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', domain):
+            if not _DOMAIN_FORMAT.match(domain):
                 return False
             
             # Check for valid TLD
@@ -427,16 +850,8 @@ class CleaningRulesEngine:
                 return False
             
             # Check for suspicious patterns
-            suspicious_patterns = [
-                r'\.\.+',  # Multiple consecutive dots
-                r'^-',     # Starting with dash
-                r'-\.',    # Ending with dash before TLD
-                r'--',     # Double dashes
-            ]
-            
-            for pattern in suspicious_patterns:
-                if re.search(pattern, domain):
-                    return False
+            if _SUSPICIOUS_DOMAIN_PATTERN.search(domain):
+                return False
             
             return True
             
@@ -534,7 +949,7 @@ class CleaningRulesEngine:
                     return False
             
             # Check for IP addresses (not typical for business websites)
-            if re.match(r'^\d+\.\d+\.\d+\.\d+', domain):
+            if _IP_ADDRESS.match(domain):
                 return False
             
             # Check minimum domain length (too short domains are suspicious)
@@ -565,63 +980,15 @@ class CleaningRulesEngine:
         Returns:
             Text with search artifacts removed
         """
+        return self._remove_search_artifacts(text, self.program)
+    
+    def _remove_search_artifacts(self, text: str, program: CleaningProgram) -> str:
+        """Remove search artifacts with the rules of one program."""
         if not text or not isinstance(text, str):
             return ""
         
-        cleaned = text
-        
-        # Remove specific search artifacts from configuration
-        artifacts = self.rules.get('search_artifacts', {}).get('remove_patterns', [])
-        for pattern in artifacts:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE | re.MULTILINE)
-        
-        # Additional aggressive search artifact removal
-        additional_artifacts = [
-            r'Showing results for\s*',
-            r'Search results for\s*',
-            r'Results for\s*',
-            r'About.*?results for\s*',  # More aggressive "About X results for" removal
-        ]
-        
-        for pattern in additional_artifacts:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove common Google search navigation elements
-        navigation_patterns = [
-            r'About \d{1,3}(,\d{3})* results',
-            r'Search instead for.*',
-            r'Did you mean:.*',
-            r'Showing results for.*',
-            r'No results found for.*',
-            r'Learn more Next',
-            r'Previous.*Next',
-            r'Page \d+ of \d+',
-            r'More results',
-            r'Related searches',
-            r'People also ask',
-            r'Videos.*Images.*News.*Shopping',
-            r'Cached.*Similar.*',
-            r'More from.*',
-            r'Jump to.*',
-            r'See results about.*'
-        ]
-        
-        for pattern in navigation_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove specific garbage patterns that appear in real data
-        garbage_patterns = [
-            r'Sirius XM.*',  # Remove anything starting with "Sirius XM"
-            r'Some results may have been delisted.*',
-            r'consistent with local laws.*',
-            r'\.{3,}.*?Next',  # Multiple dots followed by Next
-            r'and\s*\.{3,}.*?Next',  # "and ..." patterns
-            r'and\s*\.{3,}.*',  # "and ..." at end of text
-            r'Learn more.*',  # Remove anything starting with "Learn more"
-        ]
-        
-        for pattern in garbage_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE | re.DOTALL)
+        # Artifacts from the configuration, then navigation elements and garbage seen in real data
+        cleaned = program.search_artifacts.apply(text)
         
         return cleaned.strip()
     
@@ -646,17 +1013,8 @@ class CleaningRulesEngine:
         
         cleaned = text
         
-        # Remove script and style tags with their content
-        cleaned = re.sub(r'<script[^>]*>.*?</script>', '', cleaned, flags=re.IGNORECASE | re.DOTALL)
-        cleaned = re.sub(r'<style[^>]*>.*?</style>', '', cleaned, flags=re.IGNORECASE | re.DOTALL)
-        
-        # Remove HTML comments
-        cleaned = re.sub(r'<!--.*?-->', '', cleaned, flags=re.DOTALL)
-        
-        # Remove all HTML tags (including malformed ones)
-        cleaned = re.sub(r'<[^>]*>', '', cleaned)
-        cleaned = re.sub(r'<[^>]*$', '', cleaned)  # Handle incomplete tags at end
-        cleaned = re.sub(r'^[^<]*>', '', cleaned)  # Handle incomplete tags at start
+        # Remove script, style and comment blocks, then all HTML tags (including malformed ones)
+        cleaned = _HTML_TAG_RULES.apply(cleaned)
         
         # Remove HTML entities (comprehensive list)
         html_entities = {
@@ -683,20 +1041,19 @@ class CleaningRulesEngine:
             '&middot;': '·'
         }
         
-        for entity, replacement in html_entities.items():
-            cleaned = cleaned.replace(entity, replacement)
-        
-        # Remove any remaining HTML entities (numeric and named)
-        cleaned = re.sub(r'&#\d+;', '', cleaned)  # Numeric entities
-        cleaned = re.sub(r'&#x[0-9a-fA-F]+;', '', cleaned)  # Hex entities
-        cleaned = re.sub(r'&[a-zA-Z][a-zA-Z0-9]*;', '', cleaned)  # Named entities
+        # Every entity starts with "&"
+        if '&' in cleaned:
+            for entity, replacement in html_entities.items():
+                cleaned = cleaned.replace(entity, replacement)
+            
+            # Remove any remaining HTML entities (numeric and named)
+            cleaned = _HTML_ENTITY_RULES.apply(cleaned)
         
         # Remove CSS remnants
-        cleaned = re.sub(r'style\s*=\s*["\'][^"\']*["\']', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'class\s*=\s*["\'][^"\']*["\']', '', cleaned, flags=re.IGNORECASE)
+        cleaned = _CSS_RULES.apply(cleaned)
         
         # Clean up excessive whitespace created by HTML removal
-        cleaned = re.sub(r'\s+', ' ', cleaned)
+        cleaned = _WHITESPACE.sub(' ', cleaned)
         
         return cleaned.strip()
     
@@ -722,11 +1079,8 @@ class CleaningRulesEngine:
         
         normalized = text
         
-        # Remove control characters (except newlines and tabs which we'll handle separately)
-        normalized = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]', '', normalized)
-        
-        # Remove zero-width characters and other invisible Unicode characters
-        normalized = re.sub(r'[\u200b-\u200d\ufeff\u2060\u180e]', '', normalized)
+        # Remove control characters, zero-width characters and other invisible Unicode characters
+        normalized = _INVISIBLE_CHARACTERS.sub('', normalized)
         
         # Normalize different types of quotes and dashes
         quote_replacements = {
@@ -744,11 +1098,8 @@ class CleaningRulesEngine:
         for old_char, new_char in quote_replacements.items():
             normalized = normalized.replace(old_char, new_char)
         
-        # Convert tabs and multiple newlines to single spaces
-        normalized = re.sub(r'[\t\n\r]+', ' ', normalized)
-        
-        # Remove excessive whitespace (multiple spaces become single space)
-        normalized = re.sub(r'\s+', ' ', normalized)
+        # Convert tabs, newlines and multiple spaces to single spaces
+        normalized = _WHITESPACE.sub(' ', normalized)
         
         # Remove leading/trailing whitespace
         normalized = normalized.strip()
@@ -780,14 +1131,16 @@ class ValidationEngine:
     - Context-aware validation with confidence scoring
     """
     
-    def __init__(self, validation_config: Dict[str, Any]):
+    def __init__(self, validation_config: Dict[str, Any], cache: Optional[CleaningResultCache] = None):
         """
         Initialize the validation engine.
         
         Args:
             validation_config: Configuration dictionary with validation rules
+            cache: Cache of validation results, keyed on the rules version
         """
         self.rules = validation_config
+        self.cache = cache
         self.logger = get_logger('data_cleaner')
         
         # Initialize validation statistics
@@ -799,6 +1152,17 @@ class ValidationEngine:
             'by_field': {}
         }
     
+    @property
+    def rules(self) -> Dict[str, Any]:
+        """Validation rules in use."""
+        return self._rules_state[0]
+    
+    @rules.setter
+    def rules(self, rules: Dict[str, Any]) -> None:
+        # Rules and their version change together, so a result is never
+        # cached under the version of other rules
+        self._rules_state = (rules, _rules_version(rules))
+    
     def validate_company_name(self, company: str, context: Dict[str, Any]) -> ValidationResult:
         """
         Validate company name against professional standards.
@@ -810,6 +1174,23 @@ class ValidationEngine:
         Returns:
             ValidationResult with validation outcome
         """
+        # The outcome depends on the value alone, not on the lead context
+        rules, version = self._rules_state
+        if self.cache is None or not isinstance(company, str):
+            return self._validate_company_name(company, context, rules)
+        
+        cached = self.cache.get('company_name_validation', company, version)
+        if cached is not None:
+            result = ValidationResult(*cached)
+            self._update_validation_stats(result)
+            return result
+        
+        result = self._validate_company_name(company, context, rules)
+        self.cache.put('company_name_validation', company, version, astuple(result))
+        return result
+    
+    def _validate_company_name(self, company: str, context: Dict[str, Any], rules: Dict[str, Any]) -> ValidationResult:
+        """Validate a company name against some rules, without consulting the cache."""
         field_name = "company"
         
         if not company or not isinstance(company, str):
@@ -824,7 +1205,7 @@ class ValidationEngine:
             self._update_validation_stats(result)
             return result
         
-        company_rules = self.rules.get('company_name', {})
+        company_rules = rules.get('company_name', {})
         min_confidence = company_rules.get('min_confidence', 0.7)
         
         # Check minimum length
@@ -909,6 +1290,23 @@ class ValidationEngine:
         Returns:
             ValidationResult with validation outcome
         """
+        # The outcome depends on the value alone, not on the lead context
+        rules, version = self._rules_state
+        if self.cache is None or not isinstance(website, str):
+            return self._validate_website_url(website, context, rules)
+        
+        cached = self.cache.get('website_url_validation', website, version)
+        if cached is not None:
+            result = ValidationResult(*cached)
+            self._update_validation_stats(result)
+            return result
+        
+        result = self._validate_website_url(website, context, rules)
+        self.cache.put('website_url_validation', website, version, astuple(result))
+        return result
+    
+    def _validate_website_url(self, website: str, context: Dict[str, Any], rules: Dict[str, Any]) -> ValidationResult:
+        """Validate a website URL against some rules, without consulting the cache."""
         field_name = "website"
         
         if not website or not isinstance(website, str):
@@ -923,7 +1321,7 @@ class ValidationEngine:
             self._update_validation_stats(result)
             return result
         
-        website_rules = self.rules.get('website_url', {})
+        website_rules = rules.get('website_url', {})
         min_confidence = website_rules.get('min_confidence', 0.8)
         
         # Check required format
@@ -1563,6 +1961,22 @@ class ValidationEngine:
         else:
             self.validation_stats['by_field'][field]['failed'] += 1
 
+    def merge_validation_stats(self, other: Dict[str, Any]) -> None:
+        """
+        Add validation statistics gathered by another engine, e.g. in a worker process.
+        
+        Args:
+            other: validation_stats of the other engine
+        """
+        for key in ('total_validations', 'passed_validations', 'failed_validations'):
+            self.validation_stats[key] += other[key]
+        
+        for group in ('by_rule', 'by_field'):
+            for name, counts in other[group].items():
+                totals = self.validation_stats[group].setdefault(name, {'passed': 0, 'failed': 0})
+                totals['passed'] += counts['passed']
+                totals['failed'] += counts['failed']
+
 
 class ConfigurationManager:
     """
@@ -1576,12 +1990,16 @@ class ConfigurationManager:
     - Hot-reload support
     """
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, cache_size: Optional[int] = None,
+                 cache_db: Optional[str] = None):
         """
         Initialize the configuration manager.
         
         Args:
             config_path: Path to configuration directory
+            cache_size: Results kept by result_cache (DATA_CLEANER_CACHE_SIZE or
+                DEFAULT_RESULT_CACHE_SIZE if not given, 0 disables the cache)
+            cache_db: SQLite file persisting result_cache (DATA_CLEANER_CACHE_DB if not given)
         """
         self.logger = get_logger('data_cleaner')
         
@@ -1599,6 +2017,13 @@ class ConfigurationManager:
         self.current_version = None
         self.config_checksums = {}
         
+        # (mtime_ns, size, inode) of each rule file when last read or written
+        self.config_stats = {}
+        self._rule_paths = {filename: str(self.config_path / filename) for filename in RULE_FILES}
+        self._stale = False
+        self._watcher = None
+        self._watch_stop = threading.Event()
+        
         # Create backup directory
         self.backup_path = self.config_path / "backups"
         self.backup_path.mkdir(exist_ok=True)
@@ -1609,24 +2034,48 @@ class ConfigurationManager:
         
         # Initialize version tracking
         self._initialize_version_tracking()
+        
+        # Results of cleaning and validation under the loaded rules
+        if cache_size is None:
+            cache_size = int(os.getenv('DATA_CLEANER_CACHE_SIZE', DEFAULT_RESULT_CACHE_SIZE))
+        if cache_size > 0:
+            self.result_cache = CleaningResultCache(cache_size, cache_db or os.getenv('DATA_CLEANER_CACHE_DB'))
+        else:
+            self.result_cache = None
+        self._refresh_result_cache()
     
     def load_rules(self, filename: str) -> Dict[str, Any]:
         """
         Load rules from configuration file with integrity checking.
         
+        Cleaning rules are also compiled, replacing cleaning_program.
+        
         Args:
             filename: Configuration filename
             
         Returns:
             Configuration dictionary
         """
+        config = self._read_rules(filename)
+        
+        if filename == 'cleaning_rules.yaml':
+            self.cleaning_program = CleaningProgram(config)
+        
+        return config
+    
+    def _read_rules(self, filename: str) -> Dict[str, Any]:
+        """Read and validate a configuration file, falling back to defaults."""
         config_file = self.config_path / filename
         
         try:
             if config_file.exists():
+                # Taken before reading, so a write during the read still shows as a change
+                signature = self._stat_signature(filename)
+                
                 # Read and validate configuration
                 with open(config_file, 'r', encoding='utf-8') as f:
                     config_content = f.read()
+                    self.config_stats[filename] = signature
                     config = yaml.safe_load(config_content)
                 
                 # Validate configuration integrity
@@ -1771,6 +2220,7 @@ class ConfigurationManager:
             import hashlib
             checksum = hashlib.md5(yaml_content.encode()).hexdigest()
             self.config_checksums[filename] = checksum
+            self.config_stats[filename] = self._stat_signature(filename)
                 
             self.logger.log_module_activity('data_cleaner', 'system', 'success', {
                 'message': f'Saved configuration to {filename}',
@@ -2006,6 +2456,7 @@ class ConfigurationManager:
             # Update cleaning rules
             if 'cleaning_rules' in new_rules:
                 self.cleaning_rules.update(new_rules['cleaning_rules'])
+                self.cleaning_program = CleaningProgram(self.cleaning_rules)
                 self._save_config('cleaning_rules.yaml', self.cleaning_rules)
                 updated_files.append('cleaning_rules.yaml')
             
@@ -2027,6 +2478,7 @@ class ConfigurationManager:
             
             self.version_history.append(update_record)
             self._save_version_history()
+            self._refresh_result_cache()
             
             self.logger.log_module_activity('data_cleaner', 'update_rules', 'success', {
                 'message': 'Rules updated successfully',
@@ -2048,6 +2500,11 @@ class ConfigurationManager:
         """Get current rule version timestamp."""
         return self.current_version or datetime.datetime.now().isoformat()
     
+    def _refresh_result_cache(self) -> None:
+        """Drop cached results of rules other than the loaded ones."""
+        if self.result_cache is not None:
+            self.result_cache.retain_versions([self.cleaning_program.version, _rules_version(self.validation_rules)])
+    
     def _initialize_version_tracking(self) -> None:
         """Initialize version tracking system."""
         try:
@@ -2186,6 +2643,7 @@ class ConfigurationManager:
             
             self.version_history.append(restore_record)
             self._save_version_history()
+            self._refresh_result_cache()
             
             self.logger.log_module_activity('data_cleaner', 'restore', 'success', {
                 'message': f'Configuration restored from backup: {backup_version}',
@@ -2209,6 +2667,9 @@ class ConfigurationManager:
         """
         Detect if configuration files have changed since last load.
         
+        Files are only read and hashed when their stat signature changed, so
+        a touched but unchanged file is not reported.
+        
         Returns:
             Dictionary mapping filename to changed status
         """
@@ -2217,20 +2678,26 @@ class ConfigurationManager:
         try:
             import hashlib
             
-            config_files = ['cleaning_rules.yaml', 'validation_rules.yaml']
-            
-            for filename in config_files:
+            for filename in RULE_FILES:
                 config_file = self.config_path / filename
-                if config_file.exists():
-                    with open(config_file, 'r', encoding='utf-8') as f:
-                        current_content = f.read()
-                    
-                    current_checksum = hashlib.md5(current_content.encode()).hexdigest()
-                    stored_checksum = self.config_checksums.get(filename)
-                    
-                    changes[filename] = current_checksum != stored_checksum
-                else:
+                signature = self._stat_signature(filename)
+                if signature is None:
                     changes[filename] = True  # File missing is a change
+                    continue
+                
+                if signature == self.config_stats.get(filename):
+                    changes[filename] = False
+                    continue
+                
+                with open(config_file, 'r', encoding='utf-8') as f:
+                    current_content = f.read()
+                
+                current_checksum = hashlib.md5(current_content.encode()).hexdigest()
+                stored_checksum = self.config_checksums.get(filename)
+                
+                changes[filename] = current_checksum != stored_checksum
+                if not changes[filename]:
+                    self.config_stats[filename] = signature
             
         except Exception as e:
             self.logger.log_error(e, {'action': 'detect_config_changes'})
@@ -2248,6 +2715,9 @@ class ConfigurationManager:
         """
         changes = self.detect_config_changes()
         
+        # The watcher raises the flag again if a file changes after being read
+        self._stale = False
+        
         if any(changes.values()):
             self.logger.log_module_activity('data_cleaner', 'hot_reload', 'info', {
                 'message': 'Configuration changes detected, reloading',
@@ -2264,10 +2734,63 @@ class ConfigurationManager:
             # Update version
             self.current_version = datetime.datetime.now().isoformat()
             self._save_version_history()
+            self._refresh_result_cache()
             
             return True
         
         return False
+    
+    def is_stale(self) -> bool:
+        """
+        Whether a rule file may have changed since it was last read or written.
+        
+        Only compares os.stat signatures, or reads a flag while the watcher
+        thread runs, so it is cheap enough to call for every record.
+        reload_if_changed() confirms the change by content.
+        """
+        if self._watcher is not None:
+            return self._stale
+        return self._stats_changed()
+    
+    def start_watching(self, interval: float = CONFIG_WATCH_INTERVAL) -> None:
+        """
+        Check the rule files in a daemon thread, so is_stale() makes no system calls.
+        
+        Args:
+            interval: Seconds between checks
+        """
+        if self._watcher is not None:
+            return
+        
+        self._watch_stop.clear()
+        self._watcher = threading.Thread(target=self._watch, args=(interval,),
+                                         name='data-cleaner-config-watcher', daemon=True)
+        self._watcher.start()
+    
+    def stop_watching(self) -> None:
+        """Stop the watcher thread started by start_watching()."""
+        watcher = self._watcher
+        if watcher is None:
+            return
+        
+        self._watch_stop.set()
+        watcher.join()
+        self._watcher = None
+    
+    def _watch(self, interval: float) -> None:
+        while not self._watch_stop.wait(interval):
+            self._stale = self._stats_changed()
+    
+    def _stats_changed(self) -> bool:
+        return any(self._stat_signature(filename) != self.config_stats.get(filename) for filename in RULE_FILES)
+    
+    def _stat_signature(self, filename: str) -> Optional[Tuple[int, int, int]]:
+        """(mtime_ns, size, inode) of a rule file, or None if it is missing."""
+        try:
+            stat = os.stat(self._rule_paths.get(filename) or self.config_path / filename)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
 
 
 class AuditLogger:
@@ -2276,14 +2799,21 @@ class AuditLogger:
     
     Provides detailed tracking of cleaning actions, validation decisions,
     performance metrics, and quality reporting capabilities.
+    
+    Memory stays flat in long-running processes: statistics are streaming
+    aggregates (running mean and variance, fixed histograms, top-k counters),
+    and only the most recent log entries are kept in ring buffers. Older
+    entries are appended to daily NDJSON files before they leave the ring,
+    and save_logs writes the rest.
     """
     
-    def __init__(self, log_dir: Optional[str] = None):
+    def __init__(self, log_dir: Optional[str] = None, ring_size: int = AUDIT_RING_SIZE):
         """
         Initialize the audit logger with comprehensive metrics tracking.
         
         Args:
             log_dir: Directory for storing audit log files
+            ring_size: Most recent cleaning, validation and performance entries kept in memory
         """
         self.logger = get_logger('data_cleaner')
         
@@ -2301,9 +2831,11 @@ class AuditLogger:
             'successful_cleanings': 0,
             'patterns_applied': 0,
             'fields_cleaned': {},
-            'rules_usage': {},
-            'confidence_scores': [],
-            'processing_times': [],
+            'rules_usage': TopKCounter(AUDIT_TOP_K),
+            'confidence': RunningStats(),
+            'confidence_histogram': Histogram(CONFIDENCE_BUCKETS),
+            'processing_time': RunningStats(),
+            'processing_time_histogram': Histogram(PROCESSING_TIME_BUCKETS),
             'start_time': datetime.datetime.now()
         }
         
@@ -2313,8 +2845,9 @@ class AuditLogger:
             'invalid_count': 0,
             'by_field': {},
             'by_rule': {},
-            'confidence_scores': [],
-            'error_patterns': {},
+            'confidence': RunningStats(),
+            'confidence_histogram': Histogram(CONFIDENCE_BUCKETS),
+            'error_patterns': TopKCounter(AUDIT_TOP_K),
             'start_time': datetime.datetime.now()
         }
         
@@ -2328,11 +2861,21 @@ class AuditLogger:
             'start_time': datetime.datetime.now()
         }
         
-        # Initialize log storage
-        self.cleaning_logs = []
-        self.validation_logs = []
-        self.performance_logs = []
-        self.quality_metrics = []
+        # Recent log entries; older ones are in the NDJSON files
+        self.cleaning_logs = deque(maxlen=ring_size)
+        self.validation_logs = deque(maxlen=ring_size)
+        self.performance_logs = deque(maxlen=ring_size)
+        self.quality_metrics = deque(maxlen=AUDIT_REPORTS_KEPT)
+        self.reports_generated = 0
+        
+        # Ring of each log file, and how many of its newest entries are not yet written
+        self._rings = {
+            'cleaning_log': self.cleaning_logs,
+            'validation_log': self.validation_logs,
+            'performance_log': self.performance_logs,
+            'quality_reports': self.quality_metrics
+        }
+        self._unsaved = dict.fromkeys(self._rings, 0)
         
         self.logger.log_module_activity('data_cleaner', 'audit_logger', 'success', {
             'message': 'AuditLogger initialized with comprehensive metrics',
@@ -2367,13 +2910,13 @@ class AuditLogger:
             
             # Track rule usage
             for pattern in cleaning_result.patterns_applied:
-                if pattern not in self.cleaning_stats['rules_usage']:
-                    self.cleaning_stats['rules_usage'][pattern] = 0
-                self.cleaning_stats['rules_usage'][pattern] += 1
+                self.cleaning_stats['rules_usage'].add(pattern)
             
             # Track confidence scores and processing times
-            self.cleaning_stats['confidence_scores'].append(cleaning_result.confidence_score)
-            self.cleaning_stats['processing_times'].append(cleaning_result.processing_time)
+            self.cleaning_stats['confidence'].add(cleaning_result.confidence_score)
+            self.cleaning_stats['confidence_histogram'].add(cleaning_result.confidence_score)
+            self.cleaning_stats['processing_time'].add(cleaning_result.processing_time)
+            self.cleaning_stats['processing_time_histogram'].add(cleaning_result.processing_time)
             
             # Create detailed log entry
             log_entry = {
@@ -2387,7 +2930,7 @@ class AuditLogger:
                 'changed': cleaning_result.original_value != cleaning_result.cleaned_value
             }
             
-            self.cleaning_logs.append(log_entry)
+            self._record('cleaning_log', log_entry)
             
             # Log to system logger
             self.logger.log_module_activity('data_cleaner', 'cleaning', 'info', {
@@ -2451,12 +2994,11 @@ class AuditLogger:
             # Track error patterns
             if validation_result.error_message:
                 error_key = validation_result.error_message[:50]  # First 50 chars as key
-                if error_key not in self.validation_stats['error_patterns']:
-                    self.validation_stats['error_patterns'][error_key] = 0
-                self.validation_stats['error_patterns'][error_key] += 1
+                self.validation_stats['error_patterns'].add(error_key)
             
             # Track confidence scores
-            self.validation_stats['confidence_scores'].append(validation_result.confidence_score)
+            self.validation_stats['confidence'].add(validation_result.confidence_score)
+            self.validation_stats['confidence_histogram'].add(validation_result.confidence_score)
             
             # Create detailed log entry
             log_entry = {
@@ -2469,7 +3011,7 @@ class AuditLogger:
                 'suggested_fix': validation_result.suggested_fix
             }
             
-            self.validation_logs.append(log_entry)
+            self._record('validation_log', log_entry)
             
             # Log to system logger
             self.logger.log_module_activity('data_cleaner', 'validation', 
@@ -2531,7 +3073,7 @@ class AuditLogger:
                 'throughput': records_processed / duration if duration > 0 else 0
             }
             
-            self.performance_logs.append(log_entry)
+            self._record('performance_log', log_entry)
             
         except Exception as e:
             self.logger.log_error(e, {'action': 'log_performance_metrics'})
@@ -2592,32 +3134,14 @@ class AuditLogger:
                     self.validation_stats['total_validations']
                 )
             
-            # Calculate average confidence scores
-            avg_cleaning_confidence = 0.0
-            if self.cleaning_stats['confidence_scores']:
-                avg_cleaning_confidence = sum(self.cleaning_stats['confidence_scores']) / len(self.cleaning_stats['confidence_scores'])
-            
-            avg_validation_confidence = 0.0
-            if self.validation_stats['confidence_scores']:
-                avg_validation_confidence = sum(self.validation_stats['confidence_scores']) / len(self.validation_stats['confidence_scores'])
-            
-            # Calculate performance metrics
-            avg_processing_time = 0.0
-            if self.cleaning_stats['processing_times']:
-                avg_processing_time = sum(self.cleaning_stats['processing_times']) / len(self.cleaning_stats['processing_times'])
+            # Average confidence scores and processing time
+            avg_cleaning_confidence = self.cleaning_stats['confidence'].mean
+            avg_validation_confidence = self.validation_stats['confidence'].mean
+            avg_processing_time = self.cleaning_stats['processing_time'].mean
             
             # Identify top issues and patterns
-            top_error_patterns = sorted(
-                self.validation_stats['error_patterns'].items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:5]
-            
-            top_cleaning_rules = sorted(
-                self.cleaning_stats['rules_usage'].items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]
+            top_error_patterns = self.validation_stats['error_patterns'].most_common(5)
+            top_cleaning_rules = self.cleaning_stats['rules_usage'].most_common(10)
             
             # Generate comprehensive report
             report = {
@@ -2641,6 +3165,9 @@ class AuditLogger:
                     'successful_cleanings': self.cleaning_stats['successful_cleanings'],
                     'patterns_applied': self.cleaning_stats['patterns_applied'],
                     'average_confidence': round(avg_cleaning_confidence, 3),
+                    'confidence_stddev': round(self.cleaning_stats['confidence'].stddev, 3),
+                    'confidence_histogram': self.cleaning_stats['confidence_histogram'].to_dict(),
+                    'processing_time_histogram': self.cleaning_stats['processing_time_histogram'].to_dict(),
                     'fields_processed': len(self.cleaning_stats['fields_cleaned']),
                     'top_cleaning_rules': [{'rule': rule, 'usage_count': count} for rule, count in top_cleaning_rules],
                     'field_statistics': self.cleaning_stats['fields_cleaned']
@@ -2652,6 +3179,8 @@ class AuditLogger:
                     'invalid_count': self.validation_stats['invalid_count'],
                     'success_rate': round(validation_success_rate * 100, 2),
                     'average_confidence': round(avg_validation_confidence, 3),
+                    'confidence_stddev': round(self.validation_stats['confidence'].stddev, 3),
+                    'confidence_histogram': self.validation_stats['confidence_histogram'].to_dict(),
                     'validation_by_field': self.validation_stats['by_field'],
                     'validation_by_rule': self.validation_stats['by_rule'],
                     'top_error_patterns': [{'error': error, 'count': count} for error, count in top_error_patterns]
@@ -2677,7 +3206,8 @@ class AuditLogger:
             }
             
             # Store report for historical tracking
-            self.quality_metrics.append(report)
+            self._record('quality_reports', report)
+            self.reports_generated += 1
             
             self.logger.log_module_activity('data_cleaner', 'quality_report', 'success', {
                 'message': 'Quality report generated successfully',
@@ -2728,11 +3258,11 @@ class AuditLogger:
             
             return {
                 'cleaning': {
-                    **self.cleaning_stats,
+                    **_summarize(self.cleaning_stats),
                     'success_rate': cleaning_success_rate
                 },
                 'validation': {
-                    **self.validation_stats,
+                    **_summarize(self.validation_stats),
                     'success_rate': validation_success_rate
                 },
                 'performance': {
@@ -2743,7 +3273,7 @@ class AuditLogger:
                     'total_records': self.performance_stats['total_records_processed'],
                     'overall_success_rate': (cleaning_success_rate + validation_success_rate) / 2,
                     'system_uptime': str(datetime.datetime.now() - self.cleaning_stats['start_time']),
-                    'reports_generated': len(self.quality_metrics)
+                    'reports_generated': self.reports_generated
                 }
             }
             
@@ -2752,49 +3282,53 @@ class AuditLogger:
             return {}
     
     def save_logs(self) -> None:
-        """Save all logs to persistent storage."""
+        """
+        Save log entries recorded since the last save.
+        
+        Entries are appended to daily NDJSON files such as
+        cleaning_log_2025-01-31.ndjson, so each save only writes what is new.
+        """
         try:
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d")
-            
-            # Save cleaning logs
-            if self.cleaning_logs:
-                cleaning_file = self.log_dir / f"cleaning_log_{timestamp}.json"
-                with open(cleaning_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.cleaning_logs, f, indent=2)
-            
-            # Save validation logs
-            if self.validation_logs:
-                validation_file = self.log_dir / f"validation_log_{timestamp}.json"
-                with open(validation_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.validation_logs, f, indent=2)
-            
-            # Save performance logs
-            if self.performance_logs:
-                performance_file = self.log_dir / f"performance_log_{timestamp}.json"
-                with open(performance_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.performance_logs, f, indent=2)
-            
-            # Save quality reports
-            if self.quality_metrics:
-                quality_file = self.log_dir / f"quality_reports_{timestamp}.json"
-                with open(quality_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.quality_metrics, f, indent=2)
+            entries_saved = {log_name: self._flush(log_name) for log_name in self._rings}
             
             self.logger.log_module_activity('data_cleaner', 'save_logs', 'success', {
                 'message': 'Audit logs saved successfully',
-                'files_saved': 4,
+                'entries_saved': entries_saved,
                 'log_dir': str(self.log_dir)
             })
             
         except Exception as e:
             self.logger.log_error(e, {'action': 'save_logs'})
     
+    def _record(self, log_name: str, entry: Dict[str, Any]) -> None:
+        """Keep an entry in its ring, writing unsaved entries out before the ring would drop them."""
+        ring = self._rings[log_name]
+        if self._unsaved[log_name] == ring.maxlen:
+            self._flush(log_name)
+        
+        ring.append(entry)
+        self._unsaved[log_name] += 1
+    
+    def _flush(self, log_name: str) -> int:
+        """Append the unsaved entries of one log to today's file and return how many were written."""
+        ring = self._rings[log_name]
+        unsaved = self._unsaved[log_name]
+        if not unsaved:
+            return 0
+        
+        log_file = self.log_dir / f"{log_name}_{datetime.date.today().isoformat()}{JSON_LOG_SUFFIX}"
+        for entry in itertools.islice(ring, len(ring) - unsaved, None):
+            append_json_log(log_file, entry)
+        
+        self._unsaved[log_name] = 0
+        return unsaved
+    
     def _calculate_quality_trends(self) -> Dict[str, Any]:
         """Calculate quality trends over time."""
         try:
             # This is a simplified version - in production, you'd analyze time-series data
-            recent_validations = self.validation_logs[-100:] if len(self.validation_logs) > 100 else self.validation_logs
-            recent_cleanings = self.cleaning_logs[-100:] if len(self.cleaning_logs) > 100 else self.cleaning_logs
+            recent_validations = list(self.validation_logs)[-100:]
+            recent_cleanings = list(self.cleaning_logs)[-100:]
             
             if not recent_validations and not recent_cleanings:
                 return {'trend': 'insufficient_data'}
@@ -2875,8 +3409,8 @@ class AuditLogger:
                     })
             
             # Check for low confidence scores
-            if self.cleaning_stats['confidence_scores']:
-                avg_confidence = sum(self.cleaning_stats['confidence_scores']) / len(self.cleaning_stats['confidence_scores'])
+            if self.cleaning_stats['confidence'].count:
+                avg_confidence = self.cleaning_stats['confidence'].mean
                 if avg_confidence < 0.6:
                     risks.append({
                         'risk_type': 'low_confidence',
@@ -2944,6 +3478,11 @@ class AuditLogger:
             }
 
 
+def _summarize(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of an AuditLogger statistics dict with streaming aggregates as plain dicts."""
+    return {key: value.to_dict() if hasattr(value, 'to_dict') else value for key, value in stats.items()}
+
+
 class DataCleaner:
     """
     Main Data Cleaner class that orchestrates cleaning and validation.
@@ -2963,8 +3502,11 @@ class DataCleaner:
         
         # Initialize components
         self.config_manager = ConfigurationManager(config_path)
-        self.cleaning_engine = CleaningRulesEngine(self.config_manager.cleaning_rules)
-        self.validation_engine = ValidationEngine(self.config_manager.validation_rules)
+        self.cleaning_engine = CleaningRulesEngine(self.config_manager.cleaning_rules,
+                                                   self.config_manager.cleaning_program,
+                                                   self.config_manager.result_cache)
+        self.validation_engine = ValidationEngine(self.config_manager.validation_rules,
+                                                  self.config_manager.result_cache)
         self.audit_logger = AuditLogger()
         
         # Statistics tracking
@@ -2991,6 +3533,21 @@ class DataCleaner:
         Returns:
             CleaningResult with cleaned data or rejection reasons
         """
+        self._sync_program()
+        return self._clean_record(raw_data, lead_context)
+    
+    def _sync_program(self) -> None:
+        """Pick up rules changed on disk, reloaded or updated since the last record."""
+        if self.config_manager.is_stale():
+            self.config_manager.reload_if_changed()
+        
+        if self.cleaning_engine.program is not self.config_manager.cleaning_program:
+            self.cleaning_engine.use_program(self.config_manager.cleaning_program)
+        if self.validation_engine.rules is not self.config_manager.validation_rules:
+            self.validation_engine.rules = self.config_manager.validation_rules
+    
+    def _clean_record(self, raw_data: Dict[str, Any], lead_context: Dict[str, Any]) -> CleaningResult:
+        """Clean and validate one record with the current engines."""
         start_time = datetime.datetime.now()
         
         try:
@@ -3162,9 +3719,79 @@ class DataCleaner:
                 processing_time=processing_time
             )
     
+    def clean_and_validate_many(self, records: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]],
+                                workers: Optional[int] = None,
+                                chunk_size: int = BATCH_CHUNK_SIZE) -> List[CleaningResult]:
+        """
+        Clean and validate a batch of records across worker processes.
+        
+        Records are streamed to the workers in chunks, with at most two chunks
+        per worker in flight. Each worker receives the compiled rule program once,
+        when it starts. Statistics and audit events are merged back here in input
+        order, so the outcome is the same as calling clean_and_validate on each
+        record in turn. Batches that fit in one chunk are cleaned in this process.
+        
+        Args:
+            records: Iterable of (raw_data, lead_context) pairs
+            workers: Number of worker processes (default: CPU count); 1 cleans in this process
+            chunk_size: Records sent to a worker at a time
+        
+        Returns:
+            List of CleaningResult, one per record in input order
+        """
+        start_time = datetime.datetime.now()
+        self._sync_program()
+        
+        workers = workers or os.cpu_count() or 1
+        chunks = _chunked(records, max(chunk_size, 1))
+        head = list(itertools.islice(chunks, 2))
+        
+        results = []
+        if workers <= 1 or len(head) < 2:
+            for chunk in itertools.chain(head, chunks):
+                results.extend(self._clean_record(raw_data, lead_context) for raw_data, lead_context in chunk)
+        else:
+            pending = deque()
+            cache = self.config_manager.result_cache
+            initargs = (self.cleaning_engine.program, self.validation_engine.rules,
+                        cache.max_entries if cache is not None else 0)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                     initargs=initargs) as executor:
+                for chunk in itertools.chain(head, chunks):
+                    pending.append(executor.submit(_clean_batch_chunk, chunk))
+                    if len(pending) >= workers * 2:
+                        results.extend(self._merge_batch_chunk(*pending.popleft().result()))
+                while pending:
+                    results.extend(self._merge_batch_chunk(*pending.popleft().result()))
+        
+        duration = (datetime.datetime.now() - start_time).total_seconds()
+        self.audit_logger.log_performance_metrics('clean_and_validate_many', duration, len(results))
+        
+        return results
+    
+    def _merge_batch_chunk(self, results: List[CleaningResult], audit_events: List[Tuple[str, tuple]],
+                           stats: Dict[str, int], validation_stats: Dict[str, Any],
+                           cache_counts: Tuple[int, int]) -> List[CleaningResult]:
+        """Fold a worker's statistics and audit events for one chunk into this cleaner."""
+        for key, count in stats.items():
+            self.stats[key] += count
+        self.validation_engine.merge_validation_stats(validation_stats)
+        
+        cache = self.config_manager.result_cache
+        if cache is not None:
+            cache.hits += cache_counts[0]
+            cache.misses += cache_counts[1]
+        
+        for method, args in audit_events:
+            getattr(self.audit_logger, method)(*args)
+        
+        return results
+    
     def get_cleaning_stats(self) -> Dict[str, Any]:
         """Get cleaning statistics."""
         runtime = (datetime.datetime.now() - self.stats['start_time']).total_seconds()
+        cache = self.config_manager.result_cache
+        cache_stats = cache.get_stats() if cache is not None else {'hits': 0, 'misses': 0, 'hit_rate': 0.0}
         
         return {
             'total_processed': self.stats['total_processed'],
@@ -3173,9 +3800,85 @@ class DataCleaner:
             'success_rate': (self.stats['successful_cleanings'] / max(self.stats['total_processed'], 1)) * 100,
             'rejection_rate': (self.stats['rejections'] / max(self.stats['total_processed'], 1)) * 100,
             'runtime_seconds': runtime,
-            'processing_rate': self.stats['total_processed'] / max(runtime, 1)
+            'processing_rate': self.stats['total_processed'] / max(runtime, 1),
+            'cache_hits': cache_stats['hits'],
+            'cache_misses': cache_stats['misses'],
+            'cache_hit_rate': cache_stats['hit_rate']
         }
     
     def update_rules(self, new_rules: Dict[str, Any]) -> bool:
         """Update cleaning and validation rules."""
-        return self.config_manager.update_rules(new_rules)
\ No newline at end of file
+        return self.config_manager.update_rules(new_rules)
+
+def _chunked(items: Iterable, size: int) -> Iterator[List]:
+    """Yield lists of up to size items, reading the iterable lazily."""
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class _AuditRecorder:
+    """
+    Stand-in for AuditLogger in batch worker processes.
+    
+    Records the audit calls made while cleaning a chunk so that the parent
+    DataCleaner can replay them through its own AuditLogger.
+    """
+    
+    def __init__(self):
+        self.events = []
+    
+    def log_cleaning_action(self, cleaning_result: FieldCleaningResult) -> None:
+        self.events.append(('log_cleaning_action', (cleaning_result,)))
+    
+    def log_validation_decision(self, validation_result: ValidationResult) -> None:
+        self.events.append(('log_validation_decision', (validation_result,)))
+    
+    def log_rejection(self, data: Dict[str, Any], reasons: List[str]) -> None:
+        self.events.append(('log_rejection', (data, reasons)))
+
+
+# Cleaner of a batch worker process, built once by _init_batch_worker
+_batch_cleaner: Optional[DataCleaner] = None
+
+
+def _init_batch_worker(program: CleaningProgram, validation_rules: Dict[str, Any], cache_size: int) -> None:
+    """Build the worker's cleaner from the parent's rules, without reading configuration files."""
+    global _batch_cleaner
+    
+    # Workers keep their own in-memory cache of results under the parent's rules
+    cache = CleaningResultCache(cache_size) if cache_size > 0 else None
+    
+    cleaner = DataCleaner.__new__(DataCleaner)
+    cleaner.logger = get_logger('data_cleaner')
+    cleaner.config_manager = None
+    cleaner.cleaning_engine = CleaningRulesEngine(program.rules, program, cache)
+    cleaner.validation_engine = ValidationEngine(validation_rules, cache)
+    _batch_cleaner = cleaner
+
+
+def _clean_batch_chunk(chunk: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> Tuple[
+        List[CleaningResult], List[Tuple[str, tuple]], Dict[str, int], Dict[str, Any], Tuple[int, int]]:
+    """
+    Clean one chunk in a worker process.
+    
+    Returns:
+        Results in chunk order, recorded audit events, and the cleaning,
+        validation and cache statistics of this chunk alone
+    """
+    cleaner = _batch_cleaner
+    cache = cleaner.cleaning_engine.cache
+    cleaner.audit_logger = _AuditRecorder()
+    cleaner.validation_engine = ValidationEngine(cleaner.validation_engine.rules, cache)
+    cleaner.stats = {'total_processed': 0, 'successful_cleanings': 0, 'rejections': 0}
+    if cache is not None:
+        cache.hits = cache.misses = 0
+    
+    results = [cleaner._clean_record(raw_data, lead_context) for raw_data, lead_context in chunk]
+    
+    cache_counts = (cache.hits, cache.misses) if cache is not None else (0, 0)
+    return (results, cleaner.audit_logger.events, cleaner.stats, cleaner.validation_engine.validation_stats,
+            cache_counts)
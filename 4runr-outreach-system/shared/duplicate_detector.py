@@ -4,11 +4,22 @@ Duplicate Detector
 
 Advanced duplicate detection and resolution system for database maintenance.
 Identifies duplicates across local database and Airtable using configurable matching criteria.
+
+Duplicates within one system are found without comparing every pair of records:
+- records are grouped into blocks by keys (exact field value, email, normalized
+  URL, LinkedIn slug, name soundex plus company prefix, rare name trigrams)
+- records sharing an exact-value key are duplicates without comparison; other
+  records are compared only within their blocks
+- exact matches are merged with union-find, so transitive exact duplicates form
+  one group; near matches then attach whole exact groups to a seed group in
+  record order, so chains of similar values cannot grow into one giant group
+- group confidence is the mean best-field similarity of every pair in the group
 """
 
 import logging
+from collections import Counter, defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 import re
@@ -16,6 +27,72 @@ import re
 # Configure logging
 logger = logging.getLogger('duplicate-detector')
 
+# Rarest trigrams of a text value used as blocking keys
+TRIGRAM_KEYS_PER_VALUE = 4
+
+# Blocks larger than this are too unspecific to compare all pairs within
+DEFAULT_MAX_BLOCK_SIZE = 100
+
+_LINKEDIN_SLUG_PATTERN = re.compile(r'linkedin\.com/(?:in|company|pub)/([^/?#]+)')
+_SOUNDEX_CODES = {
+    **dict.fromkeys('bfpv', '1'), **dict.fromkeys('cgjkqsxz', '2'),
+    **dict.fromkeys('dt', '3'), 'l': '4', **dict.fromkeys('mn', '5'), 'r': '6'
+}
+
+
+def _soundex(word: str) -> str:
+    """American Soundex code of a word ('' if it has no letters)."""
+    letters = [c for c in word.lower() if 'a' <= c <= 'z']
+    if not letters:
+        return ''
+    
+    code = letters[0].upper()
+    previous = _SOUNDEX_CODES.get(letters[0], '')
+    for letter in letters[1:]:
+        digit = _SOUNDEX_CODES.get(letter, '')
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        # h and w do not separate letters with the same code
+        if letter not in 'hw':
+            previous = digit
+    
+    return code.ljust(4, '0')
+
+
+def _trigrams(value: str) -> Set[str]:
+    """Character trigrams of a value (the value itself when shorter)."""
+    if len(value) < 3:
+        return {value}
+    return {value[i:i + 3] for i in range(len(value) - 2)}
+
+
+class _UnionFind:
+    """Disjoint sets over record indexes, with path halving and union by size."""
+    
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+    
+    def find(self, index: int) -> int:
+        parent = self.parent
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+    
+    def union(self, first: int, second: int) -> bool:
+        """Merge the sets of two indexes; False if they were already one set."""
+        root1, root2 = self.find(first), self.find(second)
+        if root1 == root2:
+            return False
+        if self.size[root1] < self.size[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        self.size[root1] += self.size[root2]
+        return True
+
 @dataclass
 class DuplicateGroup:
     """Group of duplicate records with resolution information."""
@@ -58,14 +135,16 @@ class DuplicateDetector:
     matching criteria and provides intelligent resolution strategies.
     """
     
-    def __init__(self, matching_threshold: float = 0.85):
+    def __init__(self, matching_threshold: float = 0.85, max_block_size: int = DEFAULT_MAX_BLOCK_SIZE):
         """
         Initialize the duplicate detector.
         
         Args:
             matching_threshold: Minimum similarity score for duplicate detection (0.0-1.0)
+            max_block_size: Largest block of candidate records compared pairwise
         """
         self.matching_threshold = matching_threshold
+        self.max_block_size = max_block_size
         logger.info(f"DuplicateDetector initialized with threshold: {matching_threshold}")
     
     def find_database_duplicates(self, matching_fields: List[str]) -> List[DuplicateGroup]:
@@ -203,29 +282,67 @@ class DuplicateDetector:
     
     def _find_duplicates_in_records(self, records: List[Dict[str, Any]], matching_fields: List[str], source: str) -> List[DuplicateGroup]:
         """Find duplicates within a list of records."""
-        duplicate_groups = []
-        processed_records = set()
+        values = [self._normalized_values(record, matching_fields) for record in records]
+        profiles = [self._comparison_profile(record_values) for record_values in values]
+        groups = _UnionFind(len(records))
+        comparisons = 0
+        
+        exact_blocks, candidate_blocks = self._build_blocks(records, values)
         
-        for i, record1 in enumerate(records):
-            if i in processed_records:
+        # Records sharing an exact key match with similarity 1.0
+        for members in exact_blocks.values():
+            for index in members[1:]:
+                groups.union(members[0], index)
+        
+        # Near (below 1.0) matches by record pair, kept apart so they cannot chain
+        near_matches: Set[Tuple[int, int]] = set()
+        for key, members in candidate_blocks.items():
+            if len(members) > self.max_block_size:
+                logger.debug(f"Skipping {source} block {key[:2]} with {len(members)} records")
                 continue
-            
-            duplicates = [record1]
-            processed_records.add(i)
-            
-            # Compare with remaining records
-            for j, record2 in enumerate(records[i+1:], i+1):
-                if j in processed_records:
-                    continue
-                
-                match_result = self._compare_records(record1, record2, matching_fields)
-                
-                if match_result['is_duplicate']:
-                    duplicates.append(record2)
-                    processed_records.add(j)
+            for position, first in enumerate(members):
+                for second in members[position + 1:]:
+                    # Already connected or scored through other blocks
+                    if groups.find(first) == groups.find(second) or (first, second) in near_matches:
+                        continue
+                    comparisons += 1
+                    score = self._profiles_score(profiles[first], profiles[second])
+                    if score == 1.0:
+                        groups.union(first, second)
+                    elif score >= self.matching_threshold:
+                        near_matches.add((first, second))
+        
+        logger.debug(f"Compared {comparisons} candidate pairs among {len(records)} {source} records")
+        
+        members_by_root: Dict[int, List[int]] = defaultdict(list)
+        for index in range(len(records)):
+            members_by_root[groups.find(index)].append(index)
+        
+        near_by_root: Dict[int, Set[int]] = defaultdict(set)
+        for first, second in near_matches:
+            root1, root2 = groups.find(first), groups.find(second)
+            if root1 != root2:
+                near_by_root[root1].add(root2)
+                near_by_root[root2].add(root1)
+        
+        # In record order, each unclaimed exact group seeds a group and claims its
+        # unclaimed near matches; claimed groups do not claim their own near matches
+        claimed = set()
+        duplicate_groups = []
+        for root, seed_members in members_by_root.items():
+            if root in claimed:
+                continue
+            claimed.add(root)
+            members = list(seed_members)
+            for other in near_by_root.get(root, ()):
+                if other not in claimed:
+                    claimed.add(other)
+                    members.extend(members_by_root[other])
             
             # If we found duplicates, create a group
-            if len(duplicates) > 1:
+            if len(members) > 1:
+                duplicates = [records[index] for index in sorted(members)]
+                
                 # Determine the best matching field for this group
                 best_field = self._determine_best_matching_field(duplicates, matching_fields)
                 matching_value = str(duplicates[0].get(best_field, ''))
@@ -244,6 +361,142 @@ class DuplicateDetector:
         
         return duplicate_groups
     
+    def _normalized_values(self, record: Dict[str, Any], matching_fields: List[str]) -> Dict[str, str]:
+        """Non-empty matching field values of a record, normalized as _compare_records does."""
+        values = {}
+        for field in matching_fields:
+            value = str(record.get(field, '')).strip().lower()
+            if value:
+                values[field] = value
+        return values
+    
+    def _build_blocks(self, records: List[Dict[str, Any]], values: List[Dict[str, str]]) -> Tuple[Dict[tuple, List[int]], Dict[tuple, List[int]]]:
+        """
+        Group record indexes by blocking key.
+        
+        Returns:
+            Tuple of exact blocks (every pair is a duplicate) and candidate
+            blocks (pairs still need comparing)
+        """
+        trigram_counts: Dict[Tuple[str, str], int] = defaultdict(int)
+        record_trigrams = []
+        for record_values in values:
+            grams = {}
+            for field, value in record_values.items():
+                if self._is_text_value(value):
+                    grams[field] = _trigrams(value)
+                    for gram in grams[field]:
+                        trigram_counts[(field, gram)] += 1
+            record_trigrams.append(grams)
+        
+        exact_blocks: Dict[tuple, List[int]] = defaultdict(list)
+        candidate_blocks: Dict[tuple, List[int]] = defaultdict(list)
+        
+        for index, record_values in enumerate(values):
+            for key in self._exact_keys(record_values):
+                exact_blocks[key].append(index)
+            
+            keys = set(self._candidate_keys(record_values, records[index]))
+            for field, grams in record_trigrams[index].items():
+                # Rare shared trigrams give small blocks that still catch near-identical values
+                shared = [gram for gram in grams if trigram_counts[(field, gram)] > 1]
+                rarest = sorted(shared, key=lambda gram: (trigram_counts[(field, gram)], gram))
+                keys.update(('trigram', field, gram) for gram in rarest[:TRIGRAM_KEYS_PER_VALUE])
+            for key in keys:
+                candidate_blocks[key].append(index)
+        
+        return exact_blocks, {key: members for key, members in candidate_blocks.items() if len(members) > 1}
+    
+    def _exact_keys(self, record_values: Dict[str, str]) -> Iterator[tuple]:
+        """Keys whose equality alone makes two records duplicates."""
+        for field, value in record_values.items():
+            yield ('value', field, value)
+            if value.startswith(('http://', 'https://')):
+                yield ('normalized_url', field, self._normalize_url(value))
+    
+    def _candidate_keys(self, record_values: Dict[str, str], record: Dict[str, Any]) -> Iterator[tuple]:
+        """Keys of records that may be duplicates and need comparing."""
+        for field, value in record_values.items():
+            if '@' in value:
+                yield ('email_domain', field, value.rsplit('@', 1)[1])
+            
+            slug = _LINKEDIN_SLUG_PATTERN.search(value)
+            if slug:
+                yield ('linkedin', field, slug.group(1))
+            if '.' in value and ' ' not in value and '@' not in value:
+                # Lets URLs without a protocol meet protocol-prefixed ones
+                yield ('url', field, self._normalize_url(value))
+        
+        name = record_values.get('name')
+        if name:
+            name_code = ''.join(_soundex(token) for token in name.split()[:2])
+            yield ('name', name_code)
+            
+            # Narrower block for common names whose name block is too large
+            company = str(record.get('company') or '').strip().lower()
+            if company:
+                yield ('name_company', name_code, re.sub(r'[^a-z0-9]', '', company)[:4])
+    
+    def _is_text_value(self, value: str) -> bool:
+        """Whether a value is compared by text similarity rather than exactly."""
+        return '@' not in value and not value.startswith(('http://', 'https://'))
+    
+    def _comparison_profile(self, record_values: Dict[str, str]) -> Dict[str, Tuple[str, Optional[str], Optional[Counter]]]:
+        """
+        Per field: the value, its normalized URL (URLs only) and its character
+        counts (text only), computed once per record instead of once per pair.
+        """
+        profile = {}
+        for field, value in record_values.items():
+            is_url = value.startswith(('http://', 'https://'))
+            profile[field] = (
+                value,
+                self._normalize_url(value) if is_url else None,
+                Counter(value) if not is_url and '@' not in value else None
+            )
+        return profile
+    
+    def _profiles_score(self, profile1: Dict[str, tuple], profile2: Dict[str, tuple]) -> float:
+        """
+        Best shared-field similarity, as _compare_records scores it, or 0.0
+        when no field reaches the matching threshold.
+        """
+        best = 0.0
+        for field, entry1 in profile1.items():
+            entry2 = profile2.get(field)
+            if entry2 is not None:
+                best = max(best, self._similarity(entry1, entry2))
+                if best == 1.0:
+                    break
+        return best
+    
+    def _similarity(self, entry1: tuple, entry2: tuple) -> float:
+        """
+        Similarity of two profiled values when it reaches the matching
+        threshold, else 0.0.
+        
+        Scores the same as _calculate_similarity, but rejects most pairs
+        on length and character-count upper bounds of the SequenceMatcher
+        ratio before computing the ratio itself.
+        """
+        value1, url1, chars1 = entry1
+        value2, url2, chars2 = entry2
+        if value1 == value2:
+            return 1.0
+        if '@' in value1 and '@' in value2:
+            return 0.0
+        if url1 is not None or url2 is not None:
+            return 1.0 if (url1 or self._normalize_url(value1)) == (url2 or self._normalize_url(value2)) else 0.0
+        
+        total = len(value1) + len(value2)
+        threshold = self.matching_threshold * total / 2.0
+        if min(len(value1), len(value2)) < threshold:
+            return 0.0
+        if chars1 is not None and chars2 is not None and sum((chars1 & chars2).values()) < threshold:
+            return 0.0
+        ratio = SequenceMatcher(None, value1, value2).ratio()
+        return ratio if ratio >= self.matching_threshold else 0.0
+    
     def _compare_records(self, record1: Dict[str, Any], record2: Dict[str, Any], matching_fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """Compare two records for similarity."""
         if matching_fields is None:
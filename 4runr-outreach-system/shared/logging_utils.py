@@ -2,17 +2,250 @@
 Logging utilities for the 4Runr Autonomous Outreach System.
 
 Provides structured logging with engagement tracking and JSON log export capabilities.
+
+JSON logs are stored one entry per line (NDJSON) in daily files such as
+``engager_log_2025-01-31.ndjson``. Each entry is appended with a single
+O_APPEND write, so logging is O(1) per call and writes need no locking. A lock
+only guards the per-process descriptor cache; descriptors are reference
+counted so one is never closed while a write is using it, and are reopened
+when the file on disk has been replaced. ``load_daily_logs`` reads both the
+NDJSON files and the older ``*.json`` array files so existing tooling keeps
+working.
 """
 
 import os
 import json
 import logging
 import datetime
-from typing import Dict, Any, Optional
+import threading
+import time
+from typing import Dict, Any, Optional, List, Iterator, Union
 from pathlib import Path
 from .config import config
 
 
+JSON_LOG_SUFFIX = '.ndjson'
+LEGACY_JSON_LOG_SUFFIX = '.json'
+
+# Seconds between checks that a cached descriptor still refers to the file on disk
+APPEND_FD_RECHECK_SECONDS = 1.0
+
+
+class _AppendFd:
+    """A cached O_APPEND descriptor and the writes currently using it."""
+    
+    __slots__ = ('fd', 'users', 'retired', 'checked_at')
+    
+    def __init__(self, fd: int, checked_at: float):
+        self.fd = fd
+        self.users = 0
+        self.retired = False
+        self.checked_at = checked_at
+
+
+# Per-process cache of append-mode descriptors, keyed by log path. The lock
+# guards the cache and reference counts only; writes happen outside it, and a
+# retired descriptor is closed by the last write using it.
+_append_fds: Dict[str, _AppendFd] = {}
+_append_fds_lock = threading.Lock()
+
+
+def _same_file(fd: int, path: str) -> bool:
+    """Check that a descriptor still refers to the file at path."""
+    try:
+        on_disk = os.stat(path)
+    except FileNotFoundError:
+        return False
+    opened = os.fstat(fd)
+    return (opened.st_ino, opened.st_dev) == (on_disk.st_ino, on_disk.st_dev)
+
+
+def _retire_append_fd(key: str) -> None:
+    """Drop a descriptor from the cache, closing it unless a write is using it (lock held)."""
+    entry = _append_fds.pop(key, None)
+    if entry is None:
+        return
+    entry.retired = True
+    if entry.users == 0:
+        os.close(entry.fd)
+
+
+def _acquire_append_fd(log_file: Path) -> _AppendFd:
+    """Get a cached O_APPEND descriptor for a log file, reopening it if the file was replaced."""
+    key = str(log_file)
+    now = time.monotonic()
+    with _append_fds_lock:
+        entry = _append_fds.get(key)
+        if entry is not None and now - entry.checked_at >= APPEND_FD_RECHECK_SECONDS:
+            entry.checked_at = now
+            if not _same_file(entry.fd, key):
+                # Replaced (migration) or removed since it was opened
+                _retire_append_fd(key)
+                entry = None
+        if entry is None:
+            entry = _AppendFd(os.open(key, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644), now)
+            _append_fds[key] = entry
+            _close_stale_fds(log_file)
+        entry.users += 1
+        return entry
+
+
+def _release_append_fd(entry: _AppendFd) -> None:
+    """Finish a write, closing the descriptor if it was retired meanwhile."""
+    with _append_fds_lock:
+        entry.users -= 1
+        if entry.retired and entry.users == 0:
+            os.close(entry.fd)
+
+
+def _close_stale_fds(current_file: Path) -> None:
+    """Retire descriptors for earlier days of the same log once a new day starts (lock held)."""
+    stem = current_file.name.rsplit('_', 1)[0]
+    for key in list(_append_fds):
+        path = Path(key)
+        if path != current_file and path.parent == current_file.parent and path.name.rsplit('_', 1)[0] == stem:
+            _retire_append_fd(key)
+
+
+def append_json_log(log_file: Union[str, Path], log_entry: Dict[str, Any]) -> None:
+    """
+    Append one entry to an NDJSON log file.
+    
+    Args:
+        log_file: Path of the .ndjson file
+        log_entry: JSON-serializable log entry
+    """
+    line = (json.dumps(log_entry, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+    entry = _acquire_append_fd(Path(log_file))
+    try:
+        # A single O_APPEND write of one line needs no lock
+        os.write(entry.fd, line)
+    finally:
+        _release_append_fd(entry)
+
+
+def read_log_entries(log_file: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream entries from a JSON log file in either format.
+    
+    Args:
+        log_file: NDJSON file, or a legacy JSON array file
+        
+    Yields:
+        Log entries in file order
+    """
+    log_file = Path(log_file)
+    if not log_file.exists():
+        return
+    
+    if log_file.suffix == LEGACY_JSON_LOG_SUFFIX:
+        with open(log_file, 'r', encoding='utf-8') as f:
+            try:
+                entries = json.load(f)
+            except json.JSONDecodeError:
+                entries = []
+        yield from (entries if isinstance(entries, list) else [entries])
+        return
+    
+    with open(log_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # Skip a torn line left by a crash mid-write
+                continue
+
+
+def load_daily_logs(log_name: str, date: Optional[Union[str, datetime.date]] = None,
+                    log_directory: Optional[Union[str, Path]] = None) -> List[Dict[str, Any]]:
+    """
+    Load all entries of one daily JSON log.
+    
+    Args:
+        log_name: Log name, e.g. 'engager_log', 'engagement_log' or 'error_log'
+        date: Day to load (defaults to today)
+        log_directory: Directory holding the logs (defaults to the configured one)
+        
+    Returns:
+        Entries from the legacy JSON array file followed by the NDJSON file
+    """
+    if date is None:
+        date = datetime.date.today()
+    if isinstance(date, datetime.date):
+        date = date.isoformat()
+    if log_directory is None:
+        log_directory = config.get_logging_config()['log_directory']
+    
+    base = Path(log_directory) / f"{log_name}_{date}"
+    entries = list(read_log_entries(base.with_name(base.name + LEGACY_JSON_LOG_SUFFIX)))
+    entries.extend(read_log_entries(base.with_name(base.name + JSON_LOG_SUFFIX)))
+    return entries
+
+
+def migrate_json_logs(log_directory: Optional[Union[str, Path]] = None) -> int:
+    """
+    Convert legacy JSON array logs into NDJSON files.
+    
+    Entries are placed before those already in the matching .ndjson file and
+    the old file is removed once the conversion succeeds. Writers notice the
+    replaced file within APPEND_FD_RECHECK_SECONDS; entries they append to
+    the old file until then are carried over.
+    
+    Args:
+        log_directory: Directory holding the logs (defaults to the configured one)
+        
+    Returns:
+        Number of files migrated
+    """
+    if log_directory is None:
+        log_directory = config.get_logging_config()['log_directory']
+    
+    replaced = []
+    for legacy_file in sorted(Path(log_directory).glob(f"*_log_*{LEGACY_JSON_LOG_SUFFIX}")):
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+        if not isinstance(entries, list):
+            continue
+        
+        target = legacy_file.with_suffix(JSON_LOG_SUFFIX)
+        lines = ''.join(json.dumps(e, ensure_ascii=False, default=str) + '\n' for e in entries)
+        tmp_file = target.with_suffix(JSON_LOG_SUFFIX + '.tmp')
+        
+        old = open(target, 'ab+')
+        old.seek(0)
+        existing = old.read()
+        
+        # Legacy entries are older, so they go before anything already appended
+        with open(tmp_file, 'wb') as f:
+            f.write(lines.encode('utf-8'))
+            f.write(existing)
+        os.replace(tmp_file, target)
+        with _append_fds_lock:
+            _retire_append_fd(str(target))
+        
+        legacy_file.unlink()
+        replaced.append((target, old))
+    
+    if replaced:
+        # Let writers in this and other processes move to the new files, then
+        # carry over what they appended to the old ones meanwhile
+        time.sleep(APPEND_FD_RECHECK_SECONDS + 0.1)
+        for target, old in replaced:
+            with old:
+                late = old.read()
+            if late:
+                with open(target, 'ab') as f:
+                    f.write(late)
+    
+    return len(replaced)
+
+
 class OutreachLogger:
     """Enhanced logger for outreach system with engagement tracking."""
     
@@ -120,7 +353,7 @@ class OutreachLogger:
         
         # Save detailed log
         if self.save_json_logs:
-            filename = f"engagement_log_{datetime.date.today().isoformat()}.json"
+            filename = f"engagement_log_{datetime.date.today().isoformat()}{JSON_LOG_SUFFIX}"
             self._append_json_log(filename, log_entry)
     
     def log_error(self, error: Exception, context: Dict[str, Any]) -> None:
@@ -147,7 +380,7 @@ class OutreachLogger:
         
         # Save to JSON log
         if self.save_json_logs:
-            filename = f"error_log_{datetime.date.today().isoformat()}.json"
+            filename = f"error_log_{datetime.date.today().isoformat()}{JSON_LOG_SUFFIX}"
             self._append_json_log(filename, log_entry)
     
     def log_pipeline_start(self, total_leads: int) -> None:
@@ -164,33 +397,28 @@ class OutreachLogger:
         self.logger.info(f"[PROGRESS] {current}/{total} ({percentage:.1f}%)")
     
     def _save_json_log(self, log_entry: Dict[str, Any]) -> None:
-        """Save a single log entry to JSON file."""
-        filename = f"{self.module_name}_log_{datetime.date.today().isoformat()}.json"
+        """Save a single log entry to the module's daily NDJSON file."""
+        filename = f"{self.module_name}_log_{datetime.date.today().isoformat()}{JSON_LOG_SUFFIX}"
         self._append_json_log(filename, log_entry)
     
     def _append_json_log(self, filename: str, log_entry: Dict[str, Any]) -> None:
-        """Append log entry to JSON file."""
+        """Append log entry to an NDJSON file."""
         try:
-            log_file = self.log_directory / filename
-            
-            # Read existing logs
-            logs = []
-            if log_file.exists():
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    try:
-                        logs = json.load(f)
-                    except json.JSONDecodeError:
-                        logs = []
-            
-            # Append new log entry
-            logs.append(log_entry)
-            
-            # Write back to file
-            with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(logs, f, indent=2, ensure_ascii=False)
-                
+            append_json_log(self.log_directory / filename, log_entry)
         except Exception as e:
             self.logger.error(f"Failed to save JSON log: {str(e)}")
+    
+    def load_json_logs(self, date: Optional[Union[str, datetime.date]] = None) -> List[Dict[str, Any]]:
+        """
+        Load this module's JSON log entries for a day.
+        
+        Args:
+            date: Day to load (defaults to today)
+            
+        Returns:
+            List of log entries
+        """
+        return load_daily_logs(f"{self.module_name}_log", date, self.log_directory)
 
 
 def get_logger(module_name: str) -> OutreachLogger:
@@ -0,0 +1,118 @@
+"""
+Streaming statistics with constant memory.
+
+Long-running processes used to keep every sample in a list to report
+averages and most common values. These accumulators keep a fixed-size
+summary instead, so memory stays flat however many samples are added:
+
+- RunningStats: count, mean, variance, min and max (Welford's algorithm)
+- Histogram: sample counts per fixed bucket
+- TopKCounter: counts of the most frequent keys, exact while there are at
+  most `capacity` distinct keys and approximate (Space-Saving) beyond that
+"""
+
+import math
+from bisect import bisect_left
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+class RunningStats:
+    """Count, mean, variance and range of a stream of numbers."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        """Add one sample."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the samples."""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def stddev(self) -> float:
+        """Population standard deviation of the samples."""
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable summary."""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'variance': self.variance,
+            'stddev': self.stddev,
+            'min': self.min,
+            'max': self.max
+        }
+
+
+class Histogram:
+    """Sample counts per bucket, bounded by fixed upper edges."""
+
+    def __init__(self, edges: Sequence[float]):
+        """
+        Args:
+            edges: Ascending upper bounds of the buckets; larger samples go to an overflow bucket
+        """
+        self.edges = list(edges)
+        self.counts = [0] * (len(self.edges) + 1)
+
+    def add(self, value: float) -> None:
+        """Count one sample in the first bucket whose edge is not below it."""
+        self.counts[bisect_left(self.edges, value)] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable bucket counts; the last count is the overflow bucket."""
+        return {'edges': list(self.edges), 'counts': list(self.counts)}
+
+
+class TopKCounter:
+    """Counts of the most frequent keys in bounded memory."""
+
+    def __init__(self, capacity: int = 100):
+        """
+        Args:
+            capacity: Distinct keys tracked
+        """
+        self.capacity = capacity
+        self.counts: Dict[Hashable, int] = {}
+
+    def add(self, key: Hashable, count: int = 1) -> None:
+        """
+        Count a key.
+
+        Once `capacity` keys are tracked, a new key replaces the least frequent
+        one and inherits its count, so frequent keys are never undercounted.
+        """
+        if key in self.counts or len(self.counts) < self.capacity:
+            self.counts[key] = self.counts.get(key, 0) + count
+            return
+
+        evicted = min(self.counts, key=self.counts.get)
+        self.counts[key] = self.counts.pop(evicted) + count
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[Hashable, int]]:
+        """Keys and counts, most frequent first."""
+        items = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        return items if n is None else items[:n]
+
+    def to_dict(self) -> Dict[Hashable, int]:
+        """Counts of the tracked keys, most frequent first."""
+        return dict(self.most_common())
+
+    def __len__(self) -> int:
+        return len(self.counts)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared Airtable schema cache.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from shared.airtable_schema import AirtableSchemaCache, is_unknown_field_error
+from shared.airtable_stub import AirtableStubServer
+from shared.airtable_transport import AirtableTransport
+
+
+class TestAirtableSchemaCache(unittest.TestCase):
+    """Test schema caching against the local Airtable stand-in."""
+
+    def setUp(self):
+        """Start an unthrottled stand-in with one table and a transport pointing at it."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'schema.db')
+        self.server = AirtableStubServer(requests_per_second=0).start()
+        self.server.stub.define_table('appTEST', 'Leads', ['Full Name', 'Email', 'Level Engaged'])
+
+        self.transport = AirtableTransport(
+            'test_key', 'appTEST',
+            endpoint_url=self.server.url,
+            requests_per_second=1000,
+            limiter_path=os.path.join(self.temp_dir, 'limiter.db')
+        )
+
+    def tearDown(self):
+        """Stop the server and clean up."""
+        self.transport.close()
+        self.server.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def _requests(self):
+        return self.server.stub.stats()['requests']
+
+    def test_field_names_fetched_once(self):
+        """Repeated lookups, from any cache on the same file, are served from disk."""
+        schema = AirtableSchemaCache(self.transport, db_path=self.db_path)
+
+        self.assertTrue(schema.has_field('Leads', 'Level Engaged'))
+        self.assertEqual(self._requests(), 1)
+
+        other_process = AirtableSchemaCache(self.transport, db_path=self.db_path)
+        self.assertEqual(sorted(other_process.get_field_names('Leads')),
+                         ['Email', 'Full Name', 'Level Engaged'])
+        self.assertEqual(self._requests(), 1)
+
+    def test_expired_entry_refetched(self):
+        """Entries older than the TTL are fetched again."""
+        schema = AirtableSchemaCache(self.transport, ttl=0.05, db_path=self.db_path)
+        schema.get_field_names('Leads')
+        time.sleep(0.1)
+
+        schema.get_field_names('Leads')
+
+        self.assertEqual(self._requests(), 2)
+
+    def test_invalidate_after_unknown_field(self):
+        """An unknown-field failure invalidates the table so the new field is seen."""
+        schema = AirtableSchemaCache(self.transport, db_path=self.db_path)
+        self.assertFalse(schema.has_field('Leads', 'Website'))
+
+        self.server.stub.define_table('appTEST', 'Leads', ['Full Name', 'Email', 'Website'])
+        response = self.transport.post(self.transport.table_url('Leads'), json={
+            'records': [{'fields': {'Level Engaged': 'Yes'}}]
+        })
+        error = Exception(response.text)
+        self.assertTrue(is_unknown_field_error(error))
+
+        schema.invalidate('Leads')
+
+        self.assertTrue(schema.has_field('Leads', 'Website'))
+
+    def test_unknown_table_sampled(self):
+        """Tables missing from the metadata response fall back to sampling records."""
+        self.server.stub.seed('appTEST', 'Contacts', [{'Name': 'Ann'}, {'Name': 'Bo', 'Phone': '1'}])
+        schema = AirtableSchemaCache(self.transport, db_path=self.db_path)
+
+        # The stand-in lists seeded tables in the schema too; drop it to force sampling
+        schema._fetch_base_schema = lambda: None
+
+        self.assertEqual(schema.get_field_names('Contacts'), ['Name', 'Phone'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
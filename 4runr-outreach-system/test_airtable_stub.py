@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the local Airtable stand-in server.
+"""
+
+import datetime
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from shared.airtable_stub import AirtableStubServer, compile_formula
+
+
+class TestFormulas(unittest.TestCase):
+    """Test filterByFormula evaluation."""
+
+    def setUp(self):
+        now = datetime.datetime(2025, 1, 2, 12, 0, tzinfo=datetime.timezone.utc)
+        self.record = {
+            'id': 'rec1', 'created': now, 'modified': now,
+            'fields': {'Name': 'Ann Lee', 'Score': 7},
+        }
+
+    def _matches(self, formula):
+        predicate, _ = compile_formula(formula)
+        return predicate(self.record)
+
+    def test_comparisons_and_functions(self):
+        """Common formula shapes evaluate like Airtable's."""
+        self.assertTrue(self._matches("AND({Name} = 'Ann Lee', {Score} > 5)"))
+        self.assertTrue(self._matches("OR(RECORD_ID()='rec9', RECORD_ID()='rec1')"))
+        self.assertTrue(self._matches("{Website} = ''"))
+        self.assertFalse(self._matches("NOT(LOWER({Name}) = 'ann lee')"))
+        self.assertTrue(self._matches("IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('2025-01-01T00:00:00Z'))"))
+        self.assertTrue(self._matches("{Score} * 2 - 4 = 10"))
+
+    def test_unsupported_formula_rejected(self):
+        """Unknown functions and malformed formulas raise."""
+        for formula in ("REGEX_MATCH({Name}, 'A.*')", "AND({Name} = 'x'", "{Name} ="):
+            with self.assertRaises(Exception):
+                compile_formula(formula)
+
+
+class TestAirtableStubServer(unittest.TestCase):
+    """Test the stand-in over HTTP."""
+
+    def setUp(self):
+        """Start an unthrottled server."""
+        self.server = AirtableStubServer(requests_per_second=0).start()
+        self.url = f'{self.server.url}/v0/appTEST/Leads'
+        self.session = requests.Session()
+        self.session.headers['Authorization'] = 'Bearer test_key'
+
+    def tearDown(self):
+        """Stop the server."""
+        self.session.close()
+        self.server.stop()
+
+    def test_list_filters_and_pages(self):
+        """Filtered listing returns pages of pageSize linked by offset."""
+        self.server.stub.seed('appTEST', 'Leads', [{'Name': f'Lead {i}', 'Score': i} for i in range(25)])
+
+        params = {'filterByFormula': '{Score} >= 5', 'pageSize': 10}
+        names = []
+        while True:
+            page = self.session.get(self.url, params=params).json()
+            names.extend(record['fields']['Name'] for record in page['records'])
+            if 'offset' not in page:
+                break
+            params['offset'] = page['offset']
+
+        self.assertEqual(names, [f'Lead {i}' for i in range(5, 25)])
+
+    def test_batch_limits(self):
+        """Batches are created and updated; more than 10 records is rejected."""
+        created = self.session.post(self.url, json={
+            'records': [{'fields': {'Name': f'Lead {i}'}} for i in range(10)]
+        }).json()['records']
+        self.assertEqual(len(created), 10)
+
+        response = self.session.patch(self.url, json={
+            'records': [{'id': record['id'], 'fields': {'Score': 1}} for record in created[:3]]
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['records'][0]['fields'], {'Name': 'Lead 0', 'Score': 1})
+
+        response = self.session.post(self.url, json={'records': [{'fields': {}}] * 11})
+        self.assertEqual(response.status_code, 422)
+
+    def test_requests_without_token_rejected(self):
+        """Requests without a bearer token get 401."""
+        self.assertEqual(requests.get(self.url).status_code, 401)
+
+    def test_throttles_above_rate_limit(self):
+        """Requests beyond the per-second limit get 429 RATE_LIMIT_REACHED."""
+        self.server.stub.requests_per_second = 5
+
+        statuses = [self.session.get(self.url).status_code for _ in range(7)]
+
+        self.assertEqual(statuses[:5], [200] * 5)
+        self.assertEqual(statuses[5:], [429, 429])
+        self.assertEqual(self.server.stub.stats()['throttled'], 2)
+
+    def test_latency_added(self):
+        """Configured latency delays every response."""
+        self.server.stub.latency = 0.05
+
+        started = time.monotonic()
+        self.session.get(self.url)
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+
+
+class TestAirtableClientAgainstStub(unittest.TestCase):
+    """Run the real client against the stand-in via AIRTABLE_ENDPOINT_URL."""
+
+    def setUp(self):
+        """Start a throttled server and point the Airtable settings at it."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.server = AirtableStubServer(requests_per_second=5).start()
+        self.env = patch.dict(os.environ, {
+            'AIRTABLE_API_KEY': 'test_key',
+            'AIRTABLE_BASE_ID': 'appCLIENT',
+            'AIRTABLE_TABLE_NAME': 'Leads',
+            'AIRTABLE_ENDPOINT_URL': self.server.url,
+            'AIRTABLE_RATE_LIMIT_DB': os.path.join(self.temp_dir, 'limiter.db'),
+        })
+        self.env.start()
+
+    def tearDown(self):
+        """Restore the environment and stop the server."""
+        self.env.stop()
+        self.server.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def test_create_update_and_pull(self):
+        """Batched writes and incremental reads round-trip through the stand-in."""
+        from shared.airtable_client import AirtableClient
+
+        client = AirtableClient()
+        record_ids = [result.record_id for result in
+                      client.batch_create_leads([{'Full Name': f'Lead {i}'} for i in range(25)])]
+        self.assertTrue(all(record_ids))
+
+        updated = client.batch_update_leads([{'id': record_ids[0], 'fields': {'Company': 'Acme'}}])
+        self.assertEqual(updated, [record_ids[0]])
+
+        pulled = [lead for page in client.iter_leads_modified_since(page_size=10) for lead in page]
+        self.assertEqual(len(pulled), 25)
+        # Batches are created concurrently, so look the updated record up by ID
+        self.assertEqual({lead['id']: lead for lead in pulled}[record_ids[0]]['Company'], 'Acme')
+
+        since = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=1)
+        self.assertEqual([lead for page in client.iter_leads_modified_since(since) for lead in page], [])
+
+    def test_batch_update_reports_updated_records(self):
+        """A failed batch leaves out exactly its own records."""
+        from shared.airtable_client import AirtableClient
+
+        client = AirtableClient()
+        record_ids = [result.record_id for result in
+                      client.batch_create_leads([{'Full Name': f'Lead {i}'} for i in range(30)])]
+        updates = [{'id': record_id, 'fields': {'Company': 'Acme'}} for record_id in record_ids]
+        updates[15]['id'] = 'recMISSING'
+
+        updated = client.batch_update_leads(updates)
+
+        self.assertEqual(sorted(updated), sorted(record_ids[:10] + record_ids[20:]))
+
+    def test_batch_create_failures_classified(self):
+        """Rejected batches can be resent; timed out ones may exist and are not marked rejected."""
+        from shared.airtable_client import AirtableClient
+
+        self.server.stub.define_table('appCLIENT', 'Leads', ['Full Name', 'Email'])
+        client = AirtableClient()
+
+        rejected = client.batch_create_leads([{'Full Name': 'Ann Lee', 'Phone': '555'}])
+        self.assertTrue(rejected[0].rejected)
+        self.assertIsNone(rejected[0].record_id)
+
+        self.server.stub.latency = 0.5
+        with patch.object(client.transport.session, 'timeout', 0.1):
+            timed_out = client.batch_create_leads([{'Full Name': 'Bo Chan'}])
+        self.assertFalse(timed_out[0].rejected)
+        self.assertIsNone(timed_out[0].record_id)
+
+    def test_find_lead_ids(self):
+        """Existing records are found by exact field value, quotes included."""
+        from shared.airtable_client import AirtableClient
+
+        client = AirtableClient()
+        created = client.batch_create_leads([{'Email': 'ann@example.com'}, {'Email': "o'neil@example.com"}])
+
+        found = client.find_lead_ids('Email', ['ann@example.com', "o'neil@example.com", 'bo@example.com'])
+
+        self.assertEqual(found, {'ann@example.com': created[0].record_id,
+                                 "o'neil@example.com": created[1].record_id})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
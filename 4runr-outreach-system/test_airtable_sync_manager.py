@@ -22,6 +22,7 @@ from airtable_sync_manager import (
     SyncResult, 
     SyncSummary
 )
+from shared.airtable_client import BatchCreateResult
 
 
 class TestAirtableSyncManager(unittest.TestCase):
@@ -135,7 +136,7 @@ class TestAirtableSyncManager(unittest.TestCase):
         mock_db.get_sync_pending_leads.return_value = [self.sample_db_lead]
         
         # Mock Airtable client
-        self.mock_airtable.create_lead.return_value = 'airtable-new-123'
+        self.mock_airtable.batch_create_leads.return_value = [BatchCreateResult(record_id='airtable-new-123')]
         
         # Reinitialize sync manager with mocked database
         sync_manager = AirtableSyncManager(self.temp_db.name)
@@ -150,9 +151,11 @@ class TestAirtableSyncManager(unittest.TestCase):
         self.assertEqual(summary.successful_syncs, 1)
         self.assertEqual(summary.created_records, 1)
         self.assertEqual(summary.failed_syncs, 0)
+        self.assertEqual(summary.sync_results[0].airtable_id, 'airtable-new-123')
         
-        # Verify Airtable create was called
-        self.mock_airtable.create_lead.assert_called_once()
+        # Verify Airtable batch create was called
+        self.mock_airtable.batch_create_leads.assert_called_once()
+        self.mock_airtable.create_lead.assert_not_called()
     
     @patch('airtable_sync_manager.LeadDatabase')
     def test_sync_to_airtable_update_success(self, mock_db_class):
@@ -166,7 +169,7 @@ class TestAirtableSyncManager(unittest.TestCase):
         mock_db.get_sync_pending_leads.return_value = [lead_with_airtable_id]
         
         # Mock Airtable client
-        self.mock_airtable.batch_update_leads.return_value = 1  # 1 successful update
+        self.mock_airtable.batch_update_leads.return_value = ['existing-airtable-123']
         
         # Reinitialize sync manager with mocked database
         sync_manager = AirtableSyncManager(self.temp_db.name)
@@ -185,6 +188,37 @@ class TestAirtableSyncManager(unittest.TestCase):
         # Verify Airtable batch update was called
         self.mock_airtable.batch_update_leads.assert_called_once()
     
+    def test_sync_to_airtable_sends_only_changed_fields(self):
+        """Test that pushes diff against the last pushed payload."""
+        lead = dict(self.sample_db_lead, airtable_id='rec-123')
+        lead.pop('created_at')
+        lead.pop('updated_at')
+        lead_id = self.sync_manager.db.add_lead(lead)
+        self.mock_airtable.batch_update_leads.side_effect = lambda updates: [update['id'] for update in updates]
+        
+        # First push has no history and sends everything
+        summary = self.sync_manager.sync_to_airtable([lead_id])
+        first_fields = self.mock_airtable.batch_update_leads.call_args[0][0][0]['fields']
+        self.assertEqual(summary.updated_records, 1)
+        self.assertIn('Email', first_fields)
+        
+        # Unchanged lead marked for sync is skipped without an API call
+        self.mock_airtable.batch_update_leads.reset_mock()
+        self.sync_manager.mark_for_sync(lead_id)
+        summary = self.sync_manager.sync_to_airtable([lead_id])
+        self.mock_airtable.batch_update_leads.assert_not_called()
+        self.assertEqual((summary.skipped_records, summary.updated_records), (1, 0))
+        self.assertEqual(summary.fields_saved, len(first_fields) - 1)
+        self.assertGreater(summary.bytes_saved, 0)
+        
+        # A single changed column produces a single-field PATCH
+        self.sync_manager.db.update_lead(lead_id, {'title': 'CTO'})
+        summary = self.sync_manager.sync_to_airtable([lead_id])
+        sent_fields = self.mock_airtable.batch_update_leads.call_args[0][0][0]['fields']
+        self.assertEqual(set(sent_fields), {'Job Title', 'Last Sync'})
+        self.assertEqual(summary.updated_records, 1)
+        self.assertEqual(summary.fields_saved, len(first_fields) - 2)
+    
     @patch('airtable_sync_manager.LeadDatabase')
     def test_sync_to_airtable_create_failure(self, mock_db_class):
         """Test handling of Airtable creation failure."""
@@ -194,6 +228,7 @@ class TestAirtableSyncManager(unittest.TestCase):
         mock_db.get_sync_pending_leads.return_value = [self.sample_db_lead]
         
         # Mock Airtable client to fail
+        self.mock_airtable.batch_create_leads.return_value = [BatchCreateResult(rejected=True)]  # Batch rejected
         self.mock_airtable.create_lead.return_value = None  # Creation failed
         
         # Reinitialize sync manager with mocked database
@@ -216,11 +251,12 @@ class TestAirtableSyncManager(unittest.TestCase):
         # Mock database
         mock_db = MagicMock()
         mock_db_class.return_value = mock_db
-        mock_db.search_leads.return_value = []  # No existing lead
-        mock_db.add_lead.return_value = 'new-db-lead-123'
+        mock_db.get_sync_watermark.return_value = None
+        mock_db.get_lead_ids_by_airtable_ids.return_value = {}  # No existing lead
+        mock_db.add_leads_bulk.return_value = {'lead_ids': ['new-db-lead-123'], 'created': 1, 'merged': 0}
         
         # Mock Airtable client
-        self.mock_airtable.get_leads_for_engagement.return_value = [self.sample_airtable_lead]
+        self.mock_airtable.iter_leads_modified_since.return_value = iter([[self.sample_airtable_lead]])
         
         # Reinitialize sync manager with mocked database
         sync_manager = AirtableSyncManager(self.temp_db.name)
@@ -236,8 +272,10 @@ class TestAirtableSyncManager(unittest.TestCase):
         self.assertEqual(summary.created_records, 1)
         self.assertEqual(summary.failed_syncs, 0)
         
-        # Verify database add was called
-        mock_db.add_lead.assert_called_once()
+        # Verify database add was called and the pull was recorded
+        mock_db.add_leads_bulk.assert_called_once()
+        self.assertEqual(summary.sync_results[0].lead_id, 'new-db-lead-123')
+        mock_db.set_sync_watermark.assert_called_once()
     
     @patch('airtable_sync_manager.LeadDatabase')
     def test_sync_from_airtable_update_success(self, mock_db_class):
@@ -251,11 +289,12 @@ class TestAirtableSyncManager(unittest.TestCase):
         
         mock_db = MagicMock()
         mock_db_class.return_value = mock_db
-        mock_db.search_leads.return_value = [existing_lead]
-        mock_db.update_lead.return_value = True
+        mock_db.get_sync_watermark.return_value = None
+        mock_db.get_lead_ids_by_airtable_ids.return_value = {'airtable-123': existing_lead['id']}
+        mock_db.update_leads.return_value = {existing_lead['id']: 1}
         
         # Mock Airtable client
-        self.mock_airtable.get_leads_for_engagement.return_value = [self.sample_airtable_lead]
+        self.mock_airtable.iter_leads_modified_since.return_value = iter([[self.sample_airtable_lead]])
         
         # Reinitialize sync manager with mocked database
         sync_manager = AirtableSyncManager(self.temp_db.name)
@@ -272,7 +311,8 @@ class TestAirtableSyncManager(unittest.TestCase):
         self.assertEqual(summary.failed_syncs, 0)
         
         # Verify database update was called
-        mock_db.update_lead.assert_called_once()
+        mock_db.update_leads.assert_called_once()
+        mock_db.add_leads_bulk.assert_not_called()
     
     @patch('airtable_sync_manager.LeadDatabase')
     def test_bidirectional_sync(self, mock_db_class):
@@ -281,12 +321,13 @@ class TestAirtableSyncManager(unittest.TestCase):
         mock_db = MagicMock()
         mock_db_class.return_value = mock_db
         mock_db.get_sync_pending_leads.return_value = [self.sample_db_lead]
-        mock_db.search_leads.return_value = []
-        mock_db.add_lead.return_value = 'new-lead-123'
+        mock_db.get_sync_watermark.return_value = None
+        mock_db.get_lead_ids_by_airtable_ids.return_value = {}
+        mock_db.add_leads_bulk.return_value = {'lead_ids': ['new-lead-123'], 'created': 1, 'merged': 0}
         
         # Mock Airtable client
-        self.mock_airtable.create_lead.return_value = 'airtable-new-123'
-        self.mock_airtable.get_leads_for_engagement.return_value = [self.sample_airtable_lead]
+        self.mock_airtable.batch_create_leads.return_value = [BatchCreateResult(record_id='airtable-new-123')]
+        self.mock_airtable.iter_leads_modified_since.return_value = iter([[self.sample_airtable_lead]])
         
         # Reinitialize sync manager with mocked database
         sync_manager = AirtableSyncManager(self.temp_db.name)
@@ -310,6 +351,38 @@ class TestAirtableSyncManager(unittest.TestCase):
         self.assertEqual(pull_summary.total_leads, 1)
         self.assertEqual(pull_summary.successful_syncs, 1)
     
+    def test_sync_from_airtable_incremental(self):
+        """Test that pulls resume from the stored high-water mark."""
+        self.mock_airtable.config = {'base_id': 'appTEST', 'table_name': 'Leads'}
+        second_lead = dict(self.sample_airtable_lead, id='airtable-456', **{
+            'Full Name': 'Sam Lee', 'Email': 'sam.lee@example.com', 'LinkedIn': 'https://linkedin.com/in/samlee'
+        })
+        pages = [[self.sample_airtable_lead], [second_lead]]
+        self.mock_airtable.iter_leads_modified_since.side_effect = lambda since, page_size: iter(pages)
+        
+        # A limited pull applies what it fetched but keeps the mark unset
+        summary = self.sync_manager.sync_from_airtable(limit=1)
+        self.assertEqual(summary.created_records, 1)
+        self.assertIsNone(self.sync_manager.db.get_sync_watermark('airtable_pull:appTEST:Leads'))
+        
+        # The full pull updates the known record and creates the new one
+        summary = self.sync_manager.sync_from_airtable()
+        self.assertEqual((summary.updated_records, summary.created_records), (1, 1))
+        self.assertEqual(self.mock_airtable.iter_leads_modified_since.call_args[0][0], None)
+        self.assertIsNotNone(self.sync_manager.db.get_sync_watermark('airtable_pull:appTEST:Leads'))
+        
+        # The next pull only asks for records changed since, with an overlap
+        before = datetime.datetime.now(datetime.timezone.utc)
+        pages = []
+        summary = self.sync_manager.sync_from_airtable()
+        since = self.mock_airtable.iter_leads_modified_since.call_args[0][0]
+        self.assertEqual(summary.total_leads, 0)
+        self.assertLess(since, before - datetime.timedelta(seconds=self.sync_manager.pull_overlap_seconds - 5))
+        self.assertGreater(since, before - datetime.timedelta(seconds=self.sync_manager.pull_overlap_seconds + 60))
+        
+        lead_ids = self.sync_manager.db.get_lead_ids_by_airtable_ids(['airtable-123', 'airtable-456'])
+        self.assertEqual(len(lead_ids), 2)
+    
     def test_should_update_from_airtable(self):
         """Test logic for determining if update from Airtable is needed."""
         # Test with no updated_at timestamp
@@ -329,9 +402,7 @@ class TestAirtableSyncManager(unittest.TestCase):
         # Mock database
         mock_db = MagicMock()
         mock_db_class.return_value = mock_db
-        mock_db.get_database_stats.return_value = {'total_leads': 100}
-        mock_db.get_sync_pending_leads.return_value = [{'id': '1'}, {'id': '2'}]
-        mock_db.search_leads.return_value = [{'id': '3'}, {'id': '4'}, {'id': '5'}]
+        mock_db.get_database_stats.return_value = {'total_leads': 100, 'sync_queue': 2, 'synced_leads': 3}
         
         # Reinitialize sync manager with mocked database
         sync_manager = AirtableSyncManager(self.temp_db.name)
@@ -391,7 +462,8 @@ class TestAirtableSyncManager(unittest.TestCase):
         mock_db_class.return_value = mock_db
         mock_db.get_sync_pending_leads.return_value = [self.sample_db_lead]
         
-        # Mock Airtable client to fail first two times, succeed on third
+        # Mock Airtable client to reject the batch, fail the record twice, succeed on third
+        self.mock_airtable.batch_create_leads.return_value = [BatchCreateResult(rejected=True, error="422")]
         self.mock_airtable.create_lead.side_effect = [
             Exception("Network error"),
             Exception("Rate limit"),
@@ -428,7 +500,9 @@ class TestAirtableSyncManager(unittest.TestCase):
         mock_db.get_sync_pending_leads.return_value = leads
         
         # Mock Airtable client
-        self.mock_airtable.create_lead.return_value = 'airtable-123'
+        self.mock_airtable.batch_create_leads.side_effect = (
+            lambda records: [BatchCreateResult(record_id=f"airtable-{record['Full Name']}") for record in records]
+        )
         
         # Reinitialize sync manager with mocked database
         sync_manager = AirtableSyncManager(self.temp_db.name)
@@ -442,8 +516,142 @@ class TestAirtableSyncManager(unittest.TestCase):
         self.assertEqual(summary.total_leads, 25)
         self.assertEqual(summary.successful_syncs, 25)
         
-        # Verify create_lead was called for each lead
-        self.assertEqual(self.mock_airtable.create_lead.call_count, 25)
+        # Verify creates were sent in batches of at most 10
+        batch_sizes = [len(call.args[0]) for call in self.mock_airtable.batch_create_leads.call_args_list]
+        self.assertEqual(batch_sizes, [10, 10, 5])
+        self.mock_airtable.create_lead.assert_not_called()
+        
+        # Verify each result carries the ID created for its own lead
+        for result in summary.sync_results:
+            index = result.lead_id.split('-')[1]
+            self.assertEqual(result.airtable_id, f'airtable-Test User {index}')
+    
+    @patch('airtable_sync_manager.LeadDatabase')
+    @patch('airtable_sync_manager.time.sleep')
+    def test_batch_create_partial_failure(self, mock_sleep, mock_db_class):
+        """Test that leads from a rejected batch are retried individually."""
+        leads = []
+        for i in range(4):
+            lead = self.sample_db_lead.copy()
+            lead['id'] = f'lead-{i}'
+            lead['full_name'] = f'Test User {i}'
+            leads.append(lead)
+        
+        # Mock database
+        mock_db = MagicMock()
+        mock_db_class.return_value = mock_db
+        mock_db.get_sync_pending_leads.return_value = leads
+        
+        # Two records were rejected by the batch request
+        self.mock_airtable.batch_create_leads.return_value = [
+            BatchCreateResult(record_id='airtable-0'), BatchCreateResult(rejected=True),
+            BatchCreateResult(record_id='airtable-2'), BatchCreateResult(rejected=True)
+        ]
+        self.mock_airtable.create_lead.side_effect = ['airtable-1', None, None, None]
+        
+        # Reinitialize sync manager with mocked database
+        sync_manager = AirtableSyncManager(self.temp_db.name)
+        sync_manager.airtable = self.mock_airtable
+        sync_manager.db = mock_db
+        
+        # Perform sync
+        summary = sync_manager.sync_to_airtable()
+        
+        # Verify per-record results
+        results = {result.lead_id: result for result in summary.sync_results}
+        self.assertEqual(results['lead-0'].airtable_id, 'airtable-0')
+        self.assertEqual(results['lead-1'].airtable_id, 'airtable-1')
+        self.assertEqual(results['lead-2'].airtable_id, 'airtable-2')
+        self.assertEqual(results['lead-3'].status, SyncStatus.FAILED)
+        self.assertEqual(summary.successful_syncs, 3)
+        self.assertEqual(summary.failed_syncs, 1)
+        
+        # Only the failed records were retried one by one
+        self.assertEqual(self.mock_airtable.create_lead.call_count, 4)
+    
+    def test_batch_update_failed_chunk_matched_by_record_id(self):
+        """Test that only the leads whose records were updated are marked synced."""
+        leads = []
+        for i in range(25):
+            lead = self.sample_db_lead.copy()
+            lead['id'] = f'lead-{i}'
+            lead['airtable_id'] = f'rec-{i}'
+            leads.append(lead)
+        
+        # The second chunk of 10 failed while the others completed
+        self.mock_airtable.batch_update_leads.side_effect = lambda updates: [
+            update['id'] for i, update in enumerate(updates) if not 10 <= i < 20
+        ]
+        self.sync_manager.airtable = self.mock_airtable
+        
+        results = self.sync_manager._batch_update_leads_in_airtable(leads)
+        
+        failed = [result.lead_id for result in results if result.status == SyncStatus.FAILED]
+        self.assertEqual(failed, [f'lead-{i}' for i in range(10, 20)])
+        self.assertTrue(all(result.status == SyncStatus.SUCCESS for result in results if result.lead_id not in failed))
+        
+        self.sync_manager.db = MagicMock()
+        self.sync_manager._update_sync_status_in_db(results)
+        saved = self.sync_manager.db.update_leads.call_args.args[0]
+        self.assertNotIn('airtable_push_hashes', saved['lead-15'])
+        self.assertIn('airtable_push_hashes', saved['lead-20'])
+    
+    def test_batch_create_unknown_outcome_not_resent(self):
+        """Test that leads whose batch may have been created are failed, not recreated."""
+        leads = []
+        for i in range(2):
+            lead = self.sample_db_lead.copy()
+            lead['id'] = f'lead-{i}'
+            leads.append(lead)
+        
+        # The request timed out after it was sent
+        self.mock_airtable.batch_create_leads.return_value = [
+            BatchCreateResult(error='Read timed out'), BatchCreateResult(error='Read timed out')
+        ]
+        self.sync_manager.airtable = self.mock_airtable
+        
+        results = self.sync_manager._sync_batch_to_airtable(leads)
+        
+        self.assertEqual([result.status for result in results], [SyncStatus.FAILED, SyncStatus.FAILED])
+        self.assertEqual(results[0].error_message, 'Read timed out')
+        self.mock_airtable.create_lead.assert_not_called()
+    
+    def test_earlier_create_looked_up_before_recreating(self):
+        """Test that leads with an earlier create attempt are linked to records found in Airtable."""
+        found = dict(self.sample_db_lead, id='lead-found', email='found@example.com',
+                     last_sync_attempt='2025-01-01T00:00:00')
+        missing = dict(self.sample_db_lead, id='lead-missing', email='missing@example.com',
+                       last_sync_attempt='2025-01-01T00:00:00')
+        new = dict(self.sample_db_lead, id='lead-new', email='new@example.com')
+        
+        self.mock_airtable.find_lead_ids.return_value = {'found@example.com': 'airtable-found'}
+        self.mock_airtable.batch_create_leads.side_effect = (
+            lambda records: [BatchCreateResult(record_id=f"airtable-{record['Email']}") for record in records]
+        )
+        self.mock_airtable.batch_update_leads.return_value = ['airtable-found']
+        self.sync_manager.airtable = self.mock_airtable
+        
+        results = {result.lead_id: result for result in self.sync_manager._sync_batch_to_airtable([found, missing, new])}
+        
+        self.mock_airtable.find_lead_ids.assert_called_once_with('Email', ['found@example.com', 'missing@example.com'])
+        created = [record['Email'] for record in self.mock_airtable.batch_create_leads.call_args.args[0]]
+        self.assertEqual(created, ['missing@example.com', 'new@example.com'])
+        self.assertEqual(results['lead-found'].operation, SyncOperation.UPDATE)
+        self.assertEqual(results['lead-found'].airtable_id, 'airtable-found')
+        self.assertEqual(results['lead-found'].status, SyncStatus.SUCCESS)
+        self.assertEqual(results['lead-missing'].airtable_id, 'airtable-missing@example.com')
+    
+    def test_failed_lookup_does_not_recreate(self):
+        """Test that leads are not recreated when the lookup of their earlier create fails."""
+        lead = dict(self.sample_db_lead, last_sync_attempt='2025-01-01T00:00:00')
+        self.mock_airtable.find_lead_ids.side_effect = Exception('Server error')
+        self.sync_manager.airtable = self.mock_airtable
+        
+        results = self.sync_manager._sync_batch_to_airtable([lead])
+        
+        self.assertEqual(results[0].status, SyncStatus.FAILED)
+        self.mock_airtable.batch_create_leads.assert_not_called()
+        self.mock_airtable.create_lead.assert_not_called()
     
     @patch('airtable_sync_manager.LeadDatabase')
     def test_mark_for_sync(self, mock_db_class):
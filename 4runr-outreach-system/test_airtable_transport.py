@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared Airtable transport.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from shared.airtable_transport import AirtableTransport, TokenBucketLimiter
+
+
+LEAD_SCRAPER_COPY = Path(__file__).parent.parent / '4runr-lead-scraper' / 'sync' / 'airtable_transport.py'
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Answers with the next queued status code, then 200, after an optional one-off delay."""
+
+    def do_GET(self):
+        server = self.server
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        with server.lock:
+            server.request_count += 1
+            status, headers = server.responses.pop(0) if server.responses else (200, {})
+            delay, server.delay = server.delay, 0
+        if delay:
+            time.sleep(delay)
+
+        body = json.dumps({'records': [], 'path': self.path}).encode('utf-8')
+        try:
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up waiting
+            pass
+
+    do_POST = do_GET
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestTokenBucketLimiter(unittest.TestCase):
+    """Test the SQLite-backed token bucket."""
+
+    def setUp(self):
+        """Create a temporary limiter database."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'limiter.db')
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_limiters_share_one_bucket(self):
+        """Two limiters on the same file draw from the same budget."""
+        first = TokenBucketLimiter('appTEST', rate=20, capacity=2, db_path=self.db_path)
+        second = TokenBucketLimiter('appTEST', rate=20, capacity=2, db_path=self.db_path)
+
+        started = time.monotonic()
+        for _ in range(3):
+            first.acquire()
+            second.acquire()
+        elapsed = time.monotonic() - started
+
+        # 6 tokens with a burst of 2 need at least 4 refills at 20/s
+        self.assertGreaterEqual(elapsed, 0.15)
+
+    def test_block_for_pauses_bucket(self):
+        """A penalty blocks acquisition until it expires."""
+        limiter = TokenBucketLimiter('appTEST', rate=100, db_path=self.db_path)
+        limiter.block_for(0.2)
+
+        self.assertGreaterEqual(limiter.acquire(), 0.15)
+
+    def test_acquire_timeout(self):
+        """acquire raises when no token arrives in time."""
+        limiter = TokenBucketLimiter('appTEST', rate=1, capacity=1, db_path=self.db_path)
+        limiter.acquire()
+
+        with self.assertRaises(TimeoutError):
+            limiter.acquire(timeout=0.1)
+
+
+class TestAirtableTransport(unittest.TestCase):
+    """Test request handling against a local HTTP server."""
+
+    def setUp(self):
+        """Start a stub server and create a transport pointing at it."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+        self.server.lock = threading.Lock()
+        self.server.request_count = 0
+        self.server.responses = []
+        self.server.delay = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.transport = AirtableTransport(
+            'test_key', 'appTEST',
+            endpoint_url=f'http://127.0.0.1:{self.server.server_port}',
+            requests_per_second=1000,
+            max_in_flight=3,
+            limiter_path=os.path.join(self.temp_dir, 'limiter.db')
+        )
+
+    def tearDown(self):
+        """Stop the server and clean up."""
+        self.transport.close()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_retries_after_429(self):
+        """A 429 is retried after the Retry-After delay."""
+        self.server.responses = [(429, {'Retry-After': '0.1'}), (503, {'Retry-After': '0'})]
+
+        started = time.monotonic()
+        response = self.transport.get(self.transport.table_url('Leads'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.request_count, 3)
+        self.assertGreaterEqual(time.monotonic() - started, 0.1)
+
+    def test_non_retryable_status_returned(self):
+        """Client errors are returned to the caller without retrying."""
+        self.server.responses = [(422, {})]
+
+        response = self.transport.get(self.transport.table_url('Leads'))
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_prepared_requests_are_limited(self):
+        """Requests sent as prepared requests (as pyairtable does) are retried too."""
+        self.server.responses = [(429, {'Retry-After': '0'})]
+
+        prepared = self.transport.session.prepare_request(
+            requests.Request('GET', self.transport.table_url('Leads'))
+        )
+        response = self.transport.session.send(prepared)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.request_count, 2)
+
+    def test_post_not_retried_after_server_error(self):
+        """A POST that may have created records is not repeated on a 5xx."""
+        self.server.responses = [(503, {'Retry-After': '0'})]
+
+        response = self.transport.post(self.transport.table_url('Leads'), json={'records': []})
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_post_not_retried_after_read_timeout(self):
+        """A POST whose response timed out is not repeated."""
+        self.server.delay = 0.5
+
+        with self.assertRaises(requests.ReadTimeout):
+            self.transport.post(self.transport.table_url('Leads'), json={'records': []}, timeout=0.1)
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_post_retried_after_429(self):
+        """A throttled POST was rejected before processing, so it is retried."""
+        self.server.responses = [(429, {'Retry-After': '0'})]
+
+        response = self.transport.post(self.transport.table_url('Leads'), json={'records': []})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.request_count, 2)
+
+    def test_table_url_quotes_name(self):
+        """Table names are URL-encoded."""
+        url = self.transport.table_url('Table 1', 'rec123')
+        self.assertTrue(url.endswith('/v0/appTEST/Table%201/rec123'))
+
+    def test_map_preserves_order(self):
+        """map runs concurrently but returns results in input order."""
+        urls = [self.transport.table_url(f'T{i}') for i in range(8)]
+
+        paths = self.transport.map(lambda url: self.transport.get(url).json()['path'], urls)
+
+        self.assertEqual(paths, [f'/v0/appTEST/T{i}' for i in range(8)])
+
+
+class TestLeadScraperCopy(unittest.TestCase):
+    """The lead scraper ships its own copy of the transport."""
+
+    @unittest.skipUnless(LEAD_SCRAPER_COPY.exists(), 'lead scraper not checked out alongside')
+    def test_copies_identical(self):
+        """Both systems must limit and retry requests the same way."""
+        shared_copy = Path(__file__).parent / 'shared' / 'airtable_transport.py'
+        self.assertEqual(LEAD_SCRAPER_COPY.read_text(), shared_copy.read_text(),
+                         'update 4runr-lead-scraper/sync/airtable_transport.py together with shared/airtable_transport.py')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the bounded-memory AuditLogger and its streaming aggregates.
+"""
+
+import shutil
+import statistics
+import tempfile
+import unittest
+from pathlib import Path
+
+from shared.data_cleaner import AuditLogger, FieldCleaningResult, ValidationResult
+from shared.logging_utils import read_log_entries
+from shared.streaming_stats import Histogram, RunningStats, TopKCounter
+
+
+def _cleaning(i):
+    return FieldCleaningResult(
+        field_name='company',
+        original_value=f'Company {i} Inc.',
+        cleaned_value=f'Company {i} Inc',
+        patterns_applied=['company_name_rules'],
+        confidence_score=(i % 10) / 10,
+        processing_time=0.001 * (i % 7)
+    )
+
+
+class TestStreamingStats(unittest.TestCase):
+    """Test the constant-memory accumulators."""
+
+    def test_running_stats(self):
+        """Mean, variance and range match the full sample."""
+        values = [0.3, 0.9, 0.85, 0.1, 0.5, 0.5, 0.72]
+        running = RunningStats()
+        for value in values:
+            running.add(value)
+
+        self.assertAlmostEqual(running.mean, statistics.mean(values))
+        self.assertAlmostEqual(running.variance, statistics.pvariance(values))
+        self.assertEqual((running.min, running.max), (0.1, 0.9))
+
+    def test_histogram(self):
+        """Samples are counted in the first bucket whose edge is not below them."""
+        histogram = Histogram([0.5, 1.0])
+        for value in (0.2, 0.5, 0.7, 1.0, 3.0):
+            histogram.add(value)
+
+        self.assertEqual(histogram.counts, [2, 2, 1])
+
+    def test_top_k_counter(self):
+        """Counts are exact within capacity, and frequent keys survive a stream of rare ones."""
+        counter = TopKCounter(capacity=3)
+        for key in ['a', 'b', 'a', 'c', 'a', 'b']:
+            counter.add(key)
+        self.assertEqual(counter.most_common(), [('a', 3), ('b', 2), ('c', 1)])
+
+        counter = TopKCounter(capacity=3)
+        for i in range(100):
+            counter.add('frequent')
+            counter.add(f'rare{i}')
+
+        self.assertEqual(len(counter), 3)
+        self.assertEqual(counter.most_common(1), [('frequent', 100)])
+
+
+class TestBoundedAuditLogger(unittest.TestCase):
+    """Test that AuditLogger keeps a bounded window and writes everything to disk."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.audit_logger = AuditLogger(log_dir=self.temp_dir, ring_size=50)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _entries(self, log_name):
+        return [entry for log_file in sorted(Path(self.temp_dir).glob(f'{log_name}_*.ndjson'))
+                for entry in read_log_entries(log_file)]
+
+    def test_memory_bounded_and_nothing_lost(self):
+        """Entries leaving the ring are already on disk; save_logs writes the rest once."""
+        for i in range(1000):
+            self.audit_logger.log_cleaning_action(_cleaning(i))
+
+        self.assertEqual(len(self.audit_logger.cleaning_logs), 50)
+        self.audit_logger.save_logs()
+        self.audit_logger.save_logs()
+
+        entries = self._entries('cleaning_log')
+        self.assertEqual([entry['original_value'] for entry in entries],
+                         [f'Company {i} Inc.' for i in range(1000)])
+
+    def test_statistics_cover_all_events(self):
+        """Aggregates cover every event, not just the ones kept in memory."""
+        for i in range(1000):
+            self.audit_logger.log_cleaning_action(_cleaning(i))
+            self.audit_logger.log_validation_decision(ValidationResult(
+                'website', i % 4 != 0, 0.9 if i % 4 else 0.0, 'url_validation',
+                '' if i % 4 else 'Website URL format is invalid', ''
+            ))
+
+        stats = self.audit_logger.get_statistics()
+        report = self.audit_logger.generate_quality_report()
+
+        self.assertEqual(stats['cleaning']['confidence']['count'], 1000)
+        self.assertAlmostEqual(stats['cleaning']['confidence']['mean'], 0.45)
+        self.assertEqual(sum(stats['validation']['confidence_histogram']['counts']), 1000)
+        self.assertEqual(stats['validation']['error_patterns'], {'Website URL format is invalid': 250})
+        self.assertEqual(report['cleaning_analytics']['top_cleaning_rules'],
+                         [{'rule': 'company_name_rules', 'usage_count': 1000}])
+        self.assertEqual(report['validation_analytics']['average_confidence'], 0.675)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
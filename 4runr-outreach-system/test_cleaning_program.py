@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the compiled cleaning rules used by CleaningRulesEngine.
+"""
+
+import re
+import unittest
+
+from data_cleaner_test_support import ShippedRulesTestCase
+from shared.data_cleaner import CleaningProgram, CleaningRulesEngine, CompiledRuleGroup, ConfigurationManager
+
+
+def _sequential(rules, text):
+    for pattern, replacement, flags in rules:
+        text = re.sub(pattern, replacement, text, flags=flags)
+    return text
+
+
+class TestCompiledRuleGroup(unittest.TestCase):
+    """Test that fused rule groups behave like substitutions applied one by one."""
+
+    def test_matches_sequential_substitutions(self):
+        """Later rules see the output of earlier ones, inside and across guarded chunks."""
+        rules = [(r'\s*Next$', '', re.IGNORECASE), (r'\s*\.\.\.$', '', re.IGNORECASE)] + \
+                [(f'filler{i}', '', 0) for i in range(10)] + \
+                [(r'^for\s+', '', re.IGNORECASE), (r'\s+Inc\.?$', ' Inc', re.IGNORECASE)]
+        group = CompiledRuleGroup(rules)
+
+        for text in ['Acme ... Next', 'for Acme inc.', 'For filler3Acme Inc', 'Acme', 'Acme ... Next ...', '']:
+            self.assertEqual(group.apply(text), _sequential(rules, text), text)
+
+    def test_flags_scoped_per_rule(self):
+        """Each rule keeps its own flags inside the fused guard."""
+        rules = [('^acme', '', re.MULTILINE), ('Acme.*', 'X', re.IGNORECASE | re.DOTALL), ('corp', '', 0)]
+        group = CompiledRuleGroup(rules)
+
+        for text in ['one\nacme', 'CORP', 'Corp acme\nline', 'the ACME\ncorp']:
+            self.assertEqual(group.apply(text), _sequential(rules, text), text)
+
+    def test_unfusable_patterns_still_applied(self):
+        """Backreferences cannot be fused, so their rules run without a guard."""
+        rules = [(r'(\w+) \1', r'\1', 0), ('(?i)x', '', 0)]
+        group = CompiledRuleGroup(rules)
+
+        self.assertIsNone(group.chunks[0][0])
+        self.assertEqual(group.apply('Acme Acme X'), 'Acme ')
+
+
+class TestCleaningProgram(ShippedRulesTestCase):
+    """Test compilation, versioning and hot swapping of cleaning rules."""
+
+    def setUp(self):
+        super().setUp()
+        self.config_manager = ConfigurationManager(self.temp_dir)
+
+    def test_program_compiled_on_load(self):
+        """Loading the rules compiles them, and the same rules get the same version."""
+        program = self.config_manager.cleaning_program
+
+        self.assertIs(program.rules, self.config_manager.cleaning_rules)
+        self.assertEqual(program.version, CleaningProgram(dict(program.rules)).version)
+
+    def test_update_swaps_program(self):
+        """Updated rules get a new program, which an engine uses once switched to it."""
+        engine = CleaningRulesEngine(self.config_manager.cleaning_rules, self.config_manager.cleaning_program)
+        old_program = engine.program
+        self.assertEqual(engine.clean_company_name('Globex Holdings'), 'Globex Holdings')
+
+        company_rules = dict(self.config_manager.cleaning_rules['company_name'])
+        company_rules['remove_patterns'] = company_rules['remove_patterns'] + [r'\s*Holdings']
+        self.assertTrue(self.config_manager.update_rules({'cleaning_rules': {'company_name': company_rules}}))
+
+        new_program = self.config_manager.cleaning_program
+        self.assertIsNot(new_program, old_program)
+        self.assertNotEqual(new_program.version, old_program.version)
+
+        engine.use_program(new_program)
+        self.assertEqual(engine.clean_company_name('Globex Holdings'), 'Globex')
+
+    def test_invalid_domain_rejected(self):
+        """Configured invalid domains are matched case-insensitively."""
+        engine = CleaningRulesEngine(self.config_manager.cleaning_rules)
+
+        self.assertEqual(engine.clean_website_url('https://www.LinkedIn.com/company/acme'), '')
+        self.assertEqual(engine.clean_website_url('https://www.acme.com/'), 'https://www.acme.com')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -817,7 +817,78 @@ class ConcurrentAccessBenchmarks(unittest.TestCase):
         
         print(f"Best throughput: {best_throughput['config']} ({best_throughput['throughput']:.2f} ops/sec)")
         print(f"Best latency: {best_latency['config']} ({best_latency['avg_latency']:.3f}s)")
-    
+
+    def test_add_lead_latency_under_load(self):
+        """Benchmark end-to-end add_lead latency through the access manager"""
+        print("\n=== add_lead Latency Under Load ===")
+
+        num_threads = 20
+        operations_per_thread = 25
+
+        db_path = os.path.join(self.test_dir, "bench_add_lead_latency.db")
+        lead_db = LeadDatabase(db_path)
+        access_manager = ConcurrentAccessManager(
+            db_path=db_path,
+            max_concurrent_operations=10
+        )
+
+        latencies = []
+        errors = []
+        results_lock = threading.Lock()
+
+        def latency_worker(thread_id: int):
+            for i in range(operations_per_thread):
+                lead = {
+                    'full_name': f'Latency User T{thread_id}I{i}',
+                    'email': f'latency_t{thread_id}i{i}@test.com',
+                    'company': f'Latency Corp {thread_id}',
+                    'source': 'benchmark'
+                }
+
+                start_time = time.perf_counter()
+                try:
+                    # Goes through @thread_safe_operation -> queue -> worker -> future
+                    lead_db.add_lead(lead, _access_manager=access_manager)
+                    elapsed = time.perf_counter() - start_time
+                    with results_lock:
+                        latencies.append(elapsed)
+                except Exception as e:
+                    with results_lock:
+                        errors.append(e)
+
+        try:
+            start_time = time.perf_counter()
+            threads = [
+                threading.Thread(target=latency_worker, args=(thread_id,), name=f"LatencyWorker-{thread_id}")
+                for thread_id in range(num_threads)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=120)
+            duration = time.perf_counter() - start_time
+
+            stats = access_manager.get_stats()
+        finally:
+            access_manager.shutdown()
+
+        sorted_latencies = sorted(latencies)
+        if sorted_latencies:
+            p50 = sorted_latencies[len(sorted_latencies) // 2]
+            p95 = sorted_latencies[int(len(sorted_latencies) * 0.95)]
+            p99 = sorted_latencies[min(len(sorted_latencies) - 1, int(len(sorted_latencies) * 0.99))]
+        else:
+            p50 = p95 = p99 = 0
+
+        print(f"Operations: {len(latencies)} ok, {len(errors)} failed in {duration:.2f}s")
+        print(f"Throughput: {len(latencies) / duration if duration > 0 else 0:.2f} ops/sec")
+        print(f"add_lead latency - P50: {p50 * 1000:.1f}ms, P95: {p95 * 1000:.1f}ms, P99: {p99 * 1000:.1f}ms")
+        print(f"Peak concurrent operations: {stats['concurrent_access_stats']['peak_concurrent_operations']}")
+
+        self.assertEqual(len(errors), 0, f"add_lead failures: {errors[:3]}")
+        self.assertEqual(len(latencies), num_threads * operations_per_thread)
+        self.assertLessEqual(stats['concurrent_access_stats']['peak_concurrent_operations'], 10)
+
     def _run_benchmark(self, lead_db: LeadDatabase, access_manager: ConcurrentAccessManager, config_name: str) -> Dict[str, Any]:
         """Run a benchmark test with given configuration"""
         num_threads = 20
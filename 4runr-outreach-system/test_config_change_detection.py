@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Unit tests for stat-based rule file change detection in ConfigurationManager.
+"""
+
+import os
+import time
+import unittest
+from pathlib import Path
+
+import yaml
+
+from data_cleaner_test_support import ShippedRulesTestCase
+from shared.data_cleaner import ConfigurationManager, DataCleaner
+
+
+class TestConfigChangeDetection(ShippedRulesTestCase):
+    """Test is_stale, detect_config_changes and the watcher thread."""
+
+    def setUp(self):
+        super().setUp()
+        self.rules_file = Path(self.temp_dir) / 'cleaning_rules.yaml'
+        self.config_manager = ConfigurationManager(self.temp_dir)
+
+    def tearDown(self):
+        """Stop watching the temporary configuration."""
+        self.config_manager.stop_watching()
+
+    def _add_company_pattern(self, pattern):
+        rules = yaml.safe_load(self.rules_file.read_text(encoding='utf-8'))
+        rules['company_name']['remove_patterns'].append(pattern)
+        self.rules_file.write_text(yaml.dump(rules), encoding='utf-8')
+
+    def test_unchanged_files(self):
+        """Freshly loaded rules are neither stale nor changed."""
+        self.assertFalse(self.config_manager.is_stale())
+        self.assertFalse(any(self.config_manager.detect_config_changes().values()))
+        self.assertFalse(self.config_manager.reload_if_changed())
+
+    def test_touched_file_not_reported(self):
+        """A new modification time alone is rechecked by content once, then forgotten."""
+        stat = self.rules_file.stat()
+        os.utime(self.rules_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertTrue(self.config_manager.is_stale())
+        self.assertFalse(any(self.config_manager.detect_config_changes().values()))
+        self.assertFalse(self.config_manager.is_stale())
+
+    def test_edited_file_reloaded(self):
+        """An edited file is detected, reloaded, and no longer stale afterwards."""
+        self._add_company_pattern(r'\s*Holdings')
+
+        self.assertTrue(self.config_manager.is_stale())
+        self.assertEqual(self.config_manager.detect_config_changes(),
+                         {'cleaning_rules.yaml': True, 'validation_rules.yaml': False})
+        self.assertTrue(self.config_manager.reload_if_changed())
+        self.assertFalse(self.config_manager.is_stale())
+        self.assertIn(r'\s*Holdings', self.config_manager.cleaning_rules['company_name']['remove_patterns'])
+
+    def test_data_cleaner_picks_up_edits(self):
+        """Rules edited on disk apply from the next record."""
+        cleaner = DataCleaner(self.temp_dir)
+        self.assertEqual(cleaner.clean_and_validate({'Company': 'Globex Holdings'}, {'id': 'lead1'})
+                         .cleaning_actions, [])
+
+        self._add_company_pattern(r'\s*Holdings')
+        result = cleaner.clean_and_validate({'Company': 'Globex Holdings'}, {'id': 'lead2'})
+
+        self.assertEqual(result.cleaning_actions[0].cleaned_value, 'Globex')
+
+    def test_watcher_flags_changes(self):
+        """The watcher thread raises the stale flag and a reload clears it."""
+        self.config_manager.start_watching(interval=0.01)
+        self._add_company_pattern(r'\s*Holdings')
+
+        deadline = time.monotonic() + 5
+        while not self.config_manager.is_stale() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertTrue(self.config_manager.is_stale())
+        self.assertTrue(self.config_manager.reload_if_changed())
+        self.config_manager.stop_watching()
+        self.assertFalse(self.config_manager.is_stale())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
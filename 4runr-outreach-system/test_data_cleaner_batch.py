@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Unit tests for batch cleaning with DataCleaner.clean_and_validate_many.
+"""
+
+import unittest
+
+from data_cleaner_test_support import ShippedRulesTestCase
+from shared.data_cleaner import DataCleaner, ValidationEngine, ValidationResult
+
+
+RECORDS = [
+    ({'Company': 'Sirius XM and ... Some results may have been delisted', 'Website': 'https://google.com/search?q=x'},
+     {'id': 'lead1', 'Full Name': 'Ann Lee'}),
+    ({'Company': 'Lightspeed Commerce Inc.', 'Website': 'https://lightspeedhq.com/'}, {'id': 'lead2'}),
+    ({'Company': '<span>Coveo</span> &amp; Partners', 'Website': 'www.coveo.com'}, {'id': 'lead3'}),
+    ({'Company': 'Hopper', 'Website': 'https://www.linkedin.com/company/hopper'}, {'id': 'lead4'}),
+    ({'Company': 'About 1,234 results for Busbud', 'Website': 'busbud.com'}, {'id': 'lead5'}),
+    ({'Company': '', 'Website': ''}, {'id': 'lead6'}),
+    ({'Company': 'Plusgrade', 'Website': 'https://plusgrade.com'}, {'id': 'lead7'}),
+]
+
+COUNTERS = ('total_processed', 'successful_cleanings', 'rejections')
+
+
+def _summary(result):
+    return result.success, result.cleaned_data, result.rejection_reasons, result.confidence_score
+
+
+class TestCleanAndValidateMany(ShippedRulesTestCase):
+    """Test that batches give the same outcome as cleaning records one by one."""
+
+    def setUp(self):
+        super().setUp()
+        self.serial = DataCleaner(self.temp_dir)
+        self.expected = [self.serial.clean_and_validate(raw_data, context) for raw_data, context in RECORDS]
+
+    def _assert_matches_serial(self, cleaner, results):
+        self.assertEqual([_summary(r) for r in results], [_summary(r) for r in self.expected])
+        self.assertEqual({k: cleaner.stats[k] for k in COUNTERS}, {k: self.serial.stats[k] for k in COUNTERS})
+        self.assertEqual(cleaner.validation_engine.validation_stats, self.serial.validation_engine.validation_stats)
+        self.assertEqual(cleaner.audit_logger.cleaning_stats['total_cleanings'],
+                         self.serial.audit_logger.cleaning_stats['total_cleanings'])
+        self.assertEqual(len(cleaner.audit_logger.validation_logs), len(self.serial.audit_logger.validation_logs))
+
+    def test_worker_processes(self):
+        """Chunks cleaned by worker processes come back in input order with merged statistics."""
+        cleaner = DataCleaner(self.temp_dir)
+
+        results = cleaner.clean_and_validate_many(iter(RECORDS), workers=2, chunk_size=2)
+
+        self._assert_matches_serial(cleaner, results)
+
+    def test_in_process(self):
+        """A single worker cleans in this process."""
+        cleaner = DataCleaner(self.temp_dir)
+
+        results = cleaner.clean_and_validate_many(RECORDS, workers=1, chunk_size=2)
+
+        self._assert_matches_serial(cleaner, results)
+
+    def test_empty_batch(self):
+        """An empty batch gives no results."""
+        self.assertEqual(DataCleaner(self.temp_dir).clean_and_validate_many([], workers=2), [])
+
+
+class TestMergeValidationStats(unittest.TestCase):
+    """Test merging validation statistics from another engine."""
+
+    def test_merge(self):
+        """Totals and per-rule and per-field counts are added."""
+        engine, other = ValidationEngine({}), ValidationEngine({})
+        engine._update_validation_stats(ValidationResult('company', True, 1.0, 'length', '', ''))
+        other._update_validation_stats(ValidationResult('company', False, 0.0, 'length', 'too short', ''))
+        other._update_validation_stats(ValidationResult('website', True, 1.0, 'format', '', ''))
+
+        engine.merge_validation_stats(other.validation_stats)
+
+        self.assertEqual(engine.validation_stats['total_validations'], 3)
+        self.assertEqual(engine.validation_stats['failed_validations'], 1)
+        self.assertEqual(engine.validation_stats['by_rule']['length'], {'passed': 1, 'failed': 1})
+        self.assertEqual(engine.validation_stats['by_field']['website'], {'passed': 1, 'failed': 0})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
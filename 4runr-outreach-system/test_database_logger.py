@@ -24,6 +24,7 @@ from unittest.mock import patch, MagicMock
 
 from database_logger import (
     DatabaseLogger, 
+    SegmentedLogWriter,
     database_logger, 
     log_database_event, 
     monitor_performance
@@ -62,8 +63,16 @@ class TestDatabaseLogger(unittest.TestCase):
     
     def tearDown(self):
         """Clean up temporary files."""
+        self.logger.close()
         shutil.rmtree(self.temp_dir)
     
+    def _read_last_record(self, log_path):
+        """Flush the logger and return the last record in a segment file."""
+        self.logger.flush()
+        with open(log_path, 'r', encoding='utf-8') as f:
+            lines = [line for line in f if line.strip()]
+        return json.loads(lines[-1])
+    
     def test_logger_initialization(self):
         """Test that logger initializes correctly with proper directory structure."""
         # Check that all required subdirectories are created
@@ -98,8 +107,7 @@ class TestDatabaseLogger(unittest.TestCase):
         self.assertTrue(os.path.exists(log_path))
         
         # Verify log content
-        with open(log_path, 'r', encoding='utf-8') as f:
-            log_data = json.load(f)
+        log_data = self._read_last_record(log_path)
         
         self.assertEqual(log_data["log_type"], "database_operation")
         self.assertEqual(log_data["operation_details"]["operation_type"], "add_lead")
@@ -125,8 +133,7 @@ class TestDatabaseLogger(unittest.TestCase):
         )
         
         # Verify log content
-        with open(log_path, 'r', encoding='utf-8') as f:
-            log_data = json.load(f)
+        log_data = self._read_last_record(log_path)
         
         self.assertEqual(log_data["operation_details"]["operation_type"], "get_lead")
         self.assertFalse(log_data["operation_details"]["success"])
@@ -166,8 +173,7 @@ class TestDatabaseLogger(unittest.TestCase):
         )
         
         # Verify log content
-        with open(log_path, 'r', encoding='utf-8') as f:
-            log_data = json.load(f)
+        log_data = self._read_last_record(log_path)
         
         self.assertEqual(log_data["log_type"], "sync_operation")
         self.assertEqual(log_data["sync_details"]["sync_type"], "to_airtable")
@@ -213,8 +219,7 @@ class TestDatabaseLogger(unittest.TestCase):
         )
         
         # Verify log content
-        with open(log_path, 'r', encoding='utf-8') as f:
-            log_data = json.load(f)
+        log_data = self._read_last_record(log_path)
         
         self.assertEqual(log_data["log_type"], "migration_operation")
         self.assertEqual(log_data["migration_details"]["migration_type"], "json_to_db")
@@ -249,8 +254,7 @@ class TestDatabaseLogger(unittest.TestCase):
         )
         
         # Verify log content
-        with open(log_path, 'r', encoding='utf-8') as f:
-            log_data = json.load(f)
+        log_data = self._read_last_record(log_path)
         
         self.assertEqual(log_data["log_type"], "error_log")
         self.assertEqual(log_data["error_details"]["error_type"], "database_error")
@@ -292,8 +296,7 @@ class TestDatabaseLogger(unittest.TestCase):
         )
         
         # Verify log content
-        with open(log_path, 'r', encoding='utf-8') as f:
-            log_data = json.load(f)
+        log_data = self._read_last_record(log_path)
         
         self.assertEqual(log_data["log_type"], "performance_metrics")
         self.assertEqual(log_data["operation_info"]["operation_name"], "bulk_sync_operation")
@@ -332,8 +335,7 @@ class TestDatabaseLogger(unittest.TestCase):
         )
         
         # Verify log content
-        with open(log_path, 'r', encoding='utf-8') as f:
-            log_data = json.load(f)
+        log_data = self._read_last_record(log_path)
         
         self.assertEqual(log_data["log_type"], "monitoring_data")
         self.assertEqual(log_data["monitoring_info"]["monitoring_type"], "health_check")
@@ -388,20 +390,33 @@ class TestDatabaseLogger(unittest.TestCase):
             time.sleep(duration)
             return "success"
         
-        # Mock the database_logger to capture the log call
+        database_logger.metrics.reset()
+        
+        # Timing goes to the in-memory registry, not a log record per call
         with patch.object(database_logger, 'log_performance_metrics') as mock_log:
             result = test_function(0.05)  # 50ms sleep
             
             self.assertEqual(result, "success")
-            mock_log.assert_called_once()
-            
-            # Verify the call arguments
-            call_args = mock_log.call_args
-            self.assertEqual(call_args[0][0], "test_operation")  # operation_name
-            metrics = call_args[0][1]
-            self.assertIn("total_duration_ms", metrics)
-            self.assertGreaterEqual(metrics["total_duration_ms"], 50)  # At least 50ms
-            self.assertTrue(metrics["success"])
+            mock_log.assert_not_called()
+        
+        stats = database_logger.metrics.get_operation_stats("test_operation")
+        self.assertEqual(stats["count"], 1)
+        self.assertEqual(stats["errors"], 0)
+        self.assertGreaterEqual(stats["max_ms"], 50)  # At least 50ms
+    
+    def test_metrics_snapshot_logging(self):
+        """Test registry snapshots are written as performance records."""
+        self.logger.metrics.reset()
+        for duration in (5, 10, 20, 400):
+            self.logger.metrics.observe("add_lead", duration)
+        
+        log_paths = self.logger.log_metrics_snapshot()
+        log_data = self._read_last_record(log_paths[-1])
+        
+        self.assertEqual(log_data["operation_info"]["operation_name"], "add_lead")
+        self.assertEqual(log_data["latency_summary"]["count"], 4)
+        self.assertIn("p95_ms", log_data["latency_summary"])
+        self.assertEqual(log_data["operation_info"]["total_duration_ms"], 108.75)
     
     def test_performance_monitoring_decorator_with_exception(self):
         """Test the performance monitoring decorator handles exceptions."""
@@ -467,6 +482,103 @@ class TestDatabaseLogger(unittest.TestCase):
         self.assertEqual(summary_data["sync_summary"]["total_sync_operations"], 2)
         self.assertEqual(summary_data["sync_summary"]["leads_synced"], 11)  # 5 + 6
     
+    def test_records_share_segment_files(self):
+        """Test that many records append to one NDJSON segment instead of one file each."""
+        paths = set()
+        for i in range(50):
+            paths.add(self.logger.log_database_operation(
+                "add_lead", self.sample_lead_data, self.sample_operation_result,
+                self.sample_performance_metrics
+            ))
+        self.logger.flush()
+        
+        self.assertEqual(len(paths), 1)
+        segment_files = list((Path(self.temp_dir) / "database_operations").iterdir())
+        self.assertEqual(len(segment_files), 1)
+        
+        records = list(self.logger.read_records("database_operation"))
+        self.assertEqual(len(records), 50)
+        self.assertTrue(all(r["log_type"] == "database_operation" for r in records))
+    
+    def test_segment_rotation_with_gzip(self):
+        """Test size-based rotation, gzip on rotate and streaming reads."""
+        segment_dir = Path(self.temp_dir) / "rotation_test"
+        writer = SegmentedLogWriter(
+            segment_dir, "test", "abcd1234",
+            max_segment_bytes=512,
+            compress_on_rotate=True
+        )
+        try:
+            for i in range(100):
+                writer.write({"index": i, "payload": "x" * 20})
+            writer.flush()
+        finally:
+            writer.close()
+        
+        self.assertGreater(len(list(segment_dir.glob("*.ndjson.gz"))), 1)
+        self.assertGreater(writer.stats['segments_rotated'], 0)
+        
+        indexes = [r["index"] for r in SegmentedLogWriter.iter_records(segment_dir)]
+        self.assertEqual(indexes, list(range(100)))
+    
+    def test_full_queue_drops_without_blocking(self):
+        """Test that writes to a stalled writer are dropped immediately and counted."""
+        import threading
+        writer = SegmentedLogWriter(
+            Path(self.temp_dir) / "stalled_test", "test", "abcd1234",
+            max_queue_size=1, flush_interval=5.0
+        )
+        release = threading.Event()
+        write_batch = writer._write_batch
+        
+        def stalled_write_batch(records):
+            release.wait(5)
+            write_batch(records)
+        
+        writer._write_batch = stalled_write_batch
+        try:
+            start = time.monotonic()
+            for i in range(20):
+                writer.write({"index": i})
+            elapsed = time.monotonic() - start
+            self.assertLess(elapsed, 1.0)
+            self.assertGreater(writer.stats['records_dropped'], 0)
+        finally:
+            release.set()
+            writer.close()
+    
+    def test_atexit_hook_does_not_keep_logger_alive(self):
+        """Test that a discarded logger can be garbage collected."""
+        import gc
+        import weakref
+        logger = DatabaseLogger(log_directory=os.path.join(self.temp_dir, "discarded"))
+        logger.close()
+        logger_ref = weakref.ref(logger)
+        del logger
+        gc.collect()
+        self.assertIsNone(logger_ref())
+    
+    def test_daily_summary_from_segments(self):
+        """Test that the daily summary streams over segment records."""
+        for i in range(4):
+            self.logger.log_database_operation(
+                "add_lead", self.sample_lead_data,
+                {"success": i != 0, "records_affected": 1},
+                self.sample_performance_metrics
+            )
+        self.logger.log_sync_operation(
+            "to_airtable", {"batch_size": 3}, {"success": True, "leads_synced": 3}, []
+        )
+        
+        summary_path = self.logger.create_daily_summary()
+        with open(summary_path, 'r') as f:
+            summary_data = json.load(f)
+        
+        self.assertEqual(summary_data["operation_summary"]["total_database_operations"], 4)
+        self.assertEqual(summary_data["operation_summary"]["successful_operations"], 3)
+        self.assertEqual(summary_data["operation_summary"]["failed_operations"], 1)
+        self.assertEqual(summary_data["sync_summary"]["leads_synced"], 3)
+    
     def test_helper_methods(self):
         """Test helper methods for training labels and assessments."""
         # Test performance tier classification
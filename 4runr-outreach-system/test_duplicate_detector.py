@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Unit tests for blocked duplicate detection in DuplicateDetector.
+"""
+
+import unittest
+from difflib import SequenceMatcher
+
+from shared.duplicate_detector import DuplicateDetector, DuplicateGroup, _soundex
+
+
+FIELDS = ['email', 'linkedin_url', 'name']
+
+
+def _lead(lead_id, name='', email='', linkedin_url='', company=''):
+    return {'id': lead_id, 'name': name, 'email': email, 'linkedin_url': linkedin_url, 'company': company}
+
+
+def _pairwise_scan(detector, records, fields):
+    """The original O(n^2) grouping: each unclaimed record claims the later records matching it."""
+    groups = []
+    processed = set()
+    for i, record1 in enumerate(records):
+        if i in processed:
+            continue
+        duplicates = [record1]
+        processed.add(i)
+        for j in range(i + 1, len(records)):
+            if j not in processed and detector._compare_records(record1, records[j], fields)['is_duplicate']:
+                duplicates.append(records[j])
+                processed.add(j)
+        if len(duplicates) > 1:
+            best_field = detector._determine_best_matching_field(duplicates, fields)
+            groups.append(DuplicateGroup(
+                matching_field=best_field,
+                matching_value=str(duplicates[0].get(best_field, '')),
+                records=duplicates,
+                confidence_score=detector._calculate_group_confidence(duplicates, fields)
+            ))
+    return groups
+
+
+class TestDuplicateDetectorBlocking(unittest.TestCase):
+    """Test grouping of duplicates found through blocking keys."""
+
+    def setUp(self):
+        self.detector = DuplicateDetector(matching_threshold=0.85)
+
+    def _group_ids(self, records, fields=FIELDS):
+        groups = self.detector._find_duplicates_in_records(records, fields, 'test')
+        return [[record['id'] for record in group.records] for group in groups]
+
+    def test_transitive_duplicates_form_one_group(self):
+        """A matches B by email and B matches C by LinkedIn, so all three are one lead."""
+        records = [
+            _lead('a', 'Ann Lee', 'ann@acme.com'),
+            _lead('x', 'Bo Chan', 'bo@other.com', 'https://www.linkedin.com/in/bo-chan'),
+            _lead('b', 'Ann Lee', 'ann@acme.com', 'https://www.linkedin.com/in/ann-lee'),
+            _lead('c', 'Annie L.', '', 'linkedin.com/in/ann-lee/'),
+        ]
+
+        self.assertEqual(self._group_ids(records), [['a', 'b', 'c']])
+
+    def test_name_typos_grouped(self):
+        """Names within the threshold are matched; different people are not."""
+        records = [
+            _lead('1', 'Jonathan Tremblay', company='Acme Inc'),
+            _lead('2', 'Jonathon Tremblay', company='Acme Inc'),
+            _lead('3', 'Marie Gagnon', company='Acme Inc'),
+            _lead('4', 'Luc Gagnon', company='Hopper'),
+        ]
+
+        self.assertEqual(self._group_ids(records, ['name']), [['1', '2']])
+
+    def test_confidence_matches_pairwise_scores(self):
+        """Group confidence is the mean best-field similarity of every pair, as before."""
+        records = [
+            _lead('1', 'Jonathan Tremblay', 'jt@acme.com'),
+            _lead('2', 'Jonathon Tremblay', 'jon@tremblay.ca'),
+            _lead('3', 'Someone Else', 'jt@acme.com'),
+        ]
+        name_score = SequenceMatcher(None, 'jonathan tremblay', 'jonathon tremblay').ratio()
+        other_score = self.detector._compare_records(records[1], records[2], FIELDS)['confidence_score']
+
+        group = self.detector._find_duplicates_in_records(records, FIELDS, 'test')[0]
+
+        self.assertEqual([r['id'] for r in group.records], ['1', '2', '3'])
+        self.assertAlmostEqual(group.confidence_score, (name_score + 1.0 + other_score) / 3)
+
+    def test_matches_pairwise_scan(self):
+        """Groups, matching fields and confidence equal those of the original pairwise scan."""
+        people = [
+            ('Jonathan Tremblay', 'acme.com'), ('Marie Gagnon', 'hopper.ca'),
+            ('Luc Bergeron', 'globex.com'), ('Sophie Nguyen', 'initech.io'),
+            ('Olivier Martin', 'umbrella.org'), ('Isabelle Roy', 'stark.com'),
+        ]
+        clusters = []
+        for number, (name, domain) in enumerate(people):
+            email = f"{name.split()[0].lower()}@{domain}"
+            slug = 'linkedin.com/in/' + name.lower().replace(' ', '-')
+            clusters.append([
+                _lead(f'{number}-seed', name, email, f'https://www.{slug}'),
+                _lead(f'{number}-email', name.upper(), email),
+                _lead(f'{number}-typo', name[:-1] + 'x', f'other{number}@mail.com'),
+                _lead(f'{number}-url', f'{name.split()[0]} Smith', linkedin_url=f'{slug}/'),
+                _lead(f'{number}-other', f'Unrelated Person {number}', f'someone{number}@{domain}'),
+            ])
+        # Each cluster's seed comes before its duplicates, interleaved with other clusters
+        records = [record for column in zip(*clusters) for record in column]
+
+        groups = self.detector._find_duplicates_in_records(records, FIELDS, 'test')
+        expected = _pairwise_scan(self.detector, records, FIELDS)
+
+        # The 'Unrelated Person N' names are close enough to form one more group
+        self.assertEqual(len(groups), len(people) + 1)
+        self.assertEqual([[r['id'] for r in group.records] for group in groups],
+                         [[r['id'] for r in group.records] for group in expected])
+        for group, old in zip(groups, expected):
+            self.assertEqual((group.matching_field, group.matching_value), (old.matching_field, old.matching_value))
+            self.assertAlmostEqual(group.confidence_score, old.confidence_score)
+
+    def test_near_matches_do_not_chain(self):
+        """Each near match must also match the group representative."""
+        records = [_lead(str(i), f'Contact {i:05d}') for i in range(1, 200)]
+
+        groups = self.detector._find_duplicates_in_records(records, ['name'], 'test')
+
+        self.assertGreater(len(groups), 1)
+        for group in groups:
+            representative = group.records[0]['name'].lower()
+            for record in group.records[1:]:
+                score = SequenceMatcher(None, representative, record['name'].lower()).ratio()
+                self.assertGreaterEqual(score, 0.85)
+            self.assertGreaterEqual(group.confidence_score, 0.85)
+
+    def test_exact_matches_found_in_oversized_blocks(self):
+        """Skipping a block too large to compare never loses exact duplicates."""
+        detector = DuplicateDetector(matching_threshold=0.85, max_block_size=10)
+        records = [_lead(str(i), f'Person {i:03d}', f'user{i}@gmail.com') for i in range(50)]
+        records.append(_lead('dup', 'Someone Else', 'user7@gmail.com'))
+
+        groups = detector._find_duplicates_in_records(records, ['email'], 'test')
+
+        self.assertEqual([[r['id'] for r in g.records] for g in groups], [['7', 'dup']])
+
+    def test_soundex(self):
+        """Soundex codes follow the American Soundex rules."""
+        self.assertEqual(_soundex('Robert'), 'R163')
+        self.assertEqual(_soundex('Rupert'), 'R163')
+        self.assertEqual(_soundex('Ashcraft'), 'A261')
+        self.assertEqual(_soundex('Tymczak'), 'T522')
+        self.assertEqual(_soundex('Lee'), 'L000')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -54,22 +54,40 @@ class TestIntegratedLogging(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test environment."""
+        database_logger.close()
         shutil.rmtree(self.temp_dir)
     
+    def _read_logs(self, log_type, operation_type=None):
+        """Flush queued log records and return those of one type."""
+        database_logger.flush()
+        records = list(database_logger.read_records(log_type))
+        if operation_type:
+            records = [
+                r for r in records
+                if r.get("operation_details", {}).get("operation_type") == operation_type
+                or r.get("error_details", {}).get("error_type") == operation_type
+                or r.get("operation_info", {}).get("operation_name") == operation_type
+            ]
+        return records
+    
+    def _clear_logs(self, subdirectory):
+        """Close the segment writers and delete everything logged so far."""
+        database_logger.close()
+        for log_file in (Path(self.log_dir) / subdirectory).iterdir():
+            log_file.unlink()
+    
     def test_lead_database_add_lead_logging(self):
         """Test that add_lead operations are properly logged."""
         # Add a lead (this should trigger logging)
         lead_id = self.db.add_lead(self.sample_lead)
         
-        # Check that log file was created
-        log_dir = Path(self.log_dir) / "database_operations"
-        log_files = list(log_dir.glob("db_op_add_lead_*.json"))
+        # Check that a log record was written
+        log_records = self._read_logs("database_operation", "add_lead")
         
-        self.assertGreater(len(log_files), 0, "Add lead operation should create log file")
+        self.assertGreater(len(log_records), 0, "Add lead operation should be logged")
         
         # Verify log content
-        with open(log_files[0], 'r', encoding='utf-8') as f:
-            log_data = json.load(f)
+        log_data = log_records[0]
         
         self.assertEqual(log_data["log_type"], "database_operation")
         self.assertEqual(log_data["operation_details"]["operation_type"], "add_lead")
@@ -84,22 +102,19 @@ class TestIntegratedLogging(unittest.TestCase):
         lead_id = self.db.add_lead(self.sample_lead)
         
         # Clear existing logs
-        log_dir = Path(self.log_dir) / "database_operations"
-        for log_file in log_dir.glob("*.json"):
-            log_file.unlink()
+        self._clear_logs("database_operations")
         
         # Get the lead (this should trigger logging)
         retrieved_lead = self.db.get_lead(lead_id)
         
-        # Check that log file was created
-        log_files = list(log_dir.glob("db_op_get_lead_*.json"))
+        # Check that a log record was written
+        log_records = self._read_logs("database_operation", "get_lead")
         
-        self.assertGreater(len(log_files), 0, "Get lead operation should create log file")
+        self.assertGreater(len(log_records), 0, "Get lead operation should be logged")
         self.assertIsNotNone(retrieved_lead, "Lead should be retrieved successfully")
         
         # Verify log content
-        with open(log_files[0], 'r', encoding='utf-8') as f:
-            log_data = json.load(f)
+        log_data = log_records[0]
         
         self.assertEqual(log_data["operation_details"]["operation_type"], "get_lead")
         self.assertTrue(log_data["operation_details"]["success"])
@@ -110,16 +125,14 @@ class TestIntegratedLogging(unittest.TestCase):
         # Try to get non-existent lead
         retrieved_lead = self.db.get_lead("non-existent-id")
         
-        # Check that log file was created
-        log_dir = Path(self.log_dir) / "database_operations"
-        log_files = list(log_dir.glob("db_op_get_lead_*.json"))
+        # Check that a log record was written
+        log_records = self._read_logs("database_operation", "get_lead")
         
-        self.assertGreater(len(log_files), 0, "Get lead operation should create log file")
+        self.assertGreater(len(log_records), 0, "Get lead operation should be logged")
         self.assertIsNone(retrieved_lead, "Non-existent lead should return None")
         
         # Verify log content
-        with open(log_files[0], 'r', encoding='utf-8') as f:
-            log_data = json.load(f)
+        log_data = log_records[0]
         
         self.assertEqual(log_data["operation_details"]["operation_type"], "get_lead")
         self.assertTrue(log_data["operation_details"]["success"])  # Operation succeeded, just no result
@@ -137,14 +150,12 @@ class TestIntegratedLogging(unittest.TestCase):
             self.db.add_lead(self.sample_lead)
         
         # Check that error log was created
-        error_log_dir = Path(self.log_dir) / "error_logs"
-        error_files = list(error_log_dir.glob("error_database_error_*.json"))
+        error_records = self._read_logs("error_log", "database_error")
         
-        self.assertGreater(len(error_files), 0, "Database error should create error log")
+        self.assertGreater(len(error_records), 0, "Database error should create error log")
         
         # Verify error log content
-        with open(error_files[0], 'r', encoding='utf-8') as f:
-            log_data = json.load(f)
+        log_data = error_records[0]
         
         self.assertEqual(log_data["log_type"], "error_log")
         self.assertEqual(log_data["error_details"]["error_type"], "database_error")
@@ -158,9 +169,7 @@ class TestIntegratedLogging(unittest.TestCase):
         lead_id1 = self.db.add_lead(self.sample_lead)
         
         # Clear existing logs
-        log_dir = Path(self.log_dir) / "database_operations"
-        for log_file in log_dir.glob("*.json"):
-            log_file.unlink()
+        self._clear_logs("database_operations")
         
         # Add duplicate lead (same email)
         duplicate_lead = self.sample_lead.copy()
@@ -171,13 +180,12 @@ class TestIntegratedLogging(unittest.TestCase):
         # Should return same ID due to duplicate detection
         self.assertEqual(lead_id1, lead_id2, "Duplicate lead should return same ID")
         
-        # Check that log file shows duplicate detection
-        log_files = list(log_dir.glob("db_op_add_lead_*.json"))
-        self.assertGreater(len(log_files), 0, "Duplicate add should create log file")
+        # Check that the log shows duplicate detection
+        log_records = self._read_logs("database_operation", "add_lead")
+        self.assertGreater(len(log_records), 0, "Duplicate add should be logged")
         
         # Verify log content shows duplicate detection
-        with open(log_files[0], 'r', encoding='utf-8') as f:
-            log_data = json.load(f)
+        log_data = log_records[0]
         
         self.assertTrue(log_data["data_details"]["duplicate_detected"])
         self.assertEqual(log_data["data_details"]["duplicate_action"], "updated")
@@ -232,18 +240,22 @@ class TestIntegratedLogging(unittest.TestCase):
         """Test that performance monitoring works with database operations."""
         # Performance monitoring should be automatic via decorators
         
-        # Add a lead (decorated method should log performance)
+        database_logger.metrics.reset()
+        
+        # Add a lead (decorated method should record its latency)
         lead_id = self.db.add_lead(self.sample_lead)
         
-        # Check that performance log was created
-        perf_log_dir = Path(self.log_dir) / "performance_metrics"
-        perf_files = list(perf_log_dir.glob("perf_add_lead_*.json"))
+        stats = database_logger.metrics.get_operation_stats("add_lead")
+        self.assertEqual(stats["count"], 1)
         
-        self.assertGreater(len(perf_files), 0, "Performance monitoring should create log file")
+        # Registry snapshots are written as performance records on demand
+        database_logger.log_metrics_snapshot()
+        perf_records = self._read_logs("performance_metrics", "add_lead")
+        
+        self.assertGreater(len(perf_records), 0, "Performance monitoring should be logged")
         
         # Verify performance log content
-        with open(perf_files[0], 'r', encoding='utf-8') as f:
-            log_data = json.load(f)
+        log_data = perf_records[0]
         
         self.assertEqual(log_data["log_type"], "performance_metrics")
         self.assertEqual(log_data["operation_info"]["operation_name"], "add_lead")
@@ -288,11 +300,10 @@ class TestIntegratedLogging(unittest.TestCase):
         self.assertEqual(len(errors), 0, f"Concurrent operations should not cause errors: {errors}")
         self.assertEqual(len(results), 5, "All concurrent operations should succeed")
         
-        # Verify that log files were created for each operation
-        log_dir = Path(self.log_dir) / "database_operations"
-        log_files = list(log_dir.glob("db_op_add_lead_*.json"))
+        # Verify that a record was logged for each operation
+        log_records = self._read_logs("database_operation", "add_lead")
         
-        self.assertGreaterEqual(len(log_files), 5, "Each concurrent operation should create a log file")
+        self.assertGreaterEqual(len(log_records), 5, "Each concurrent operation should be logged")
     
     def test_log_file_structure_and_content(self):
         """Test that log files have correct structure and required fields."""
@@ -301,13 +312,10 @@ class TestIntegratedLogging(unittest.TestCase):
         retrieved_lead = self.db.get_lead(lead_id)
         
         # Check database operation logs
-        log_dir = Path(self.log_dir) / "database_operations"
-        log_files = list(log_dir.glob("*.json"))
+        log_records = self._read_logs("database_operation")
+        self.assertGreater(len(log_records), 0)
         
-        for log_file in log_files:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                log_data = json.load(f)
-            
+        for log_data in log_records:
             # Verify required top-level fields
             required_fields = ["log_type", "session_id", "timestamp", "operation_details", 
                              "lead_identifier", "data_details", "performance_metrics", "training_labels"]
@@ -161,6 +161,60 @@ class TestLeadDatabase(unittest.TestCase):
         result = self.db.update_lead('nonexistent-id', {'title': 'Test'})
         self.assertFalse(result)
     
+    def test_update_leads_batch(self):
+        """Test batched updates by ID and UUID with per-row counts."""
+        lead1_id = self.db.add_lead(self.sample_lead)
+        lead2_id = self.db.add_lead({'full_name': 'Jane Smith', 'company': 'Other Corp'})
+        lead2_uuid = self.db.get_lead(lead2_id)['uuid']
+        
+        counts = self.db.update_leads({
+            lead1_id: {'status': 'contacted', 'sync_pending': False},
+            lead2_uuid: {'status': 'qualified', 'sync_pending': False},
+            'missing-lead': {'status': 'contacted'}
+        })
+        
+        self.assertEqual(counts, {lead1_id: 1, lead2_uuid: 1, 'missing-lead': 0})
+        self.assertEqual(self.db.get_lead(lead1_id)['status'], 'contacted')
+        self.assertEqual(self.db.get_lead(lead2_id)['status'], 'qualified')
+    
+    def test_update_leads_counts_rows_actually_changed(self):
+        """Test per-row counts come from the database, not from the request."""
+        lead1_id = self.db.add_lead(self.sample_lead)
+        lead2_id = self.db.add_lead({'full_name': 'Jane Smith', 'company': 'Other Corp'})
+        
+        # A trigger that skips updates to one row makes the counts observable
+        with sqlite3.connect(self.temp_db.name) as conn:
+            conn.execute(f"""
+                CREATE TRIGGER skip_lead2 BEFORE UPDATE ON leads
+                WHEN OLD.id = '{lead2_id}' BEGIN SELECT RAISE(IGNORE); END
+            """)
+        
+        counts = self.db.update_leads({
+            lead1_id: {'status': 'contacted'},
+            lead2_id: {'status': 'contacted'}
+        })
+        
+        self.assertEqual(counts, {lead1_id: 1, lead2_id: 0})
+        self.assertEqual(self.db.get_lead(lead2_id)['status'], 'new')
+    
+    def test_update_leads_rejects_unknown_fields(self):
+        """Test batched updates write nothing when a field is not a column."""
+        lead_id = self.db.add_lead(self.sample_lead)
+        
+        with self.assertRaises(ValueError):
+            self.db.update_leads({lead_id: {'status': 'contacted', 'not_a_column': 1}})
+        
+        self.assertEqual(self.db.get_lead(lead_id)['status'], 'new')
+    
+    def test_update_lead_keeps_dedupe_keys_current(self):
+        """Test partial name/company updates refresh the name+company key."""
+        lead_id = self.db.add_lead({'full_name': 'John Doe', 'company': 'Old Corp'})
+        
+        self.assertTrue(self.db.update_lead(lead_id, {'company': 'New Corp'}))
+        
+        self.assertEqual(self.db._find_duplicates({'full_name': 'John Doe', 'company': 'New Corp'}), lead_id)
+        self.assertIsNone(self.db._find_duplicates({'full_name': 'John Doe', 'company': 'Old Corp'}))
+    
     def test_search_leads_by_company(self):
         """Test searching leads by company name."""
         # Add multiple leads
@@ -240,6 +294,44 @@ class TestLeadDatabase(unittest.TestCase):
         page2_ids = {lead['id'] for lead in results_page2}
         self.assertEqual(len(page1_ids.intersection(page2_ids)), 0)
     
+    def test_search_leads_iter_pages_and_projects(self):
+        """Test streaming search with keyset pagination and projection."""
+        for i in range(25):
+            self.db.add_lead({
+                'full_name': f'Person {i:02d}',
+                'company': 'Even Corp' if i % 2 == 0 else 'Odd Corp',
+                'raw_data': {'index': i}
+            })
+        
+        rows = list(self.db.search_leads_iter({'company': 'Even Corp'}, columns=['full_name'],
+                                              order_by='full_name', page_size=4))
+        
+        self.assertEqual([row['full_name'] for row in rows], [f'Person {i:02d}' for i in range(0, 25, 2)])
+        self.assertEqual(set(rows[0].keys()), {'id', 'full_name'})
+        
+        # Resume after the fifth row
+        resumed = list(self.db.search_leads_iter({'company': 'Even Corp'}, columns=['full_name'],
+                                                 order_by='full_name', page_size=4,
+                                                 after=(rows[4]['full_name'], rows[4]['id'])))
+        self.assertEqual(resumed, rows[5:])
+        
+        # Descending order over all rows, raw_data decoded on access
+        rows = list(self.db.search_leads_iter(order_by='-full_name', page_size=7))
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(rows[0]['full_name'], 'Person 24')
+        self.assertEqual(rows[0]['raw_data'], {'index': 24})
+    
+    def test_search_leads_iter_rejects_unknown_fields(self):
+        """Test streaming search validates field names against the schema."""
+        with self.assertRaises(ValueError):
+            self.db.search_leads_iter({'company = company; --': 'x'})
+        
+        with self.assertRaises(ValueError):
+            self.db.search_leads_iter({}, columns=['not_a_column'])
+        
+        with self.assertRaises(ValueError):
+            self.db.search_leads_iter({}, order_by='not_a_column')
+    
     def test_get_all_leads(self):
         """Test retrieving all leads."""
         # Add multiple leads
@@ -371,6 +463,56 @@ class TestLeadDatabase(unittest.TestCase):
         updated_lead = self.db.get_lead(lead1_id)
         self.assertEqual(updated_lead['title'], 'Senior Engineer')
     
+    def test_duplicate_detection_normalizes_keys(self):
+        """Test duplicate detection ignores URL form and email/name casing."""
+        lead1_id = self.db.add_lead(self.sample_lead)
+        
+        self.assertEqual(
+            self.db._find_duplicates({'linkedin_url': 'https://www.linkedin.com/in/JohnDoe/?trk=x'}),
+            lead1_id
+        )
+        self.assertEqual(self.db._find_duplicates({'email': ' John.Doe@Example.com '}), lead1_id)
+        self.assertEqual(
+            self.db._find_duplicates({'full_name': 'john  doe', 'company': 'EXAMPLE CORP'}),
+            lead1_id
+        )
+        self.assertIsNone(self.db._find_duplicates({'email': 'someone.else@example.com'}))
+    
+    def test_add_leads_bulk(self):
+        """Test bulk ingest creates new leads and merges duplicates in one call."""
+        existing_id = self.db.add_lead(self.sample_lead)
+        
+        batch = [
+            {'full_name': f'Bulk Lead {i}', 'company': 'Bulk Corp', 'email': f'bulk{i}@example.com'}
+            for i in range(50)
+        ]
+        batch.append({'full_name': 'John Doe', 'email': 'JOHN.DOE@example.com', 'phone': '555-0100'})
+        batch.append({'full_name': 'Bulk Lead 3', 'company': 'Bulk Corp', 'title': 'CTO'})
+        
+        result = self.db.add_leads_bulk(batch)
+        
+        self.assertEqual(result['created'], 50)
+        self.assertEqual(result['merged'], 2)
+        self.assertEqual(len(result['lead_ids']), 52)
+        self.assertEqual(result['lead_ids'][50], existing_id)
+        self.assertEqual(result['lead_ids'][51], result['lead_ids'][3])
+        
+        # Duplicate within the batch was merged before insert
+        self.assertEqual(self.db.get_lead(result['lead_ids'][3])['title'], 'CTO')
+        
+        with sqlite3.connect(self.temp_db.name) as conn:
+            count = conn.execute("SELECT COUNT(*) FROM leads").fetchone()[0]
+        self.assertEqual(count, 51)
+    
+    def test_add_leads_bulk_rejects_invalid_batch(self):
+        """Test bulk ingest writes nothing when a lead is invalid."""
+        with self.assertRaises(ValueError):
+            self.db.add_leads_bulk([{'full_name': 'Valid Lead'}, {'email': 'nameless@example.com'}])
+        
+        with sqlite3.connect(self.temp_db.name) as conn:
+            count = conn.execute("SELECT COUNT(*) FROM leads").fetchone()[0]
+        self.assertEqual(count, 0)
+    
     def test_data_merging(self):
         """Test intelligent data merging for duplicates."""
         # Add initial lead with partial data
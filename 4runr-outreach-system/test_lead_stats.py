@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the trigger-maintained lead counters.
+"""
+
+import random
+import sqlite3
+import unittest
+
+from lead_stats import ensure_lead_stats, read_lead_stats
+
+
+class TestLeadStats(unittest.TestCase):
+    """Test lead_stats stays equal to a full recount."""
+    
+    def setUp(self):
+        """Create an in-memory leads table."""
+        self.conn = sqlite3.connect(':memory:', isolation_level=None)
+        self.conn.execute("""
+            CREATE TABLE leads (
+                id TEXT PRIMARY KEY,
+                email TEXT,
+                company TEXT,
+                engagement_stage TEXT,
+                status TEXT,
+                enriched BOOLEAN DEFAULT FALSE,
+                airtable_synced BOOLEAN DEFAULT FALSE,
+                sync_pending BOOLEAN DEFAULT TRUE
+            )
+        """)
+    
+    def tearDown(self):
+        """Close the connection."""
+        self.conn.close()
+    
+    def _recount(self):
+        """Force a full rebuild and return the counters."""
+        self.conn.execute("DELETE FROM lead_stats_meta")
+        ensure_lead_stats(self.conn)
+        return read_lead_stats(self.conn)
+    
+    def test_existing_rows_are_counted(self):
+        """Counters are built from rows present before the triggers."""
+        self.conn.executemany("INSERT INTO leads (id, email, status) VALUES (?, ?, ?)",
+                              [(str(i), 'a@example.com' if i % 2 else '', 'new') for i in range(10)])
+        
+        self.assertTrue(ensure_lead_stats(self.conn))
+        self.assertFalse(ensure_lead_stats(self.conn))
+        
+        stats = read_lead_stats(self.conn)
+        self.assertEqual(stats['total_leads'], 10)
+        self.assertEqual(stats['with_email'], 5)
+        self.assertEqual(stats['sync_pending'], 10)
+        self.assertEqual(stats['status'], {'new': 10})
+    
+    def test_triggers_track_inserts_updates_and_deletes(self):
+        """Random writes leave the counters equal to a full recount."""
+        ensure_lead_stats(self.conn)
+        rng = random.Random(42)
+        
+        for _ in range(500):
+            lead_id = str(rng.randint(0, 60))
+            action = rng.random()
+            if action < 0.35:
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO leads (id, company, engagement_stage) VALUES (?, ?, ?)",
+                    (lead_id, rng.choice(['Acme', '', None]), rng.choice(['new', 'contacted', None]))
+                )
+            elif action < 0.8:
+                self.conn.execute(
+                    "UPDATE leads SET enriched = ?, airtable_synced = ?, sync_pending = ?, "
+                    "engagement_stage = ?, email = ? WHERE id = ?",
+                    (rng.randint(0, 1), rng.randint(0, 1), rng.randint(0, 1),
+                     rng.choice(['new', 'contacted', None]), rng.choice(['x@example.com', '', None]), lead_id)
+                )
+            else:
+                self.conn.execute("DELETE FROM leads WHERE id = ?", (lead_id,))
+        
+        incremental = read_lead_stats(self.conn)
+        self.assertEqual(incremental, self._recount())
+        self.assertEqual(incremental['total_leads'],
+                         self.conn.execute("SELECT COUNT(*) FROM leads").fetchone()[0])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
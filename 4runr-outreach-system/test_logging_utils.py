@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for the NDJSON log storage in shared.logging_utils.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from shared import logging_utils
+from shared.logging_utils import (
+    OutreachLogger,
+    append_json_log,
+    read_log_entries,
+    load_daily_logs,
+    migrate_json_logs
+)
+
+
+class TestNDJSONLogStorage(unittest.TestCase):
+    """Test append-only JSON log storage."""
+    
+    def setUp(self):
+        """Create a temporary log directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_dir = Path(self.temp_dir)
+    
+    def tearDown(self):
+        """Remove the temporary log directory."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_append_writes_one_line_per_entry(self):
+        """Each entry is appended as its own JSON line."""
+        log_file = self.log_dir / "engager_log_2025-01-31.ndjson"
+        for i in range(3):
+            append_json_log(log_file, {"lead_id": f"lead_{i}", "status": "success"})
+        
+        with open(log_file, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(json.loads(lines[2])["lead_id"], "lead_2")
+    
+    def test_concurrent_appends_do_not_interleave(self):
+        """Appends from many threads produce whole, parseable lines."""
+        log_file = self.log_dir / "engager_log_2025-01-31.ndjson"
+        
+        def worker(worker_id):
+            for i in range(100):
+                append_json_log(log_file, {"worker": worker_id, "i": i, "details": {"pad": "x" * 200}})
+        
+        threads = [threading.Thread(target=worker, args=(w,)) for w in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        entries = list(read_log_entries(log_file))
+        self.assertEqual(len(entries), 800)
+    
+    def test_module_activity_uses_ndjson(self):
+        """OutreachLogger writes module activity to the daily NDJSON file."""
+        logger = OutreachLogger("unit_test_module")
+        logger.log_directory = self.log_dir
+        logger.save_json_logs = True
+        
+        logger.log_module_activity("scrape", "lead_1", "success", {"pages": 2})
+        logger.log_module_activity("scrape", "lead_2", "error")
+        
+        entries = logger.load_json_logs()
+        self.assertEqual([e["lead_id"] for e in entries], ["lead_1", "lead_2"])
+        self.assertEqual(list(self.log_dir.glob("*.json")), [])
+    
+    def test_reader_shim_and_migration_handle_legacy_arrays(self):
+        """Legacy JSON array logs remain readable and can be migrated."""
+        legacy_file = self.log_dir / "engager_log_2025-01-31.json"
+        with open(legacy_file, 'w', encoding='utf-8') as f:
+            json.dump([{"lead_id": "old_1"}, {"lead_id": "old_2"}], f, indent=2)
+        append_json_log(self.log_dir / "engager_log_2025-01-31.ndjson", {"lead_id": "new_1"})
+        
+        entries = load_daily_logs("engager_log", "2025-01-31", self.log_dir)
+        self.assertEqual([e["lead_id"] for e in entries], ["old_1", "old_2", "new_1"])
+        
+        self.assertEqual(migrate_json_logs(self.log_dir), 1)
+        self.assertFalse(legacy_file.exists())
+        
+        entries = load_daily_logs("engager_log", "2025-01-31", self.log_dir)
+        self.assertEqual([e["lead_id"] for e in entries], ["old_1", "old_2", "new_1"])
+
+    
+    def test_appends_after_migration_reach_new_file(self):
+        """Writers holding a cached descriptor follow the file migration replaced."""
+        log_file = self.log_dir / "engager_log_2025-01-31.ndjson"
+        append_json_log(log_file, {"lead_id": "new_1"})
+        with open(self.log_dir / "engager_log_2025-01-31.json", 'w', encoding='utf-8') as f:
+            json.dump([{"lead_id": "old_1"}], f)
+        
+        self.assertEqual(migrate_json_logs(self.log_dir), 1)
+        append_json_log(log_file, {"lead_id": "new_2"})
+        
+        entries = list(read_log_entries(log_file))
+        self.assertEqual([e["lead_id"] for e in entries], ["old_1", "new_1", "new_2"])
+    
+    def test_retired_descriptor_closed_after_last_write(self):
+        """A descriptor retired while a write uses it stays open until that write finishes."""
+        log_file = self.log_dir / "engager_log_2025-01-31.ndjson"
+        entry = logging_utils._acquire_append_fd(log_file)
+        
+        # The next day's log retires the earlier day's descriptor
+        append_json_log(self.log_dir / "engager_log_2025-02-01.ndjson", {"lead_id": "next_day"})
+        self.assertTrue(entry.retired)
+        os.write(entry.fd, b'{"lead_id": "in_flight"}\n')
+        logging_utils._release_append_fd(entry)
+        
+        with self.assertRaises(OSError):
+            os.fstat(entry.fd)
+        self.assertEqual([e["lead_id"] for e in read_log_entries(log_file)], ["in_flight"])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
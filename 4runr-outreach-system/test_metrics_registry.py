@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the in-process metrics registry.
+"""
+
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from metrics_registry import MetricsRegistry, LatencyHistogram
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Test histogram percentile estimates."""
+
+    def test_percentiles_follow_distribution(self):
+        """Percentiles land in the buckets holding those ranks."""
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.observe(3)
+        for _ in range(9):
+            histogram.observe(80)
+        histogram.observe(4000)
+
+        self.assertTrue(2.5 <= histogram.percentile(0.50) <= 5)
+        self.assertTrue(50 <= histogram.percentile(0.95) <= 100)
+        self.assertTrue(50 <= histogram.percentile(0.99) <= 100)
+        self.assertEqual(histogram.percentile(1.0), 4000)
+
+    def test_empty_histogram(self):
+        """An empty histogram reports zeros."""
+        snapshot = LatencyHistogram().snapshot()
+        self.assertEqual(snapshot["count"], 0)
+        self.assertEqual(snapshot["p99_ms"], 0.0)
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test registry recording and export."""
+
+    def setUp(self):
+        """Create a fresh registry and temp directory."""
+        self.registry = MetricsRegistry()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Stop flushing and remove the temp directory."""
+        self.registry.stop_periodic_flush(final_flush=False)
+        shutil.rmtree(self.temp_dir)
+
+    def test_concurrent_observations(self):
+        """Observations from many threads are all counted."""
+        def worker():
+            for i in range(1000):
+                self.registry.observe("get_lead", i % 50, success=i % 100 != 0)
+                self.registry.increment("lookups")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = self.registry.snapshot()
+        self.assertEqual(snapshot["operations"]["get_lead"]["count"], 8000)
+        self.assertEqual(snapshot["operations"]["get_lead"]["errors"], 80)
+        self.assertEqual(snapshot["counters"]["lookups"], 8000)
+
+    def test_prometheus_export(self):
+        """Prometheus output has cumulative buckets, sum and count."""
+        self.registry.observe("add_lead", 3)
+        self.registry.observe("add_lead", 30)
+        self.registry.increment("leads_added", 2)
+
+        text = self.registry.to_prometheus()
+
+        self.assertIn("lead_db_leads_added_total 2", text)
+        self.assertIn('lead_db_operation_duration_ms_bucket{operation="add_lead",le="5"} 1', text)
+        self.assertIn('lead_db_operation_duration_ms_bucket{operation="add_lead",le="+Inf"} 2', text)
+        self.assertIn('lead_db_operation_duration_ms_sum{operation="add_lead"} 33', text)
+        self.assertIn('lead_db_operation_duration_ms_count{operation="add_lead"} 2', text)
+
+    def test_flush_to_rolling_file(self):
+        """Snapshots are appended to one file that rolls over by size."""
+        path = Path(self.temp_dir) / "metrics.ndjson"
+        self.registry.start_periodic_flush(path, interval_seconds=3600, max_bytes=400)
+        self.registry.observe("update_lead", 12)
+
+        for _ in range(5):
+            self.registry.flush_to_file()
+
+        lines = path.read_text().splitlines()
+        self.assertGreaterEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[-1])["operations"]["update_lead"]["count"], 1)
+        self.assertTrue(path.with_name("metrics.ndjson.1").exists())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -17,6 +17,7 @@ from datetime import datetime, timedelta
 sys.path.insert(0, str(Path(__file__).parent))
 
 from shared.data_cleaner import AuditLogger, FieldCleaningResult, ValidationResult
+from shared.logging_utils import read_log_entries
 
 
 def test_comprehensive_metrics_tracking():
@@ -466,7 +467,7 @@ def test_log_persistence():
             
             # Check that log files were created
             log_dir = Path(temp_dir)
-            log_files = list(log_dir.glob('*.json'))
+            log_files = list(log_dir.glob('*.ndjson'))
             
             print(f"\\n📁 Log Files Created: {len(log_files)}")
             for log_file in log_files:
@@ -478,14 +479,13 @@ def test_log_persistence():
             
             for log_file in log_files:
                 try:
-                    with open(log_file, 'r') as f:
-                        data = json.load(f)
-                        if data:  # File has content
-                            files_with_content += 1
-                            total_entries += len(data)
-                            print(f"   ✅ {log_file.name} has {len(data)} entries")
-                        else:
-                            print(f"   ⚠️  {log_file.name} is empty")
+                    data = list(read_log_entries(log_file))
+                    if data:  # File has content
+                        files_with_content += 1
+                        total_entries += len(data)
+                        print(f"   ✅ {log_file.name} has {len(data)} entries")
+                    else:
+                        print(f"   ⚠️  {log_file.name} is empty")
                 except Exception as e:
                     print(f"   ❌ Error reading {log_file.name}: {e}")
             
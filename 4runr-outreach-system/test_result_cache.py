@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the versioned cache of cleaning and validation results.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from data_cleaner_test_support import ShippedRulesTestCase
+from shared.data_cleaner import CleaningResultCache, DataCleaner
+
+
+class TestCleaningResultCache(unittest.TestCase):
+    """Test the LRU, versioning and persistence of CleaningResultCache."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_least_recently_used_evicted(self):
+        """The cache keeps its newest entries and counts hits and misses."""
+        cache = CleaningResultCache(max_entries=2)
+        cache.put('company_name', 'a', 'v1', 'A')
+        cache.put('company_name', 'b', 'v1', 'B')
+        self.assertEqual(cache.get('company_name', 'a', 'v1'), 'A')
+        cache.put('company_name', 'c', 'v1', 'C')
+
+        self.assertIsNone(cache.get('company_name', 'b', 'v1'))
+        self.assertEqual(cache.get('company_name', 'c', 'v1'), 'C')
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_results_keyed_on_version(self):
+        """Results are only returned for the rules they were computed with."""
+        cache = CleaningResultCache()
+        cache.put('company_name', 'a', 'v1', 'A')
+        cache.put('company_name', 'a', 'v2', 'B')
+
+        self.assertEqual(cache.get('company_name', 'a', 'v1'), 'A')
+        self.assertEqual(cache.get('company_name', 'a', 'v2'), 'B')
+        self.assertIsNone(cache.get('company_name', 'a', 'v3'))
+
+    def test_retain_versions_drops_others(self):
+        """Results of rules no longer in use are dropped, in memory and on disk."""
+        cache = CleaningResultCache(db_path=os.path.join(self.temp_dir, 'results.db'))
+        cache.put('company_name', 'a', 'v1', 'A')
+        cache.put('website_url_validation', 'a', 'w1', ['website', True, 1.0, 'url_validation', '', ''])
+        cache.put('company_name', 'a', 'v2', 'B')
+
+        cache.retain_versions(['v2', 'w1'])
+
+        self.assertEqual(cache.get_stats()['entries'], 2)
+        self.assertEqual(cache.get('company_name', 'a', 'v2'), 'B')
+        self.assertIsNone(cache.get('company_name', 'a', 'v1'))
+        self.assertIsNotNone(cache.get('website_url_validation', 'a', 'w1'))
+
+    def test_persisted_results_shared(self):
+        """A cache on the same database and rules sees stored results."""
+        db_path = os.path.join(self.temp_dir, 'results.db')
+        writer = CleaningResultCache(db_path=db_path)
+        writer.put('website_url_validation', 'https://acme.com', 'v1', ['website', True, 1.0, 'url_validation', '', ''])
+
+        reader = CleaningResultCache(db_path=db_path)
+        self.assertEqual(reader.get('website_url_validation', 'https://acme.com', 'v1'),
+                         ['website', True, 1.0, 'url_validation', '', ''])
+        self.assertIsNone(reader.get('website_url_validation', 'https://acme.com', 'v2'))
+
+
+class TestDataCleanerResultCache(ShippedRulesTestCase):
+    """Test the result cache as used by DataCleaner."""
+
+    def setUp(self):
+        super().setUp()
+        self.cleaner = DataCleaner(self.temp_dir)
+
+    def test_repeated_records_hit(self):
+        """Repeated values come from the cache with identical results and statistics."""
+        raw_data = {'Company': 'About 1,234 results for Busbud', 'Website': 'https://www.busbud.com/'}
+
+        first = self.cleaner.clean_and_validate(raw_data, {'id': 'lead1'})
+        misses = self.cleaner.get_cleaning_stats()['cache_misses']
+        second = self.cleaner.clean_and_validate(raw_data, {'id': 'lead2'})
+
+        self.assertEqual(second.cleaned_data, first.cleaned_data)
+        self.assertEqual(second.validation_results, first.validation_results)
+        stats = self.cleaner.get_cleaning_stats()
+        self.assertEqual(stats['cache_misses'], misses)
+        self.assertEqual(stats['cache_hits'], 4)
+        self.assertEqual(self.cleaner.validation_engine.validation_stats['by_field']['company'], {'passed': 2, 'failed': 0})
+
+    def test_update_rules_invalidates(self):
+        """Values cleaned before a rule update are cleaned again with the new rules."""
+        self.assertEqual(self.cleaner.cleaning_engine.clean_company_name('Globex Holdings'), 'Globex Holdings')
+
+        company_rules = dict(self.cleaner.config_manager.cleaning_rules['company_name'])
+        company_rules['remove_patterns'] = company_rules['remove_patterns'] + [r'\s*Holdings']
+        self.assertTrue(self.cleaner.update_rules({'cleaning_rules': {'company_name': company_rules}}))
+
+        result = self.cleaner.clean_and_validate({'Company': 'Globex Holdings'}, {'id': 'lead1'})
+
+        self.assertEqual(self.cleaner.cleaning_engine.clean_company_name('Globex Holdings'), 'Globex')
+        self.assertEqual(result.cleaning_actions[0].cleaned_value, 'Globex')
+
+    def test_engine_on_earlier_rules_does_not_poison_cache(self):
+        """Values cleaned after a rule update but before the engines switch to it are not reused."""
+        company_rules = dict(self.cleaner.config_manager.cleaning_rules['company_name'])
+        company_rules['remove_patterns'] = company_rules['remove_patterns'] + [r'\s*Holdings']
+        self.assertTrue(self.cleaner.update_rules({'cleaning_rules': {'company_name': company_rules}}))
+
+        # The engine has not picked up the new program yet
+        self.assertEqual(self.cleaner.cleaning_engine.clean_company_name('Globex Holdings'), 'Globex Holdings')
+
+        result = self.cleaner.clean_and_validate({'Company': 'Globex Holdings'}, {'id': 'lead1'})
+
+        self.assertEqual(result.cleaning_actions[0].cleaned_value, 'Globex')
+
+    def test_validation_results_keyed_on_engine_rules(self):
+        """A validation engine on other rules does not see results of the loaded ones."""
+        self.cleaner.validation_engine.validate_website_url('https://www.busbud.com', {})
+        misses = self.cleaner.get_cleaning_stats()['cache_misses']
+
+        rules = dict(self.cleaner.validation_engine.rules)
+        rules['website_url'] = dict(rules.get('website_url', {}), min_length=100)
+        self.cleaner.validation_engine.rules = rules
+        self.cleaner.validation_engine.validate_website_url('https://www.busbud.com', {})
+
+        self.assertEqual(self.cleaner.get_cleaning_stats()['cache_misses'], misses + 1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
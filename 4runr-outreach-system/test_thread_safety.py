@@ -375,7 +375,47 @@ class ThreadSafetyTests(unittest.TestCase):
         self.assertEqual(pool_health['status'], 'healthy')
         self.assertGreater(total_acquisitions, 0)
         self.assertEqual(len(self.race_conditions), 0, f"Race conditions detected: {self.race_conditions}")
-    
+
+    def test_connection_pool_reuses_configured_connections(self):
+        """Test that pooled connections are reused and keep their PRAGMAs"""
+        print("\n=== Testing Connection Pool Reuse ===")
+
+        pool = DatabaseConnectionPool(self.db_path, min_connections=2, max_connections=4)
+        checked_out = set()
+        checked_out_lock = threading.Lock()
+
+        def connection_worker():
+            for _ in range(50):
+                with pool.get_connection(timeout=10) as conn:
+                    with checked_out_lock:
+                        checked_out.add(pool.get_connection_id(conn))
+
+                    # Settings from _create_connection must apply to the handed-out connection
+                    self.assertEqual(conn.execute("PRAGMA cache_size").fetchone()[0], -64000)
+                    self.assertEqual(conn.execute("PRAGMA busy_timeout").fetchone()[0], 30000)
+                    conn.execute("SELECT COUNT(*) FROM leads").fetchone()
+
+        try:
+            threads = [threading.Thread(target=connection_worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=60)
+
+            pool._perform_maintenance()
+            stats = pool.get_pool_stats()
+            print(f"Pool stats: {stats}")
+
+            self.assertLessEqual(len(checked_out), 4)
+            self.assertEqual(stats['connections_created'], stats['total_connections'])
+            self.assertEqual(stats['checkouts'], 400)
+            self.assertEqual(stats['checkins'], 400)
+            self.assertEqual(stats['active_connections'], 0)
+            self.assertEqual(stats['health_check_failures'], 0)
+            self.assertGreaterEqual(stats['average_wait_time_ms'], 0)
+        finally:
+            pool.close()
+
     def test_transaction_isolation(self):
         """Test transaction isolation between concurrent threads"""
         print("\n=== Testing Transaction Isolation ===")
@@ -8,7 +8,6 @@ Automated Real-Time Airtable Sync for EC2
 """
 
 import sqlite3
-import requests
 import json
 import os
 import time
@@ -17,6 +16,10 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import logging
 from pathlib import Path
+import sys
+
+sys.path.insert(0, './4runr-outreach-system')
+from shared.airtable_transport import get_airtable_transport
 
 # Configure logging for production
 logging.basicConfig(
@@ -40,12 +43,9 @@ class AutomatedAirtableSync:
         self.base_id = 'appBZvPvNXGqtoJdc'
         self.table_name = 'Table 1'
         
-        self.headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json'
-        }
-        
-        self.airtable_url = f'https://api.airtable.com/v0/{self.base_id}/{self.table_name}'
+        # Shared rate-limited transport (5 requests/second per base across all processes)
+        self.transport = get_airtable_transport(self.api_key, self.base_id)
+        self.airtable_url = self.transport.table_url(self.table_name)
         
         # Sync state tracking
         self.last_sync_time = None
@@ -294,15 +294,10 @@ class AutomatedAirtableSync:
         for attempt in range(self.retry_attempts):
             try:
                 update_data = {"fields": fields}
-                response = requests.patch(f"{self.airtable_url}/{record_id}", 
-                                        headers=self.headers, json=update_data)
+                response = self.transport.patch(f"{self.airtable_url}/{record_id}", json=update_data)
                 
                 if response.status_code == 200:
                     return True
-                elif response.status_code == 429:  # Rate limit
-                    logger.warning(f"Rate limited, waiting {self.retry_delay}s...")
-                    time.sleep(self.retry_delay)
-                    continue
                 else:
                     logger.error(f"Failed to update record {record_id}: {response.status_code} - {response.text}")
                     if attempt < self.retry_attempts - 1:
@@ -325,15 +320,11 @@ class AutomatedAirtableSync:
         for attempt in range(self.retry_attempts):
             try:
                 create_data = {"fields": fields}
-                response = requests.post(self.airtable_url, headers=self.headers, json=create_data)
+                response = self.transport.post(self.airtable_url, json=create_data)
                 
                 if response.status_code == 200:
                     record_id = response.json().get('id')
                     return True, record_id
-                elif response.status_code == 429:  # Rate limit
-                    logger.warning(f"Rate limited, waiting {self.retry_delay}s...")
-                    time.sleep(self.retry_delay)
-                    continue
                 else:
                     logger.error(f"Failed to create record: {response.status_code} - {response.text}")
                     if attempt < self.retry_attempts - 1:
@@ -373,7 +364,7 @@ class AutomatedAirtableSync:
         """Get existing Airtable records"""
         
         try:
-            response = requests.get(self.airtable_url, headers=self.headers)
+            response = self.transport.get(self.airtable_url)
             if response.status_code == 200:
                 return response.json().get('records', [])
             else:
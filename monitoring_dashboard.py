@@ -6,12 +6,16 @@ Real-time system health and performance monitoring
 
 import sqlite3
 import os
+import sys
 import time
 import json
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 import psutil
 
+sys.path.append('4runr-outreach-system')
+from lead_stats import ensure_lead_stats, read_lead_stats
+
 class SystemMonitor:
     def __init__(self):
         load_dotenv()
@@ -59,15 +63,14 @@ class SystemMonitor:
             
             conn = sqlite3.connect(self.db_path)
             
-            # Get lead counts
-            cursor = conn.execute("SELECT COUNT(*) FROM leads")
-            total_leads = cursor.fetchone()[0]
-            
-            # Get leads by stage
-            cursor = conn.execute("SELECT engagement_stage, COUNT(*) FROM leads GROUP BY engagement_stage")
-            stage_counts = dict(cursor.fetchall())
+            # Lead counts are trigger-maintained, so each poll is O(1)
+            ensure_lead_stats(conn)
+            stats = read_lead_stats(conn)
+            total_leads = stats['total_leads']
+            stage_counts = stats['engagement_stage']
             
-            # Get recent activity
+            # Get recent activity (range scan on the updated_at index)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_leads_updated_at ON leads(updated_at)")
             cursor = conn.execute("""
                 SELECT COUNT(*) FROM leads 
                 WHERE updated_at > datetime('now', '-24 hours')
@@ -75,11 +78,8 @@ class SystemMonitor:
             recent_updates = cursor.fetchone()[0]
             
             # Get data quality metrics
-            cursor = conn.execute("SELECT COUNT(*) FROM leads WHERE email IS NOT NULL AND email != ''")
-            leads_with_email = cursor.fetchone()[0]
-            
-            cursor = conn.execute("SELECT COUNT(*) FROM leads WHERE company IS NOT NULL AND company != ''")
-            leads_with_company = cursor.fetchone()[0]
+            leads_with_email = stats['with_email']
+            leads_with_company = stats['with_company']
             
             # Database file size
             db_size = os.path.getsize(self.db_path) / (1024 * 1024)  # MB
@@ -7,12 +7,15 @@ Production Airtable Sync System
 """
 
 import sqlite3
-import requests
 import json
 import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import logging
+import sys
+
+sys.path.insert(0, './4runr-outreach-system')
+from shared.airtable_transport import get_airtable_transport
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -29,12 +32,9 @@ class ProductionAirtableSync:
         self.base_id = 'appBZvPvNXGqtoJdc'
         self.table_name = 'Table 1'
         
-        self.headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json'
-        }
-        
-        self.airtable_url = f'https://api.airtable.com/v0/{self.base_id}/{self.table_name}'
+        # Shared rate-limited transport (5 requests/second per base across all processes)
+        self.transport = get_airtable_transport(self.api_key, self.base_id)
+        self.airtable_url = self.transport.table_url(self.table_name)
         
         # Currently existing fields in Airtable (verified)
         self.existing_fields = {
@@ -424,7 +424,7 @@ class ProductionAirtableSync:
         """Get existing Airtable records"""
         
         try:
-            response = requests.get(self.airtable_url, headers=self.headers)
+            response = self.transport.get(self.airtable_url)
             if response.status_code == 200:
                 return response.json().get('records', [])
             else:
@@ -439,8 +439,7 @@ class ProductionAirtableSync:
         
         try:
             update_data = {"fields": fields}
-            response = requests.patch(f"{self.airtable_url}/{record_id}", 
-                                    headers=self.headers, json=update_data)
+            response = self.transport.patch(f"{self.airtable_url}/{record_id}", json=update_data)
             
             return response.status_code == 200
         except Exception as e:
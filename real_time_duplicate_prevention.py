@@ -10,21 +10,232 @@ FEATURES:
 - Smart similarity matching
 - Real-time quality scoring
 - Duplicate merge recommendations
-- Performance optimized for speed
+- Performance optimized for speed (in-memory indexes over every lead)
 - Configurable thresholds
 - Automatic decision making
 
 This system ensures we never save duplicates in the first place.
 """
 
+import re
 import sqlite3
 import hashlib
+import math
+import threading
 import time
+from collections import Counter, defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from difflib import SequenceMatcher
 from intelligent_lead_cleaner import IntelligentLeadCleaner
 
+LEAD_INDEX_COLUMNS = "rowid, full_name, company, email, linkedin_url, phone, created_at, updated_at"
+LINKEDIN_SLUG_PATTERN = re.compile(r'linkedin\.com/(?:in|pub)/([^/?#\s]+)', re.IGNORECASE)
+
+
+def linkedin_slug(url: str) -> str:
+    """Profile slug of a LinkedIn URL ('' if it is not a profile URL)"""
+    match = LINKEDIN_SLUG_PATTERN.search(url or '')
+    return match.group(1).lower() if match else ''
+
+
+def trigrams(value: str) -> Set[str]:
+    """Character trigrams of a value (the value itself when shorter)"""
+    if len(value) < 3:
+        return {value} if value else set()
+    return {value[i:i + 3] for i in range(len(value) - 2)}
+
+
+def min_shared_trigrams(value: str, threshold: float) -> int:
+    """
+    Fewest distinct trigrams a value shares with any value whose
+    SequenceMatcher ratio to it reaches the threshold (0 or less when a
+    similar value may share none, as "acme" and "acdme" do).
+
+    Matching characters M >= threshold * (la + lb) / 2 form blocks separated
+    by unmatched characters, and every trigram inside a block is shared, so
+    at least 5M - 2(la + lb) - 2 trigram positions are shared; the other
+    length is at least threshold * la / (2 - threshold). Positions holding a
+    trigram repeated within the value may share one distinct trigram.
+    """
+    length = len(value)
+    shortest_total = length + threshold * length / (2 - threshold)
+    shared_positions = math.ceil((2.5 * threshold - 2) * shortest_total - 1e-9) - 2
+    repeated = max(0, length - 2) - len(trigrams(value))
+    return shared_positions - repeated
+
+
+class LeadIndex:
+    """
+    In-memory indexes over every lead: signature hashes, normalized emails,
+    LinkedIn slugs and an inverted index of name, company and email trigrams.
+
+    Leads are normalized once when added, so a lookup only touches the
+    leads sharing a key with the new one.
+    """
+
+    def __init__(self, cleaner: IntelligentLeadCleaner):
+        self.cleaner = cleaner
+        self.leads: Dict[int, Dict] = {}
+        self.normalized: Dict[int, Dict] = {}
+        self.signatures: Dict[str, Set[int]] = defaultdict(set)
+        self.emails: Dict[str, Set[int]] = defaultdict(set)
+        self.linkedin_slugs: Dict[str, Set[int]] = defaultdict(set)
+        self.grams: Dict[Tuple[str, str], Set[int]] = defaultdict(set)
+        self.max_rowid = 0
+        self.last_updated_at = ''
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.leads)
+
+    def normalize(self, lead: Dict) -> Dict:
+        """Normalized fields of a lead, as the cleaner compares them"""
+        return {
+            'name': self.cleaner.normalize_person_name(lead.get('full_name', '') or ''),
+            'company': self.cleaner.normalize_company_name(lead.get('company', '') or ''),
+            'email': self.cleaner.normalize_email(lead.get('email', '') or ''),
+            'linkedin_slug': linkedin_slug(lead.get('linkedin_url', '') or ''),
+            'signature': self.cleaner.generate_lead_signature(lead),
+            # Leads are checked most recent first, as ORDER BY created_at DESC did
+            'order': (str(lead.get('created_at') or ''), lead['rowid'])
+        }
+
+    def _keys(self, normalized: Dict):
+        yield self.signatures, normalized['signature']
+        if normalized['email']:
+            yield self.emails, normalized['email']
+        if normalized['linkedin_slug']:
+            yield self.linkedin_slugs, normalized['linkedin_slug']
+        for gram in trigrams(normalized['name']):
+            yield self.grams, ('name', gram)
+        for gram in trigrams(normalized['company']):
+            yield self.grams, ('company', gram)
+        for gram in trigrams(normalized['email']):
+            yield self.grams, ('email', gram)
+
+    def add(self, lead: Dict):
+        """Add a lead, replacing its previous version if indexed"""
+        rowid = lead['rowid']
+        normalized = self.normalize(lead)
+
+        with self._lock:
+            self.remove(rowid)
+            self.leads[rowid] = lead
+            self.normalized[rowid] = normalized
+            for index, key in self._keys(normalized):
+                index[key].add(rowid)
+
+            self.max_rowid = max(self.max_rowid, rowid)
+            self.last_updated_at = max(self.last_updated_at, str(lead.get('updated_at') or ''))
+
+    def remove(self, rowid: int):
+        """Remove a lead from every index"""
+        with self._lock:
+            normalized = self.normalized.pop(rowid, None)
+            if normalized is None:
+                return
+            del self.leads[rowid]
+            for index, key in self._keys(normalized):
+                members = index.get(key)
+                if members is not None:
+                    members.discard(rowid)
+                    if not members:
+                        del index[key]
+
+    def retain(self, rowids: Set[int]):
+        """Remove every lead not in rowids, such as leads other processes deleted"""
+        with self._lock:
+            for rowid in [rowid for rowid in self.leads if rowid not in rowids]:
+                self.remove(rowid)
+
+    def with_field(self, field: str) -> Set[int]:
+        """Leads with a non-empty normalized field"""
+        with self._lock:
+            return {rowid for rowid, normalized in self.normalized.items() if normalized[field]}
+
+    def most_recent(self, rowids: Set[int]) -> Optional[Dict]:
+        """The most recently created of some leads"""
+        if not rowids:
+            return None
+        return self.leads[max(rowids, key=lambda rowid: self.normalized[rowid]['order'])]
+
+    def find_signature(self, signature: str) -> Optional[Dict]:
+        with self._lock:
+            return self.most_recent(self.signatures.get(signature, set()))
+
+    def find_linkedin(self, slug: str) -> Optional[Dict]:
+        with self._lock:
+            return self.most_recent(self.linkedin_slugs.get(slug, set())) if slug else None
+
+    def probe(self, field: str, value: str, threshold: float) -> Set[int]:
+        """
+        Leads sharing at least one of the rarest trigrams a similar value must share.
+
+        A value sharing `required` of n trigrams shares at least one of any
+        n - required + 1 of them, so only the smallest postings are read.
+        """
+        grams = trigrams(value)
+        if not grams:
+            return set()
+
+        required = min(len(grams), min_shared_trigrams(value, threshold))
+        with self._lock:
+            if required < 1:
+                return self.with_field(field)
+            postings = sorted((self.grams.get((field, gram), set()) for gram in grams), key=len)
+            return set().union(*postings[:len(postings) - required + 1])
+
+    def candidates(self, field: str, value: str, threshold: float, within: Optional[Set[int]] = None) -> Set[int]:
+        """
+        Leads sharing enough trigrams of a field to reach the similarity threshold.
+
+        Args:
+            field: 'name', 'company' or 'email'
+            value: Normalized value of the new lead
+            threshold: Similarity threshold
+            within: Only consider these leads
+
+        Returns:
+            Lead rowids
+        """
+        grams = trigrams(value)
+        if not grams or within is not None and not within:
+            return set()
+
+        required = min(len(grams), min_shared_trigrams(value, threshold))
+        with self._lock:
+            if required < 1:
+                # Short values can be similar without sharing a trigram
+                found = self.with_field(field)
+                return found & within if within is not None else found
+            postings = sorted((self.grams.get((field, gram), set()) for gram in grams), key=len)
+            if within is not None:
+                postings = [posting & within for posting in postings]
+
+            # Trigrams most leads have ("com", "@gm") are only checked for the
+            # leads that share enough of the rarer ones; a match shares at least
+            # one of the n - required + 1 rarest, so those are never skipped
+            average = sum(len(posting) for posting in postings) / len(postings)
+            common = [posting for posting in postings[len(postings) - required + 1:] if len(posting) > average]
+            rare = postings[:len(postings) - len(common)]
+
+            counts = Counter()
+            for posting in rare:
+                counts.update(posting)
+            found = {rowid for rowid, count in counts.items() if count >= required - len(common)}
+            if not common:
+                return found
+            return {rowid for rowid in found
+                    if counts[rowid] + sum(rowid in posting for posting in common) >= required}
+
+    def ordered(self, rowids: Set[int]) -> List[Tuple[Dict, Dict]]:
+        """Leads with their normalized fields, most recent first"""
+        with self._lock:
+            ordered_ids = sorted(rowids, key=lambda rowid: self.normalized[rowid]['order'], reverse=True)
+            return [(self.leads[rowid], self.normalized[rowid]) for rowid in ordered_ids]
+
+
 class RealTimeDuplicatePrevention:
     """Real-time duplicate prevention during lead processing"""
     
@@ -32,11 +243,12 @@ class RealTimeDuplicatePrevention:
         self.db_path = db_path
         self.cleaner = IntelligentLeadCleaner(db_path)
         
-        # Performance optimization - keep recent leads in memory
-        self.recent_leads_cache = []
-        self.cache_size = 1000
-        self.last_cache_update = 0
-        self.cache_ttl = 300  # 5 minutes
+        # Performance optimization - index every lead in memory, loaded once and
+        # kept current by save_new_lead/update_existing_lead
+        self.index = LeadIndex(self.cleaner)
+        self.index_loaded = False
+        self.last_index_refresh = 0
+        self.index_refresh_interval = 300  # 5 minutes, for leads written by other processes
         
         # Prevention thresholds (more strict than cleaning)
         self.exact_match_threshold = 1.0
@@ -47,59 +259,71 @@ class RealTimeDuplicatePrevention:
         print("🚫 Real-Time Duplicate Prevention System initialized")
         print("🎯 Ready to prevent duplicates at the source")
     
-    def refresh_cache(self):
-        """Refresh the recent leads cache for performance"""
+    def refresh_index(self, force: bool = False):
+        """Load every lead into the index, then pick up leads other processes saved, changed or deleted"""
         current_time = time.time()
         
-        if current_time - self.last_cache_update > self.cache_ttl:
-            try:
-                conn = sqlite3.connect(self.db_path)
-                conn.row_factory = sqlite3.Row
-                
-                # Get recent leads (last 1000)
-                cursor = conn.execute("""
-                    SELECT rowid, full_name, company, email, linkedin_url, phone, created_at 
+        if not force and self.index_loaded and current_time - self.last_index_refresh <= self.index_refresh_interval:
+            return
+        
+        try:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            
+            if self.index_loaded:
+                cursor = conn.execute(f"""
+                    SELECT {LEAD_INDEX_COLUMNS}
                     FROM leads 
-                    WHERE full_name IS NOT NULL 
-                    ORDER BY created_at DESC 
-                    LIMIT ?
-                """, (self.cache_size,))
-                
-                self.recent_leads_cache = [dict(row) for row in cursor.fetchall()]
-                self.last_cache_update = current_time
-                conn.close()
-                
-            except Exception as e:
-                print(f"⚠️ Cache refresh failed: {e}")
+                    WHERE full_name IS NOT NULL AND (rowid > ? OR updated_at > ?)
+                """, (self.index.max_rowid, self.index.last_updated_at))
+            else:
+                cursor = conn.execute(f"""
+                    SELECT {LEAD_INDEX_COLUMNS}
+                    FROM leads 
+                    WHERE full_name IS NOT NULL
+                """)
+            
+            for row in cursor:
+                self.index.add(dict(row))
+            
+            if self.index_loaded:
+                # Drop leads other processes deleted (or cleared the name of)
+                self.index.retain({row[0] for row in conn.execute(
+                    "SELECT rowid FROM leads WHERE full_name IS NOT NULL"
+                )})
+            
+            self.index_loaded = True
+            self.last_index_refresh = current_time
+            conn.close()
+            
+        except Exception as e:
+            print(f"⚠️ Index refresh failed: {e}")
     
     def check_for_duplicates(self, new_lead: Dict) -> Dict:
         """Check if new lead is a duplicate before insertion"""
         start_time = time.time()
         
-        # Refresh cache if needed
-        self.refresh_cache()
+        # Load or catch up the index if needed
+        self.refresh_index()
         
         # Generate signature for exact matching
         new_signature = self.cleaner.generate_lead_signature(new_lead)
         
-        # Check against cached leads for performance
-        leads_to_check = self.recent_leads_cache
-        
         # Step 1: Exact duplicate check
-        exact_match = self.check_exact_duplicates(new_lead, new_signature, leads_to_check)
+        exact_match = self.check_exact_duplicates(new_lead, new_signature)
         if exact_match:
             return {
                 'is_duplicate': True,
                 'duplicate_type': 'exact',
                 'action': 'reject',
                 'confidence': 1.0,
-                'existing_lead': exact_match,
-                'reason': 'Exact duplicate found',
+                'existing_lead': exact_match['existing_lead'],
+                'reason': exact_match['reason'],
                 'processing_time_ms': (time.time() - start_time) * 1000
             }
         
         # Step 2: Fuzzy duplicate check
-        fuzzy_match = self.check_fuzzy_duplicates(new_lead, leads_to_check)
+        fuzzy_match = self.check_fuzzy_duplicates(new_lead)
         if fuzzy_match:
             return {
                 'is_duplicate': True,
@@ -120,26 +344,51 @@ class RealTimeDuplicatePrevention:
             'processing_time_ms': (time.time() - start_time) * 1000
         }
     
-    def check_exact_duplicates(self, new_lead: Dict, new_signature: str, existing_leads: List[Dict]) -> Optional[Dict]:
-        """Check for exact duplicates using signatures"""
-        for existing_lead in existing_leads:
-            existing_signature = self.cleaner.generate_lead_signature(existing_lead)
-            
-            if new_signature == existing_signature:
-                return existing_lead
+    def check_exact_duplicates(self, new_lead: Dict, new_signature: str) -> Optional[Dict]:
+        """Check for exact duplicates using signatures and LinkedIn profiles"""
+        existing_lead = self.index.find_signature(new_signature)
+        if existing_lead:
+            return {'existing_lead': existing_lead, 'reason': 'Exact duplicate found'}
+        
+        existing_lead = self.index.find_linkedin(linkedin_slug(new_lead.get('linkedin_url', '') or ''))
+        if existing_lead:
+            return {'existing_lead': existing_lead, 'reason': 'Same LinkedIn profile found'}
         
         return None
     
-    def check_fuzzy_duplicates(self, new_lead: Dict, existing_leads: List[Dict]) -> Optional[Dict]:
+    def check_fuzzy_duplicates(self, new_lead: Dict) -> Optional[Dict]:
         """Check for fuzzy duplicates using similarity matching"""
         new_name_norm = self.cleaner.normalize_person_name(new_lead.get('full_name', ''))
         new_company_norm = self.cleaner.normalize_company_name(new_lead.get('company', ''))
         new_email_norm = self.cleaner.normalize_email(new_lead.get('email', ''))
         
-        for existing_lead in existing_leads:
-            existing_name_norm = self.cleaner.normalize_person_name(existing_lead.get('full_name', ''))
-            existing_company_norm = self.cleaner.normalize_company_name(existing_lead.get('company', ''))
-            existing_email_norm = self.cleaner.normalize_email(existing_lead.get('email', ''))
+        # Only leads whose name or email could reach a threshold need comparing
+        # The name branch also needs a similar company, which narrows the name check cheaply
+        name_candidates = self.index.candidates(
+            'company', new_company_norm, self.company_similarity_threshold,
+            within=self.index.probe('name', new_name_norm, self.name_similarity_threshold)
+        )
+        name_candidates = self.index.candidates(
+            'name', new_name_norm, self.name_similarity_threshold, within=name_candidates
+        )
+        email_candidates = set()
+        if new_email_norm:
+            email_candidates = self.index.candidates('email', new_email_norm, self.email_similarity_threshold)
+        
+        for existing_lead, existing in self.index.ordered(name_candidates | email_candidates):
+            existing_name_norm = existing['name']
+            existing_company_norm = existing['company']
+            existing_email_norm = existing['email']
+            
+            # Skip leads whose upper-bound similarities cannot reach either threshold
+            rowid = existing_lead['rowid']
+            may_match_name = (rowid in name_candidates
+                              and self.may_reach(new_name_norm, existing_name_norm, self.name_similarity_threshold)
+                              and self.may_reach(new_company_norm, existing_company_norm, self.company_similarity_threshold))
+            may_match_email = (rowid in email_candidates
+                               and self.may_reach(new_email_norm, existing_email_norm, self.email_similarity_threshold))
+            if not may_match_name and not may_match_email:
+                continue
             
             # Calculate similarities
             name_similarity = self.cleaner.calculate_similarity(new_name_norm, existing_name_norm)
@@ -186,6 +435,16 @@ class RealTimeDuplicatePrevention:
         
         return None
     
+    def may_reach(self, str1: str, str2: str, threshold: float) -> bool:
+        """Whether calculate_similarity could reach the threshold, from SequenceMatcher's cheap upper bounds"""
+        if not str1 or not str2:
+            return False
+        if 2.0 * min(len(str1), len(str2)) / (len(str1) + len(str2)) < threshold:
+            return False
+        
+        matcher = SequenceMatcher(None, str1.lower(), str2.lower())
+        return matcher.real_quick_ratio() >= threshold and matcher.quick_ratio() >= threshold
+    
     def process_lead_with_prevention(self, new_lead: Dict) -> Dict:
         """Process a new lead with duplicate prevention"""
         print(f"🔍 Checking for duplicates: {new_lead.get('full_name')} at {new_lead.get('company')}")
@@ -279,11 +538,9 @@ class RealTimeDuplicatePrevention:
             conn.commit()
             conn.close()
             
-            # Update cache
+            # Update index
             lead['rowid'] = lead_id
-            self.recent_leads_cache.insert(0, lead)
-            if len(self.recent_leads_cache) > self.cache_size:
-                self.recent_leads_cache.pop()
+            self.index.add(lead)
             
             return str(lead_id)
             
@@ -314,6 +571,9 @@ class RealTimeDuplicatePrevention:
                 query = f"UPDATE leads SET {', '.join(update_fields)} WHERE rowid = ?"
                 conn.execute(query, update_values)
                 conn.commit()
+                
+                # Update index
+                self.index.add({**lead, 'rowid': int(lead_id)})
             
             conn.close()
             
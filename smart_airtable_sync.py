@@ -4,12 +4,15 @@ Smart Airtable Sync - Detects existing fields and maps accordingly
 """
 
 import os
+import sys
 import sqlite3
-import requests
 import json
 import logging
 from typing import Dict, List, Any
 
+sys.path.insert(0, './4runr-outreach-system')
+from shared.airtable_transport import get_airtable_transport
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -26,19 +29,16 @@ class SmartAirtableSync:
         if not all([self.api_key, self.base_id, self.table_name]):
             raise ValueError("Missing required Airtable environment variables")
         
-        self.headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json'
-        }
-        
-        self.base_url = f'https://api.airtable.com/v0/{self.base_id}/{self.table_name}'
+        # Shared rate-limited transport (5 requests/second per base across all processes)
+        self.transport = get_airtable_transport(self.api_key, self.base_id)
+        self.base_url = self.transport.table_url(self.table_name)
         self.existing_fields = None
         
     def detect_airtable_fields(self):
         """Detect existing fields in Airtable."""
         try:
             # Get existing records to see field structure
-            response = requests.get(self.base_url, headers=self.headers, timeout=10)
+            response = self.transport.get(self.base_url, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -122,7 +122,7 @@ class SmartAirtableSync:
             logger.info("Clearing existing Airtable records...")
             
             # Get all existing records
-            response = requests.get(self.base_url, headers=self.headers)
+            response = self.transport.get(self.base_url)
             
             if response.status_code == 200:
                 data = response.json()
@@ -137,7 +137,7 @@ class SmartAirtableSync:
                         delete_params = '&'.join([f'records[]={rid}' for rid in record_ids])
                         delete_url = f"{self.base_url}?{delete_params}"
                         
-                        delete_response = requests.delete(delete_url, headers=self.headers)
+                        delete_response = self.transport.delete(delete_url)
                         
                         if delete_response.status_code != 200:
                             logger.warning(f"Failed to delete batch: {delete_response.status_code}")
@@ -212,9 +212,8 @@ class SmartAirtableSync:
         }
         
         # Post to Airtable
-        response = requests.post(
+        response = self.transport.post(
             self.base_url,
-            headers=self.headers,
             data=json.dumps(airtable_data),
             timeout=30
         )
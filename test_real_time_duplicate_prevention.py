@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the lead index behind real-time duplicate prevention.
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from real_time_duplicate_prevention import LeadIndex, RealTimeDuplicatePrevention, min_shared_trigrams, trigrams
+
+
+def _create_leads_table(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE leads (
+            full_name TEXT, company TEXT, email TEXT, linkedin_url TEXT,
+            phone TEXT, job_title TEXT, created_at TEXT, updated_at TEXT
+        )
+    """)
+    conn.commit()
+    conn.close()
+
+
+def _insert_lead(db_path, **fields):
+    conn = sqlite3.connect(db_path)
+    columns = ', '.join(fields)
+    placeholders = ', '.join('?' for _ in fields)
+    rowid = conn.execute(f"INSERT INTO leads ({columns}) VALUES ({placeholders})", list(fields.values())).lastrowid
+    conn.commit()
+    conn.close()
+    return rowid
+
+
+class TestLeadIndex(unittest.TestCase):
+    """Test lookups in the in-memory lead index."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'leads.db')
+        _create_leads_table(self.db_path)
+        self.prevention = RealTimeDuplicatePrevention(self.db_path)
+        self.index = self.prevention.index
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_min_shared_trigrams_allows_none_for_short_values(self):
+        """Short values can be similar without sharing a trigram."""
+        self.assertEqual(trigrams('acme') & trigrams('acdme'), set())
+        self.assertLess(min_shared_trigrams('acme', 0.85), 1)
+        self.assertGreaterEqual(min_shared_trigrams('jonathan tremblay', 0.90), 1)
+
+    def test_short_company_without_shared_trigrams_is_found(self):
+        """A candidate lookup falls back to every lead when no trigram is required."""
+        _insert_lead(self.db_path, full_name='Bo Li', company='Acme', created_at='2025-01-01')
+
+        result = self.prevention.check_for_duplicates({'full_name': 'Bo Lii', 'company': 'Acdme'})
+
+        self.assertTrue(result['is_duplicate'])
+        self.assertEqual(result['duplicate_type'], 'fuzzy')
+        self.assertEqual(result['existing_lead']['full_name'], 'Bo Li')
+
+    def test_linkedin_slug_is_exact_match(self):
+        """Leads with the same LinkedIn profile are exact duplicates whatever their names."""
+        _insert_lead(self.db_path, full_name='Ann Lee', company='Acme',
+                     linkedin_url='https://www.linkedin.com/in/ann-lee/', created_at='2025-01-01')
+
+        result = self.prevention.check_for_duplicates({
+            'full_name': 'Annie Leigh', 'company': 'Other Corp',
+            'linkedin_url': 'linkedin.com/in/Ann-Lee?trk=profile'
+        })
+
+        self.assertEqual(result['duplicate_type'], 'exact')
+        self.assertEqual(result['reason'], 'Same LinkedIn profile found')
+
+    def test_add_replaces_previous_version(self):
+        """Re-adding a lead removes the keys of its previous version."""
+        index = LeadIndex(self.prevention.cleaner)
+        old_version = {'rowid': 1, 'full_name': 'Ann Lee', 'company': 'Acme Robotics', 'email': 'ann@acme.com'}
+        index.add(old_version)
+        index.add({'rowid': 1, 'full_name': 'Ann Lee', 'company': 'Globex Industries', 'email': 'ann@globex.com'})
+
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.candidates('company', 'acme robotics', 0.85), set())
+        self.assertEqual(index.candidates('company', 'globex industries', 0.85), {1})
+        self.assertIsNone(index.find_signature(self.prevention.cleaner.generate_lead_signature(old_version)))
+
+    def test_refresh_picks_up_other_processes_changes(self):
+        """Refreshing adds inserted and updated leads and drops deleted ones."""
+        kept = _insert_lead(self.db_path, full_name='Ann Lee', company='Acme', updated_at='2025-01-01')
+        deleted = _insert_lead(self.db_path, full_name='Bo Chan', company='Globex Industries', updated_at='2025-01-01')
+        self.prevention.refresh_index()
+        self.assertEqual(len(self.index), 2)
+
+        added = _insert_lead(self.db_path, full_name='Cy Twombly', company='Initech', updated_at='2025-01-02')
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("UPDATE leads SET company = 'Hooli', updated_at = '2025-01-03' WHERE rowid = ?", (kept,))
+        conn.execute("DELETE FROM leads WHERE rowid = ?", (deleted,))
+        conn.commit()
+        conn.close()
+
+        self.prevention.refresh_index(force=True)
+
+        self.assertEqual(set(self.index.leads), {kept, added})
+        self.assertEqual(self.index.leads[kept]['company'], 'Hooli')
+        self.assertEqual(self.index.candidates('company', 'globex industries', 0.85), set())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)